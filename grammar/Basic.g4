@@ -28,6 +28,32 @@ RETURN: 'RETURN';
 WHILE: 'WHILE';
 WEND: 'WEND';
 INPUT: 'INPUT';
+ON: 'ON';
+SELECT: 'SELECT';
+CASE: 'CASE';
+IS: 'IS';
+DIM: 'DIM';
+MAT: 'MAT';
+TRN: 'TRN';
+INV: 'INV';
+DATA: 'DATA';
+READ: 'READ';
+DEF: 'DEF';
+OPEN: 'OPEN';
+CLOSE: 'CLOSE';
+AS: 'AS';
+OUTPUT: 'OUTPUT';
+APPEND: 'APPEND';
+RANDOM: 'RANDOM';
+LEN: 'LEN';
+FIELD: 'FIELD';
+GET: 'GET';
+PUT: 'PUT';
+// Встроенные функции
+BUILTIN: 'SQR' | 'SIN' | 'COS' | 'ATN' | 'EXP' | 'LOG' | 'INT' | 'ABS' | 'SGN' | 'RND' | 'EOF';
+
+// Функции пользователя: FN и имя без пробела (FNA, FNDIST); имена переменных не начинаются с FN
+FN_NAME: 'FN' [a-zA-Z_] [a-zA-Z0-9_]*;
 
 // Идентификаторы и литералы
 ID: [a-zA-Z_] [a-zA-Z0-9_]*;
@@ -54,6 +80,7 @@ RPAREN: ')';
 COLON: ':';     // Для меток типа MYLABEL:
 COMMA: ',';     // Для списка выражений в PRINT, переменных в INPUT/NEXT
 SEMICOLON: ';'; // Для списка выражений в PRINT (печать вплотную)
+HASH: '#';      // Номер файла: PRINT #1, INPUT #1
 
 TYPE_SUFFIX: '$' | '!' | '%'; // Суффиксы типов
 
@@ -79,13 +106,25 @@ statement:
     | returnStmt
     | whileStmt
     | inputStmt
+    | onStmt
+    | selectStmt
+    | dimStmt
+    | matStmt
+    | dataStmt
+    | readStmt
+    | defStmt
+    | openStmt
+    | closeStmt
+    | fieldStmt
+    | getStmt
+    | putStmt
     | endStmt
     ;
 
-printStmt: PRINT expressionList?;
+printStmt: PRINT (HASH expression COMMA)? expressionList?; // PRINT #1, A пишет в файл
 expressionList: expression ( (COMMA | SEMICOLON) expression )*;
 
-letStmt: LET variable ASSIGN expression;
+letStmt: LET target ASSIGN expression;
 ifStmt: IF WS? condition WS? THEN WS? statement (ELSE WS? statement)?;
 gotoStmt: GOTO targetLabel;
 forStmt: FOR variable ASSIGN expression TO expression (STEP expression)?; // ASSIGN для начального значения
@@ -94,13 +133,63 @@ gosubStmt: GOSUB targetLabel;
 returnStmt: RETURN;
 // Тело цикла WHILE - ноль или больше строк (lineContent NEWLINE) до WEND
 whileStmt: WHILE condition (lineContent? NEWLINE)* WEND;
-inputStmt: INPUT (STRING COMMA)? variable (COMMA variable)*;
+inputStmt: INPUT (HASH expression COMMA | STRING COMMA)? target (COMMA target)*; // INPUT #1, A читает из файла
+// Переход по номеру: ON N GOTO A, B, C идет к метке с номером N в списке (считая с 1)
+onStmt: ON expression (GOTO | GOSUB) targetLabel (COMMA targetLabel)*;
+// Блок SELECT CASE: ветви CASE со строками тела до END SELECT
+selectStmt: SELECT CASE expression NEWLINE+ caseClause* END SELECT;
+caseClause: CASE (ELSE | caseTest (COMMA caseTest)*) (lineContent? NEWLINE)*;
+caseTest
+    : IS op=(ASSIGN | LT | GT | LTE | GTE | NEQ) expression // CASE IS > 10
+    | expression (TO expression)?                           // CASE 5 или CASE 1 TO 4
+    ;
+
+// Объявление массивов: DIM A(10), B%(3, 4) — в скобках наибольшие индексы измерений
+dimStmt: DIM arrayElement (COMMA arrayElement)*;
+
+// Операции над массивами целиком: строки и столбцы с 1 до наибольшего индекса из DIM
+matStmt
+    : MAT variable ASSIGN matExpr                                   // MAT C = A * B
+    | MAT READ variable (COMMA variable)*                           // MAT READ A, B
+    | MAT PRINT variable ((COMMA | SEMICOLON) variable)* SEMICOLON? // MAT PRINT A; B
+    ;
+matExpr
+    : TRN LPAREN variable RPAREN                      // транспонирование
+    | INV LPAREN variable RPAREN                      // обратная матрица
+    | LPAREN expression RPAREN MUL variable           // умножение на число
+    | variable (op=(PLUS | MINUS | MUL) variable)?    // копия, сумма, разность, произведение
+    ;
+
+// Значения для READ и MAT READ: DATA читаются по порядку записи в программе
+dataStmt: DATA dataItem (COMMA dataItem)*;
+dataItem: MINUS? NUMBER | STRING;
+readStmt: READ target (COMMA target)*;
+
+// Функция пользователя: DEF FNA(X, Y) = X * X + Y; остальные переменные тела - переменные программы
+defStmt: DEF FN_NAME TYPE_SUFFIX? (LPAREN variable (COMMA variable)* RPAREN)? ASSIGN expression;
+
+// Последовательные файлы: OPEN "data.txt" FOR INPUT AS #1 ... CLOSE #1; CLOSE без номеров закрывает все.
+// Файл записей фиксированной длины: OPEN "stock.dat" AS #2 LEN = 32 (FOR RANDOM можно не писать)
+openStmt
+    : OPEN expression (FOR fileMode=(INPUT | OUTPUT | APPEND | RANDOM))? AS HASH? expression
+      (LEN ASSIGN expression)?
+    ;
+closeStmt: CLOSE (HASH? expression (COMMA HASH? expression)*)?;
+// Поля записи: FIELD #2, 20 AS N$, 8 AS Q% — ширины в байтах; GET и PUT читают и пишут запись с номером
+fieldStmt: FIELD HASH? expression COMMA fieldItem (COMMA fieldItem)*;
+fieldItem: NUMBER AS variable;
+getStmt: GET HASH? expression (COMMA expression)?;
+putStmt: PUT HASH? expression (COMMA expression)?;
 
 targetLabel: ID | NUMBER; // Метка, на которую переходим, может быть именем или числом
 
 endStmt: END;
 
 variable: ID TYPE_SUFFIX?; // Переменная с необязательным суффиксом типа
+arrayElement: variable LPAREN expression (COMMA expression)* RPAREN; // Элемент массива A(I, J)
+target: arrayElement | variable; // Что можно присвоить в LET и прочитать в INPUT
+functionCall: BUILTIN (LPAREN expression RPAREN)?; // SQR(X), INT(X / 2); аргумент можно опустить только у RND
+userFunctionCall: FN_NAME TYPE_SUFFIX? (LPAREN expression (COMMA expression)* RPAREN)?; // FNA(X, 2), FNPI
 
 condition: expression; // Условие - это просто выражение
 
@@ -128,6 +217,9 @@ unaryExpr
 atom
     : NUMBER
     | STRING
+    | functionCall
+    | userFunctionCall
+    | arrayElement
     | variable
     | LPAREN expression RPAREN
     ;
\ No newline at end of file
@@ -3,18 +3,47 @@ from generated.BasicVisitor import BasicVisitor
 from ast_nodes import (
     ProgramNode, PrintNode, LetNode, EndNode, IfNode, GotoNode, LabelReferenceNode,
     ForNode, NextNode, GosubNode, ReturnNode, WhileNode, InputNode,
-    NumberNode, StringNode, VariableNode, BinaryOpNode, UnaryOpNode, LabelNode
+    NumberNode, StringNode, VariableNode, BinaryOpNode, UnaryOpNode, LabelNode,
+    OnJumpNode, SelectCaseNode, CaseNode, CaseRangeNode, CaseIsNode, DimNode, ArrayElementNode,
+    MatrixNode, MatLetNode, MatReadNode, MatPrintNode, DataNode, ReadNode, FunctionCallNode,
+    DefFnNode, FnCallNode, OpenNode, CloseNode, FieldNode, GetNode, PutNode
 )
 
 
 class AstBuilder(BasicVisitor):
     def visitProgram(self, ctx: BasicParser.ProgramContext):
+        # Пустая строка в конце файла тоже дает lineContent
+        line_contexts = [lc_ctx for lc_ctx in ctx.lineContent() if lc_ctx.getChildCount()]
+        # Программа, в которой пронумерованы все строки, выполняется в порядке номеров, а не записи
+        if line_contexts and all(lc_ctx.NUMBER() for lc_ctx in line_contexts):
+            line_contexts.sort(key=self._line_number)
+        return ProgramNode(self._visit_lines(line_contexts))
+
+    def _visit_lines(self, line_contexts):
+        """
+        Инструкции строк программы. Номер строки записывается в line_number инструкции и
+        становится меткой перед ней, поэтому GOTO 100 разрешается так же, как GOTO ИМЯ.
+        """
         statements = []
-        for lc_node_ctx in ctx.lineContent():  # Обходим все lineContent
-            stmt_node = self.visit(lc_node_ctx)
+        for lc_ctx in line_contexts:
+            line_number = self._line_number(lc_ctx)
+            if line_number is not None:
+                label = LabelNode(line_number)
+                label.line_number = line_number
+                statements.append(label)
+            stmt_node = self.visit(lc_ctx)
             if stmt_node:
+                stmt_node.line_number = line_number
                 statements.append(stmt_node)
-        return ProgramNode(statements)
+        return statements
+
+    def _line_number(self, ctx: BasicParser.LineContentContext):
+        if not ctx.NUMBER():
+            return None
+        text = ctx.NUMBER().getText()
+        if not text.isdigit():
+            raise ValueError(f"Номер строки должен быть целым числом: {text}")
+        return int(text)
 
     def visitLineContent(self, ctx: BasicParser.LineContentContext):
         if ctx.labelDef():
@@ -27,43 +56,18 @@ class AstBuilder(BasicVisitor):
     def visitPrintStmt(self, ctx: BasicParser.PrintStmtContext):
         expressions_data = []
         if ctx.expressionList():
-            expr_list_ctx = ctx.expressionList()
-            expressions = expr_list_ctx.expression()
-
-            commas = [token.getText() for token in expr_list_ctx.COMMA()]
-            semicolons = [token.getText() for token in expr_list_ctx.SEMICOLON()]
-
-            for i, expr_ctx in enumerate(expressions):
-                expr_node = self.visit(expr_ctx)
-                separator_text = None
-
-                if i < len(expressions) - 1:
-                    expr_stop_index = expr_ctx.stop.tokenIndex
-
-                    nearest_comma_index = None
-                    nearest_semicolon_index = None
-
-                    if i < len(commas):
-                        comma_token = expr_list_ctx.COMMA(i)
-                        if comma_token:
-                            nearest_comma_index = comma_token.symbol.tokenIndex
-
-                    if i < len(semicolons):
-                        semicolon_token = expr_list_ctx.SEMICOLON(i)
-                        if semicolon_token:
-                            nearest_semicolon_index = semicolon_token.symbol.tokenIndex
-
-                    if nearest_comma_index is not None and (
-                            nearest_semicolon_index is None or nearest_comma_index < nearest_semicolon_index):
-                        separator_text = ','
-                    elif nearest_semicolon_index is not None:
-                        separator_text = ';'
-
-                expressions_data.append({'expression': expr_node, 'separator': separator_text})
-        return PrintNode(expressions_data)
+            # Выражения и разделители чередуются: разделитель после выражения — следующий дочерний узел
+            children = list(ctx.expressionList().getChildren())
+            for i, child in enumerate(children):
+                if not isinstance(child, BasicParser.ExpressionContext):
+                    continue
+                separator_text = children[i + 1].getText() if i + 1 < len(children) else None
+                expressions_data.append({'expression': self.visit(child), 'separator': separator_text})
+        channel_node = self.visit(ctx.expression()) if ctx.HASH() else None
+        return PrintNode(expressions_data, channel_node)
 
     def visitLetStmt(self, ctx: BasicParser.LetStmtContext):
-        var_node = self.visit(ctx.variable())
+        var_node = self.visit(ctx.target())
         expr_node = self.visit(ctx.expression())
         return LetNode(var_node, expr_node)
 
@@ -108,14 +112,7 @@ class AstBuilder(BasicVisitor):
 
     def visitWhileStmt(self, ctx: BasicParser.WhileStmtContext):
         condition_node = self.visit(ctx.condition())
-        body_statements = []
-
-        for lc_ctx in ctx.lineContent():
-            stmt = self.visit(lc_ctx)
-            if stmt:
-                body_statements.append(stmt)
-
-        return WhileNode(condition_node, body_statements)
+        return WhileNode(condition_node, self._visit_lines(ctx.lineContent()))
 
     def visitInputStmt(self, ctx: BasicParser.InputStmtContext):
         prompt_node = None
@@ -123,9 +120,133 @@ class AstBuilder(BasicVisitor):
             text = ctx.STRING().getText()
             prompt_node = StringNode(text[1:-1])
 
-        variables = [self.visit(var_ctx) for var_ctx in ctx.variable()]
-
-        return InputNode(variables, prompt_node=prompt_node)
+        channel_node = self.visit(ctx.expression()) if ctx.HASH() else None
+        variables = [self.visit(target_ctx) for target_ctx in ctx.target()]
+
+        return InputNode(variables, prompt_node=prompt_node, channel_node=channel_node)
+
+    def visitOnStmt(self, ctx: BasicParser.OnStmtContext):
+        index_node = self.visit(ctx.expression())
+        targets = [self.visit(label_ctx) for label_ctx in ctx.targetLabel()]
+        return OnJumpNode(index_node, targets, is_gosub=ctx.GOSUB() is not None)
+
+    def visitSelectStmt(self, ctx: BasicParser.SelectStmtContext):
+        selector_node = self.visit(ctx.expression())
+        cases = []
+        else_body = None
+        for clause_ctx in ctx.caseClause():
+            if else_body is not None:
+                raise ValueError("CASE ELSE должна быть последней ветвью SELECT CASE")
+            body = self._visit_lines(clause_ctx.lineContent())
+            if clause_ctx.ELSE():
+                else_body = body
+            else:
+                cases.append(CaseNode([self.visit(test_ctx) for test_ctx in clause_ctx.caseTest()], body))
+        return SelectCaseNode(selector_node, cases, else_body)
+
+    def visitCaseTest(self, ctx: BasicParser.CaseTestContext):
+        if ctx.IS():
+            return CaseIsNode(ctx.op.text, self.visit(ctx.expression(0)))
+        if ctx.TO():
+            return CaseRangeNode(self.visit(ctx.expression(0)), self.visit(ctx.expression(1)))
+        return self.visit(ctx.expression(0))
+
+    def visitDimStmt(self, ctx: BasicParser.DimStmtContext):
+        return DimNode([self.visit(array_ctx) for array_ctx in ctx.arrayElement()])
+
+    def visitMatStmt(self, ctx: BasicParser.MatStmtContext):
+        matrices = [self._visit_matrix(var_ctx) for var_ctx in ctx.variable()]
+        if ctx.READ():
+            return MatReadNode(matrices)
+        if ctx.PRINT():
+            # Разделитель после массива — следующий за ним дочерний узел
+            children = list(ctx.getChildren())
+            separators = []
+            for i, child in enumerate(children):
+                if isinstance(child, BasicParser.VariableContext):
+                    separators.append(children[i + 1].getText() if i + 1 < len(children) else None)
+            return MatPrintNode(matrices, separators)
+
+        expr_ctx = ctx.matExpr()
+        operands = [self._visit_matrix(var_ctx) for var_ctx in expr_ctx.variable()]
+        if expr_ctx.TRN():
+            return MatLetNode(matrices[0], 'TRN', operands)
+        if expr_ctx.INV():
+            return MatLetNode(matrices[0], 'INV', operands)
+        if expr_ctx.expression():
+            return MatLetNode(matrices[0], 'SCALE', operands, self.visit(expr_ctx.expression()))
+        if expr_ctx.op is not None:
+            return MatLetNode(matrices[0], expr_ctx.op.text, operands)
+        return MatLetNode(matrices[0], 'COPY', operands)
+
+    def _visit_matrix(self, ctx: BasicParser.VariableContext):
+        var_node = self.visit(ctx)
+        return MatrixNode(var_node.name, var_node.type_suffix)
+
+    def visitDataStmt(self, ctx: BasicParser.DataStmtContext):
+        return DataNode([self.visit(item_ctx) for item_ctx in ctx.dataItem()])
+
+    def visitDataItem(self, ctx: BasicParser.DataItemContext):
+        if ctx.STRING():
+            return StringNode(ctx.STRING().getText()[1:-1])
+        value = float(ctx.NUMBER().getText())
+        return NumberNode(-value if ctx.MINUS() else value)
+
+    def visitReadStmt(self, ctx: BasicParser.ReadStmtContext):
+        return ReadNode([self.visit(target_ctx) for target_ctx in ctx.target()])
+
+    def visitDefStmt(self, ctx: BasicParser.DefStmtContext):
+        name = ctx.FN_NAME().getText()
+        type_suffix = ctx.TYPE_SUFFIX().getText() if ctx.TYPE_SUFFIX() else None
+        parameters = [self.visit(var_ctx) for var_ctx in ctx.variable()]
+        body = self.visit(ctx.expression())
+
+        # Параметр тела получает имя FNA_X: переменная X программы внутри функции не видна
+        renamed = {}
+        for parameter in parameters:
+            key = parameter.name, parameter.type_suffix
+            if key in renamed:
+                raise ValueError(f"Повторяющийся параметр {parameter.name} функции {name}")
+            renamed[key] = f"{name}_{parameter.name}"
+            parameter.name = renamed[key]
+        for node in body.walk():
+            if isinstance(node, VariableNode) and (node.name, node.type_suffix) in renamed:
+                node.name = renamed[(node.name, node.type_suffix)]
+        return DefFnNode(name, type_suffix, parameters, body)
+
+    def visitOpenStmt(self, ctx: BasicParser.OpenStmtContext):
+        path_node = self.visit(ctx.expression(0))
+        channel_node = self.visit(ctx.expression(1))
+        # OPEN без FOR открывает файл записей, как в GW-BASIC
+        mode = ctx.fileMode.text if ctx.fileMode else 'RANDOM'
+        record_length_node = self.visit(ctx.expression(2)) if ctx.LEN() else None
+        if record_length_node is not None and mode != 'RANDOM':
+            raise ValueError(f"LEN задается только для файла RANDOM, а не {mode}")
+        return OpenNode(path_node, mode, channel_node, record_length_node)
+
+    def visitCloseStmt(self, ctx: BasicParser.CloseStmtContext):
+        return CloseNode([self.visit(expr_ctx) for expr_ctx in ctx.expression()])
+
+    def visitFieldStmt(self, ctx: BasicParser.FieldStmtContext):
+        widths = []
+        for item_ctx in ctx.fieldItem():
+            text = item_ctx.NUMBER().getText()
+            if not text.isdigit():
+                raise ValueError(f"Ширина поля FIELD должна быть целым числом: {text}")
+            widths.append(int(text))
+        variables = [self.visit(item_ctx.variable()) for item_ctx in ctx.fieldItem()]
+        return FieldNode(self.visit(ctx.expression()), widths, variables)
+
+    def visitGetStmt(self, ctx: BasicParser.GetStmtContext):
+        record_node = self.visit(ctx.expression(1)) if len(ctx.expression()) > 1 else None
+        return GetNode(self.visit(ctx.expression(0)), record_node)
+
+    def visitPutStmt(self, ctx: BasicParser.PutStmtContext):
+        record_node = self.visit(ctx.expression(1)) if len(ctx.expression()) > 1 else None
+        return PutNode(self.visit(ctx.expression(0)), record_node)
+
+    def visitEndStmt(self, ctx: BasicParser.EndStmtContext):
+        return EndNode()
 
     def visitTargetLabel(self, ctx: BasicParser.TargetLabelContext):
         if ctx.ID():
@@ -140,6 +261,27 @@ class AstBuilder(BasicVisitor):
         suffix_text = type_suffix_node.getText() if type_suffix_node else None
         return VariableNode(name, suffix_text)
 
+    def visitArrayElement(self, ctx: BasicParser.ArrayElementContext):
+        var_node = self.visit(ctx.variable())
+        indices = [self.visit(expr_ctx) for expr_ctx in ctx.expression()]
+        return ArrayElementNode(var_node.name, var_node.type_suffix, indices)
+
+    def visitTarget(self, ctx: BasicParser.TargetContext):
+        if ctx.arrayElement():
+            return self.visit(ctx.arrayElement())
+        return self.visit(ctx.variable())
+
+    def visitFunctionCall(self, ctx: BasicParser.FunctionCallContext):
+        name = ctx.BUILTIN().getText()
+        if not ctx.expression() and name != 'RND':
+            raise ValueError(f"У функции {name} должен быть аргумент")
+        return FunctionCallNode(name, [self.visit(ctx.expression())] if ctx.expression() else [])
+
+    def visitUserFunctionCall(self, ctx: BasicParser.UserFunctionCallContext):
+        type_suffix = ctx.TYPE_SUFFIX().getText() if ctx.TYPE_SUFFIX() else None
+        arguments = [self.visit(expr_ctx) for expr_ctx in ctx.expression()]
+        return FnCallNode(ctx.FN_NAME().getText(), type_suffix, arguments)
+
     def visitCondition(self, ctx: BasicParser.ConditionContext):
         return self.visit(ctx.expression())
 
@@ -155,51 +297,18 @@ class AstBuilder(BasicVisitor):
         return left_node
 
     def visitAdditiveExpr(self, ctx: BasicParser.AdditiveExprContext):
-        left_node = self.visit(ctx.left)
-
-        ops_list = []
-        if ctx.op:
-            if isinstance(ctx.op, list):
-                ops_list = ctx.op
-            else:
-                ops_list = [ctx.op]
-
-        rights_list = []
-        if ctx.right:
-            if isinstance(ctx.right, list):
-                rights_list = ctx.right
-            else:
-                rights_list = [ctx.right]
-
-        if len(ops_list) == len(rights_list):
-            for i in range(len(ops_list)):
-                op_text = ops_list[i].text
-                right_node = self.visit(rights_list[i])
-                left_node = BinaryOpNode(left_node, op_text, right_node)
-        return left_node
+        return self._visit_left_associative(ctx)
 
     def visitMultiplicativeExpr(self, ctx: BasicParser.MultiplicativeExprContext):
-        left_node = self.visit(ctx.left)
-
-        ops_list = []
-        if ctx.op:
-            if isinstance(ctx.op, list):
-                ops_list = ctx.op
-            else:
-                ops_list = [ctx.op]
-
-        rights_list = []
-        if ctx.right:
-            if isinstance(ctx.right, list):
-                rights_list = ctx.right
-            else:
-                rights_list = [ctx.right]
-
-        if len(ops_list) == len(rights_list):
-            for i in range(len(ops_list)):
-                op_text = ops_list[i].text
-                right_node = self.visit(rights_list[i])
-                left_node = BinaryOpNode(left_node, op_text, right_node)
+        return self._visit_left_associative(ctx)
+
+    def _visit_left_associative(self, ctx):
+        # Метки left/op/right хранят только последний операнд цепочки, поэтому
+        # операнды и операторы берутся из дочерних узлов: они чередуются
+        children = list(ctx.getChildren())
+        left_node = self.visit(children[0])
+        for i in range(1, len(children) - 1, 2):
+            left_node = BinaryOpNode(left_node, children[i].getText(), self.visit(children[i + 1]))
         return left_node
 
     def visitUnaryExpr(self, ctx: BasicParser.UnaryExprContext):
@@ -215,6 +324,12 @@ class AstBuilder(BasicVisitor):
         elif ctx.STRING():
             text = ctx.STRING().getText()
             return StringNode(text[1:-1])
+        elif ctx.functionCall():
+            return self.visit(ctx.functionCall())
+        elif ctx.userFunctionCall():
+            return self.visit(ctx.userFunctionCall())
+        elif ctx.arrayElement():
+            return self.visit(ctx.arrayElement())
         elif ctx.variable():
             return self.visit(ctx.variable())
         elif ctx.LPAREN():
@@ -35,14 +35,16 @@ class Node:
             )
 
             if is_node_child or is_list_of_nodes or is_dict_list_of_nodes:
-                children_to_display.append((k, v))
+                # Вид списка запоминается для каждого дочернего атрибута: после цикла флаги
+                # относятся только к последнему атрибуту узла
+                children_to_display.append((k, v, is_dict_list_of_nodes))
             else:
                 stream.write(f"{prefix}  {k}={v!r}\n")
 
-        for k, v_child in children_to_display:
+        for k, v_child, is_dict_list in children_to_display:
             stream.write(f"{prefix}  {k}=(\n")
             if isinstance(v_child, list):
-                if is_dict_list_of_nodes:
+                if is_dict_list:
                     for item_dict in v_child:
                         stream.write(f"{prefix}    Item(\n")
                         item_dict['expression'].display(indent + 3, stream)
@@ -61,6 +63,24 @@ class Node:
 
         stream.write(f"{prefix})\n")
 
+    def walk(self):
+        """Обходит узел и все вложенные в него узлы (в глубину, без рекурсии)"""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            for k, v in node.__dict__.items():
+                if k.startswith('_'):
+                    continue
+                if isinstance(v, Node):
+                    stack.append(v)
+                elif isinstance(v, list):
+                    for item in v:
+                        if isinstance(item, Node):
+                            stack.append(item)
+                        elif isinstance(item, dict) and isinstance(item.get('expression'), Node):
+                            stack.append(item['expression'])
+
 
 class ProgramNode(Node):
     def __init__(self, statements):
@@ -68,12 +88,15 @@ class ProgramNode(Node):
 
 
 class StatementNode(Node):
-    pass
+    # Номер строки программы с нумерованными строками (10 PRINT ...), иначе None
+    line_number = None
 
 
 class PrintNode(StatementNode):
-    def __init__(self, expressions_with_separators):
+    def __init__(self, expressions_with_separators, channel_node=None):
         self.expressions_with_separators = expressions_with_separators
+        # Номер файла PRINT #n; None — вывод на экран
+        self.channel = channel_node
 
 
 class LetNode(StatementNode):
@@ -95,11 +118,14 @@ class GotoNode(StatementNode):
 
 
 class ForNode(StatementNode):
-    def __init__(self, loop_variable_node, start_value_expr_node, end_value_expr_node, step_value_expr_node=None):
+    def __init__(self, loop_variable_node, start_value_expr_node, end_value_expr_node, step_value_expr_node=None,
+                 body_statements_list=None):
         self.loop_variable = loop_variable_node
         self.start_value = start_value_expr_node
         self.end_value = end_value_expr_node
         self.step_value = step_value_expr_node
+        # Тело вместе с закрывающим NEXT; None — цикл в исходной плоской форме FOR ... NEXT
+        self.body = body_statements_list
 
 
 class NextNode(StatementNode):
@@ -123,21 +149,200 @@ class WhileNode(StatementNode):
 
 
 class InputNode(StatementNode):
-    def __init__(self, variable_list, prompt_node=None):
+    def __init__(self, variable_list, prompt_node=None, channel_node=None):
         self.prompt = prompt_node
         self.variables = variable_list
+        # Номер файла INPUT #n; None — ввод с клавиатуры
+        self.channel = channel_node
 
 
 class EndNode(StatementNode):
     pass
 
 
+class DimNode(StatementNode):
+    """DIM A(10), B%(3, 4): индексы ArrayElementNode — наибольшие индексы измерений"""
+
+    def __init__(self, array_nodes):
+        self.arrays = array_nodes
+
+
+class MatLetNode(StatementNode):
+    """
+    MAT массив = выражение над массивами целиком. Операция: COPY (MAT C = A), '+', '-', '*'
+    (матричное произведение), TRN, INV или SCALE (MAT C = (K) * A, множитель — factor)
+    """
+
+    def __init__(self, target_node, operation, operand_nodes, factor_node=None):
+        self.target = target_node
+        self.operation = operation
+        self.operands = operand_nodes
+        self.factor = factor_node
+
+
+class MatReadNode(StatementNode):
+    """MAT READ A, B: элементы массивов по строкам читаются из DATA"""
+
+    def __init__(self, matrix_nodes):
+        self.matrices = matrix_nodes
+
+
+class MatPrintNode(StatementNode):
+    """MAT PRINT A; B: разделитель после массива — ';' (вплотную), ',' или None (по зонам)"""
+
+    def __init__(self, matrix_nodes, separators):
+        self.matrices = matrix_nodes
+        self.separators = separators
+
+
+class DataNode(StatementNode):
+    """DATA 1, -2.5, "X": значения NumberNode и StringNode; сама инструкция ничего не выполняет"""
+
+    def __init__(self, value_nodes):
+        self.values = value_nodes
+
+
+class ReadNode(StatementNode):
+    """READ A, B$(I): присваивает переменным очередные значения DATA"""
+
+    def __init__(self, target_nodes):
+        self.variables = target_nodes
+
+
+class DefFnNode(StatementNode):
+    """
+    DEF FNA(X, Y) = выражение: функция пользователя. Параметры тела переименованы в FNA_X, FNA_Y,
+    чтобы не совпадать с переменными программы; сама инструкция ничего не выполняет
+    """
+
+    def __init__(self, name, type_suffix, parameter_nodes, body_node):
+        self.name = name
+        self.type_suffix = type_suffix
+        self.parameters = parameter_nodes
+        self.body = body_node
+
+
+class OpenNode(StatementNode):
+    """
+    OPEN имя FOR INPUT/OUTPUT/APPEND AS #n: открывает последовательный файл под номером n.
+    Режим RANDOM — файл записей длины record_length (LEN = ...) для FIELD, GET и PUT
+    """
+
+    def __init__(self, path_node, mode, channel_node, record_length_node=None):
+        self.path = path_node
+        self.mode = mode
+        self.channel = channel_node
+        self.record_length = record_length_node
+
+
+class CloseNode(StatementNode):
+    """CLOSE #n, #m: закрывает файлы; пустой список — все открытые файлы"""
+
+    def __init__(self, channel_nodes):
+        self.channels = channel_nodes
+
+
+class FieldNode(StatementNode):
+    """FIELD #n, 20 AS N$, 8 AS Q%: поля записи файла n — ширины в байтах и переменные"""
+
+    def __init__(self, channel_node, widths, variable_nodes):
+        self.channel = channel_node
+        self.widths = widths
+        self.variables = variable_nodes
+
+
+class GetNode(StatementNode):
+    """
+    GET #n, запись: читает запись в переменные FIELD файла n; без номера — следующую запись.
+    Переменные заполняет семантический анализ по FIELD того же файла
+    """
+
+    def __init__(self, channel_node, record_node=None, variable_nodes=None):
+        self.channel = channel_node
+        self.record = record_node
+        self.variables = variable_nodes or []
+
+
+class PutNode(StatementNode):
+    """PUT #n, запись: записывает значения переменных FIELD файла n в запись"""
+
+    def __init__(self, channel_node, record_node=None, variable_nodes=None):
+        self.channel = channel_node
+        self.record = record_node
+        self.variables = variable_nodes or []
+
+
+class OnJumpNode(StatementNode):
+    """ON выражение GOTO/GOSUB метка, ...: переход к метке с номером значения выражения в списке"""
+
+    def __init__(self, index_expression_node, target_label_refs, is_gosub=False):
+        self.index = index_expression_node
+        self.target_label_refs = target_label_refs
+        self.is_gosub = is_gosub
+
+
+class SelectCaseNode(StatementNode):
+    """Блок SELECT CASE: выбирается первая ветвь, одна из проверок которой выполнена"""
+
+    def __init__(self, selector_node, case_nodes, else_statements=None):
+        self.selector = selector_node
+        self.cases = case_nodes
+        # None — ветви CASE ELSE нет
+        self.else_body = else_statements
+
+
+class CaseNode(Node):
+    """
+    Ветвь CASE: проверки и инструкции тела. Проверка — выражение, равное селектору,
+    CaseRangeNode или CaseIsNode
+    """
+
+    def __init__(self, tests, body_statements_list):
+        self.tests = tests
+        self.body = body_statements_list
+
+
+class CaseRangeNode(Node):
+    """Проверка CASE нижняя TO верхняя"""
+
+    def __init__(self, low_node, high_node):
+        self.low = low_node
+        self.high = high_node
+
+
+class CaseIsNode(Node):
+    """Проверка CASE IS оператор выражение"""
+
+    def __init__(self, operator_text, value_node):
+        self.op = operator_text
+        self.value = value_node
+
+
 class VariableNode(Node):
     def __init__(self, name, type_suffix=None):
         self.name = str(name)
         self.type_suffix = type_suffix
 
 
+class ArrayElementNode(Node):
+    """
+    Элемент массива A(I, J). Массив и простая переменная с тем же именем — разные объекты,
+    поэтому узел не наследует VariableNode
+    """
+
+    def __init__(self, name, type_suffix, index_nodes):
+        self.name = str(name)
+        self.type_suffix = type_suffix
+        self.indices = index_nodes
+
+
+class MatrixNode(ArrayElementNode):
+    """Массив целиком в инструкции MAT: элемент без индексов, хранилище то же, что у A(I, J)"""
+
+    def __init__(self, name, type_suffix):
+        super().__init__(name, type_suffix, [])
+
+
 class NumberNode(Node):
     def __init__(self, value):
         self.value = float(value)
@@ -161,6 +366,28 @@ class UnaryOpNode(Node):
         self.operand = operand_node
 
 
+# Встроенные функции, которые при каждом вызове могут вернуть новое значение: их вызов нельзя
+# подставить, повторить или вынести из цикла
+IMPURE_FUNCTIONS = ('RND', 'EOF')
+
+
+class FunctionCallNode(Node):
+    """Вызов встроенной функции SQR(X), INT(X), RND(1): имя и список аргументов"""
+
+    def __init__(self, name, argument_nodes):
+        self.name = name
+        self.arguments = argument_nodes
+
+
+class FnCallNode(Node):
+    """Вызов функции пользователя FNA(X, 2): имя, суффикс типа и список аргументов"""
+
+    def __init__(self, name, type_suffix, argument_nodes):
+        self.name = name
+        self.type_suffix = type_suffix
+        self.arguments = argument_nodes
+
+
 class LabelReferenceNode(Node):
     def __init__(self, name_or_number):
         self.name_or_number = name_or_number
@@ -172,4 +399,114 @@ class LabelNode(StatementNode):
     """Узел для определения метки (например, 'START:')"""
 
     def __init__(self, name):
-        self.name = name
\ No newline at end of file
+        self.name = name
+
+class BreakNode(StatementNode):
+    """Выход из ближайшего цикла (генерируется при понижении потока управления)"""
+    pass
+
+
+class ContinueNode(StatementNode):
+    """Переход к следующей итерации ближайшего цикла (генерируется при понижении потока управления)"""
+    pass
+
+
+class LoopNode(StatementNode):
+    """Цикл, восстановленный из графа переходов: while True или while с условием"""
+
+    def __init__(self, body_statements_list, condition_node=None):
+        self.condition = condition_node
+        self.body = body_statements_list
+
+
+class IfBlockNode(StatementNode):
+    """Условный оператор с блоками инструкций в ветках (генерируется при понижении потока управления)"""
+
+    def __init__(self, condition_node, then_statements, else_statements=None):
+        self.condition = condition_node
+        self.then_body = then_statements
+        self.else_body = else_statements or []
+
+
+class SwitchNode(StatementNode):
+    """
+    Выбор ветви по таблице (генерируется при понижении ON и SELECT CASE): проверки ветвей —
+    числовые и строковые константы, значение селектора ищется в словаре за O(1) при любом
+    числе ветвей. Если значения нет в таблице, выполняется default_body
+    """
+
+    def __init__(self, selector_node, case_nodes, default_statements=None, rounded=False):
+        self.selector = selector_node
+        self.cases = case_nodes
+        self.default_body = default_statements or []
+        # Селектор — номер в списке ON: дробное значение округляется до целого
+        self.rounded = rounded
+
+
+class DispatchStateNode(Node):
+    """Состояние конечного автомата: номер и линейный список инструкций"""
+
+    def __init__(self, state_id, statements):
+        self.state_id = state_id
+        self.statements = statements
+
+
+class DispatchNode(StatementNode):
+    """Цикл диспетчеризации по счётчику состояний: переходы меняют номер состояния, а не стек вызовов"""
+
+    def __init__(self, states, entry_state=0, exits=None):
+        self.states = states
+        self.entry_state = entry_state
+        # Выходы из цикла диспетчеризации: состояния, код которых выполняется уже после цикла
+        self.exits = exits or []
+
+
+class JumpNode(StatementNode):
+    """Переход к состоянию конечного автомата; при GOSUB сохраняет состояние возврата"""
+
+    def __init__(self, target_state, return_state=None):
+        self.target_state = target_state
+        self.return_state = return_state
+
+
+class ReturnJumpNode(StatementNode):
+    """RETURN внутри конечного автомата: переход к последнему сохранённому состоянию возврата"""
+    pass
+
+
+class SubroutineNode(StatementNode):
+    """Подпрограмма GOSUB, скомпилированная в отдельную функцию уровня модуля"""
+
+    def __init__(self, name, body_statements_list):
+        self.name = name
+        self.body = body_statements_list
+
+
+class CallSubroutineNode(StatementNode):
+    """Прямой вызов подпрограммы, выделенной в функцию"""
+
+    def __init__(self, name):
+        self.name = name
+
+
+class SubroutineReturnNode(StatementNode):
+    """RETURN из подпрограммы, выделенной в функцию"""
+    pass
+
+
+class ChunkNode(StatementNode):
+    """Часть конечного автомата в отдельной функции уровня модуля: состояния с номерами подряд"""
+
+    def __init__(self, states):
+        self.states = states
+
+
+class ChunkedDispatchNode(StatementNode):
+    """Цикл диспетчеризации по частям автомата: номер состояния выбирает функцию части"""
+
+    def __init__(self, chunk_names, chunk_sizes, entry_state=0, uses_gosub=False):
+        self.chunk_names = chunk_names
+        # Число состояний в каждой части, по порядку номеров состояний
+        self.chunk_sizes = chunk_sizes
+        self.entry_state = entry_state
+        self.uses_gosub = uses_gosub
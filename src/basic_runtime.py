@@ -0,0 +1,823 @@
+"""
+Библиотека времени выполнения для программ, сгенерированных компилятором BASIC.
+
+Сгенерированный код импортирует из модуля только те функции, которые использует,
+поэтому модуль компилируется в байт-код один раз и дальше загружается из __pycache__.
+"""
+import atexit
+import mmap
+import os
+import random
+import struct
+import sys
+
+# Имена среды выполнения в том порядке, в котором они выводятся в программу при встраивании
+RUNTIME_NAMES = [
+    'DEFAULT_OUTPUT_BUFFER_SIZE', 'PRINT_ZONE_WIDTH', 'OutputBuffer', '_output',
+    'configure_output', 'flush_output', 'basic_write', 'basic_zone', 'basic_print',
+    'BasicString', 'BasicRope', 'basic_append', 'DEFAULT_INPUT_BLOCK_SIZE', 'BATCH_INPUT_VARIABLE', 'InputReader',
+    '_input', 'configure_input', 'basic_input', 'basic_input_string', 'basic_input_number', 'basic_input_integer',
+    '_parse_fields',
+    'basic_input_fields', 'DEFAULT_FILE_BUFFER_SIZE', 'FileChannel', '_files', 'basic_open', 'basic_close',
+    '_channel', 'file_write', 'file_input_fields', 'basic_eof', 'DEFAULT_RECORD_LENGTH', 'RecordFile',
+    'basic_open_random', '_record_file', 'basic_field', 'file_get', 'file_put',
+    'basic_index', 'VECTOR_MIN_LENGTH', 'VECTOR_CHECK_TOLERANCE', 'OptionalModule', '_numpy', 'vector_loop',
+    'DataReader', 'mat_view', '_mat_check', 'mat_assign', 'mat_add', 'mat_subtract', 'mat_multiply', 'mat_scale',
+    'mat_transpose', 'mat_inverse', 'mat_rows', 'mat_read', 'mat_print',
+    'DEFAULT_RANDOM_SEED', '_random', 'configure_random', 'basic_rnd', 'basic_sgn',
+]
+
+# Что ещё нужно встроить вместе с функцией
+_OUTPUT = ['DEFAULT_OUTPUT_BUFFER_SIZE', 'OutputBuffer', '_output']
+REQUIRES = {
+    'configure_output': _OUTPUT,
+    'flush_output': _OUTPUT,
+    'basic_write': _OUTPUT,
+    'basic_zone': ['PRINT_ZONE_WIDTH'],
+    'basic_print': _OUTPUT,
+    'BasicRope': ['BasicString'],
+    'basic_append': ['BasicString', 'BasicRope'],
+}
+_INPUT = _OUTPUT + ['BasicString', 'DEFAULT_INPUT_BLOCK_SIZE', 'BATCH_INPUT_VARIABLE', 'InputReader', '_input']
+for _name in ('configure_input', 'basic_input', 'basic_input_string', 'basic_input_number',
+              'basic_input_integer'):
+    REQUIRES[_name] = _INPUT
+REQUIRES['basic_input_fields'] = _INPUT + ['_parse_fields']
+_FILES = _INPUT + ['DEFAULT_FILE_BUFFER_SIZE', 'FileChannel', '_files']
+REQUIRES['basic_open'] = _FILES
+REQUIRES['basic_close'] = _FILES
+REQUIRES['file_write'] = _FILES + ['_channel']
+REQUIRES['file_input_fields'] = _FILES + ['_channel', '_parse_fields']
+REQUIRES['basic_eof'] = _FILES + ['_channel']
+REQUIRES['basic_open_random'] = _FILES + ['DEFAULT_RECORD_LENGTH', 'RecordFile']
+for _name in ('basic_field', 'file_get', 'file_put'):
+    REQUIRES[_name] = _FILES + ['RecordFile', '_record_file']
+REQUIRES['vector_loop'] = ['VECTOR_MIN_LENGTH', 'VECTOR_CHECK_TOLERANCE', 'OptionalModule', '_numpy']
+REQUIRES['DataReader'] = ['BasicString']
+_MAT = ['OptionalModule', '_numpy', 'mat_view', '_mat_check']
+for _name in ('mat_view', 'mat_assign', 'mat_add', 'mat_subtract', 'mat_multiply', 'mat_scale',
+              'mat_transpose', 'mat_inverse'):
+    REQUIRES[_name] = _MAT
+REQUIRES['mat_read'] = ['mat_rows']
+REQUIRES['configure_random'] = ['DEFAULT_RANDOM_SEED', '_random']
+REQUIRES['basic_rnd'] = ['DEFAULT_RANDOM_SEED', '_random']
+REQUIRES['mat_print'] = _OUTPUT + ['PRINT_ZONE_WIDTH', 'basic_zone', 'mat_rows']
+
+DEFAULT_OUTPUT_BUFFER_SIZE = 65536
+DEFAULT_INPUT_BLOCK_SIZE = 1 << 20
+# Переменная окружения, которая при запуске программы включает пакетный INPUT
+BATCH_INPUT_VARIABLE = 'BASIC_BATCH_INPUT'
+# Файлы OPEN читаются блоками и пишутся буфером такого размера
+DEFAULT_FILE_BUFFER_SIZE = 1 << 20
+# Длина записи файла RANDOM, если в OPEN нет LEN
+DEFAULT_RECORD_LENGTH = 128
+# Ширина зоны вывода: запятая в PRINT переводит позицию к началу следующей зоны
+PRINT_ZONE_WIDTH = 14
+# Цикл из меньшего числа итераций выгоднее выполнить обычным кодом, чем создавать срезы NumPy
+VECTOR_MIN_LENGTH = 32
+# Допустимое относительное расхождение результатов векторизованного цикла с их проверкой в float64
+VECTOR_CHECK_TOLERANCE = 1e-9
+# Начальное значение генератора RND: каждый запуск программы получает одну и ту же последовательность
+DEFAULT_RANDOM_SEED = 0
+
+
+class OutputBuffer:
+    """
+    Буфер вывода PRINT. Текст накапливается в памяти и записывается одним вызовом, когда
+    размер буфера превышает порог, перед INPUT и при завершении программы.
+    Если задан fd, данные пишутся прямо в файловый дескриптор, минуя sys.stdout.
+    """
+
+    def __init__(self, fd=None, buffer_size=DEFAULT_OUTPUT_BUFFER_SIZE):
+        self.fd = fd
+        self.buffer_size = buffer_size
+        self.parts = []
+        self.size = 0
+
+    def write(self, text):
+        self.parts.append(text)
+        self.size += len(text)
+        if self.size >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if not self.parts:
+            return
+        text = ''.join(self.parts)
+        self.parts = []
+        self.size = 0
+
+        if self.fd is None:
+            # sys.stdout берется в момент записи: его могли подменить после запуска программы
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            return
+
+        data = text.encode()
+        while data:
+            written = os.write(self.fd, data)
+            data = data[written:]
+
+
+_output = OutputBuffer()
+
+
+def configure_output(fd=None, buffer_size=DEFAULT_OUTPUT_BUFFER_SIZE):
+    """Задает файловый дескриптор вывода и порог сброса буфера (0 — сбрасывать после каждого PRINT)"""
+    _output.flush()
+    _output.fd = fd
+    _output.buffer_size = buffer_size
+
+
+def flush_output():
+    _output.flush()
+
+
+# Запись готовой строки PRINT: генератор собирает строку целиком и вызывает метод буфера напрямую
+basic_write = _output.write
+
+
+def basic_zone(text):
+    """Дополняет строку пробелами до начала следующей зоны вывода"""
+    return text + ' ' * (PRINT_ZONE_WIDTH - len(text) % PRINT_ZONE_WIDTH)
+
+
+def basic_print(*args, sep=''):
+    _output.write(sep.join(map(str, args)) + '\n')
+
+
+class BasicString(str):
+    def __add__(self, other):
+        return BasicString(super().__add__(str(other)))
+
+    def __radd__(self, other):
+        return BasicString(str(other) + self)
+
+
+class BasicRope:
+    """
+    Строка, которая растет дописыванием в конец (A$ = A$ + ...). Части копятся в списке и
+    склеиваются только когда значение выводится, сравнивается или измеряется.
+    Строка неизменяема: несколько строк делят один список частей, и каждая видит только
+    первые count его элементов. Дописывание в строку, которая заканчивается на конце списка,
+    стоит O(1), иначе части сначала копируются.
+    """
+    __slots__ = ('parts', 'count', 'text')
+
+    def __init__(self, parts, count):
+        self.parts = parts
+        self.count = count
+        self.text = None
+
+    def extend(self, values):
+        if self.text is not None:
+            # Уже склеенная строка продолжается с одной готовой части
+            parts = [self.text]
+        elif self.count == len(self.parts):
+            parts = self.parts
+        else:
+            parts = self.parts[:self.count]
+        parts.extend(values)
+        return BasicRope(parts, len(parts))
+
+    def __str__(self):
+        if self.text is None:
+            self.text = ''.join(self.parts[:self.count]) if self.count < len(self.parts) else ''.join(self.parts)
+        return self.text
+
+    def __repr__(self):
+        return repr(str(self))
+
+    def __format__(self, format_spec):
+        return str(self).__format__(format_spec)
+
+    def __len__(self):
+        return len(str(self))
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __add__(self, other):
+        return self.extend((str(other),))
+
+    def __radd__(self, other):
+        return BasicString(str(other) + str(self))
+
+    def __eq__(self, other):
+        return str(self) == other
+
+    def __ne__(self, other):
+        return str(self) != other
+
+    def __lt__(self, other):
+        return str(self) < other
+
+    def __le__(self, other):
+        return str(self) <= other
+
+    def __gt__(self, other):
+        return str(self) > other
+
+    def __ge__(self, other):
+        return str(self) >= other
+
+
+def basic_append(value, *values):
+    """A$ = A$ + X + Y: дописывает части к строке, превращая её в BasicRope при первом дописывании"""
+    if isinstance(value, BasicRope):
+        return value.extend(map(str, values))
+    parts = [str(value)]
+    parts.extend(map(str, values))
+    return BasicRope(parts, len(parts))
+
+
+
+class InputReader:
+    """
+    Источник строк для INPUT. По умолчанию каждая запись читается отдельной строкой после
+    сброса буфера вывода: подсказка видна до ввода, и программа, которой ввод подают
+    построчно через канал, не ждет заполнения блока. В пакетном режиме (batch=True) поток
+    читается блоками по block_size символов и сразу делится на записи, а INPUT берёт готовую
+    запись из списка без сброса вывода. Если batch не задан, пакетный режим включает
+    непустая переменная окружения BASIC_BATCH_INPUT (кроме '0').
+    """
+
+    def __init__(self, stream=None, block_size=DEFAULT_INPUT_BLOCK_SIZE, batch=None):
+        self.stream = stream
+        self.block_size = block_size
+        if batch is None:
+            batch = os.environ.get(BATCH_INPUT_VARIABLE, '') not in ('', '0')
+        self.batch = batch
+        self.records = []
+        # Записи блока, заранее разделенные на поля: заполняется при первом read_fields из блока
+        self.fields = None
+        self.position = 0
+        self.tail = ''
+
+    def read_record(self, prompt=None):
+        if not self.batch:
+            return self._read_line(prompt)
+        position = self._next_position(prompt)
+        return self.records[position]
+
+    def read_fields(self, prompt=None):
+        """Следующая запись, разделенная на поля по запятым; в пакетном режиме — весь блок сразу"""
+        if not self.batch:
+            return self._read_line(prompt).split(',')
+        position = self._next_position(prompt)
+        if self.fields is None:
+            self.fields = [record.split(',') for record in self.records]
+        return self.fields[position]
+
+    def _read_line(self, prompt):
+        if prompt:
+            _output.write(prompt)
+        _output.flush()
+        if self.stream is None:
+            return input()
+        line = self.stream.readline()
+        if not line:
+            raise EOFError("EOF when reading a line")
+        return line[:-1] if line.endswith('\n') else line
+
+    def _next_position(self, prompt):
+        """Номер следующей записи в текущем блоке; при необходимости читает следующий блок"""
+        if prompt:
+            _output.write(prompt)
+        while self.position >= len(self.records):
+            if not self._read_block():
+                _output.flush()
+                raise EOFError("EOF when reading a line")
+        self.position += 1
+        return self.position - 1
+
+    def _read_block(self):
+        block = (self.stream or sys.stdin).read(self.block_size)
+        if not block:
+            if not self.tail:
+                return False
+            # Последняя строка без перевода строки
+            self.records, self.tail = [self.tail], ''
+        else:
+            self.records = (self.tail + block).split('\n')
+            self.tail = self.records.pop()
+        self.fields = None
+        self.position = 0
+        return True
+
+    def at_end(self):
+        """Записи кончились: следующий read_record вызовет EOFError"""
+        while self.position >= len(self.records):
+            if not self._read_block():
+                return True
+        return False
+
+
+_input = InputReader()
+
+
+def configure_input(stream=None, block_size=DEFAULT_INPUT_BLOCK_SIZE, batch=None):
+    """
+    Задает поток INPUT (по умолчанию sys.stdin). batch=True включает пакетный режим:
+    чтение блоками по block_size символов; None — режим из переменной BASIC_BATCH_INPUT
+    """
+    _input.__init__(stream, block_size, batch)
+
+
+def basic_input(prompt=None):
+    return _input.read_record(prompt)
+
+
+def basic_input_string(prompt=None):
+    return BasicString(_input.read_record(prompt))
+
+
+def basic_input_number(prompt=None):
+    try:
+        return float(_input.read_record(prompt))
+    except ValueError:
+        return 0.0
+
+
+def basic_input_integer(prompt=None):
+    try:
+        return int(float(_input.read_record(prompt)))
+    except ValueError:
+        return 0
+
+
+def basic_input_fields(prompt, type_suffixes):
+    return _parse_fields(_input.read_fields(prompt), type_suffixes)
+
+
+def _parse_fields(fields, type_suffixes):
+    """
+    Поля записи, приведенные к типам переменных INPUT по их суффиксам. Если полей меньше,
+    чем переменных, список короче и оставшиеся переменные не меняются.
+    """
+    values = []
+    for field, suffix in zip(fields, type_suffixes):
+        if suffix == '$':
+            values.append(BasicString(field.strip()))
+            continue
+        # float() сам пропускает пробелы по краям
+        try:
+            number = float(field)
+        except ValueError:
+            number = 0.0
+        values.append(int(number) if suffix == '%' else number)
+    return values
+
+
+class FileChannel:
+    """
+    Последовательный файл, открытый OPEN ... AS #n. Файл INPUT читается блоками по
+    DEFAULT_FILE_BUFFER_SIZE символов, которые сразу делятся на записи, как пакетный ввод
+    INPUT. В файл OUTPUT или APPEND текст PRINT # копится в OutputBuffer и уходит в
+    дескриптор одним os.write на каждый заполненный буфер и при CLOSE.
+    """
+
+    def __init__(self, path, mode):
+        self.path = path
+        if mode == 'INPUT':
+            self.reader = InputReader(open(path, encoding='utf-8'), DEFAULT_FILE_BUFFER_SIZE, batch=True)
+            self.writer = None
+        else:
+            flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if mode == 'APPEND' else os.O_TRUNC)
+            self.reader = None
+            self.writer = OutputBuffer(os.open(path, flags, 0o666), DEFAULT_FILE_BUFFER_SIZE)
+
+    def at_end(self):
+        if self.reader is None:
+            raise ValueError(f"EOF: файл {self.path} открыт для записи")
+        return self.reader.at_end()
+
+    def close(self):
+        if self.writer is not None:
+            try:
+                self.writer.flush()
+            finally:
+                os.close(self.writer.fd)
+        else:
+            self.reader.stream.close()
+
+
+# Открытые файлы по номерам OPEN ... AS #n
+_files = {}
+
+
+def basic_open(path, mode, channel):
+    if channel in _files:
+        raise ValueError(f"Файл #{channel} уже открыт")
+    _files[channel] = FileChannel(str(path), mode)
+
+
+def basic_open_random(path, channel, record_length=DEFAULT_RECORD_LENGTH):
+    if channel in _files:
+        raise ValueError(f"Файл #{channel} уже открыт")
+    _files[channel] = RecordFile(str(path), record_length)
+
+
+def basic_close(*channels):
+    """CLOSE #n: записывает буфер и закрывает файл; без номеров закрывает все открытые файлы"""
+    for channel in channels or list(_files):
+        file = _files.pop(channel, None)
+        if file is not None:
+            file.close()
+
+
+def _channel(channel, writing):
+    file = _files.get(channel)
+    if not isinstance(file, FileChannel) or (file.writer is None) == writing:
+        purpose = "записи" if writing else "чтения"
+        raise ValueError(f"Файл #{channel} не открыт для {purpose}")
+    return file
+
+
+def file_write(channel, text):
+    """PRINT #n: готовая строка PRINT дописывается в буфер файла"""
+    _channel(channel, True).writer.write(text)
+
+
+def file_input_fields(channel, type_suffixes):
+    """INPUT #n: следующая запись файла, разделенная на поля, как в INPUT"""
+    return _parse_fields(_channel(channel, False).reader.read_fields(), type_suffixes)
+
+
+def basic_eof(channel):
+    """EOF(n): -1, если записи файла кончились, иначе 0"""
+    file = _files.get(channel)
+    if file is None:
+        raise ValueError(f"Файл #{channel} не открыт")
+    return -1.0 if file.at_end() else 0.0
+
+
+class RecordFile:
+    """
+    Файл записей фиксированной длины, открытый OPEN ... AS #n LEN = длина. Файл отображается в
+    память через mmap, и GET и PUT разбирают и собирают запись одним вызовом unpack_from или
+    pack_into struct.Struct полей FIELD прямо в отображении: без seek, read и write и без
+    копирования записи в промежуточный буфер. Запись за концом файла увеличивает отображение
+    вдвое; при CLOSE файл обрезается до конца последней записи.
+    """
+
+    def __init__(self, path, length):
+        if length < 1:
+            raise ValueError(f"Длина записи файла {path} должна быть положительной: {length}")
+        self.path = path
+        self.length = length
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o666)
+        # Размер файла в байтах; отображение может быть больше него после роста
+        self.file_size = os.fstat(self.fd).st_size
+        self.map = mmap.mmap(self.fd, self.file_size) if self.file_size else None
+        self.map_size = self.file_size
+        self.layout = None
+        # Значения полей пустой записи из нулевых байтов
+        self.empty = ()
+        # Номера строковых полей: их байты декодируются и кодируются отдельно
+        self.strings = []
+        # Номер записи последнего GET или PUT: GET без номера читает следующую
+        self.position = 0
+
+    def field(self, layout):
+        """FIELD: задает поля записи форматом struct и возвращает значения пустой записи"""
+        layout = struct.Struct(layout)
+        if layout.size > self.length:
+            raise ValueError(f"Поля FIELD занимают {layout.size} байт, больше длины записи {self.length}")
+        self.layout = layout
+        self.empty = layout.unpack(bytes(layout.size))
+        self.strings = [number for number, value in enumerate(self.empty) if isinstance(value, bytes)]
+        return self._values(self.empty)
+
+    def get(self, record):
+        offset = self._offset(record)
+        if offset + self.layout.size > self.file_size:
+            # Запись за концом файла пуста, как и пропущенные записи внутри него
+            return self._values(self.empty)
+        return self._values(self.layout.unpack_from(self.map, offset))
+
+    def put(self, record, values):
+        offset = self._offset(record)
+        end = offset + self.length
+        if end > self.map_size:
+            self._grow(max(end, 2 * self.map_size))
+        self.file_size = max(self.file_size, end)
+        values = list(values)
+        for number in self.strings:
+            values[number] = str(values[number]).encode()
+        self.layout.pack_into(self.map, offset, *values)
+
+    def at_end(self):
+        """Следующий GET без номера прочитает запись за концом файла"""
+        return self.position * self.length >= self.file_size
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+        try:
+            if self.map_size != self.file_size:
+                os.ftruncate(self.fd, self.file_size)
+        finally:
+            os.close(self.fd)
+
+    def _offset(self, record):
+        if self.layout is None:
+            raise ValueError(f"Для файла {self.path} не выполнен FIELD")
+        if record is None:
+            record = self.position + 1
+        if record < 1:
+            raise ValueError(f"Номер записи должен быть не меньше 1: {record}")
+        self.position = record
+        return (record - 1) * self.length
+
+    def _grow(self, size):
+        if self.map is None:
+            os.ftruncate(self.fd, size)
+            self.map = mmap.mmap(self.fd, size)
+        else:
+            # resize увеличивает и сам файл
+            self.map.resize(size)
+        self.map_size = size
+
+    def _values(self, values):
+        """Поля записи для переменных FIELD: строка — до первого нулевого байта заполнения"""
+        values = list(values)
+        for number in self.strings:
+            values[number] = BasicString(values[number].rstrip(b'\0').decode('utf-8', 'ignore'))
+        return values
+
+
+def _record_file(channel):
+    file = _files.get(channel)
+    if not isinstance(file, RecordFile):
+        raise ValueError(f"Файл #{channel} не открыт как файл записей (OPEN ... LEN =)")
+    return file
+
+
+def basic_field(channel, layout):
+    return _record_file(channel).field(layout)
+
+
+def file_get(channel, record=None):
+    return _record_file(channel).get(record)
+
+
+def file_put(channel, record, *values):
+    _record_file(channel).put(record, values)
+
+
+def basic_index(index, bound):
+    """Индекс измерения массива: дробная часть отбрасывается, результат от 0 до bound из DIM"""
+    index = int(index)
+    if 0 <= index <= bound:
+        return index
+    raise IndexError(f"Индекс {index} вне границ измерения массива 0..{bound}")
+
+
+class OptionalModule:
+    """
+    Необязательная зависимость. Модуль импортируется при первом вызове load(), а не при
+    загрузке среды выполнения; если он не установлен, load() возвращает None и больше не
+    пытается его импортировать.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.module = None
+        self.loaded = False
+
+    def load(self):
+        if not self.loaded:
+            try:
+                self.module = __import__(self.name)
+            except ImportError:
+                self.module = None
+            self.loaded = True
+        return self.module
+
+
+_numpy = OptionalModule('numpy')
+
+
+def vector_loop(kernel, loop_range, accesses, written, values, index_typecode=None):
+    """
+    Выполняет цикл FOR над элементами массивов одним вызовом kernel над срезами NumPy.
+
+    accesses — четверки (хранилище array, смещение, шаг, границы): на итерации со значением I
+    переменной цикла обращение читает или пишет элемент хранилища с индексом смещение + шаг * I.
+    Границы — пары (индекс, наибольший индекс DIM) измерений элемента; первая пара — измерение
+    переменной цикла, его индекс на итерации равен индекс + I. kernel получает срезы всех
+    обращений, значения values и, если задан index_typecode, массив значений переменной цикла,
+    и возвращает новые значения обращений с номерами из written.
+
+    Возвращает False, ничего не изменив, если цикл нужно выполнить обычным кодом: NumPy не
+    установлен, итераций мало, индекс выходит за границы измерения или вычисление дает
+    ошибку (деление на ноль, переполнение) — ее воспроизведет обычный цикл.
+
+    Целые срезы при переполнении 64 бит отбрасывают старшие биты, а обычный цикл считает в
+    целых Python без ограничения. Поэтому, если ядро получает целые значения, оно выполняется
+    еще раз над их копиями в float64, и при расхождении результатов цикл тоже выполняется
+    обычным кодом.
+    """
+    count = len(loop_range)
+    if count < VECTOR_MIN_LENGTH:
+        return False
+    numpy = _numpy.load()
+    if numpy is None:
+        return False
+
+    slices = []
+    for storage, offset, stride, bounds in accesses:
+        (shift, bound), fixed = bounds[0], bounds[1:]
+        low, high = sorted((shift + loop_range[0], shift + loop_range[-1]))
+        if low < 0 or high > bound or not all(0 <= index <= limit for index, limit in fixed):
+            return False
+        first = offset + stride * loop_range.start
+        step = stride * loop_range.step
+        last = first + step * (count - 1)
+        stop = last + (1 if step > 0 else -1)
+        slices.append(numpy.frombuffer(storage, storage.typecode)[first:stop if stop >= 0 else None:step])
+
+    arguments = slices + list(values)
+    if index_typecode is not None:
+        arguments.append(numpy.arange(loop_range.start, loop_range.stop, loop_range.step, dtype=index_typecode))
+    try:
+        with numpy.errstate(all='raise'):
+            # Результаты приводятся к типу хранилища до записи: ошибка приведения не должна
+            # оставить часть массивов измененной
+            outputs = kernel(*arguments)
+            results = [numpy.asarray(value, slices[number].dtype) for number, value in zip(written, outputs)]
+            if any(numpy.asarray(argument).dtype.kind == 'i' for argument in arguments):
+                checked = kernel(*[
+                    numpy.asarray(argument, numpy.float64) if numpy.asarray(argument).dtype.kind == 'i' else argument
+                    for argument in arguments
+                ])
+                if not all(
+                    numpy.allclose(value, expected, rtol=VECTOR_CHECK_TOLERANCE, atol=0)
+                    for value, expected in zip(outputs, checked)
+                ):
+                    return False
+    except ArithmeticError:
+        return False
+    for number, value in zip(written, results):
+        slices[number][...] = value
+    return True
+
+
+
+class DataReader:
+    """Значения DATA программы: READ и MAT READ берут их по очереди"""
+
+    def __init__(self, values):
+        self.values = values
+        self.position = 0
+
+    def read(self):
+        if self.position >= len(self.values):
+            raise EOFError("Нет данных для READ: значения DATA закончились")
+        value = self.values[self.position]
+        self.position += 1
+        return value
+
+    def read_number(self):
+        value = self.read()
+        if isinstance(value, str):
+            raise TypeError(f"READ: строка {value!r} читается в числовую переменную")
+        return value
+
+    def read_integer(self):
+        return int(self.read_number())
+
+    def read_string(self):
+        value = self.read()
+        if not isinstance(value, str):
+            raise TypeError(f"READ: число {value!r} читается в строковую переменную")
+        return BasicString(value)
+
+
+def mat_view(storage, columns):
+    """
+    Массив NumPy над хранилищем array без копирования: элементы с индексами от 1, как их
+    видят операции MAT. columns — размер второго измерения матрицы, None для вектора
+    """
+    numpy = _numpy.load()
+    if numpy is None:
+        raise ImportError("Для вычислений MAT нужен NumPy")
+    values = numpy.frombuffer(storage, storage.typecode)
+    if columns is None:
+        return values[1:]
+    return values.reshape(-1, columns)[1:, 1:]
+
+
+def _mat_check(condition, message, *matrices):
+    if not condition:
+        shapes = ' и '.join(' x '.join(map(str, matrix.shape)) for matrix in matrices)
+        raise ValueError(f"{message}: {shapes}")
+
+
+def mat_assign(storage, columns, value):
+    """Записывает результат операции MAT в массив; целый массив получает целые части значений"""
+    numpy = _numpy.load()
+    target = mat_view(storage, columns)
+    value = numpy.asarray(value)
+    _mat_check(value.shape == target.shape, "MAT: размер результата не совпадает с размером массива", value, target)
+    with numpy.errstate(all='raise'):
+        target[...] = value.astype(target.dtype)
+
+
+def mat_add(first, second):
+    _mat_check(first.shape == second.shape, "MAT +: размеры массивов не совпадают", first, second)
+    return first + second
+
+
+def mat_subtract(first, second):
+    _mat_check(first.shape == second.shape, "MAT -: размеры массивов не совпадают", first, second)
+    return first - second
+
+
+def mat_multiply(first, second):
+    """Матричное произведение через BLAS: вектор слева — строка, справа — столбец"""
+    _mat_check(
+        first.ndim + second.ndim > 2 and first.shape[-1] == second.shape[0],
+        "MAT *: число столбцов первого множителя не равно числу строк второго", first, second
+    )
+    return _numpy.load().matmul(first, second)
+
+
+def mat_scale(factor, matrix):
+    return factor * matrix
+
+
+def mat_transpose(matrix):
+    _mat_check(matrix.ndim == 2, "MAT TRN: транспонировать можно только матрицу", matrix)
+    # Копия: MAT A = TRN(A) не должна читать уже записанные элементы
+    return matrix.T.copy()
+
+
+def mat_inverse(matrix):
+    _mat_check(
+        matrix.ndim == 2 and matrix.shape[0] == matrix.shape[1],
+        "MAT INV: обратная матрица есть только у квадратной матрицы", matrix
+    )
+    numpy = _numpy.load()
+    try:
+        return numpy.linalg.inv(matrix)
+    except numpy.linalg.LinAlgError:
+        raise ZeroDivisionError("MAT INV: матрица вырождена") from None
+
+
+def mat_rows(storage, columns):
+    """Строки массива для MAT READ и MAT PRINT: диапазоны индексов хранилища без строки и столбца 0"""
+    if columns is None:
+        return [range(1, len(storage))]
+    return [range(row + 1, row + columns) for row in range(columns, len(storage), columns)]
+
+
+def mat_read(storage, columns, data):
+    """MAT READ: элементы массива по строкам получают очередные значения DATA"""
+    convert = int if storage.typecode == 'q' else float
+    for row in mat_rows(storage, columns):
+        for index in row:
+            storage[index] = convert(data.read_number())
+
+
+def mat_print(storage, columns, packed=False):
+    """
+    MAT PRINT: строка матрицы — строка вывода, элементы по зонам или вплотную, как в PRINT
+    с запятыми или точками с запятой. Вектор печатается столбцом, после массива — пустая строка
+    """
+    rows = mat_rows(storage, columns)
+    if columns is None:
+        rows = [[index] for index in rows[0]]
+    for row in rows:
+        text = ''
+        for position, index in enumerate(row):
+            text += str(storage[index])
+            if not packed and position < len(row) - 1:
+                text = basic_zone(text)
+        _output.write(text + '\n')
+    _output.write('\n')
+
+
+
+# Генератор RND — вихрь Мерсенна модуля random, реализованный на C
+_random = random.Random(DEFAULT_RANDOM_SEED)
+
+
+def configure_random(seed=DEFAULT_RANDOM_SEED):
+    """Задает начальное значение RND; None — случайное, из системного источника"""
+    _random.seed(seed)
+
+
+# RND: сгенерированный код вызывает метод генератора напрямую, без промежуточной функции
+basic_rnd = _random.random
+
+
+def basic_sgn(value):
+    """SGN: 1, -1 или 0; для float аргумента результат тоже float"""
+    sign = (value > 0) - (value < 0)
+    return float(sign) if isinstance(value, float) else sign
+
+
+# Программа, чей main() вызвали напрямую после импорта, сбрасывает вывод при выходе интерпретатора
+atexit.register(flush_output)
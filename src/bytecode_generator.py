@@ -0,0 +1,947 @@
+import ast
+import dis
+import inspect
+import opcode
+import sys
+import types
+
+from ast_nodes import (
+    ProgramNode, PrintNode, LetNode, EndNode, IfNode, ForNode, WhileNode, InputNode,
+    NumberNode, StringNode, VariableNode, BinaryOpNode, UnaryOpNode, DimNode, ArrayElementNode,
+    MatLetNode, MatReadNode, MatPrintNode, DataNode, ReadNode, FunctionCallNode,
+    DefFnNode, FnCallNode, OpenNode, CloseNode, FieldNode, GetNode, PutNode
+)
+from code_generator import MAT_OPERATIONS
+from control_flow import ControlFlowBuilder, Jump, Branch, Switch, Call, Return, Halt
+from python_ast_generator import PythonAstGenerator
+from semantic_analyzer import TypeInference
+
+# Версия CPython, байт-код которой собирает генератор
+BYTECODE_VERSION = (3, 11)
+
+# Аргументы BINARY_OP (NB_ADD, NB_MULTIPLY, NB_SUBTRACT, NB_TRUE_DIVIDE) и COMPARE_OP (индексы dis.cmp_op)
+BINARY_OPS = {'+': 0, '*': 5, '-': 10, '/': 11}
+# Аргумент BINARY_OP для INT(X), который вычисляется как X // 1
+NB_FLOOR_DIVIDE = 2
+COMPARE_OPS = {'<': 0, '<=': 1, '=': 2, '<>': 3, '>': 4, '>=': 5}
+UNARY_OPS = {'-': 'UNARY_NEGATIVE', '+': 'UNARY_POSITIVE'}
+
+# Переходы задаются без направления; ассемблер выбирает инструкцию по взаимному положению
+JUMPS = {
+    'JUMP': ('JUMP_FORWARD', 'JUMP_BACKWARD'),
+    'POP_JUMP_IF_FALSE': ('POP_JUMP_FORWARD_IF_FALSE', 'POP_JUMP_BACKWARD_IF_FALSE'),
+    'POP_JUMP_IF_TRUE': ('POP_JUMP_FORWARD_IF_TRUE', 'POP_JUMP_BACKWARD_IF_TRUE'),
+    'FOR_ITER': ('FOR_ITER', None),
+}
+# После этих инструкций выполнение не переходит к следующей
+NO_FALLTHROUGH = ('JUMP', 'RETURN_VALUE')
+
+
+def bytecode_supported():
+    return sys.version_info[:2] == BYTECODE_VERSION
+
+
+class Label:
+    """Позиция в коде, на которую ссылаются переходы"""
+
+    def __init__(self):
+        self.index = None
+        self.offset = None
+
+
+class Assembler:
+    """
+    Собирает объект кода CPython 3.11 из списка инструкций и меток: расставляет кэши
+    инструкций, выбирает направление переходов, добавляет префиксы EXTENDED_ARG
+    и вычисляет глубину стека.
+    """
+
+    def __init__(self):
+        self.items = []
+        self.consts = {}
+        self.names = {}
+        self.varnames = {}
+
+    def emit(self, name, arg=0):
+        self.items.append((name, arg))
+
+    def place(self, label):
+        label.index = len(self.items)
+        self.items.append(label)
+
+    def const(self, value):
+        # 1, 1.0 и True равны как ключи словаря, поэтому ключ константы включает ее тип
+        key = (type(value), repr(value))
+        if key not in self.consts:
+            self.consts[key] = (len(self.consts), value)
+        return self.consts[key][0]
+
+    def name(self, name):
+        return self.names.setdefault(name, len(self.names))
+
+    def varname(self, name):
+        return self.varnames.setdefault(name, len(self.varnames))
+
+    def code_object(self, name, filename):
+        code = self._assemble()
+        return types.CodeType(
+            0, 0, 0, len(self.varnames), self._stack_size(), inspect.CO_OPTIMIZED | inspect.CO_NEWLOCALS,
+            code, tuple(value for _, value in self.consts.values()), tuple(self.names), tuple(self.varnames),
+            filename, name, name, 1, self._line_table(len(code) // 2), b''
+        )
+
+    def _assemble(self):
+        # Длина перехода зависит от числа префиксов EXTENDED_ARG, а они — от длины переходов,
+        # поэтому смещения пересчитываются, пока не перестанут меняться
+        prefixes = [0] * len(self.items)
+        while True:
+            offset = 0
+            for index, item in enumerate(self.items):
+                if isinstance(item, Label):
+                    item.offset = offset
+                else:
+                    offset += self._size(index, item, prefixes[index])
+
+            changed = False
+            offset = 0
+            resolved = []
+            for index, item in enumerate(self.items):
+                if isinstance(item, Label):
+                    continue
+                offset += self._size(index, item, prefixes[index])
+                name, arg = self._resolve(index, item, offset)
+                needed = (arg > 0xFF) + (arg > 0xFFFF) + (arg > 0xFFFFFF)
+                if needed > prefixes[index]:
+                    prefixes[index] = needed
+                    changed = True
+                resolved.append((name, arg, prefixes[index]))
+            if not changed:
+                break
+
+        code = bytearray()
+        for name, arg, count in resolved:
+            for shift in range(count, 0, -1):
+                code += bytes([opcode.opmap['EXTENDED_ARG'], (arg >> (8 * shift)) & 0xFF])
+            code += bytes([opcode.opmap[name], arg & 0xFF])
+            code += bytes(2 * self._caches(name))
+        return bytes(code)
+
+    def _real_name(self, index, item):
+        name, arg = item
+        if name not in JUMPS:
+            return name
+        forward, backward = JUMPS[name]
+        return forward if arg.index > index else backward
+
+    def _size(self, index, item, prefix_count):
+        """Длина инструкции в единицах кода вместе с префиксами и кэшами"""
+        return prefix_count + 1 + self._caches(self._real_name(index, item))
+
+    def _resolve(self, index, item, next_offset):
+        """Настоящая инструкция и аргумент; next_offset — смещение следующей инструкции"""
+        name, arg = item
+        if name not in JUMPS:
+            return name, arg
+        real_name = self._real_name(index, item)
+        if arg.index > index:
+            return real_name, arg.offset - next_offset
+        return real_name, next_offset - arg.offset
+
+    def _caches(self, name):
+        return opcode._inline_cache_entries[opcode.opmap[name]]
+
+    def _stack_size(self):
+        depths = {}
+        worklist = [(0, 0)]
+        max_depth = 0
+        while worklist:
+            index, depth = worklist.pop()
+            while index < len(self.items) and depths.get(index, -1) < depth:
+                depths[index] = depth
+                item = self.items[index]
+                if isinstance(item, Label):
+                    index += 1
+                    continue
+
+                name, arg = item
+                op = opcode.opmap[self._real_name(index, item)]
+                index += 1
+                if name in JUMPS:
+                    jump_depth = depth + dis.stack_effect(op, 0, jump=True)
+                    max_depth = max(max_depth, jump_depth)
+                    worklist.append((arg.index, jump_depth))
+                    depth += dis.stack_effect(op, 0, jump=False)
+                else:
+                    depth += dis.stack_effect(op, arg if op >= opcode.HAVE_ARGUMENT else None)
+                max_depth = max(max_depth, depth)
+                if name in NO_FALLTHROUGH:
+                    break
+        return max_depth
+
+    def _line_table(self, code_units):
+        # Все инструкции относятся к строке 1: записи формата 13 (строка без колонок) по 8 единиц кода
+        table = bytearray()
+        while code_units > 0:
+            length = min(code_units, 8)
+            table += bytes([0x80 | (13 << 3) | (length - 1), 0])
+            code_units -= length
+        return bytes(table)
+
+
+class BytecodeGenerator(PythonAstGenerator):
+    """
+    Генератор, который собирает main() прямо в байт-код CPython из графа потока управления.
+    Вся программа выполняется в одном кадре: переменные — быстрые локальные переменные,
+    GOTO и переходы циклов — инструкции перехода, GOSUB/RETURN — стек номеров блоков
+    возврата в локальной переменной. Модуль вокруг main() строится генератором ast.
+    """
+
+    def generate_code(self, ast_root, filename='<basic>'):
+        """Объект кода модуля программы"""
+        if not isinstance(ast_root, ProgramNode):
+            raise ValueError("Ожидается корень AST дерева типа ProgramNode")
+        if not bytecode_supported():
+            raise ValueError(f"Байт-код собирается только для CPython {'.'.join(map(str, BYTECODE_VERSION))}")
+
+        builder = ControlFlowBuilder()
+        cfg = builder.build(ast_root)
+        # Служебные переменные циклов продолжают нумерацию построителя графа
+        self.loop_counter = builder.loop_counter
+
+        # Типы выводятся по инструкциям графа: в нем есть присваивания, созданные при понижении циклов
+        conditions = [block.terminator.condition for block in cfg.blocks if isinstance(block.terminator, Branch)]
+        selectors = [block.terminator.selector for block in cfg.blocks if isinstance(block.terminator, Switch)]
+        program = ProgramNode([stmt for block in cfg.blocks for stmt in block.statements] + conditions + selectors)
+        self._collect_arrays(program)
+        self._count_variable_references(program)
+        self.type_inference.infer(program)
+
+        main_code = self._assemble_main(cfg, program, filename)
+        module_code = compile(self._build_module([self._function('main', [ast.Pass()])]), filename, 'exec')
+        consts = tuple(
+            main_code if isinstance(const, types.CodeType) and const.co_name == 'main' else const
+            for const in module_code.co_consts
+        )
+        return module_code.replace(co_consts=consts)
+
+    def _assemble_main(self, cfg, program, filename):
+        self.asm = Assembler()
+        self.block_labels = {block: Label() for block in cfg.blocks}
+        self.return_blocks = sorted(
+            {block.terminator.return_target for block in cfg.blocks if isinstance(block.terminator, Call)},
+            key=lambda block: block.id
+        )
+
+        self.asm.emit('RESUME', 0)
+        # Встроенные функции один раз копируются в локальные переменные, как значения по умолчанию
+        # параметров в других генераторах
+        for name, value in self._function_parameters(program.statements):
+            self._emit_load_global(value)
+            self._emit_store(name)
+        for name, variable in self._local_variables(program.statements).items():
+            value = self._default_value(variable)
+            if isinstance(value, str):
+                self._emit_load_global(self._string_constant(value))
+            else:
+                self.asm.emit('LOAD_CONST', self.asm.const(value))
+            self._emit_store(name)
+        if self.return_blocks:
+            self.asm.emit('BUILD_LIST', 0)
+            self._emit_store('_gosub_stack')
+
+        for position, block in enumerate(cfg.blocks):
+            self.asm.place(self.block_labels[block])
+            self._emit_statements(block.statements)
+            next_block = cfg.blocks[position + 1] if position + 1 < len(cfg.blocks) else None
+            self._emit_terminator(block.terminator, next_block)
+
+        return self.asm.code_object('main', filename)
+
+    def _emit_terminator(self, terminator, next_block):
+        if isinstance(terminator, Jump):
+            self._emit_jump_to(terminator.target, next_block)
+        elif isinstance(terminator, Branch):
+            self._emit_expression(terminator.condition, exact=False)
+            if terminator.true_target is next_block:
+                self.asm.emit('POP_JUMP_IF_FALSE', self.block_labels[terminator.false_target])
+            else:
+                self.asm.emit('POP_JUMP_IF_TRUE', self.block_labels[terminator.true_target])
+                self._emit_jump_to(terminator.false_target, next_block)
+        elif isinstance(terminator, Switch):
+            self._emit_switch(terminator)
+        elif isinstance(terminator, Call):
+            self._emit_load('_gosub_stack')
+            self.asm.emit('LOAD_METHOD', self.asm.name('append'))
+            self.asm.emit('LOAD_CONST', self.asm.const(terminator.return_target.id))
+            self._emit_call(1)
+            self.asm.emit('POP_TOP')
+            self._emit_jump_to(terminator.target, next_block)
+        elif isinstance(terminator, Return):
+            self._emit_return()
+        elif isinstance(terminator, Halt):
+            self._emit_return_none()
+
+    def _emit_switch(self, switch):
+        """Переход по таблице: словарь дает номер блока, блок выбирается деревом сравнений"""
+        arms = switch.arms()
+        table = self._switch_table([keys for _, keys in arms], [target.id for target, _ in arms])
+        self._emit_load_global(table)
+        self.asm.emit('LOAD_METHOD', self.asm.name('get'))
+        if switch.rounded and not self._is_int_valued(switch.selector):
+            self._emit_load_function('int')
+            self._emit_expression(switch.selector, exact=False)
+            self.asm.emit('LOAD_CONST', self.asm.const(0.5))
+            self.asm.emit('BINARY_OP', BINARY_OPS['+'])
+            self._emit_call(1)
+        else:
+            self._emit_operand(switch.selector, exact=False)
+        self.asm.emit('LOAD_CONST', self.asm.const(switch.default.id))
+        self._emit_call(2)
+        self._emit_store('_case')
+        targets = sorted([target for target, _ in arms] + [switch.default], key=lambda block: block.id)
+        self._emit_block_tree('_case', targets, 0, len(targets))
+
+    def _emit_jump_to(self, block, next_block):
+        if block is None:
+            self._emit_return_none()
+        elif block is not next_block:
+            self.asm.emit('JUMP', self.block_labels[block])
+
+    def _emit_return(self):
+        """RETURN: номер блока возврата снимается со стека и выбирается деревом сравнений"""
+        if not self.return_blocks:
+            self._emit_return_none()
+            return
+
+        has_return = Label()
+        self._emit_load('_gosub_stack')
+        self.asm.emit('POP_JUMP_IF_TRUE', has_return)
+        # RETURN без GOSUB завершает программу, как и в цикле диспетчеризации
+        self._emit_return_none()
+        self.asm.place(has_return)
+        self._emit_load('_gosub_stack')
+        self.asm.emit('LOAD_METHOD', self.asm.name('pop'))
+        self._emit_call(0)
+        self._emit_store('_return_to')
+        self._emit_block_tree('_return_to', self.return_blocks, 0, len(self.return_blocks))
+
+    def _emit_block_tree(self, variable, blocks, low, high):
+        """Переход к блоку, номер которого в переменной: blocks упорядочены по номерам"""
+        if high - low == 1:
+            self.asm.emit('JUMP', self.block_labels[blocks[low]])
+            return
+
+        middle = (low + high) // 2
+        upper = Label()
+        self._emit_load(variable)
+        self.asm.emit('LOAD_CONST', self.asm.const(blocks[middle].id))
+        self.asm.emit('COMPARE_OP', COMPARE_OPS['<'])
+        self.asm.emit('POP_JUMP_IF_FALSE', upper)
+        self._emit_block_tree(variable, blocks, low, middle)
+        self.asm.place(upper)
+        self._emit_block_tree(variable, blocks, middle, high)
+
+    def _emit_return_none(self):
+        self.asm.emit('LOAD_CONST', self.asm.const(None))
+        self.asm.emit('RETURN_VALUE')
+
+    def _emit_statements(self, statements):
+        for stmt in statements:
+            if isinstance(stmt, LetNode):
+                self._emit_let(stmt)
+            elif isinstance(stmt, PrintNode):
+                self._emit_print(stmt)
+            elif isinstance(stmt, IfNode):
+                self._emit_if(stmt)
+            elif isinstance(stmt, ForNode) and stmt.body is not None:
+                self._emit_for(stmt)
+            elif isinstance(stmt, WhileNode):
+                self._emit_while(stmt)
+            elif isinstance(stmt, InputNode):
+                self._emit_input(stmt)
+            elif isinstance(stmt, DimNode):
+                self._emit_dim(stmt)
+            elif isinstance(stmt, MatLetNode):
+                self._emit_mat_let(stmt)
+            elif isinstance(stmt, MatReadNode):
+                self._emit_mat_read(stmt)
+            elif isinstance(stmt, MatPrintNode):
+                self._emit_mat_print(stmt)
+            elif isinstance(stmt, ReadNode):
+                self._emit_read(stmt)
+            elif isinstance(stmt, OpenNode):
+                self._emit_open(stmt)
+            elif isinstance(stmt, CloseNode):
+                self._emit_close(stmt)
+            elif isinstance(stmt, FieldNode):
+                self._emit_field(stmt)
+            elif isinstance(stmt, GetNode):
+                self._emit_get(stmt)
+            elif isinstance(stmt, PutNode):
+                self._emit_put(stmt)
+            elif isinstance(stmt, (DataNode, DefFnNode)):
+                pass
+            elif isinstance(stmt, EndNode):
+                self._emit_return_none()
+            else:
+                raise ValueError(f"Узел {type(stmt).__name__} не поддерживается генератором байт-кода")
+
+    def _emit_let(self, let_node):
+        var_name = self._format_variable_name(let_node.variable)
+
+        if let_node.variable.type_suffix == '$':
+            appended = self._appended_parts(let_node)
+            if appended:
+                self._emit_load_function(self._runtime('basic_append'))
+                self._emit_load(var_name)
+                for part in appended:
+                    self._emit_operand(part)
+                self._emit_call(len(appended) + 1)
+            else:
+                self._emit_assigned_value('$', let_node.value)
+        else:
+            self._emit_assigned_value(let_node.variable.type_suffix, let_node.value)
+
+        self._emit_store_target(let_node.variable)
+
+    def _emit_assigned_value(self, type_suffix, value_node, exact=True):
+        """Значение на стеке, как в _build_assigned_value"""
+        if type_suffix == '$' and self._expression_type(value_node) != TypeInference.STRING:
+            self._emit_load_function(self._runtime('BasicString'))
+            self._emit_expression(value_node)
+            self._emit_call(1)
+        elif type_suffix == '$':
+            self._emit_expression(value_node)
+        elif type_suffix == '%' and not self._is_int_valued(value_node):
+            self._emit_load_function('int')
+            self._emit_expression(value_node, exact=False)
+            self._emit_call(1)
+        elif type_suffix == '%':
+            self._emit_expression(value_node, exact=False)
+        else:
+            self._emit_expression(value_node, exact)
+
+    def _emit_print(self, print_node):
+        if print_node.channel is not None:
+            self._emit_load_function(self._runtime('file_write'))
+            self._emit_integer_expression(print_node.channel)
+        else:
+            self._emit_load_function(self._runtime('basic_write'))
+        self._emit_print_string(self._print_groups(print_node), '\n')
+        self._emit_call(1 if print_node.channel is None else 2)
+        self.asm.emit('POP_TOP')
+
+    def _emit_print_string(self, groups, tail):
+        """Кладет на стек строку из групп PRINT; все группы, кроме последней, дополняются до зоны"""
+        pieces = 0
+        if len(groups) > 1:
+            self._emit_load_function(self._runtime('basic_zone'))
+            self._emit_print_string(groups[:-1], '')
+            self._emit_call(1)
+            pieces += 1
+
+        merged = []
+        for is_text, value in groups[-1] + [(True, tail)]:
+            if is_text and merged and merged[-1][0]:
+                merged[-1] = (True, merged[-1][1] + value)
+            elif not is_text or value:
+                merged.append((is_text, value))
+
+        for is_text, value in merged:
+            if is_text:
+                self.asm.emit('LOAD_CONST', self.asm.const(value))
+            else:
+                self._emit_expression(value)
+                self.asm.emit('FORMAT_VALUE', 0)
+            pieces += 1
+
+        if pieces == 0:
+            self.asm.emit('LOAD_CONST', self.asm.const(''))
+        elif pieces > 1:
+            self.asm.emit('BUILD_STRING', pieces)
+
+    def _emit_if(self, if_node):
+        else_label = Label()
+        self._emit_expression(if_node.condition, exact=False)
+        self.asm.emit('POP_JUMP_IF_FALSE', else_label)
+        self._emit_statements([if_node.then_branch] if if_node.then_branch else [])
+        if if_node.else_branch:
+            end_label = Label()
+            self.asm.emit('JUMP', end_label)
+            self.asm.place(else_label)
+            self._emit_statements([if_node.else_branch])
+            self.asm.place(end_label)
+        else:
+            self.asm.place(else_label)
+
+    def _emit_while(self, while_node):
+        head = Label()
+        exit_label = Label()
+        self.asm.place(head)
+        constant = self._constant_value(while_node.condition)
+        if constant is None or constant == 0:
+            self._emit_expression(while_node.condition, exact=False)
+            self.asm.emit('POP_JUMP_IF_FALSE', exit_label)
+        self._emit_statements(while_node.body)
+        self.asm.emit('JUMP', head)
+        self.asm.place(exit_label)
+
+    def _emit_for(self, for_node):
+        """FOR с телом: обход range() при доказуемо целых границах, иначе сравнение и переход"""
+        self.loop_counter += 1
+        step = self._constant_value(for_node.step_value) if for_node.step_value else 1
+        bounds = [for_node.start_value, for_node.end_value] + ([for_node.step_value] if for_node.step_value else [])
+
+        if (step is not None and step != 0 and for_node.loop_variable.type_suffix != '$'
+                and all(self._is_int_valued(expr) for expr in bounds)):
+            self._emit_for_range(for_node, int(step))
+        else:
+            self._emit_for_while(for_node, step)
+
+    def _emit_for_range(self, for_node, step):
+        loop_var = self._format_variable_name(for_node.loop_variable)
+        range_var = f"_for{self.loop_counter}_range"
+        is_float = for_node.loop_variable.type_suffix != '%'
+        read_outside = self._is_read_outside(for_node)
+        plan = self.vectorizer.plan(for_node)
+        stored = read_outside or plan is not None
+
+        if stored:
+            self._emit_range(for_node, step)
+            self._emit_store(range_var)
+        exit_label = Label()
+        if plan is not None:
+            self._emit_vector_loop_call(plan, range_var)
+            self.asm.emit('POP_JUMP_IF_TRUE', exit_label)
+        if is_float:
+            self._emit_load_function('map')
+            self._emit_load_global('float')
+        if stored:
+            self._emit_load(range_var)
+        else:
+            self._emit_range(for_node, step)
+        if is_float:
+            self._emit_call(2)
+
+        head = Label()
+        self.asm.emit('GET_ITER')
+        self.asm.place(head)
+        self.asm.emit('FOR_ITER', exit_label)
+        self._emit_store(loop_var)
+        self._in_loop_range(for_node, self._emit_statements)
+        self.asm.emit('JUMP', head)
+        self.asm.place(exit_label)
+
+        if read_outside:
+            if is_float:
+                self._emit_load_function('float')
+            self._emit_load(range_var)
+            self.asm.emit('LOAD_ATTR', self.asm.name('start'))
+            self._emit_load_function('len')
+            self._emit_load(range_var)
+            self._emit_call(1)
+            self._emit_load(range_var)
+            self.asm.emit('LOAD_ATTR', self.asm.name('step'))
+            self.asm.emit('BINARY_OP', BINARY_OPS['*'])
+            self.asm.emit('BINARY_OP', BINARY_OPS['+'])
+            if is_float:
+                self._emit_call(1)
+            self._emit_store(loop_var)
+
+    def _emit_vector_loop_call(self, plan, range_var):
+        self._emit_load_function(self._runtime('vector_loop'))
+        self._emit_load_global(self._build_vector_kernel(plan))
+        self._emit_load(range_var)
+        for access in plan.accesses:
+            self._emit_load(self._format_variable_name(access.base))
+            self._emit_array_index(access.base, checked=False)
+            self.asm.emit('LOAD_CONST', self.asm.const(self._array_stride(access)))
+            dimensions = self._access_dimensions(access)
+            for dimension in dimensions:
+                self._emit_integer_expression(access.base.indices[dimension])
+                self._emit_array_bound(access.base, dimension)
+                self.asm.emit('BUILD_TUPLE', 2)
+            self.asm.emit('BUILD_TUPLE', len(dimensions))
+            self.asm.emit('BUILD_TUPLE', 4)
+        self.asm.emit('BUILD_TUPLE', len(plan.accesses))
+        self.asm.emit('LOAD_CONST', self.asm.const(tuple(plan.written)))
+        for scalar in plan.scalars:
+            self._emit_expression(scalar)
+        self.asm.emit('BUILD_TUPLE', len(plan.scalars))
+        arguments = 5
+        if plan.index is not None:
+            self.asm.emit('LOAD_CONST', self.asm.const(self._array_typecode(plan.index)[0]))
+            arguments += 1
+        self._emit_call(arguments)
+
+    def _emit_range(self, for_node, step):
+        self._emit_load_function('range')
+        self._emit_integer_expression(for_node.start_value)
+        end_value = self._constant_value(for_node.end_value)
+        if end_value is not None:
+            self.asm.emit('LOAD_CONST', self.asm.const(int(end_value) + (1 if step > 0 else -1)))
+        else:
+            self._emit_integer_expression(for_node.end_value)
+            self.asm.emit('LOAD_CONST', self.asm.const(1))
+            self.asm.emit('BINARY_OP', BINARY_OPS['+' if step > 0 else '-'])
+        if step != 1:
+            self.asm.emit('LOAD_CONST', self.asm.const(step))
+        self._emit_call(3 if step != 1 else 2)
+
+    def _emit_for_while(self, for_node, step):
+        loop_var = for_node.loop_variable
+        self._emit_let(LetNode(loop_var, for_node.start_value))
+
+        end_node = for_node.end_value
+        if self._constant_value(end_node) is None:
+            end_node = VariableNode(f"_for{self.loop_counter}_end")
+            self._emit_expression(for_node.end_value, exact=False)
+            self._emit_store(self._format_variable_name(end_node))
+
+        if step is not None:
+            step_node = for_node.step_value or NumberNode(1)
+            condition = BinaryOpNode(loop_var, '>=' if step < 0 else '<=', end_node)
+        else:
+            step_node = VariableNode(f"_for{self.loop_counter}_step")
+            self._emit_expression(for_node.step_value)
+            self._emit_store(self._format_variable_name(step_node))
+            difference = BinaryOpNode(loop_var, '-', end_node)
+            condition = BinaryOpNode(BinaryOpNode(difference, '*', step_node), '<=', NumberNode(0))
+
+        head = Label()
+        exit_label = Label()
+        self.asm.place(head)
+        self._emit_expression(condition, exact=False)
+        self.asm.emit('POP_JUMP_IF_FALSE', exit_label)
+        self._emit_statements(for_node.body)
+        self._emit_let(LetNode(loop_var, BinaryOpNode(loop_var, '+', step_node)))
+        self.asm.emit('JUMP', head)
+        self.asm.place(exit_label)
+
+    def _emit_input(self, input_node):
+        suffixes = tuple(var.type_suffix for var in input_node.variables)
+        if input_node.channel is not None:
+            self._emit_load_function(self._runtime('file_input_fields'))
+            self._emit_integer_expression(input_node.channel)
+            self.asm.emit('LOAD_CONST', self.asm.const(suffixes))
+            self._emit_call(2)
+            self._emit_input_assignments(input_node.variables)
+            return
+        if len(input_node.variables) > 1:
+            self._emit_load_function(self._runtime('basic_input_fields'))
+            if input_node.prompt:
+                self._emit_operand(input_node.prompt)
+            else:
+                self.asm.emit('LOAD_CONST', self.asm.const(None))
+            self.asm.emit('LOAD_CONST', self.asm.const(suffixes))
+            self._emit_call(2)
+            self._emit_input_assignments(input_node.variables)
+            return
+
+        var = input_node.variables[0]
+        if var.type_suffix == '$':
+            reader = 'basic_input_string'
+        elif var.type_suffix == '%':
+            reader = 'basic_input_integer'
+        else:
+            reader = 'basic_input_number'
+        self._emit_load_function(self._runtime(reader))
+        if input_node.prompt:
+            self._emit_operand(input_node.prompt)
+        self._emit_call(1 if input_node.prompt else 0)
+        self._emit_store_target(var)
+
+    def _emit_input_assignments(self, variables):
+        """Сохраняет список полей со стека в input_values и присваивает поля переменным INPUT"""
+        self._emit_store('input_values')
+        for i, var in enumerate(variables):
+            skip = Label()
+            self._emit_load_function('len')
+            self._emit_load('input_values')
+            self._emit_call(1)
+            self.asm.emit('LOAD_CONST', self.asm.const(i))
+            self.asm.emit('COMPARE_OP', COMPARE_OPS['>'])
+            self.asm.emit('POP_JUMP_IF_FALSE', skip)
+            self._emit_load('input_values')
+            self.asm.emit('LOAD_CONST', self.asm.const(i))
+            self.asm.emit('BINARY_SUBSCR')
+            self._emit_store_target(var)
+            self.asm.place(skip)
+
+    def _emit_open(self, open_node):
+        if open_node.mode == 'RANDOM':
+            self._emit_load_function(self._runtime('basic_open_random'))
+            self._emit_expression(open_node.path)
+            self._emit_integer_expression(open_node.channel)
+            if open_node.record_length is not None:
+                self._emit_integer_expression(open_node.record_length)
+            self._emit_call(2 if open_node.record_length is None else 3)
+        else:
+            self._emit_load_function(self._runtime('basic_open'))
+            self._emit_expression(open_node.path)
+            self.asm.emit('LOAD_CONST', self.asm.const(open_node.mode))
+            self._emit_integer_expression(open_node.channel)
+            self._emit_call(3)
+        self.asm.emit('POP_TOP')
+
+    def _emit_close(self, close_node):
+        self._emit_load_function(self._runtime('basic_close'))
+        for channel in close_node.channels:
+            self._emit_integer_expression(channel)
+        self._emit_call(len(close_node.channels))
+        self.asm.emit('POP_TOP')
+
+    def _emit_field(self, field_node):
+        self._emit_load_function(self._runtime('basic_field'))
+        self._emit_integer_expression(field_node.channel)
+        self.asm.emit('LOAD_CONST', self.asm.const(self._field_layout(field_node)))
+        self._emit_call(2)
+        self._emit_unpack(field_node.variables)
+
+    def _emit_get(self, get_node):
+        self._emit_load_function(self._runtime('file_get'))
+        self._emit_integer_expression(get_node.channel)
+        if get_node.record is not None:
+            self._emit_integer_expression(get_node.record)
+        self._emit_call(1 if get_node.record is None else 2)
+        self._emit_unpack(get_node.variables)
+
+    def _emit_unpack(self, variables):
+        """Присваивает список полей записи с вершины стека переменным FIELD"""
+        self.asm.emit('UNPACK_SEQUENCE', len(variables))
+        for var in variables:
+            self._emit_store_target(var)
+
+    def _emit_put(self, put_node):
+        self._emit_load_function(self._runtime('file_put'))
+        self._emit_integer_expression(put_node.channel)
+        if put_node.record is not None:
+            self._emit_integer_expression(put_node.record)
+        else:
+            self.asm.emit('LOAD_CONST', self.asm.const(None))
+        for var in put_node.variables:
+            self._emit_expression(var)
+        self._emit_call(len(put_node.variables) + 2)
+        self.asm.emit('POP_TOP')
+
+    def _emit_mat_let(self, mat_node):
+        self._emit_load_function(self._runtime('mat_assign'))
+        self._emit_matrix_arguments(mat_node.target)
+        if mat_node.operation == 'SCALE':
+            self._emit_load_function(self._runtime('mat_scale'))
+            self._emit_expression(mat_node.factor)
+        elif mat_node.operation != 'COPY':
+            self._emit_load_function(self._runtime(MAT_OPERATIONS[mat_node.operation]))
+        for matrix in mat_node.operands:
+            self._emit_load_function(self._runtime('mat_view'))
+            self._emit_matrix_arguments(matrix)
+            self._emit_call(2)
+        if mat_node.operation == 'SCALE':
+            self._emit_call(2)
+        elif mat_node.operation != 'COPY':
+            self._emit_call(len(mat_node.operands))
+        self._emit_call(3)
+        self.asm.emit('POP_TOP')
+
+    def _emit_mat_read(self, mat_node):
+        for matrix in mat_node.matrices:
+            self._emit_load_function(self._runtime('mat_read'))
+            self._emit_matrix_arguments(matrix)
+            self._emit_load_global(self._data_reader())
+            self._emit_call(3)
+            self.asm.emit('POP_TOP')
+
+    def _emit_mat_print(self, mat_node):
+        for matrix, separator in zip(mat_node.matrices, mat_node.separators):
+            self._emit_load_function(self._runtime('mat_print'))
+            self._emit_matrix_arguments(matrix)
+            if separator == ';':
+                self.asm.emit('LOAD_CONST', self.asm.const(True))
+            self._emit_call(3 if separator == ';' else 2)
+            self.asm.emit('POP_TOP')
+
+    def _emit_matrix_arguments(self, matrix_node):
+        self._emit_load(self._format_variable_name(matrix_node))
+        self.asm.emit('LOAD_CONST', self.asm.const(self._matrix_columns(matrix_node)))
+
+    def _emit_read(self, read_node):
+        for var in read_node.variables:
+            self._emit_load_global(self._data_reader())
+            self.asm.emit('LOAD_METHOD', self.asm.name(self._data_read_method(var)))
+            self._emit_call(0)
+            self._emit_store_target(var)
+
+    def _emit_store_target(self, var_node):
+        """Сохраняет значение с вершины стека в переменную или элемент массива"""
+        if isinstance(var_node, ArrayElementNode):
+            # STORE_SUBSCR: TOS1[TOS] = TOS2
+            self._emit_load(self._format_variable_name(var_node))
+            self._emit_array_index(var_node)
+            self.asm.emit('STORE_SUBSCR')
+        else:
+            self._emit_store(self._format_variable_name(var_node))
+
+    def _emit_dim(self, dim_node):
+        for array in dim_node.arrays:
+            if array.type_suffix == '$':
+                self._emit_load_global(self._string_constant(''))
+                self.asm.emit('BUILD_LIST', 1)
+            else:
+                self.uses_array = True
+                typecode, zero = self._array_typecode(array)
+                self._emit_load_function('array')
+                self.asm.emit('LOAD_CONST', self.asm.const(typecode))
+                self.asm.emit('LOAD_CONST', self.asm.const(zero))
+                self.asm.emit('BUILD_LIST', 1)
+                self._emit_call(2)
+
+            size = self._array_size(array)
+            if isinstance(size, int):
+                self.asm.emit('LOAD_CONST', self.asm.const(size))
+            else:
+                first, rest = size
+                self._emit_integer_expression(first)
+                self.asm.emit('LOAD_CONST', self.asm.const(1))
+                self.asm.emit('BINARY_OP', BINARY_OPS['+'])
+                if rest != 1:
+                    self.asm.emit('LOAD_CONST', self.asm.const(rest))
+                    self.asm.emit('BINARY_OP', BINARY_OPS['*'])
+            self.asm.emit('BINARY_OP', BINARY_OPS['*'])
+            self._emit_store(self._format_variable_name(array))
+
+    def _emit_array_index(self, element_node, checked=True):
+        terms, offset = self._array_index_terms(element_node, checked)
+        for position, (index_node, stride, dimension) in enumerate(terms):
+            self._emit_subscript(element_node, index_node, dimension)
+            if stride != 1:
+                self.asm.emit('LOAD_CONST', self.asm.const(stride))
+                self.asm.emit('BINARY_OP', BINARY_OPS['*'])
+            if position:
+                self.asm.emit('BINARY_OP', BINARY_OPS['+'])
+        if not terms or offset:
+            self.asm.emit('LOAD_CONST', self.asm.const(offset))
+            if terms:
+                self.asm.emit('BINARY_OP', BINARY_OPS['+'])
+
+    def _emit_subscript(self, element_node, index_node, dimension):
+        if dimension is None:
+            self._emit_integer_expression(index_node)
+            return
+        self._emit_load_function(self._runtime('basic_index'))
+        self._emit_expression(index_node, exact=False)
+        self._emit_array_bound(element_node, dimension)
+        self._emit_call(2)
+
+    def _emit_array_bound(self, element_node, dimension):
+        bound = self._array_bound(element_node, dimension)
+        if bound is not None:
+            self.asm.emit('LOAD_CONST', self.asm.const(bound))
+            return
+        stride = self._dimension_stride(element_node, dimension)
+        self._emit_load_function('len')
+        self._emit_load(self._format_variable_name(element_node))
+        self._emit_call(1)
+        if stride != 1:
+            self.asm.emit('LOAD_CONST', self.asm.const(stride))
+            self.asm.emit('BINARY_OP', NB_FLOOR_DIVIDE)
+        self.asm.emit('LOAD_CONST', self.asm.const(1))
+        self.asm.emit('BINARY_OP', BINARY_OPS['-'])
+
+    def _emit_expression(self, expr_node, exact=True):
+        """Вычисление выражения на стеке; exact имеет тот же смысл, что и в _generate_expression"""
+        if isinstance(expr_node, NumberNode):
+            value = expr_node.value
+            if not exact and self._is_integer_literal(value):
+                value = int(value)
+            self.asm.emit('LOAD_CONST', self.asm.const(value))
+
+        elif isinstance(expr_node, StringNode):
+            self._emit_load_global(self._string_constant(expr_node.value))
+
+        elif isinstance(expr_node, VariableNode):
+            self._emit_load(self._format_variable_name(expr_node))
+
+        elif isinstance(expr_node, ArrayElementNode):
+            self._emit_load(self._format_variable_name(expr_node))
+            self._emit_array_index(expr_node)
+            self.asm.emit('BINARY_SUBSCR')
+
+        elif isinstance(expr_node, BinaryOpNode):
+            if expr_node.op in COMPARE_OPS:
+                self._emit_operand(expr_node.left, exact=False)
+                self._emit_operand(expr_node.right, exact=False)
+                self.asm.emit('COMPARE_OP', COMPARE_OPS[expr_node.op])
+            else:
+                left_exact, right_exact = self._operands_exactness(expr_node, exact)
+                self._emit_expression(expr_node.left, left_exact)
+                self._emit_expression(expr_node.right, right_exact)
+                self.asm.emit('BINARY_OP', BINARY_OPS[expr_node.op])
+
+        elif isinstance(expr_node, UnaryOpNode):
+            self._emit_expression(expr_node.operand, exact)
+            self.asm.emit(UNARY_OPS[expr_node.op])
+
+        elif isinstance(expr_node, FunctionCallNode):
+            if expr_node.name == 'INT':
+                self._emit_expression(expr_node.arguments[0], exact)
+                self.asm.emit('LOAD_CONST', self.asm.const(1))
+                self.asm.emit('BINARY_OP', NB_FLOOR_DIVIDE)
+            else:
+                arguments = [] if expr_node.name == 'RND' else expr_node.arguments
+                self.asm.emit('PUSH_NULL')
+                self._emit_load(f"_{self._builtin_function(expr_node.name)}")
+                for argument in arguments:
+                    self._emit_expression(argument, self._argument_exactness(expr_node, exact))
+                self._emit_call(len(arguments))
+
+        elif isinstance(expr_node, FnCallNode):
+            inlined = self._inlined_call(expr_node)
+            if inlined is not None:
+                self._emit_assigned_value(expr_node.type_suffix, inlined, exact)
+            else:
+                definition = self._function_definition(expr_node)
+                parameters = definition.parameters if definition else []
+                globals_read = self._function_globals(expr_node)
+                self._emit_load_function(self._user_function(expr_node))
+                for parameter, argument in zip(parameters, expr_node.arguments):
+                    self._emit_assigned_value(parameter.type_suffix, argument)
+                for node in globals_read:
+                    self._emit_load(self._format_variable_name(node))
+                self._emit_call(len(parameters) + len(globals_read))
+
+        else:
+            raise ValueError(f"Неизвестный тип узла выражения: {type(expr_node)}")
+
+    def _emit_operand(self, expr_node, exact=True):
+        if isinstance(expr_node, StringNode):
+            self.asm.emit('LOAD_CONST', self.asm.const(expr_node.value))
+        else:
+            self._emit_expression(expr_node, exact)
+
+    def _emit_integer_expression(self, expr_node):
+        value = self._constant_value(expr_node)
+        if value is not None:
+            self.asm.emit('LOAD_CONST', self.asm.const(int(value)))
+        elif self._is_int_valued(expr_node):
+            self._emit_expression(expr_node, exact=False)
+        else:
+            self._emit_load_function('int')
+            self._emit_expression(expr_node, exact=False)
+            self._emit_call(1)
+
+    def _emit_load(self, name):
+        self.asm.emit('LOAD_FAST', self.asm.varname(name))
+
+    def _emit_store(self, name):
+        self.asm.emit('STORE_FAST', self.asm.varname(name))
+
+    def _emit_load_global(self, name):
+        self.asm.emit('LOAD_GLOBAL', self.asm.name(name) << 1)
+
+    def _emit_load_function(self, name):
+        # Младший бит аргумента LOAD_GLOBAL кладет перед функцией NULL для PRECALL/CALL
+        self.asm.emit('LOAD_GLOBAL', (self.asm.name(name) << 1) | 1)
+
+    def _emit_call(self, argument_count):
+        self.asm.emit('PRECALL', argument_count)
+        self.asm.emit('CALL', argument_count)
@@ -0,0 +1,146 @@
+import math
+
+from ast_nodes import (
+    ProgramNode, StatementNode, IfNode, ForNode, WhileNode, LoopNode, IfBlockNode,
+    DispatchStateNode, DispatchNode, JumpNode, ReturnJumpNode, SubroutineNode, ChunkNode, ChunkedDispatchNode,
+    SwitchNode
+)
+from control_flow import ControlFlowBuilder, StateMachineLowering
+
+# Пределы CPython: 20 вложенных блоков (циклы, try, with) в одной функции и 100 уровней отступа.
+# Раскладка оставляет запас под цикл диспетчеризации и дерево выбора состояния
+MAX_BLOCK_DEPTH = 18
+MAX_INDENT_DEPTH = 90
+# Функцию больше этого числа инструкций выгоднее разбить на части, чем компилировать целиком
+MAX_FUNCTION_STATEMENTS = 10000
+# Наибольший размер одной части конечного автомата в инструкциях
+CHUNK_STATEMENTS = 1000
+# Номер состояния, означающий завершение программы
+EXIT_STATE = -1
+
+
+def statement_count(stmt):
+    """Число инструкций в инструкции вместе со вложенными"""
+    return sum(1 for node in stmt.walk() if isinstance(node, StatementNode))
+
+
+def function_shape(statements):
+    """(глубина вложенных блоков, глубина отступов, число инструкций) функции с таким телом"""
+    blocks = indent = size = 0
+    for stmt in statements:
+        size += 1
+        bodies, opens_block, extra_indent = _nested_bodies(stmt)
+        for body in bodies:
+            body_blocks, body_indent, body_size = function_shape(body)
+            blocks = max(blocks, body_blocks + opens_block)
+            indent = max(indent, body_indent + 1 + extra_indent)
+            size += body_size
+    return blocks, indent, size
+
+
+def _nested_bodies(stmt):
+    """Вложенные списки инструкций, открывает ли инструкция блок и сколько лишних отступов добавляет"""
+    if isinstance(stmt, (LoopNode, WhileNode)) or (isinstance(stmt, ForNode) and stmt.body is not None):
+        return [stmt.body], 1, 0
+    if isinstance(stmt, IfBlockNode):
+        return [stmt.then_body, stmt.else_body], 0, 0
+    if isinstance(stmt, IfNode):
+        return [[branch] for branch in (stmt.then_branch, stmt.else_branch) if branch is not None], 0, 0
+    if isinstance(stmt, SwitchNode):
+        # Ветвь выбирается бинарным деревом if/else по номеру ветви из таблицы
+        bodies = [case.body for case in stmt.cases] + [stmt.default_body]
+        return bodies, 0, math.ceil(math.log2(len(bodies)))
+    if isinstance(stmt, DispatchNode):
+        # Состояния выбираются бинарным деревом if/else внутри while True
+        tree_depth = math.ceil(math.log2(len(stmt.states))) if stmt.states else 0
+        bodies = [state.statements for state in stmt.states] + [state.statements for state in stmt.exits]
+        return bodies, 1, tree_depth
+    return [], 0, 0
+
+
+def exceeds_layout_limits(program_node):
+    """Не уложится ли какая-либо функция программы в пределы CPython по вложенности и размеру"""
+    main_statements = [stmt for stmt in program_node.statements if not isinstance(stmt, SubroutineNode)]
+    bodies = [stmt.body for stmt in program_node.statements if isinstance(stmt, SubroutineNode)]
+    for body in bodies + [main_statements]:
+        blocks, indent, size = function_shape(body)
+        if blocks > MAX_BLOCK_DEPTH or indent > MAX_INDENT_DEPTH or size > MAX_FUNCTION_STATEMENTS:
+            return True
+    return False
+
+
+class ChunkedLowering(StateMachineLowering):
+    """
+    Раскладка для больших программ: конечный автомат, состояния которого разложены по функциям
+    уровня модуля _chunk0(), _chunk1(), ... не больше chunk_statements инструкций в каждой.
+    Номер состояния _pc, стек возвратов GOSUB и переменные программы живут в модуле, а main()
+    только вызывает функцию части, которой принадлежит текущее состояние. Вложенность циклов,
+    которые остаются структурированными, ограничена, поэтому время компиляции линейно по размеру программы.
+    """
+
+    def __init__(self, chunk_statements=CHUNK_STATEMENTS, max_loop_depth=MAX_BLOCK_DEPTH - 1):
+        self.chunk_statements = chunk_statements
+        # Цикл диспетчеризации части сам занимает один блок
+        self.max_loop_depth = max_loop_depth
+
+    def optimize(self, ast_root):
+        # Подпрограммы не выделяются в функции: GOSUB остаётся переходом со стеком возвратов
+        cfg = ControlFlowBuilder(self.max_loop_depth).build(ast_root)
+
+        # Длинный блок делится на несколько состояний, идущих друг за другом
+        pieces = {}
+        first_state = {}
+        state_count = 0
+        for block in cfg.blocks:
+            pieces[block.id] = self._split(block.statements)
+            first_state[block.id] = state_count
+            state_count += len(pieces[block.id])
+
+        def jump_to(target):
+            if target is None:
+                return [JumpNode(EXIT_STATE)]
+            return [JumpNode(first_state[target.id])]
+
+        states = []
+        for block in cfg.blocks:
+            statements = self.lower_block(block, jump_to, lambda target: first_state[target.id])
+            transition = statements[len(block.statements):]
+            block_pieces = pieces[block.id]
+            for piece in block_pieces[:-1]:
+                states.append(DispatchStateNode(len(states), piece + [JumpNode(len(states) + 1)]))
+            states.append(DispatchStateNode(len(states), block_pieces[-1] + transition))
+
+        chunks = self._split_states(states)
+        uses_gosub = any(
+            isinstance(stmt, ReturnJumpNode) or (isinstance(stmt, JumpNode) and stmt.return_state is not None)
+            for state in states for stmt in state.statements
+        )
+        names = [f"_chunk{i}" for i in range(len(chunks))]
+        subroutines = [SubroutineNode(name, [ChunkNode(chunk)]) for name, chunk in zip(names, chunks)]
+        driver = ChunkedDispatchNode(names, [len(chunk) for chunk in chunks], first_state[cfg.entry.id], uses_gosub)
+        return ProgramNode(subroutines + [driver])
+
+    def _split(self, statements):
+        """Делит список инструкций на куски не больше chunk_statements инструкций (хотя бы один кусок)"""
+        pieces = [[]]
+        size = 0
+        for stmt in statements:
+            weight = statement_count(stmt)
+            if pieces[-1] and size + weight > self.chunk_statements:
+                pieces.append([])
+                size = 0
+            pieces[-1].append(stmt)
+            size += weight
+        return pieces
+
+    def _split_states(self, states):
+        chunks = [[]]
+        size = 0
+        for state in states:
+            weight = sum(statement_count(stmt) for stmt in state.statements) + 1
+            if chunks[-1] and size + weight > self.chunk_statements:
+                chunks.append([])
+                size = 0
+            chunks[-1].append(state)
+            size += weight
+        return chunks
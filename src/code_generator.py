@@ -1,42 +1,110 @@
+import inspect
+
 from ast_nodes import (
     ProgramNode, PrintNode, LetNode, EndNode, IfNode, GotoNode, LabelReferenceNode,
     ForNode, NextNode, GosubNode, ReturnNode, WhileNode, InputNode,
-    NumberNode, StringNode, VariableNode, BinaryOpNode, UnaryOpNode, LabelNode
+    NumberNode, StringNode, VariableNode, BinaryOpNode, UnaryOpNode, LabelNode,
+    SubroutineNode, OnJumpNode, SelectCaseNode, DimNode, ArrayElementNode,
+    MatLetNode, MatReadNode, MatPrintNode, DataNode, ReadNode, FunctionCallNode,
+    DefFnNode, FnCallNode, OpenNode, CloseNode, FieldNode, GetNode, PutNode, IMPURE_FUNCTIONS
 )
+from optimizers import ConstantFoldingOptimizer
+from semantic_analyzer import SymbolTable, TypeInference, STORAGE_LOCAL, STORAGE_SLOT
+import basic_runtime
+
+# Функции среды выполнения для операций MAT над двумя массивами и над одним
+MAT_OPERATIONS = {
+    '+': 'mat_add', '-': 'mat_subtract', '*': 'mat_multiply', 'TRN': 'mat_transpose', 'INV': 'mat_inverse',
+}
+
+# Встроенные функции BASIC: модуль и имя функции Python. INT(X) компилируется в X // 1
+BUILTIN_FUNCTIONS = {
+    'SQR': ('math', 'sqrt'), 'SIN': ('math', 'sin'), 'COS': ('math', 'cos'), 'ATN': ('math', 'atan'),
+    'EXP': ('math', 'exp'), 'LOG': ('math', 'log'), 'ABS': ('builtins', 'abs'),
+    'SGN': ('basic_runtime', 'basic_sgn'), 'RND': ('basic_runtime', 'basic_rnd'),
+    'EOF': ('basic_runtime', 'basic_eof'),
+}
+
+# Функции среды выполнения, которые пишут в буфер вывода: при завершении программы его нужно сбросить
+OUTPUT_WRITERS = {
+    'basic_write', 'mat_print', 'basic_input', 'basic_input_string', 'basic_input_number',
+    'basic_input_integer', 'basic_input_fields',
+}
+# Функции среды выполнения, которые читают INPUT
+INPUT_READERS = {'basic_input', 'basic_input_string', 'basic_input_number', 'basic_input_integer', 'basic_input_fields'}
+
+# Коды struct числовых полей FIELD по ширине в байтах: целые для %, float для остальных чисел
+INTEGER_FIELD_FORMATS = {2: 'h', 4: 'i', 8: 'q'}
+NUMBER_FIELD_FORMATS = {4: 'f', 8: 'd'}
+
+# Наибольшее число узлов тела функции DEF FN, которое подставляется в место вызова
+INLINE_MAX_NODES = 24
 
 
 class CodeGenerator:
-
-    def __init__(self):
+    """
+    Текстовый генератор режима nested: метки и GOSUB становятся вложенными функциями.
+    Остальные режимы строит PythonAstGenerator, а их текст получается через ast.unparse.
+    Анализ программы (ячейки переменных, типы, индексы массивов, DEF FN) общий для обоих
+    """
+
+    def __init__(self, symbol_table=None, inline_runtime=False, batch_input=False):
+        # Таблица символов семантического анализатора: по ней доказываются типы выражений
+        self.symbol_table = symbol_table or SymbolTable()
+        # Встроить используемые функции среды выполнения в программу вместо импорта basic_runtime
+        self.inline_runtime = inline_runtime
+        # Программа при запуске включает пакетный INPUT, не дожидаясь переменной окружения
+        self.batch_input = batch_input
+        self.runtime_names = set()
+        # Пул строковых констант: текст литерала -> имя объекта BasicString уровня модуля
+        self.string_constants = {}
+        # Ссылки на ячейки списка _slots в тексте программы -> номер ячейки
+        self.slot_references = {}
+        # Функции DEF FN, которые вызываются, а не подставляются: ключи в порядке первого вызова
+        # и строки их определений уровня модуля
+        self.called_functions = []
+        self.user_functions = []
+        self.uses_sys = False
+        self.uses_array = False
+        # Функции модуля math, которые вызывает программа
+        self.math_functions = set()
+        # Размеры измерений массивов по (имени, суффиксу); None — первый размер вычисляется при DIM
+        self.arrays = {}
+        # Наименьшее и наибольшее значение переменных циклов range() с константными границами,
+        # тело которых генерируется сейчас: ключ ячейки переменной -> пара значений
+        self.loop_ranges = {}
+        self.type_inference = TypeInference(self.symbol_table.functions)
         self.labels = {}
         self.indent_level = 0
         self.current_line = 0
         self.code_lines = []
         self.forward_jumps = {}
         self.for_loops = {}
-        self.while_stack = []
         self.gosub_calls = []
 
     def generate(self, ast_root):
         if not isinstance(ast_root, ProgramNode):
             raise ValueError("Ожидается корень AST дерева типа ProgramNode")
 
-        self._add_line("")
-        self._add_line("import sys")
-        self._add_line("import math")
+        self._assign_storage(ast_root)
+        self._collect_arrays(ast_root)
+        self.type_inference.infer(ast_root)
 
-        self._add_runtime_helpers()
-
-        self._add_line("")
-        self._add_line("")
-        self._add_line("_gosub_return_points = []")
+        uses_return_points = any(isinstance(node, (GosubNode, ReturnNode)) for node in ast_root.walk())
+        if uses_return_points:
+            self._add_line("")
+            self._add_line("")
+            self._add_line("_gosub_return_points = []")
 
         self._add_line("")
-        self._add_line("def main():")
+        self._add_line(f"def main({self._parameters_text(self._function_parameters(ast_root.statements))}):")
         self.indent_level += 1
 
         self._add_line("")
-        self._add_line("global _gosub_return_points")
+        if uses_return_points:
+            self._add_line("global _gosub_return_points")
+        for name, variable in self._local_variables(ast_root.statements).items():
+            self._add_line(f"{name} = {self._default_text(variable)}")
 
         self._add_line("")
 
@@ -51,53 +119,241 @@ class CodeGenerator:
         self._add_line("")
         self._add_line("if __name__ == '__main__':")
         self.indent_level += 1
-        self._add_line("main()")
-
-        return "\n".join(self.code_lines)
+        if 'basic_rnd' in self.runtime_names:
+            # Каждый запуск программы получает одну и ту же последовательность RND
+            self._add_line(f"{self._runtime('configure_random')}()")
+        if self._reads_batch_input():
+            self._add_line(f"{self._runtime('configure_input')}(batch=True)")
+        if self._writes_output() or self._opens_files():
+            # Буфер вывода сбрасывается, а незакрытые файлы закрываются и при END (sys.exit),
+            # и при ошибке выполнения
+            self._add_line("try:")
+            self._add_line("    main()")
+            self._add_line("finally:")
+            if self._opens_files():
+                self._add_line(f"    {self._runtime('basic_close')}()")
+            if self._writes_output():
+                self._add_line(f"    {self._runtime('flush_output')}()")
+        else:
+            self._add_line("main()")
 
-    def _add_runtime_helpers(self):
+        # Заголовок собирается последним: импортируются только реально использованные функции
+        body = self.code_lines
+        self._generate_user_functions()
+        slots = ", ".join(self._default_text(symbol) for symbol in self.symbol_table.slots.values())
+        self.code_lines = []
+        self.indent_level = 0
         self._add_line("")
+        self._add_runtime_imports()
+        self._add_string_constants()
+        self._add_data()
+        self._add_user_functions()
+        self._add_slots(slots)
         self._add_line("")
+        self.code_lines.extend(body)
 
-        self._add_line("def basic_print(*args, sep=''):")
-        self.indent_level += 1
-        self._add_line("for i, arg in enumerate(args):")
-        self._add_line("    if i > 0:")
-        self._add_line("        sys.stdout.write(sep)")
-        self._add_line("    sys.stdout.write(str(arg))")
-        self._add_line("sys.stdout.write('\\n')")
-        self.indent_level -= 1
+        return "\n".join(self.code_lines)
 
-        self._add_line("")
-        self._add_line("def basic_input(prompt=None):")
-        self.indent_level += 1
-        self._add_line("if prompt:")
-        self._add_line("    sys.stdout.write(prompt)")
-        self._add_line("return input()")
-        self.indent_level -= 1
+    def _runtime(self, name):
+        """Имя функции среды выполнения; отмечает её как используемую программой"""
+        self.runtime_names.add(name)
+        return name
+
+    def _add_runtime_imports(self):
+        names = [name for name in basic_runtime.RUNTIME_NAMES if name in self.runtime_names]
+        if not self.inline_runtime:
+            if self.uses_sys:
+                self._add_line("import sys")
+            if self.uses_array:
+                self._add_line("from array import array")
+            if self.math_functions:
+                self._add_line(f"from math import {', '.join(sorted(self.math_functions))}")
+            if names:
+                self._add_line(f"from basic_runtime import {', '.join(names)}")
+            return
 
+        required = self._required_runtime_names(names)
+        if self.uses_sys or required:
+            self._add_line("import sys")
+        if required:
+            self._add_line("import os")
+        if '_random' in required:
+            self._add_line("import random")
+        if 'RecordFile' in required:
+            self._add_line("import mmap")
+            self._add_line("import struct")
+        if self.uses_array:
+            self._add_line("from array import array")
+        if self.math_functions:
+            self._add_line(f"from math import {', '.join(sorted(self.math_functions))}")
+
+        for name in basic_runtime.RUNTIME_NAMES:
+            if name in required:
+                self._add_inline_runtime_definition(name)
+
+    def _writes_output(self):
+        """Программа пишет в буфер вывода: PRINT, MAT PRINT или подсказки INPUT"""
+        return bool(OUTPUT_WRITERS & self.runtime_names)
+
+    def _reads_batch_input(self):
+        """Программа читает INPUT, и пакетный режим включен при компиляции"""
+        return self.batch_input and bool(INPUT_READERS & self.runtime_names)
+
+    def _opens_files(self):
+        """Программа открывает файлы OPEN: при завершении их буферы нужно записать"""
+        return bool({'basic_open', 'basic_open_random'} & self.runtime_names)
+
+    def _required_runtime_names(self, names):
+        """Используемые имена среды выполнения вместе со всем, что нужно встроить вместе с ними"""
+        required = set(names)
+        for name in names:
+            required.update(basic_runtime.REQUIRES.get(name, []))
+        return required
+
+    def _add_string_constants(self):
+        if not self.string_constants:
+            return
         self._add_line("")
-        self._add_line("class BasicString(str):")
-        self.indent_level += 1
-        self._add_line("def __add__(self, other):")
-        self._add_line("    return BasicString(super().__add__(str(other)))")
-        self._add_line("")
-        self._add_line("def __radd__(self, other):")
-        self._add_line("    return BasicString(str(other) + self)")
-        self.indent_level -= 1
-
-        self.indent_level = 0
+        for value, name in self.string_constants.items():
+            self._add_line(f"{name} = BasicString({value!r})")
+
+    def _add_data(self):
+        if 'DataReader' in self.runtime_names:
+            self._add_line("")
+            self._add_line(f"_data = DataReader({tuple(self.symbol_table.data)!r})")
+
+    def _add_user_functions(self):
+        for function in self.user_functions:
+            self._add_line("")
+            self._add_line("")
+            self.code_lines.extend(function)
+
+    def _add_slots(self, slots):
+        if self.slot_references:
+            self._add_line("")
+            self._add_line(f"_slots = [{slots}]")
+
+    def _local_variables(self, statements):
+        """Простые переменные инструкций, которые хранятся в локальных переменных функции, по именам"""
+        variables = {}
+        for stmt in statements:
+            for node in self._walk_with_functions(stmt):
+                if isinstance(node, VariableNode) and self._format_variable_name(node) not in self.slot_references:
+                    variables.setdefault(self._format_variable_name(node), node)
+        return variables
+
+    def _default_value(self, variable):
+        """
+        Значение переменной до первого присваивания: 0 для целых, пустая строка для строковых,
+        иначе 0.0. Тип берется из вывода типов, чтобы значение не расходилось с присвоенными.
+        У ячейки массива значения нет: хранилище создает DIM
+        """
+        if variable.name.endswith('()'):
+            return None
+        variable_type = self.type_inference.variable_type(variable)
+        if variable_type == TypeInference.STRING:
+            return ''
+        return 0 if variable_type == TypeInference.INT else 0.0
+
+    def _default_text(self, variable):
+        value = self._default_value(variable)
+        return self._string_constant(value) if isinstance(value, str) else repr(value)
+
+    def _add_inline_runtime_definition(self, name):
+        value = getattr(basic_runtime, name)
+        if inspect.isclass(value) or inspect.isfunction(value):
+            self._add_line("")
+            self._add_line("")
+            self.code_lines.extend(inspect.getsource(value).rstrip().split("\n"))
+        elif isinstance(value, (int, float, str)):
+            self._add_line(f"{name} = {value!r}")
+        else:
+            # Экземпляры среды выполнения и их методы создаются заново тем же выражением,
+            # что и в basic_runtime
+            self._add_line("")
+            self._add_line(next(
+                line for line in inspect.getsource(basic_runtime).split("\n") if line.startswith(f"{name} = ")
+            ))
+
+    def _function_parameters(self, statements):
+        """
+        Параметры функции со значениями по умолчанию: встроенные функции BASIC, которые она
+        вызывает. Значение по умолчанию связывается один раз при определении функции, и вызов
+        в теле читает быструю локальную переменную, а не глобальное имя. Так же привязывается
+        список ячеек _slots
+        """
+        names = set()
+        for stmt in statements:
+            for node in self._walk_with_functions(stmt):
+                if isinstance(node, FunctionCallNode) and node.name in BUILTIN_FUNCTIONS:
+                    names.add(self._builtin_function(node.name))
+        return [(f"_{name}", name) for name in sorted(names)]
+
+    def _builtin_function(self, name):
+        """Имя функции Python для встроенной функции BASIC; отмечает модуль, из которого ее взять"""
+        module, function = BUILTIN_FUNCTIONS[name]
+        if module == 'math':
+            self.math_functions.add(function)
+        elif module == 'basic_runtime':
+            self._runtime(function)
+        return function
+
+    def _parameters_text(self, parameters):
+        return ", ".join(f"{name}={value}" for name, value in parameters)
+
+    def _assign_storage(self, ast_root):
+        """
+        Назначает переменным ячейки в таблице символов. Переменные, с которыми работает только
+        main(), остаются быстрыми локальными переменными. Переменные подпрограмм и частей
+        автомата, а в режиме nested - все переменные, хранятся в списке _slots уровня модуля:
+        обращение к ячейке по постоянному индексу не требует global/nonlocal и поиска по словарю.
+        """
+        nested = any(isinstance(node, (LabelNode, GosubNode, ReturnNode, NextNode)) for node in ast_root.walk())
+        shared = set()
+        for stmt in ast_root.statements:
+            if nested or isinstance(stmt, SubroutineNode):
+                shared.update(
+                    self._storage_key(node) for node in self._walk_with_functions(stmt)
+                    if isinstance(node, (VariableNode, ArrayElementNode))
+                )
+
+        # Номера ячеек раздаются в порядке инструкций программы. Массив занимает одну ячейку
+        # со ссылкой на свое хранилище. Переменные программы в телах функций читает место вызова
+        for stmt in ast_root.statements:
+            for node in self._walk_with_functions(stmt):
+                if not isinstance(node, (VariableNode, ArrayElementNode)):
+                    continue
+                key = self._storage_key(node)
+                symbol = self.symbol_table.assign_slot(*key, storage=STORAGE_SLOT if key in shared else STORAGE_LOCAL)
+                if symbol.storage == STORAGE_SLOT:
+                    self.slot_references[f"_slots[{symbol.slot}]"] = symbol.slot
+
+    def _storage_key(self, node):
+        """Ключ ячейки переменной или массива: массив A() не делит ячейку с переменной A"""
+        if isinstance(node, ArrayElementNode):
+            return f"{node.name}()", node.type_suffix
+        return node.name, node.type_suffix
+
+    def _collect_arrays(self, ast_root):
+        for node in ast_root.walk():
+            if isinstance(node, DimNode):
+                for array in node.arrays:
+                    self.arrays[(array.name, array.type_suffix)] = [
+                        None if self._constant_value(bound) is None else int(self._constant_value(bound)) + 1
+                        for bound in array.indices
+                    ]
 
     def _collect_labels(self, program_node):
         for i, stmt in enumerate(program_node.statements):
             if isinstance(stmt, LabelNode):
-                self.labels[stmt.name] = f"label_{stmt.name.replace(':', '')}"
+                self.labels[stmt.name] = f"label_{str(stmt.name).replace(':', '')}"
 
     def _add_line(self, line):
         self.code_lines.append("    " * self.indent_level + line)
         self.current_line += 1
 
     def _generate_statements(self, statements):
+        start = len(self.code_lines)
         for stmt in statements:
             if isinstance(stmt, LetNode):
                 self._generate_let(stmt)
@@ -119,37 +375,168 @@ class CodeGenerator:
                 self._generate_while(stmt)
             elif isinstance(stmt, InputNode):
                 self._generate_input(stmt)
+            elif isinstance(stmt, DimNode):
+                self._generate_dim(stmt)
+            elif isinstance(stmt, MatLetNode):
+                self._generate_mat_let(stmt)
+            elif isinstance(stmt, MatReadNode):
+                self._generate_mat_read(stmt)
+            elif isinstance(stmt, MatPrintNode):
+                self._generate_mat_print(stmt)
+            elif isinstance(stmt, ReadNode):
+                self._generate_read(stmt)
+            elif isinstance(stmt, OpenNode):
+                self._generate_open(stmt)
+            elif isinstance(stmt, CloseNode):
+                self._generate_close(stmt)
+            elif isinstance(stmt, FieldNode):
+                self._generate_field(stmt)
+            elif isinstance(stmt, GetNode):
+                self._generate_get(stmt)
+            elif isinstance(stmt, PutNode):
+                self._generate_put(stmt)
+            elif isinstance(stmt, (DataNode, DefFnNode)):
+                # Значения DATA собраны в _data при анализе, а функции DEF FN генерируются на уровне модуля
+                pass
             elif isinstance(stmt, EndNode):
                 self._generate_end(stmt)
             elif isinstance(stmt, LabelNode):
                 self._generate_label(stmt)
+            elif isinstance(stmt, (OnJumpNode, SelectCaseNode)):
+                raise ValueError(
+                    "ON ... GOTO/GOSUB и SELECT CASE не поддерживаются в режиме nested: "
+                    "используйте режим structured, state_machine или chunked"
+                )
+        if statements and len(self.code_lines) == start:
+            # Блок только из DATA и DEF FN: без pass он был бы пустым
+            self._add_line("pass")
 
     def _generate_let(self, let_node):
-        var_name = self._format_variable_name(let_node.variable)
-        value_expr = self._generate_expression(let_node.value)
+        var_name = self._format_target(let_node.variable)
 
         if let_node.variable.type_suffix == '$':
-            value_expr = f"BasicString({value_expr})"
-        elif let_node.variable.type_suffix == '%':
-            value_expr = f"int({value_expr})"
-
-        self._add_line(f"{var_name} = {value_expr}")
+            appended = self._appended_parts(let_node)
+            if appended:
+                parts = ", ".join(self._generate_operand(part) for part in appended)
+                self._add_line(f"{var_name} = {self._runtime('basic_append')}({var_name}, {parts})")
+                return
+        self._add_line(f"{var_name} = {self._generate_assigned_value(let_node.variable.type_suffix, let_node.value)}")
+
+    def _generate_assigned_value(self, type_suffix, value_node, exact=True):
+        """
+        Значение для переменной с суффиксом type_suffix: строка становится BasicString, целое
+        значение - int. Так же приводятся аргументы и результат функции DEF FN
+        """
+        if type_suffix == '$':
+            value_expr = self._generate_expression(value_node)
+            if self._expression_type(value_node) != TypeInference.STRING:
+                value_expr = f"{self._runtime('BasicString')}({value_expr})"
+            return value_expr
+        if type_suffix == '%':
+            # Для целой переменной важно только значение, а не тип промежуточных результатов
+            value_expr = self._generate_expression(value_node, exact=False)
+            if not self._is_int_valued(value_node):
+                value_expr = f"int({value_expr})"
+            return value_expr
+        return self._generate_expression(value_node, exact)
+
+    def _appended_parts(self, let_node):
+        """Части, которые LET A$ = A$ + X + Y дописывает в конец A$, или None для другого LET"""
+        parts = []
+        node = let_node.value
+        while isinstance(node, BinaryOpNode) and node.op == '+':
+            parts.append(node.right)
+            node = node.left
+        if (parts and isinstance(node, VariableNode) and isinstance(let_node.variable, VariableNode)
+                and node.name == let_node.variable.name
+                and node.type_suffix == let_node.variable.type_suffix):
+            return parts[::-1]
+        return None
 
     def _generate_print(self, print_node):
-        if not print_node.expressions_with_separators:
-            self._add_line("basic_print()")
-            return
-
-        args = []
-        for item in print_node.expressions_with_separators:
-            expr = self._generate_expression(item['expression'])
-            args.append(expr)
+        prefix = None
+        groups = self._print_groups(print_node)
+        for group in groups:
+            segments = [(is_text, value if is_text else self._generate_expression(value)) for is_text, value in group]
+            if group is groups[-1]:
+                segments.append((True, '\n'))
+                text = self._join_print_segments(prefix, segments)
+                if print_node.channel is not None:
+                    channel = self._generate_integer_expression(print_node.channel)
+                    self._add_line(f"{self._runtime('file_write')}({channel}, {text})")
+                else:
+                    self._add_line(f"{self._runtime('basic_write')}({text})")
+            else:
+                prefix = f"{self._runtime('basic_zone')}({self._join_print_segments(prefix, segments)})"
+
+    def _print_groups(self, print_node):
+        """
+        Строка PRINT собирается при компиляции: константы склеиваются заранее, ';' ничего
+        не добавляет, а ',' дополняет строку пробелами до следующей зоны вывода.
+        Возвращает группы сегментов (True, текст) или (False, узел выражения). Все группы,
+        кроме последней, дополняются до зоны во время выполнения вместе с предыдущими.
+        """
+        items = print_node.expressions_with_separators
+        groups = []
+        segments = []
+        for index, item in enumerate(items):
+            constant = self._print_constant(item['expression'])
+            if constant is not None:
+                segments.append((True, constant))
+            else:
+                segments.append((False, item['expression']))
+
+            if item['separator'] != ',' or index == len(items) - 1:
+                continue
+            if not groups and all(is_text for is_text, _ in segments):
+                text = ''.join(value for _, value in segments)
+                zone = basic_runtime.PRINT_ZONE_WIDTH
+                segments = [(True, text + ' ' * (zone - len(text) % zone))]
+            else:
+                groups.append(segments)
+                segments = []
+
+        groups.append(segments)
+        return groups
+
+    def _print_constant(self, expr_node):
+        """Текст, который PRINT выведет для константы, или None"""
+        if isinstance(expr_node, StringNode):
+            return expr_node.value
+        value = self._constant_value(expr_node)
+        return str(value) if value is not None else None
+
+    def _join_print_segments(self, prefix, segments):
+        """Выражение Python, склеивающее prefix и сегменты (текст или выражения) в одну строку"""
+        merged = []
+        for is_text, value in segments:
+            if is_text and merged and merged[-1][0]:
+                merged[-1] = (True, merged[-1][1] + value)
+            else:
+                merged.append((is_text, value))
+
+        parts = [prefix] if prefix else []
+        if all(is_text for is_text, _ in merged):
+            parts.extend(self._python_string(value) for _, value in merged)
+        elif all(is_text or not any(char in value for char in '"\\{}') for is_text, value in merged):
+            body = ''.join(
+                self._python_string(value, in_fstring=True)[1:-1] if is_text else f"{{{value}}}"
+                for is_text, value in merged
+            )
+            parts.append(f'f"{body}"')
+        else:
+            # Выражение со строковыми константами нельзя вложить в f-строку: склеиваем через str()
+            parts.extend(self._python_string(value) if is_text else f"str({value})" for is_text, value in merged)
+        return " + ".join(parts)
 
-        args_str = ", ".join(args)
-        self._add_line(f"basic_print({args_str})")
+    def _python_string(self, text, in_fstring=False):
+        escaped = text.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        if in_fstring:
+            escaped = escaped.replace('{', '{{').replace('}', '}}')
+        return f'"{escaped}"'
 
     def _generate_if(self, if_node):
-        condition = self._generate_expression(if_node.condition)
+        condition = self._generate_expression(if_node.condition, exact=False)
         self._add_line(f"if {condition}:")
         self.indent_level += 1
 
@@ -166,6 +553,14 @@ class CodeGenerator:
             self._generate_statements([if_node.else_branch])
             self.indent_level -= 1
 
+    def _generate_block(self, statements):
+        self.indent_level += 1
+        if statements:
+            self._generate_statements(statements)
+        else:
+            self._add_line("pass")
+        self.indent_level -= 1
+
     def _generate_goto(self, goto_node):
         target_ref = goto_node.target_label_ref
         label_name = target_ref.name_or_number
@@ -180,6 +575,8 @@ class CodeGenerator:
 
     def _generate_for(self, for_node):
         loop_var = self._format_variable_name(for_node.loop_variable)
+        # Имена шага, границы и функции цикла строятся из имени переменной, а не из ссылки на ячейку
+        loop_name = self._variable_identifier(for_node.loop_variable)
         start_expr = self._generate_expression(for_node.start_value)
         end_expr = self._generate_expression(for_node.end_value)
 
@@ -187,26 +584,65 @@ class CodeGenerator:
 
         if for_node.step_value:
             step_expr = self._generate_expression(for_node.step_value)
-            self._add_line(f"{loop_var}_step = {step_expr}")
+            self._add_line(f"{loop_name}_step = {step_expr}")
         else:
-            self._add_line(f"{loop_var}_step = 1")
+            self._add_line(f"{loop_name}_step = 1")
 
-        self._add_line(f"{loop_var}_end = {end_expr}")
+        self._add_line(f"{loop_name}_end = {end_expr}")
 
-        loop_label = f"for_loop_{loop_var}_{self.current_line}"
+        loop_label = f"for_loop_{loop_name}_{self.current_line}"
         self._add_line(f"")
         self._add_line(f"def {loop_label}():")
         self.indent_level += 1
 
         self._add_line(
-            f"if ({loop_var}_step > 0 and {loop_var} <= {loop_var}_end) or ({loop_var}_step < 0 and {loop_var} >= {loop_var}_end):")
+            f"if ({loop_name}_step > 0 and {loop_var} <= {loop_name}_end) or ({loop_name}_step < 0 and {loop_var} >= {loop_name}_end):")
 
         self.for_loops[loop_var] = {
             "label": loop_label,
-            "step_var": f"{loop_var}_step",
-            "end_var": f"{loop_var}_end"
+            "step_var": f"{loop_name}_step",
+            "end_var": f"{loop_name}_end"
         }
 
+    def _constant_value(self, expr_node):
+        """Значение константного числового выражения или None"""
+        if isinstance(expr_node, NumberNode):
+            return expr_node.value
+        if isinstance(expr_node, UnaryOpNode) and expr_node.op == '-':
+            value = self._constant_value(expr_node.operand)
+            return -value if value is not None else None
+        return None
+
+    def _expression_type(self, expr_node):
+        """Выведенный тип выражения (для узлов, созданных после вывода типов, вычисляется заново)"""
+        return getattr(expr_node, 'inferred_type', None) or self.type_inference.expression_type(expr_node)
+
+    def _is_int_valued(self, expr_node):
+        """Выражение вычисляется в целых числах Python: целые константы и переменные, +, - и *"""
+        if isinstance(expr_node, NumberNode):
+            return self._is_integer_literal(expr_node.value)
+        if isinstance(expr_node, (VariableNode, ArrayElementNode)):
+            return self._expression_type(expr_node) == TypeInference.INT
+        if isinstance(expr_node, BinaryOpNode) and expr_node.op in ('+', '-', '*'):
+            return self._is_int_valued(expr_node.left) and self._is_int_valued(expr_node.right)
+        if isinstance(expr_node, UnaryOpNode) and expr_node.op == '-':
+            return self._is_int_valued(expr_node.operand)
+        if isinstance(expr_node, FunctionCallNode) and expr_node.name in TypeInference.TYPE_PRESERVING_FUNCTIONS:
+            return self._is_int_valued(expr_node.arguments[0])
+        if isinstance(expr_node, FnCallNode):
+            return self._expression_type(expr_node) == TypeInference.INT
+        return False
+
+    def _is_integer_literal(self, value):
+        return float(value).is_integer() and abs(value) < 2 ** 53
+
+    def _generate_integer_expression(self, expr_node):
+        value = self._constant_value(expr_node)
+        if value is not None:
+            return str(int(value))
+        expr = self._generate_expression(expr_node, exact=False)
+        return expr if self._is_int_valued(expr_node) else f"int({expr})"
+
     def _generate_next(self, next_node):
         for var in next_node.variables:
             var_name = self._format_variable_name(var)
@@ -260,74 +696,274 @@ class CodeGenerator:
             self.gosub_calls.pop()
 
     def _generate_while(self, while_node):
-        condition = self._generate_expression(while_node.condition)
-
-        loop_label = f"while_loop_{self.current_line}"
-        self._add_line(f"")
-        self._add_line(f"def {loop_label}():")
-        self.indent_level += 1
-
-        self._add_line(f"if {condition}:")
-        self.indent_level += 1
-
-        self.while_stack.append(loop_label)
-
-        self._generate_statements(while_node.body)
-
-        self._add_line(f"return {loop_label}()")
-        self.indent_level -= 1
-        self._add_line("")
-
-        self.while_stack.pop()
-
-    def _generate_input(self, input_node):
-        if input_node.prompt:
-            prompt_expr = self._generate_expression(input_node.prompt)
-            self._add_line(f"input_value = basic_input({prompt_expr})")
+        constant = self._constant_value(while_node.condition)
+        if constant is not None and constant != 0:
+            self._add_line("while True:")
         else:
-            self._add_line("input_value = basic_input()")
-
-        if len(input_node.variables) > 1:
-            self._add_line("input_values = input_value.split(',')")
-
-            for i, var in enumerate(input_node.variables):
-                var_name = self._format_variable_name(var)
-                self._add_line(f"if len(input_values) > {i}:")
-                self.indent_level += 1
-
-                if var.type_suffix == '$':
-                    self._add_line(f"{var_name} = BasicString(input_values[{i}].strip())")
-                elif var.type_suffix == '%':
-                    self._add_line(f"try:")
-                    self._add_line(f"    {var_name} = int(float(input_values[{i}].strip()))")
-                    self._add_line("except ValueError:")
-                    self._add_line(f"    {var_name} = 0")
-                else:
-                    self._add_line(f"try:")
-                    self._add_line(f"    {var_name} = float(input_values[{i}].strip())")
-                    self._add_line("except ValueError:")
-                    self._add_line(f"    {var_name} = 0.0")
+            self._add_line(f"while {self._generate_expression(while_node.condition, exact=False)}:")
+        self._generate_block(while_node.body)
 
-                self.indent_level -= 1
+    def _generate_input(self, input_node):
+        prompt_expr = self._generate_operand(input_node.prompt) if input_node.prompt else ""
+        suffixes = repr(tuple(var.type_suffix for var in input_node.variables))
+
+        if input_node.channel is not None:
+            # Запись файла всегда делится на поля: INPUT #1, A$ читает A$ до запятой
+            channel = self._generate_integer_expression(input_node.channel)
+            self._add_line(f"input_values = {self._runtime('file_input_fields')}({channel}, {suffixes})")
+            self._generate_input_assignments(input_node.variables)
+        elif len(input_node.variables) > 1:
+            prompt_arg = prompt_expr or "None"
+            self._add_line(f"input_values = {self._runtime('basic_input_fields')}({prompt_arg}, {suffixes})")
+            self._generate_input_assignments(input_node.variables)
         else:
             var = input_node.variables[0]
-            var_name = self._format_variable_name(var)
-
             if var.type_suffix == '$':
-                self._add_line(f"{var_name} = BasicString(input_value)")
+                reader = 'basic_input_string'
             elif var.type_suffix == '%':
-                self._add_line(f"try:")
-                self._add_line(f"    {var_name} = int(float(input_value))")
-                self._add_line("except ValueError:")
-                self._add_line(f"    {var_name} = 0")
+                reader = 'basic_input_integer'
+            else:
+                reader = 'basic_input_number'
+            self._add_line(f"{self._format_target(var)} = {self._runtime(reader)}({prompt_expr})")
+
+    def _generate_input_assignments(self, variables):
+        """Переменные INPUT получают поля из input_values; если полей меньше, остальные не меняются"""
+        for i, var in enumerate(variables):
+            self._add_line(f"if len(input_values) > {i}:")
+            self._add_line(f"    {self._format_target(var)} = input_values[{i}]")
+
+    def _generate_open(self, open_node):
+        path = self._generate_expression(open_node.path)
+        channel = self._generate_integer_expression(open_node.channel)
+        if open_node.mode == 'RANDOM':
+            arguments = [path, channel]
+            if open_node.record_length is not None:
+                arguments.append(self._generate_integer_expression(open_node.record_length))
+            self._add_line(f"{self._runtime('basic_open_random')}({', '.join(arguments)})")
+        else:
+            self._add_line(f"{self._runtime('basic_open')}({path}, {open_node.mode!r}, {channel})")
+
+    def _generate_close(self, close_node):
+        channels = ", ".join(self._generate_integer_expression(channel) for channel in close_node.channels)
+        self._add_line(f"{self._runtime('basic_close')}({channels})")
+
+    def _generate_field(self, field_node):
+        channel = self._generate_integer_expression(field_node.channel)
+        layout = self._field_layout(field_node)
+        targets = self._unpack_targets(field_node.variables)
+        self._add_line(f"{targets} = {self._runtime('basic_field')}({channel}, {layout!r})")
+
+    def _field_layout(self, field_node):
+        """
+        Формат struct записи FIELD без выравнивания: строка — байты фиксированной ширины,
+        числа — целые или float ширины поля
+        """
+        # Неверная ширина числового поля — семантическая ошибка: код программы с ней
+        # генерируется, но не выполняется
+        codes = []
+        for width, var in zip(field_node.widths, field_node.variables):
+            if var.type_suffix == '$':
+                codes.append(f"{width}s")
+            elif var.type_suffix == '%':
+                codes.append(INTEGER_FIELD_FORMATS.get(width, 'q'))
+            else:
+                codes.append(NUMBER_FIELD_FORMATS.get(width, 'd'))
+        return '<' + ''.join(codes)
+
+    def _unpack_targets(self, variables):
+        """Левая часть присваивания списка полей записи переменным: A, для одной и () без FIELD"""
+        if not variables:
+            return "()"
+        targets = ", ".join(self._format_target(var) for var in variables)
+        return targets + "," if len(variables) == 1 else targets
+
+    def _generate_get(self, get_node):
+        arguments = [self._generate_integer_expression(get_node.channel)]
+        if get_node.record is not None:
+            arguments.append(self._generate_integer_expression(get_node.record))
+        self._add_line(f"{self._unpack_targets(get_node.variables)} = {self._runtime('file_get')}({', '.join(arguments)})")
+
+    def _generate_put(self, put_node):
+        arguments = [
+            self._generate_integer_expression(put_node.channel),
+            self._generate_integer_expression(put_node.record) if put_node.record is not None else "None",
+        ] + [self._generate_expression(var) for var in put_node.variables]
+        self._add_line(f"{self._runtime('file_put')}({', '.join(arguments)})")
+
+    def _generate_dim(self, dim_node):
+        for array in dim_node.arrays:
+            size = self._array_size(array)
+            size_expr = str(size) if isinstance(size, int) else self._array_size_expression(size)
+            if array.type_suffix == '$':
+                storage = f"[{self._string_constant('')}] * {size_expr}"
             else:
-                self._add_line(f"try:")
-                self._add_line(f"    {var_name} = float(input_value)")
-                self._add_line("except ValueError:")
-                self._add_line(f"    {var_name} = 0.0")
+                self.uses_array = True
+                typecode, zero = self._array_typecode(array)
+                storage = f"array({typecode!r}, [{zero!r}]) * {size_expr}"
+            self._add_line(f"{self._format_variable_name(array)} = {storage}")
+
+    def _array_size_expression(self, size):
+        first, rest = size
+        count = f"({self._generate_integer_expression(first)} + 1)"
+        return count if rest == 1 else f"{count} * {rest}"
+
+    def _array_typecode(self, array_node):
+        """Код типа array и нулевой элемент: 8-байтовые целые для %, double для остальных чисел"""
+        if array_node.type_suffix == '%':
+            return 'q', 0
+        return 'd', 0.0
+
+    def _array_sizes(self, array_node):
+        # Необъявленный массив и неконстантный размер — семантические ошибки: код программы
+        # с ними генерируется, но не выполняется
+        return self.arrays.get((array_node.name, array_node.type_suffix)) or [None] * len(array_node.indices)
+
+    def _array_size(self, array_node):
+        """
+        Число элементов массива: int, если все размеры константы, иначе пара (выражение
+        наибольшего индекса первого измерения, произведение остальных размеров)
+        """
+        sizes = self._array_sizes(array_node)
+        rest = 1
+        for size in sizes[1:]:
+            rest *= size or 1
+        if sizes[0] is not None:
+            return sizes[0] * rest
+        return array_node.indices[0], rest
+
+    def _array_stride(self, access):
+        """Шаг в хранилище между соседними элементами измерения, индекс которого зависит от цикла"""
+        return self._dimension_stride(access.element, access.dimension)
+
+    def _dimension_stride(self, element_node, dimension):
+        stride = 1
+        for size in self._array_sizes(element_node)[dimension + 1:]:
+            stride *= size if size is not None else 1
+        return stride
+
+    def _array_bound(self, element_node, dimension):
+        """Наибольший индекс измерения из DIM или None, если размер измерения не константа"""
+        size = self._array_sizes(element_node)[dimension]
+        return size - 1 if size is not None else None
+
+    def _array_index_terms(self, element_node, checked=True):
+        """
+        Индекс элемента в плоском хранилище: тройки (выражение индекса, шаг, измерение) и
+        постоянное смещение. Шаг измерения — произведение размеров следующих измерений.
+        Константные индексы в границах DIM сразу сворачиваются в смещение. Индекс, который
+        остается в границах при любом значении переменных циклов (A(I) в FOR I = 0 TO 99 при
+        DIM A(99)), не проверяется; остальные проверяются при выполнении по границам своего
+        измерения. У непроверяемого индекса, в том числе при checked=False, измерение в тройке — None
+        """
+        sizes = self._array_sizes(element_node)
+        terms = []
+        offset = 0
+        stride = 1
+        for dimension in reversed(range(len(element_node.indices))):
+            index = element_node.indices[dimension]
+            value = self._constant_value(index)
+            bound = self._array_bound(element_node, dimension)
+            if value is not None and (not checked or (bound is not None and 0 <= int(value) <= bound)):
+                offset += int(value) * stride
+            else:
+                in_bounds = not checked or self._within_bound(index, bound)
+                terms.append((index, stride, None if in_bounds else dimension))
+            size = sizes[dimension]
+            stride *= size if size is not None else 1
+        return terms[::-1], offset
+
+    def _within_bound(self, index_node, bound):
+        """Целый индекс при любых значениях переменных циклов лежит в границах 0..bound"""
+        index_range = self._index_range(index_node)
+        return bound is not None and index_range is not None and 0 <= index_range[0] and index_range[1] <= bound
+
+    def _index_range(self, expr_node):
+        """Наименьшее и наибольшее значение целого выражения из констант, переменных циклов, + и -, или None"""
+        value = self._constant_value(expr_node)
+        if value is not None:
+            return (int(value), int(value)) if self._is_integer_literal(value) else None
+        if isinstance(expr_node, VariableNode):
+            return self.loop_ranges.get(self._storage_key(expr_node))
+        if isinstance(expr_node, BinaryOpNode) and expr_node.op in ('+', '-'):
+            left = self._index_range(expr_node.left)
+            right = self._index_range(expr_node.right)
+            if left is None or right is None:
+                return None
+            if expr_node.op == '+':
+                return left[0] + right[0], left[1] + right[1]
+            return left[0] - right[1], left[1] - right[0]
+        return None
+
+    def _generate_array_index(self, element_node):
+        terms, offset = self._array_index_terms(element_node)
+        parts = [
+            self._generate_subscript(element_node, index, dimension) + (f" * {stride}" if stride != 1 else "")
+            for index, stride, dimension in terms
+        ]
+        if offset or not parts:
+            parts.append(str(offset))
+        return " + ".join(parts)
+
+    def _generate_subscript(self, element_node, index, dimension):
+        """Индекс одного измерения: вызов basic_index с его границей"""
+        expr = self._generate_expression(index, exact=False)
+        return f"{self._runtime('basic_index')}({expr}, {self._generate_array_bound(element_node, dimension)})"
+
+    def _generate_array_bound(self, element_node, dimension):
+        bound = self._array_bound(element_node, dimension)
+        if bound is not None:
+            return str(bound)
+        # Первый размер вычисляется при DIM: граница следует из длины хранилища
+        stride = self._dimension_stride(element_node, dimension)
+        length = f"len({self._format_variable_name(element_node)})"
+        return f"{length} // {stride} - 1" if stride != 1 else f"{length} - 1"
+
+    def _generate_mat_let(self, mat_node):
+        operands = [f"{self._runtime('mat_view')}({self._matrix_arguments(matrix)})" for matrix in mat_node.operands]
+        if mat_node.operation == 'COPY':
+            value = operands[0]
+        elif mat_node.operation == 'SCALE':
+            value = f"{self._runtime('mat_scale')}({self._generate_expression(mat_node.factor)}, {operands[0]})"
+        else:
+            value = f"{self._runtime(MAT_OPERATIONS[mat_node.operation])}({', '.join(operands)})"
+        self._add_line(f"{self._runtime('mat_assign')}({self._matrix_arguments(mat_node.target)}, {value})")
+
+    def _generate_mat_read(self, mat_node):
+        for matrix in mat_node.matrices:
+            self._add_line(f"{self._runtime('mat_read')}({self._matrix_arguments(matrix)}, {self._data_reader()})")
+
+    def _generate_mat_print(self, mat_node):
+        for matrix, separator in zip(mat_node.matrices, mat_node.separators):
+            packed = ", True" if separator == ';' else ""
+            self._add_line(f"{self._runtime('mat_print')}({self._matrix_arguments(matrix)}{packed})")
+
+    def _matrix_arguments(self, matrix_node):
+        return f"{self._format_variable_name(matrix_node)}, {self._matrix_columns(matrix_node)}"
+
+    def _matrix_columns(self, matrix_node):
+        """Размер второго измерения хранилища матрицы: по нему строится ее вид; None для вектора"""
+        sizes = self._array_sizes(matrix_node)
+        return sizes[1] if len(sizes) == 2 else None
+
+    def _generate_read(self, read_node):
+        for var in read_node.variables:
+            self._add_line(f"{self._format_target(var)} = {self._data_reader()}.{self._data_read_method(var)}()")
+
+    def _data_reader(self):
+        """Объект значений DATA уровня модуля; отмечает, что программа их читает"""
+        self._runtime('DataReader')
+        return '_data'
+
+    def _data_read_method(self, var_node):
+        if var_node.type_suffix == '$':
+            return 'read_string'
+        if var_node.type_suffix == '%':
+            return 'read_integer'
+        return 'read_number'
 
     def _generate_end(self, end_node):
         self._add_line("")
+        self.uses_sys = True
         self._add_line("sys.exit(0)")
 
     def _generate_label(self, label_node):
@@ -345,22 +981,36 @@ class CodeGenerator:
         self.indent_level = 2
         self._add_line(f"")
 
-    def _generate_expression(self, expr_node):
+    def _generate_expression(self, expr_node, exact=True):
+        """
+        exact=False означает, что важно только значение выражения, а не его тип (int или float):
+        результат сравнивается, проверяется в условии или приводится к int. Тогда целые
+        константы выводятся как литералы int.
+        """
         if isinstance(expr_node, NumberNode):
+            if not exact and self._is_integer_literal(expr_node.value):
+                return str(int(expr_node.value))
             return str(expr_node.value)
 
         elif isinstance(expr_node, StringNode):
-            escaped_value = expr_node.value.replace('"', '\\"')
-            return f'BasicString("{escaped_value}")'
+            return self._string_constant(expr_node.value)
 
         elif isinstance(expr_node, VariableNode):
             return self._format_variable_name(expr_node)
 
-        elif isinstance(expr_node, BinaryOpNode):
-            left = self._generate_expression(expr_node.left)
-            right = self._generate_expression(expr_node.right)
+        elif isinstance(expr_node, ArrayElementNode):
+            return f"{self._format_variable_name(expr_node)}[{self._generate_array_index(expr_node)}]"
 
+        elif isinstance(expr_node, BinaryOpNode):
             op = expr_node.op
+            if op in TypeInference.COMPARISON_OPS:
+                left = self._generate_operand(expr_node.left, exact=False)
+                right = self._generate_operand(expr_node.right, exact=False)
+            else:
+                left_exact, right_exact = self._operands_exactness(expr_node, exact)
+                left = self._generate_expression(expr_node.left, left_exact)
+                right = self._generate_expression(expr_node.right, right_exact)
+
             if op == '=':
                 op = '=='
             elif op == '<>':
@@ -369,18 +1019,244 @@ class CodeGenerator:
             return f"({left} {op} {right})"
 
         elif isinstance(expr_node, UnaryOpNode):
-            operand = self._generate_expression(expr_node.operand)
+            operand = self._generate_expression(expr_node.operand, exact)
             return f"{expr_node.op}{operand}"
 
+        elif isinstance(expr_node, FunctionCallNode):
+            if expr_node.name == 'INT':
+                return f"({self._generate_expression(expr_node.arguments[0], exact)} // 1)"
+            # Аргумент RND не влияет на результат
+            arguments = [] if expr_node.name == 'RND' else [
+                self._generate_expression(argument, self._argument_exactness(expr_node, exact))
+                for argument in expr_node.arguments
+            ]
+            return f"_{self._builtin_function(expr_node.name)}({', '.join(arguments)})"
+
+        elif isinstance(expr_node, FnCallNode):
+            inlined = self._inlined_call(expr_node)
+            if inlined is not None:
+                return self._generate_assigned_value(expr_node.type_suffix, inlined, exact)
+            definition = self._function_definition(expr_node)
+            arguments = [
+                self._generate_assigned_value(parameter.type_suffix, argument)
+                for parameter, argument in zip(definition.parameters if definition else [], expr_node.arguments)
+            ] + [self._format_variable_name(node) for node in self._function_globals(expr_node)]
+            return f"{self._user_function(expr_node)}({', '.join(arguments)})"
+
         else:
             raise ValueError(f"Неизвестный тип узла выражения: {type(expr_node)}")
 
+    def _function_definition(self, call_node):
+        """DefFnNode вызываемой функции или None, если она не определена"""
+        return self.symbol_table.functions.get((call_node.name, call_node.type_suffix))
+
+    def _walk_with_functions(self, node):
+        """
+        Обходит узел и тела функций DEF FN, которые он вызывает, в том числе через другие
+        функции. Тело читает переменные программы там, где функция вызвана или подставлена;
+        параметры тел пропускаются
+        """
+        parameters = {
+            (parameter.name, parameter.type_suffix)
+            for definition in self.symbol_table.functions.values() for parameter in definition.parameters
+        }
+        visited = set()
+        stack = [node]
+        while stack:
+            for child in stack.pop().walk():
+                if isinstance(child, VariableNode) and (child.name, child.type_suffix) in parameters:
+                    continue
+                yield child
+                if isinstance(child, FnCallNode) and self._function_definition(child) is not None:
+                    key = child.name, child.type_suffix
+                    if key not in visited:
+                        visited.add(key)
+                        stack.append(self._function_definition(child).body)
+
+    def _function_globals(self, call_node):
+        """
+        Переменные и массивы программы, которые читает тело функции. Функция уровня модуля
+        получает их значения аргументами после параметров, как функция ядра векторизованного
+        цикла, поэтому им не нужны ячейки _slots
+        """
+        definition = self._function_definition(call_node)
+        if definition is None:
+            return []
+        variables = {}
+        for node in self._walk_with_functions(definition.body):
+            if isinstance(node, (VariableNode, ArrayElementNode)):
+                variables.setdefault(self._storage_key(node), node)
+        return list(variables.values())
+
+    def _user_function(self, call_node):
+        """Имя функции уровня модуля для вызова, который не подставляется"""
+        key = call_node.name, call_node.type_suffix
+        if key not in self.called_functions:
+            self.called_functions.append(key)
+        return self._variable_identifier(call_node)
+
+    def _function_scope(self):
+        """
+        Таблица символов для тела функции уровня модуля: без ячеек _slots, как у ядра цикла,
+        все переменные тела - параметры функции
+        """
+        symbol_table = SymbolTable()
+        symbol_table.functions = self.symbol_table.functions
+        return symbol_table
+
+    def _generate_user_functions(self):
+        """Определения вызываемых функций; тело одной функции может добавить вызов другой"""
+        index = 0
+        while index < len(self.called_functions):
+            definition = self.symbol_table.functions.get(self.called_functions[index])
+            index += 1
+            if definition is None:
+                continue
+            parameters = [
+                self._variable_identifier(node) for node in definition.parameters + self._function_globals(definition)
+            ] + [f"{name}={value}" for name, value in self._function_parameters([definition.body])]
+            saved = self.code_lines, self.indent_level, self.symbol_table
+            self.code_lines, self.indent_level, self.symbol_table = [], 1, self._function_scope()
+            self._add_line(f"return {self._generate_assigned_value(definition.type_suffix, definition.body)}")
+            body = self.code_lines
+            self.code_lines, self.indent_level, self.symbol_table = saved
+            self.user_functions.append([f"def {self._variable_identifier(definition)}({', '.join(parameters)}):"] + body)
+
+    def _inlined_call(self, call_node):
+        """
+        Тело функции с аргументами вместо параметров или None, если вызов остается вызовом.
+        Подставляется небольшое тело без RND, EOF и рекурсии. Аргумент должен иметь тип параметра,
+        чтобы не требовалось приведение, и не содержать RND и EOF. Сложный аргумент подставляется,
+        только если тело читает параметр ровно один раз: иначе он вычислялся бы несколько раз
+        или ни одного
+        """
+        definition = self._function_definition(call_node)
+        if (definition is None or len(call_node.arguments) != len(definition.parameters)
+                or sum(1 for _ in definition.body.walk()) > INLINE_MAX_NODES or not self._is_pure_function(call_node)):
+            return None
+
+        bindings = {}
+        for parameter, argument in zip(definition.parameters, call_node.arguments):
+            key = parameter.name, parameter.type_suffix
+            uses = sum(
+                1 for node in definition.body.walk()
+                if isinstance(node, VariableNode) and (node.name, node.type_suffix) == key
+            )
+            if not self._is_pure(argument) or not self._matches_parameter(parameter, argument):
+                return None
+            if uses != 1 and not isinstance(argument, (NumberNode, StringNode, VariableNode)):
+                return None
+            bindings[key] = argument
+        # Константные аргументы делают константами и операции тела: они вычисляются при компиляции
+        return ConstantFoldingOptimizer().fold_constants(self._substitute(definition.body, bindings))
+
+    def _is_pure(self, expr_node):
+        """Выражение без RND, EOF и без вызовов функций, которые нельзя подставить"""
+        return not any(
+            (isinstance(node, FunctionCallNode) and node.name in IMPURE_FUNCTIONS)
+            or (isinstance(node, FnCallNode) and not self._is_pure_function(node))
+            for node in expr_node.walk()
+        )
+
+    def _is_pure_function(self, call_node):
+        """Функция определена, ее тело не вызывает RND и EOF и не приводит обратно к ней самой"""
+        if self._function_definition(call_node) is None:
+            return False
+        for node in self._walk_with_functions(self._function_definition(call_node).body):
+            if isinstance(node, FunctionCallNode) and node.name in IMPURE_FUNCTIONS:
+                return False
+            if isinstance(node, FnCallNode) and (
+                    self._function_definition(node) is None
+                    or (node.name, node.type_suffix) == (call_node.name, call_node.type_suffix)):
+                return False
+        return True
+
+    def _matches_parameter(self, parameter, argument):
+        """Значение аргумента подходит параметру без приведения к int или BasicString"""
+        if parameter.type_suffix == '%':
+            return self._is_int_valued(argument)
+        if parameter.type_suffix == '$':
+            return self._expression_type(argument) == TypeInference.STRING
+        return self._expression_type(argument) != TypeInference.STRING
+
+    def _substitute(self, expr_node, bindings):
+        """Копия выражения, в которой параметры заменены аргументами"""
+        if isinstance(expr_node, VariableNode):
+            return bindings.get((expr_node.name, expr_node.type_suffix), expr_node)
+        if isinstance(expr_node, ArrayElementNode):
+            indices = [self._substitute(index, bindings) for index in expr_node.indices]
+            return ArrayElementNode(expr_node.name, expr_node.type_suffix, indices)
+        if isinstance(expr_node, BinaryOpNode):
+            return BinaryOpNode(
+                self._substitute(expr_node.left, bindings), expr_node.op, self._substitute(expr_node.right, bindings)
+            )
+        if isinstance(expr_node, UnaryOpNode):
+            return UnaryOpNode(expr_node.op, self._substitute(expr_node.operand, bindings))
+        if isinstance(expr_node, FunctionCallNode):
+            return FunctionCallNode(expr_node.name, [self._substitute(arg, bindings) for arg in expr_node.arguments])
+        if isinstance(expr_node, FnCallNode):
+            arguments = [self._substitute(argument, bindings) for argument in expr_node.arguments]
+            return FnCallNode(expr_node.name, expr_node.type_suffix, arguments)
+        return expr_node
+
+    def _argument_exactness(self, call_node, exact):
+        """Тип аргумента важен только функциям, значение которых того же типа, что и аргумент"""
+        return exact and call_node.name in TypeInference.TYPE_PRESERVING_FUNCTIONS
+
+    def _operands_exactness(self, binary_node, exact):
+        """Нужно ли сохранять тип (int или float) каждого операнда арифметической операции"""
+        left_type = self._expression_type(binary_node.left)
+        right_type = self._expression_type(binary_node.right)
+        numeric = left_type in TypeInference.NUMERIC_TYPES and right_type in TypeInference.NUMERIC_TYPES
+        if not numeric:
+            # Сложение строк: числа в нем выводятся в строку как есть
+            return True, True
+        if binary_node.op == '/' or not exact:
+            return False, False
+        # Если один операнд остается float, результат будет float при другом операнде любого
+        # числового типа. Ослабить можно только один из них, иначе оба могут стать int
+        if left_type == TypeInference.FLOAT:
+            return True, False
+        if right_type == TypeInference.FLOAT:
+            return False, True
+        return True, True
+
+    def _generate_operand(self, expr_node, exact=True):
+        """Значение, которое только выводится или сравнивается: строковой константе не нужен BasicString"""
+        if isinstance(expr_node, StringNode):
+            return repr(expr_node.value)
+        return self._generate_expression(expr_node, exact)
+
+    def _string_constant(self, value):
+        """Имя BasicString из пула: одинаковые литералы создаются один раз при загрузке модуля"""
+        if value not in self.string_constants:
+            self._runtime('BasicString')
+            self.string_constants[value] = f"_str{len(self.string_constants) + 1}"
+        return self.string_constants[value]
+
+    def _format_target(self, var_node):
+        """Левая часть присваивания: переменная или элемент массива"""
+        if isinstance(var_node, ArrayElementNode):
+            return self._generate_expression(var_node)
+        return self._format_variable_name(var_node)
+
     def _format_variable_name(self, var_node):
+        """
+        Переменная в Python коде: локальное имя или ячейка списка _slots. Для элемента
+        массива — имя или ячейка хранилища всего массива
+        """
+        symbol = self.symbol_table.get_slot(*self._storage_key(var_node))
+        if symbol is not None and symbol.storage == STORAGE_SLOT:
+            return f"_slots[{symbol.slot}]"
+        return self._variable_identifier(var_node)
+
+    def _variable_identifier(self, var_node):
         """Форматирует имя переменной для Python кода"""
         name = var_node.name
         suffix = var_node.type_suffix or ""
 
         if suffix:
-            return f"{name}_{suffix.replace('$', 'S').replace('%', 'I').replace('!', 'F')}"
-        else:
-            return name
\ No newline at end of file
+            name = f"{name}_{suffix.replace('$', 'S').replace('%', 'I').replace('!', 'F')}"
+        if isinstance(var_node, ArrayElementNode):
+            return f"{name}_array"
+        return name
\ No newline at end of file
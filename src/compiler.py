@@ -1,13 +1,24 @@
+import ast
 import os
 import sys
 from antlr4 import InputStream, CommonTokenStream
 from generated.BasicLexer import BasicLexer
 from generated.BasicParser import BasicParser
 from ast_builder import AstBuilder
-from ast_nodes import LabelNode, GotoNode, ProgramNode, GosubNode
+from ast_nodes import LabelNode, GotoNode, ProgramNode, GosubNode, OnJumpNode
 from semantic_analyzer import SemanticAnalyzer
 from code_generator import CodeGenerator
+from python_ast_generator import PythonAstGenerator
+from bytecode_generator import BytecodeGenerator, bytecode_supported
 from optimizers import create_default_pipeline
+from control_flow import StateMachineLowering
+from relooper import Relooper, NestingLimitError
+from chunked_layout import ChunkedLowering, exceeds_layout_limits
+import basic_runtime
+
+CODEGEN_MODES = ('structured', 'state_machine', 'chunked', 'nested')
+CODE_BACKENDS = ('ast', 'bytecode')
+RUNTIME_DIR = os.path.dirname(os.path.abspath(basic_runtime.__file__))
 
 
 def resolve_labels(program_node):
@@ -20,9 +31,15 @@ def resolve_labels(program_node):
 
     for stmt in program_node.statements:
         if isinstance(stmt, GotoNode) or isinstance(stmt, GosubNode):
-            if stmt.target_label_ref.name_or_number in labels:
-                stmt.target_label_ref.target = labels[stmt.target_label_ref.name_or_number]
-                stmt.target_label_ref.resolved = True
+            target_refs = [stmt.target_label_ref]
+        elif isinstance(stmt, OnJumpNode):
+            target_refs = stmt.target_label_refs
+        else:
+            continue
+        for target_ref in target_refs:
+            if target_ref.name_or_number in labels:
+                target_ref.target = labels[target_ref.name_or_number]
+                target_ref.resolved = True
 
 
 def compile_and_print_ast(basic_code_string, test_name="Test", enable_optimizations=False):
@@ -57,7 +74,11 @@ def compile_and_print_ast(basic_code_string, test_name="Test", enable_optimizati
     return ast_root
 
 
-def compile_basic_to_python(basic_code_string, output_file=None, enable_optimizations=True, debug=False):
+def build_program_ast(basic_code_string, enable_optimizations=True, debug=False, codegen_mode='structured'):
+    """Разбор, семантический анализ, оптимизации и понижение AST для выбранного режима генерации"""
+    if codegen_mode not in CODEGEN_MODES:
+        raise ValueError(f"Неизвестный режим генерации кода: {codegen_mode}")
+
     input_stream = InputStream(basic_code_string)
     lexer = BasicLexer(input_stream)
     token_stream = CommonTokenStream(lexer)
@@ -67,7 +88,7 @@ def compile_basic_to_python(basic_code_string, output_file=None, enable_optimiza
     ast_root = ast_builder.visit(parse_tree)
 
     if not isinstance(ast_root, ProgramNode):
-        return None, ["Ошибка: не удалось построить AST"]
+        return None, None, ["Ошибка: не удалось построить AST"]
 
     resolve_labels(ast_root)
 
@@ -79,6 +100,10 @@ def compile_basic_to_python(basic_code_string, output_file=None, enable_optimiza
         for error in semantic_errors:
             print(f"  - {error}")
 
+    # Понижение и генерация рассчитывают на корректную программу: с ошибками возвращаются только они
+    if semantic_errors:
+        return None, analyzer.symbol_table, semantic_errors
+
     if enable_optimizations:
         optimizer = create_default_pipeline()
         ast_root = optimizer.optimize(ast_root)
@@ -87,7 +112,37 @@ def compile_basic_to_python(basic_code_string, output_file=None, enable_optimiza
             print("Оптимизированное AST:")
             ast_root.display()
 
-    code_generator = CodeGenerator()
+    # Режим 'nested' оставляет прежнюю генерацию через вложенные функции
+    lowered = ast_root
+    if codegen_mode == 'structured':
+        try:
+            lowered = Relooper().optimize(ast_root)
+        except NestingLimitError:
+            # Слишком глубокая вложенность: программу раскладывает chunked
+            lowered = None
+    elif codegen_mode == 'state_machine':
+        lowered = StateMachineLowering().optimize(ast_root)
+    # Функцию, которую CPython не скомпилирует из-за вложенности или будет долго компилировать
+    # целиком, раскладка chunked разбивает на части ограниченного размера
+    if codegen_mode == 'chunked' or lowered is None or (codegen_mode != 'nested' and exceeds_layout_limits(lowered)):
+        lowered = ChunkedLowering().optimize(ast_root)
+
+    return lowered, analyzer.symbol_table, semantic_errors
+
+
+def compile_basic_to_python(basic_code_string, output_file=None, enable_optimizations=True, debug=False,
+                            codegen_mode='structured', inline_runtime=False, batch_input=False):
+    ast_root, symbol_table, semantic_errors = build_program_ast(
+        basic_code_string, enable_optimizations, debug, codegen_mode
+    )
+    if ast_root is None:
+        return None, semantic_errors
+
+    # Текст программы в режимах, кроме nested, - модуль PythonAstGenerator, выведенный через ast.unparse
+    if codegen_mode == 'nested':
+        code_generator = CodeGenerator(symbol_table, inline_runtime, batch_input)
+    else:
+        code_generator = PythonAstGenerator(symbol_table, inline_runtime, batch_input)
     python_code = code_generator.generate(ast_root)
 
     if output_file:
@@ -100,31 +155,96 @@ def compile_basic_to_python(basic_code_string, output_file=None, enable_optimiza
     return python_code, semantic_errors
 
 
-def compile_and_run(basic_code_string, output_file=None, run=False, enable_optimizations=True, debug=False):
+def compile_basic_to_module(basic_code_string, enable_optimizations=True, debug=False,
+                            codegen_mode='structured', inline_runtime=False, batch_input=False):
+    """
+    Компилирует программу в ast.Module без промежуточного текста. Текст программы
+    (compile_basic_to_python) - это ast.unparse того же модуля. Режим 'nested' генерируется
+    только в текст и разбирается.
+    """
+    ast_root, symbol_table, semantic_errors = build_program_ast(
+        basic_code_string, enable_optimizations, debug, codegen_mode
+    )
+    if ast_root is None:
+        return None, semantic_errors
+
+    if codegen_mode == 'nested':
+        return ast.parse(CodeGenerator(symbol_table, inline_runtime, batch_input).generate(ast_root)), semantic_errors
+    return PythonAstGenerator(symbol_table, inline_runtime, batch_input).generate_module(ast_root), semantic_errors
+
+
+def compile_basic_to_code(basic_code_string, enable_optimizations=True, debug=False,
+                          codegen_mode='structured', inline_runtime=False, filename='<basic>', backend='ast',
+                          batch_input=False):
+    """
+    Объект кода программы, готовый для exec. backend='bytecode' собирает main() прямо в байт-код
+    (codegen_mode при этом не используется); на других версиях CPython используется генератор ast.
+    """
+    if backend not in CODE_BACKENDS:
+        raise ValueError(f"Неизвестный генератор кода: {backend}")
+
+    if backend == 'bytecode' and bytecode_supported():
+        # Генератор байт-кода сам строит граф потока управления: AST берется без понижения, как в режиме nested
+        ast_root, symbol_table, semantic_errors = build_program_ast(
+            basic_code_string, enable_optimizations, debug, 'nested'
+        )
+        if ast_root is None:
+            return None, semantic_errors
+        generator = BytecodeGenerator(symbol_table, inline_runtime, batch_input)
+        return generator.generate_code(ast_root, filename), semantic_errors
+
+    module, semantic_errors = compile_basic_to_module(
+        basic_code_string, enable_optimizations, debug, codegen_mode, inline_runtime, batch_input
+    )
+    if module is None:
+        return None, semantic_errors
+    return compile(module, filename, 'exec'), semantic_errors
+
+
+def compile_and_run(basic_code_string, output_file=None, run=False, enable_optimizations=True, debug=False,
+                    codegen_mode='structured', inline_runtime=False, batch_input=False):
+    """
+    Компилирует программу, сохраняет ее в output_file и с run=True выполняет. Возвращает текст
+    программы на Python и семантические ошибки; если ошибки нашлись, программа не выполняется.
+    Без output_file программа выполняется в этом процессе из модуля ast, а возвращается его текст
+    """
+    if run and not output_file:
+        module, semantic_errors = compile_basic_to_module(
+            basic_code_string, enable_optimizations, debug, codegen_mode, inline_runtime, batch_input
+        )
+        if module is None:
+            return None, semantic_errors
+        if not semantic_errors:
+            try:
+                exec(compile(module, '<basic>', 'exec'), {'__name__': '__main__'})
+            except SystemExit:
+                pass
+            except Exception as e:
+                print(f"Ошибка выполнения: {e}")
+        return ast.unparse(module), semantic_errors
+
     python_code, semantic_errors = compile_basic_to_python(
-        basic_code_string, output_file, enable_optimizations, debug
+        basic_code_string, output_file, enable_optimizations, debug, codegen_mode, inline_runtime, batch_input
     )
 
     if run and not semantic_errors and python_code:
-        if output_file:
-            dirname = os.path.dirname(output_file)
-            filename = os.path.basename(output_file)
+        dirname = os.path.dirname(output_file)
+        filename = os.path.basename(output_file)
 
-            if dirname:
-                cwd = os.getcwd()
-                os.chdir(dirname)
+        if dirname:
+            cwd = os.getcwd()
+            os.chdir(dirname)
 
-            try:
-                import subprocess
-                subprocess.call([sys.executable, filename])
-            finally:
-                if dirname:
-                    os.chdir(cwd)
-        else:
-            try:
-                exec(python_code)
-            except Exception as e:
-                print(f"Ошибка выполнения: {e}")
+        # Сгенерированная программа импортирует basic_runtime из каталога компилятора
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [RUNTIME_DIR, env.get('PYTHONPATH')]))
+
+        try:
+            import subprocess
+            subprocess.call([sys.executable, filename], env=env)
+        finally:
+            if dirname:
+                os.chdir(cwd)
 
     return python_code, semantic_errors
 
@@ -137,7 +257,9 @@ if __name__ == "__main__":
             basic_code = f.read()
 
         print(f"Компиляция {input_file} в {output_file}")
-        python_code, errors = compile_and_run(basic_code, output_file, '--run' in sys.argv, '--debug' in sys.argv)
+        python_code, errors = compile_and_run(
+            basic_code, output_file, '--run' in sys.argv, '--debug' in sys.argv, batch_input='--batch-input' in sys.argv
+        )
 
         if errors:
             print("Ошибки:")
@@ -0,0 +1,748 @@
+from ast_nodes import (
+    ProgramNode, LetNode, EndNode, IfNode, GotoNode,
+    ForNode, NextNode, GosubNode, ReturnNode, WhileNode, InputNode,
+    NumberNode, StringNode, VariableNode, BinaryOpNode, LabelNode,
+    BreakNode, IfBlockNode, DispatchStateNode, DispatchNode, JumpNode, ReturnJumpNode,
+    SubroutineNode, CallSubroutineNode, OnJumpNode, SelectCaseNode, CaseNode, CaseRangeNode, CaseIsNode, SwitchNode,
+    ReadNode, FieldNode, GetNode
+)
+from optimizers import Optimizer
+
+
+class Jump:
+    """Безусловный переход; target=None означает выход за конец программы"""
+
+    def __init__(self, target):
+        self.target = target
+
+    def successors(self):
+        return [self.target] if self.target is not None else []
+
+    def retarget(self, old, new):
+        if self.target is old:
+            self.target = new
+
+
+class Branch:
+    """Условный переход по значению выражения"""
+
+    def __init__(self, condition, true_target, false_target):
+        self.condition = condition
+        self.true_target = true_target
+        self.false_target = false_target
+
+    def successors(self):
+        return [self.true_target, self.false_target]
+
+    def retarget(self, old, new):
+        if self.true_target is old:
+            self.true_target = new
+        if self.false_target is old:
+            self.false_target = new
+
+
+class Switch:
+    """
+    Переход по таблице: cases — пары (константа NumberNode или StringNode, блок); если значения
+    селектора нет среди констант, переход к default. rounded — селектор округляется до целого (ON)
+    """
+
+    def __init__(self, selector, cases, default, rounded=False):
+        self.selector = selector
+        self.cases = cases
+        self.default = default
+        self.rounded = rounded
+
+    def successors(self):
+        return list(dict.fromkeys([target for _, target in self.cases] + [self.default]))
+
+    def retarget(self, old, new):
+        self.cases = [(key, new if target is old else target) for key, target in self.cases]
+        if self.default is old:
+            self.default = new
+
+    def arms(self):
+        """Ветви (блок, константы) в порядке первой константы; константы, ведущие в default, отброшены"""
+        arms = {}
+        for key, target in self.cases:
+            if target is not self.default:
+                arms.setdefault(target, []).append(key)
+        return list(arms.items())
+
+
+class Call:
+    """GOSUB: переход к подпрограмме с запоминанием блока возврата"""
+
+    def __init__(self, target, return_target):
+        self.target = target
+        self.return_target = return_target
+
+    def successors(self):
+        return [self.target, self.return_target]
+
+    def retarget(self, old, new):
+        if self.target is old:
+            self.target = new
+        if self.return_target is old:
+            self.return_target = new
+
+
+class Return:
+    """RETURN: переход к блоку, сохранённому последним GOSUB"""
+
+    def successors(self):
+        return []
+
+    def retarget(self, old, new):
+        pass
+
+
+class Halt:
+    """END: завершение программы"""
+
+    def successors(self):
+        return []
+
+    def retarget(self, old, new):
+        pass
+
+
+class BasicBlock:
+    """Линейный участок: инструкции без переходов и завершающий переход"""
+
+    def __init__(self, block_id):
+        self.id = block_id
+        self.statements = []
+        self.terminator = None
+        self.labels = []
+
+    def successors(self):
+        return self.terminator.successors() if self.terminator else []
+
+    def __repr__(self):
+        return f"BasicBlock({self.id}, labels={self.labels}, terminator={type(self.terminator).__name__})"
+
+
+class ControlFlowGraph:
+    """Граф потока управления программы"""
+
+    def __init__(self, entry, blocks):
+        self.entry = entry
+        self.blocks = blocks
+
+    def predecessors(self):
+        """Возвращает словарь: блок -> список блоков, из которых в него есть переход"""
+        preds = {block: [] for block in self.blocks}
+        for block in self.blocks:
+            for succ in block.successors():
+                preds[succ].append(block)
+        return preds
+
+    def reverse_postorder(self):
+        """Обход блоков, достижимых из входа, в обратном порядке завершения (без рекурсии)"""
+        visited = {self.entry}
+        postorder = []
+        stack = [(self.entry, iter(self.entry.successors()))]
+        while stack:
+            block, successors = stack[-1]
+            for succ in successors:
+                if succ not in visited:
+                    visited.add(succ)
+                    stack.append((succ, iter(succ.successors())))
+                    break
+            else:
+                stack.pop()
+                postorder.append(block)
+        postorder.reverse()
+        return postorder
+
+    def simplify(self):
+        """Убирает недостижимые и пустые блоки и склеивает цепочки линейных блоков"""
+        self.blocks = self.reverse_postorder()
+        self._thread_empty_jumps()
+        self.blocks = self.reverse_postorder()
+        self._merge_chains()
+        self.blocks = self.reverse_postorder()
+        for index, block in enumerate(self.blocks):
+            block.id = index
+
+    def extract_subroutines(self):
+        """
+        Выделяет из графа подпрограммы GOSUB с единственным входом и выходом только через RETURN.
+        GOSUB к таким подпрограммам становится прямым вызовом CallSubroutineNode.
+        Возвращает список пар (имя функции, граф подпрограммы); остальные подпрограммы
+        остаются в графе и по-прежнему выполняются через стек возвратов.
+        """
+        regions = {}
+        for block in self.blocks:
+            if isinstance(block.terminator, Call) and block.terminator.target not in regions:
+                region = self._subroutine_region(block.terminator.target)
+                regions[block.terminator.target] = region
+
+        regular = self._regular_subroutines(regions)
+        if not regular:
+            return []
+
+        names = {}
+        for entry in sorted(regular, key=lambda block: block.id):
+            name = f"sub_{entry.labels[0] if entry.labels else entry.id}"
+            while name in names.values():
+                name += "_"
+            names[entry] = name
+
+        for block in self.blocks:
+            terminator = block.terminator
+            if isinstance(terminator, Call) and terminator.target in names:
+                block.statements.append(CallSubroutineNode(names[terminator.target]))
+                block.terminator = Jump(terminator.return_target)
+
+        subroutines = []
+        for entry, name in names.items():
+            blocks = sorted(regions[entry], key=lambda block: block.id)
+            for block in blocks:
+                if isinstance(block.terminator, Return):
+                    # В функции подпрограммы выход за конец графа означает возврат из неё
+                    block.terminator = Jump(None)
+            subroutine = ControlFlowGraph(entry, blocks)
+            subroutine.simplify()
+            subroutines.append((name, subroutine))
+
+        self.simplify()
+        return subroutines
+
+    def subroutine_blocks(self):
+        """Блоки, до которых можно дойти из входа какой-нибудь подпрограммы GOSUB или ON ... GOSUB"""
+        blocks = set()
+        for block in self.blocks:
+            if isinstance(block.terminator, Call) and block.terminator.target not in blocks:
+                blocks |= self._subroutine_region(block.terminator.target)
+        return blocks
+
+    def _subroutine_region(self, entry):
+        """Блоки, достижимые из входа подпрограммы без выхода через RETURN (GOSUB внутри — как вызов)"""
+        region = {entry}
+        stack = [entry]
+        while stack:
+            block = stack.pop()
+            terminator = block.terminator
+            successors = [terminator.return_target] if isinstance(terminator, Call) else terminator.successors()
+            for succ in successors:
+                if succ not in region:
+                    region.add(succ)
+                    stack.append(succ)
+        return region
+
+    def _regular_subroutines(self, regions):
+        """
+        Подпрограмма регулярна, если в её блоки нельзя попасть иначе как через её вход по GOSUB,
+        она не доходит до конца программы и вызывает только регулярные подпрограммы без рекурсии
+        """
+        intra_preds = {block: [] for block in self.blocks}
+        call_targets = set(regions)
+        for block in self.blocks:
+            terminator = block.terminator
+            successors = [terminator.return_target] if isinstance(terminator, Call) else terminator.successors()
+            for succ in successors:
+                intra_preds[succ].append(block)
+
+        candidates = {}
+        for entry, region in regions.items():
+            if self.entry in region:
+                continue
+            if any(isinstance(block.terminator, Jump) and block.terminator.target is None for block in region):
+                continue
+            if any(block is not entry and block in call_targets for block in region):
+                continue
+            if any(pred not in region for block in region for pred in intra_preds[block]):
+                continue
+            candidates[entry] = {block.terminator.target for block in region if isinstance(block.terminator, Call)}
+
+        # Подпрограмма выделяется после всех, которые она вызывает; рекурсивные остаются в графе
+        regular = set()
+        changed = True
+        while changed:
+            changed = False
+            for entry, callees in candidates.items():
+                if entry not in regular and callees <= regular:
+                    regular.add(entry)
+                    changed = True
+        return regular
+
+    def _thread_empty_jumps(self):
+        forward = {}
+        for block in self.blocks:
+            if not block.statements and isinstance(block.terminator, Jump):
+                target = block.terminator.target
+                if target is not None and target is not block:
+                    forward[block] = target
+
+        def resolve(block):
+            seen = set()
+            while block in forward and block not in seen:
+                seen.add(block)
+                block = forward[block]
+            return block
+
+        for block in self.blocks:
+            for succ in block.successors():
+                target = resolve(succ)
+                if target is not succ:
+                    block.terminator.retarget(succ, target)
+        if self.entry in forward:
+            self.entry = resolve(self.entry)
+
+    def _merge_chains(self):
+        preds = self.predecessors()
+        merged = set()
+        for block in self.blocks:
+            if block in merged:
+                continue
+            while isinstance(block.terminator, Jump):
+                succ = block.terminator.target
+                if succ is None or succ is block or succ is self.entry or len(preds[succ]) != 1:
+                    break
+                block.statements.extend(succ.statements)
+                block.labels.extend(succ.labels)
+                block.terminator = succ.terminator
+                merged.add(succ)
+                for next_succ in succ.successors():
+                    preds[next_succ] = [block if p is succ else p for p in preds[next_succ]]
+
+
+class ControlFlowBuilder:
+    """Строит граф потока управления из плоского списка инструкций ProgramNode"""
+
+    def __init__(self, max_loop_depth=None):
+        # Наибольшая вложенность циклов, которые остаются структурированными; более глубокие
+        # внешние циклы понижаются в граф переходов
+        self.max_loop_depth = max_loop_depth
+        self.blocks = []
+        self.labels = {}
+        self.defined_labels = set()
+        self.for_loops = []
+        self.current = None
+        self.loop_counter = 0
+        self.select_counter = 0
+
+    def build(self, program_node):
+        if not isinstance(program_node, ProgramNode):
+            raise ValueError("Ожидается корень AST дерева типа ProgramNode")
+
+        entry = self._new_block()
+        self.current = entry
+        self._lower_statements(program_node.statements)
+        self._terminate(Jump(None))
+
+        undefined = [name for name in self.labels if name not in self.defined_labels]
+        if undefined:
+            raise ValueError(f"Переход на несуществующую метку: {undefined[0]}")
+
+        for block in self.blocks:
+            if block.terminator is None:
+                block.terminator = Jump(None)
+
+        cfg = ControlFlowGraph(entry, self.blocks)
+        cfg.simplify()
+        return cfg
+
+    def _new_block(self):
+        block = BasicBlock(len(self.blocks))
+        self.blocks.append(block)
+        return block
+
+    def _label_block(self, name):
+        if name not in self.labels:
+            block = self._new_block()
+            block.labels.append(name)
+            self.labels[name] = block
+        return self.labels[name]
+
+    def _terminate(self, terminator, next_block=None):
+        """Завершает текущий блок переходом и продолжает построение с нового блока"""
+        self.current.terminator = terminator
+        self.current = next_block if next_block is not None else self._new_block()
+
+    def _lower_statements(self, statements):
+        index = 0
+        while index < len(statements):
+            structured = self.structure_loop(statements, index)
+            if structured is not None:
+                loop_node, index = structured
+                self.current.statements.append(loop_node)
+                continue
+            self._lower_statement(statements[index])
+            index += 1
+
+    def structure_loop(self, statements, index):
+        """
+        Структурированный цикл FOR или WHILE, начинающийся в statements[index]:
+        (узел цикла с телом, индекс следующей инструкции) или None
+        """
+        if isinstance(statements[index], WhileNode):
+            while_node = self.structure_while(statements[index])
+            structured = (while_node, index + 1) if while_node is not None else None
+        else:
+            structured = self.structure_for(statements, index)
+        if structured is not None and self.max_loop_depth is not None:
+            if self.loop_depth(structured[0]) > self.max_loop_depth:
+                return None
+        return structured
+
+    def loop_depth(self, stmt):
+        """Глубина вложенности структурированных циклов FOR и WHILE в инструкции"""
+        if isinstance(stmt, (ForNode, WhileNode)) and stmt.body is not None:
+            return 1 + max((self.loop_depth(body_stmt) for body_stmt in stmt.body), default=0)
+        if isinstance(stmt, IfNode):
+            return max(self.loop_depth(stmt.then_branch), self.loop_depth(stmt.else_branch))
+        return 0
+
+    def structure_while(self, while_node):
+        """
+        Если тело WHILE не содержит переходов и меток, возвращает WhileNode, в теле которого
+        вложенные циклы тоже собраны в структурированную форму. Иначе возвращает None.
+        """
+        body = []
+        position = 0
+        while position < len(while_node.body):
+            nested = self.structure_loop(while_node.body, position)
+            if nested is not None:
+                body.append(nested[0])
+                position = nested[1]
+                continue
+            if not self._is_structured(while_node.body[position]):
+                return None
+            body.append(while_node.body[position])
+            position += 1
+        return WhileNode(while_node.condition, body)
+
+    def structure_for(self, statements, index):
+        """
+        Если statements[index] — FOR, тело которого до парного NEXT не содержит переходов
+        и меток и не присваивает переменную цикла, возвращает (ForNode с телом, индекс после NEXT).
+        Иначе возвращает None, и цикл понижается в граф переходов.
+        """
+        for_node = statements[index]
+        if not isinstance(for_node, ForNode) or for_node.body is not None:
+            return None
+
+        loop_key = (for_node.loop_variable.name, for_node.loop_variable.type_suffix)
+        body = []
+        position = index + 1
+        while position < len(statements):
+            stmt = statements[position]
+            if isinstance(stmt, NextNode):
+                if [(var.name, var.type_suffix) for var in stmt.variables] != [loop_key]:
+                    return None
+                if any(self._assigns(body_stmt, loop_key) for body_stmt in body):
+                    return None
+                return ForNode(for_node.loop_variable, for_node.start_value, for_node.end_value,
+                               for_node.step_value, body), position + 1
+
+            nested = self.structure_loop(statements, position)
+            if nested is not None:
+                body.append(nested[0])
+                position = nested[1]
+                continue
+            if not self._is_structured(stmt):
+                return None
+            body.append(stmt)
+            position += 1
+        return None
+
+    def _is_structured(self, stmt):
+        """Инструкция не содержит переходов, меток и незакрытых циклов"""
+        if stmt is None:
+            return True
+        if isinstance(stmt, (LabelNode, GotoNode, GosubNode, ReturnNode, NextNode, WhileNode,
+                             OnJumpNode, SelectCaseNode)):
+            return False
+        if isinstance(stmt, ForNode):
+            return stmt.body is not None and all(self._is_structured(body_stmt) for body_stmt in stmt.body)
+        if isinstance(stmt, IfNode):
+            return self._is_structured(stmt.then_branch) and self._is_structured(stmt.else_branch)
+        return True
+
+    def _assigns(self, stmt, var_key):
+        for node in stmt.walk():
+            if isinstance(node, LetNode):
+                targets = [node.variable]
+            elif isinstance(node, (InputNode, ReadNode, FieldNode, GetNode)):
+                targets = node.variables
+            elif isinstance(node, ForNode):
+                targets = [node.loop_variable]
+            else:
+                continue
+            # Элемент массива A(I) не присваивает простую переменную A
+            if any(isinstance(var, VariableNode) and (var.name, var.type_suffix) == var_key for var in targets):
+                return True
+        return False
+
+    def _lower_statement(self, stmt):
+        if stmt is None:
+            return
+        if isinstance(stmt, LabelNode):
+            if stmt.name in self.defined_labels:
+                raise ValueError(f"Дублирование метки: {stmt.name}")
+            block = self._label_block(stmt.name)
+            self.defined_labels.add(stmt.name)
+            self._terminate(Jump(block), block)
+        elif isinstance(stmt, GotoNode):
+            self._terminate(Jump(self._label_block(stmt.target_label_ref.name_or_number)))
+        elif isinstance(stmt, GosubNode):
+            target = self._label_block(stmt.target_label_ref.name_or_number)
+            return_block = self._new_block()
+            self._terminate(Call(target, return_block), return_block)
+        elif isinstance(stmt, ReturnNode):
+            self._terminate(Return())
+        elif isinstance(stmt, EndNode):
+            self.current.statements.append(stmt)
+            self._terminate(Halt())
+        elif isinstance(stmt, IfNode):
+            self._lower_if(stmt)
+        elif isinstance(stmt, ForNode):
+            self._lower_for(stmt)
+        elif isinstance(stmt, NextNode):
+            self._lower_next(stmt)
+        elif isinstance(stmt, WhileNode):
+            self._lower_while(stmt)
+        elif isinstance(stmt, OnJumpNode):
+            self._lower_on_jump(stmt)
+        elif isinstance(stmt, SelectCaseNode):
+            self._lower_select_case(stmt)
+        else:
+            self.current.statements.append(stmt)
+
+    def _lower_if(self, if_node):
+        if not any(self._has_control_flow(branch) for branch in (if_node.then_branch, if_node.else_branch)):
+            self.current.statements.append(if_node)
+            return
+
+        then_block = self._new_block()
+        else_block = self._new_block() if if_node.else_branch else None
+        join_block = self._new_block()
+        self._terminate(Branch(if_node.condition, then_block, else_block or join_block), then_block)
+
+        self._lower_statement(if_node.then_branch)
+        self._terminate(Jump(join_block), else_block or join_block)
+
+        if else_block:
+            self._lower_statement(if_node.else_branch)
+            self._terminate(Jump(join_block), join_block)
+
+    def _lower_for(self, for_node):
+        self.loop_counter += 1
+        loop_var = for_node.loop_variable
+        self.current.statements.append(LetNode(loop_var, for_node.start_value))
+
+        end_value = for_node.end_value
+        if not isinstance(end_value, NumberNode):
+            end_value = VariableNode(f"_for{self.loop_counter}_end")
+            self.current.statements.append(LetNode(end_value, for_node.end_value))
+
+        step_value = for_node.step_value or NumberNode(1)
+        if not isinstance(step_value, NumberNode):
+            step_value = VariableNode(f"_for{self.loop_counter}_step")
+            self.current.statements.append(LetNode(step_value, for_node.step_value))
+
+        if isinstance(step_value, NumberNode):
+            op = '<=' if step_value.value >= 0 else '>='
+            condition = BinaryOpNode(loop_var, op, end_value)
+        else:
+            # (I - конец) * шаг <= 0 — одно сравнение для шага любого знака
+            distance = BinaryOpNode(loop_var, '-', end_value)
+            condition = BinaryOpNode(BinaryOpNode(distance, '*', step_value), '<=', NumberNode(0))
+
+        head = self._new_block()
+        body = self._new_block()
+        exit_block = self._new_block()
+        self._terminate(Jump(head), head)
+        self._terminate(Branch(condition, body, exit_block), body)
+
+        self.for_loops.append((loop_var, head, exit_block, step_value))
+
+    def _lower_next(self, next_node):
+        for var in next_node.variables:
+            names = [(loop_var.name, loop_var.type_suffix) for loop_var, _, _, _ in self.for_loops]
+            if (var.name, var.type_suffix) not in names:
+                continue
+
+            # NEXT закрывает и все незакрытые внутренние циклы
+            while True:
+                loop_var, head, exit_block, step_value = self.for_loops.pop()
+                if (loop_var.name, loop_var.type_suffix) == (var.name, var.type_suffix):
+                    break
+
+            self.current.statements.append(LetNode(loop_var, BinaryOpNode(loop_var, '+', step_value)))
+            self._terminate(Jump(head), exit_block)
+
+    def _lower_while(self, while_node):
+        head = self._new_block()
+        body = self._new_block()
+        exit_block = self._new_block()
+        self._terminate(Jump(head), head)
+        self._terminate(Branch(while_node.condition, body, exit_block), body)
+
+        self._lower_statements(while_node.body)
+        self._terminate(Jump(head), exit_block)
+
+    def _lower_on_jump(self, on_node):
+        next_block = self._new_block()
+        call_blocks = {}
+        cases = []
+        for position, target_ref in enumerate(on_node.target_label_refs, 1):
+            target = self._label_block(target_ref.name_or_number)
+            if on_node.is_gosub:
+                # GOSUB из таблицы: отдельный блок вызова на каждую метку, возврат к следующей инструкции
+                if target not in call_blocks:
+                    call_blocks[target] = self._new_block()
+                    call_blocks[target].terminator = Call(target, next_block)
+                target = call_blocks[target]
+            cases.append((NumberNode(position), target))
+        self._terminate(Switch(on_node.index, cases, next_block, rounded=True), next_block)
+
+    def _lower_select_case(self, select_node):
+        """
+        Подряд идущие ветви, все проверки которых — константы, собираются в один переход по
+        таблице. Ветвь с диапазоном TO, IS или неконстантным значением — одно ветвление по
+        условию, поэтому ветви проверяются в порядке записи и выбирается первая подходящая
+        """
+        selector = select_node.selector
+        if not isinstance(selector, (VariableNode, NumberNode, StringNode)):
+            # Селектор вычисляется один раз, даже если проверок несколько
+            self.select_counter += 1
+            variable = VariableNode(f"_select{self.select_counter}")
+            self.current.statements.append(LetNode(variable, selector))
+            selector = variable
+
+        join_block = self._new_block()
+        body_blocks = [self._new_block() for _ in select_node.cases]
+        else_block = self._new_block() if select_node.else_body is not None else join_block
+
+        table = []
+        for case, body_block in zip(select_node.cases, body_blocks):
+            if all(self._is_case_constant(test) for test in case.tests):
+                table.extend((test, body_block) for test in case.tests)
+                continue
+            if table:
+                self._terminate_switch(selector, table, self._new_block())
+                table = []
+            next_block = self._new_block()
+            self._terminate(Branch(self._case_condition(selector, case.tests), body_block, next_block), next_block)
+        if table:
+            self._terminate_switch(selector, table, else_block)
+        else:
+            self._terminate(Jump(else_block), else_block)
+
+        for case, body_block in zip(select_node.cases, body_blocks):
+            self.current = body_block
+            self._lower_statements(case.body)
+            self._terminate(Jump(join_block))
+        if select_node.else_body is not None:
+            self.current = else_block
+            self._lower_statements(select_node.else_body)
+            self._terminate(Jump(join_block))
+        self.current = join_block
+
+    def _case_condition(self, selector, tests):
+        """
+        Условие ветви одним выражением: в языке нет AND и OR, поэтому результаты сравнений
+        (True/False) перемножаются для диапазона и складываются для нескольких проверок.
+        Одно условие вместо цепочки ветвлений восстанавливается в if без дублирования кода
+        """
+        condition = None
+        for test in tests:
+            if isinstance(test, CaseRangeNode):
+                test_condition = BinaryOpNode(
+                    BinaryOpNode(selector, '>=', test.low), '*', BinaryOpNode(selector, '<=', test.high)
+                )
+            elif isinstance(test, CaseIsNode):
+                test_condition = BinaryOpNode(selector, test.op, test.value)
+            else:
+                test_condition = BinaryOpNode(selector, '=', test)
+            condition = test_condition if condition is None else BinaryOpNode(condition, '+', test_condition)
+        return condition
+
+    def _terminate_switch(self, selector, cases, default):
+        """
+        Завершает блок переходом по таблице и продолжает построение с default. Повторная
+        константа не меняет выбранную ветвь; таблица из одной константы — обычное сравнение
+        """
+        unique = {}
+        for key, target in cases:
+            unique.setdefault((type(key), key.value), (key, target))
+        cases = list(unique.values())
+        if len(cases) == 1:
+            key, target = cases[0]
+            self._terminate(Branch(BinaryOpNode(selector, '=', key), target, default), default)
+        else:
+            self._terminate(Switch(selector, cases, default), default)
+
+    def _is_case_constant(self, test):
+        return isinstance(test, (NumberNode, StringNode))
+
+    def _has_control_flow(self, stmt):
+        if stmt is None:
+            return False
+        if isinstance(stmt, ForNode) and stmt.body is not None:
+            return False
+        if isinstance(stmt, (LabelNode, GotoNode, GosubNode, ReturnNode, EndNode, ForNode, NextNode, WhileNode,
+                             OnJumpNode, SelectCaseNode)):
+            return True
+        if isinstance(stmt, IfNode):
+            return self._has_control_flow(stmt.then_branch) or self._has_control_flow(stmt.else_branch)
+        return False
+
+
+class StateMachineLowering(Optimizer):
+    """
+    Понижает программу в плоский конечный автомат: одна функция main() с циклом
+    диспетчеризации по номеру состояния. GOTO, GOSUB/RETURN и обратные рёбра циклов
+    становятся присваиванием номера состояния, поэтому глубина стека не растёт.
+    """
+
+    def optimize(self, ast_root):
+        cfg = ControlFlowBuilder().build(ast_root)
+        subroutines = [SubroutineNode(name, [self.lower_graph(graph)]) for name, graph in cfg.extract_subroutines()]
+        return ProgramNode(subroutines + [self.lower_graph(cfg)])
+
+    def lower_graph(self, cfg):
+        states = [
+            DispatchStateNode(block.id, self.lower_block(block, self._jump_to, lambda target: target.id))
+            for block in cfg.blocks
+        ]
+        return DispatchNode(states, cfg.entry.id)
+
+    def lower_block(self, block, jump_to, state_of):
+        """
+        Превращает блок в список инструкций состояния.
+        jump_to(блок) возвращает инструкции перехода, state_of(блок) — номер состояния блока.
+        """
+        statements = list(block.statements)
+        terminator = block.terminator
+
+        if isinstance(terminator, Jump):
+            statements.extend(jump_to(terminator.target))
+        elif isinstance(terminator, Branch):
+            statements.append(IfBlockNode(
+                terminator.condition,
+                jump_to(terminator.true_target),
+                jump_to(terminator.false_target)
+            ))
+        elif isinstance(terminator, Switch):
+            statements.append(SwitchNode(
+                terminator.selector,
+                [CaseNode(keys, jump_to(target)) for target, keys in terminator.arms()],
+                jump_to(terminator.default),
+                terminator.rounded
+            ))
+        elif isinstance(terminator, Call):
+            statements.append(JumpNode(state_of(terminator.target), state_of(terminator.return_target)))
+        elif isinstance(terminator, Return):
+            statements.append(ReturnJumpNode())
+
+        return statements
+
+    def _jump_to(self, block):
+        if block is None:
+            return [BreakNode()]
+        return [JumpNode(block.id)]
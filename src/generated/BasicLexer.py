@@ -10,97 +10,167 @@ else:
 
 def serializedATN():
     return [
-        4,0,40,261,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        4,0,64,457,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
         2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
         13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
         19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
         26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,
         32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,
-        39,7,39,1,0,3,0,83,8,0,1,0,1,0,1,1,4,1,88,8,1,11,1,12,1,89,1,1,1,
-        1,1,2,1,2,1,2,1,2,1,2,5,2,99,8,2,10,2,12,2,102,9,2,1,2,1,2,1,2,1,
-        2,1,3,1,3,5,3,110,8,3,10,3,12,3,113,9,3,1,3,1,3,1,4,1,4,1,4,1,5,
-        1,5,1,5,1,5,1,5,1,6,1,6,1,6,1,6,1,6,1,7,1,7,1,7,1,7,1,7,1,7,1,8,
-        1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,10,1,10,1,10,1,10,1,10,1,11,1,11,1,
-        11,1,11,1,12,1,12,1,12,1,13,1,13,1,13,1,13,1,13,1,14,1,14,1,14,1,
-        14,1,14,1,15,1,15,1,15,1,15,1,15,1,15,1,16,1,16,1,16,1,16,1,16,1,
-        16,1,16,1,17,1,17,1,17,1,17,1,17,1,17,1,18,1,18,1,18,1,18,1,18,1,
-        19,1,19,1,19,1,19,1,19,1,19,1,20,1,20,5,20,198,8,20,10,20,12,20,
-        201,9,20,1,21,4,21,204,8,21,11,21,12,21,205,1,21,1,21,4,21,210,8,
-        21,11,21,12,21,211,3,21,214,8,21,1,22,1,22,5,22,218,8,22,10,22,12,
-        22,221,9,22,1,22,1,22,1,23,1,23,1,24,1,24,1,25,1,25,1,26,1,26,1,
-        27,1,27,1,27,1,28,1,28,1,28,1,29,1,29,1,29,1,30,1,30,1,31,1,31,1,
-        32,1,32,1,33,1,33,1,34,1,34,1,35,1,35,1,36,1,36,1,37,1,37,1,38,1,
-        38,1,39,1,39,1,219,0,40,1,1,3,2,5,3,7,4,9,5,11,6,13,7,15,8,17,9,
-        19,10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,35,18,37,19,39,20,
-        41,21,43,22,45,23,47,24,49,25,51,26,53,27,55,28,57,29,59,30,61,31,
-        63,32,65,33,67,34,69,35,71,36,73,37,75,38,77,39,79,40,1,0,7,2,0,
-        9,9,32,32,2,0,10,10,13,13,3,0,65,90,95,95,97,122,4,0,48,57,65,90,
-        95,95,97,122,1,0,48,57,3,0,10,10,13,13,34,34,2,0,33,33,36,37,269,
-        0,1,1,0,0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,
-        1,0,0,0,0,13,1,0,0,0,0,15,1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,
-        1,0,0,0,0,23,1,0,0,0,0,25,1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,
-        1,0,0,0,0,33,1,0,0,0,0,35,1,0,0,0,0,37,1,0,0,0,0,39,1,0,0,0,0,41,
-        1,0,0,0,0,43,1,0,0,0,0,45,1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,0,51,
-        1,0,0,0,0,53,1,0,0,0,0,55,1,0,0,0,0,57,1,0,0,0,0,59,1,0,0,0,0,61,
-        1,0,0,0,0,63,1,0,0,0,0,65,1,0,0,0,0,67,1,0,0,0,0,69,1,0,0,0,0,71,
-        1,0,0,0,0,73,1,0,0,0,0,75,1,0,0,0,0,77,1,0,0,0,0,79,1,0,0,0,1,82,
-        1,0,0,0,3,87,1,0,0,0,5,93,1,0,0,0,7,107,1,0,0,0,9,116,1,0,0,0,11,
-        119,1,0,0,0,13,124,1,0,0,0,15,129,1,0,0,0,17,135,1,0,0,0,19,139,
-        1,0,0,0,21,143,1,0,0,0,23,148,1,0,0,0,25,152,1,0,0,0,27,155,1,0,
-        0,0,29,160,1,0,0,0,31,165,1,0,0,0,33,171,1,0,0,0,35,178,1,0,0,0,
-        37,184,1,0,0,0,39,189,1,0,0,0,41,195,1,0,0,0,43,203,1,0,0,0,45,215,
-        1,0,0,0,47,224,1,0,0,0,49,226,1,0,0,0,51,228,1,0,0,0,53,230,1,0,
-        0,0,55,232,1,0,0,0,57,235,1,0,0,0,59,238,1,0,0,0,61,241,1,0,0,0,
-        63,243,1,0,0,0,65,245,1,0,0,0,67,247,1,0,0,0,69,249,1,0,0,0,71,251,
-        1,0,0,0,73,253,1,0,0,0,75,255,1,0,0,0,77,257,1,0,0,0,79,259,1,0,
-        0,0,81,83,5,13,0,0,82,81,1,0,0,0,82,83,1,0,0,0,83,84,1,0,0,0,84,
-        85,5,10,0,0,85,2,1,0,0,0,86,88,7,0,0,0,87,86,1,0,0,0,88,89,1,0,0,
-        0,89,87,1,0,0,0,89,90,1,0,0,0,90,91,1,0,0,0,91,92,6,1,0,0,92,4,1,
-        0,0,0,93,94,5,82,0,0,94,95,5,69,0,0,95,96,5,77,0,0,96,100,1,0,0,
-        0,97,99,8,1,0,0,98,97,1,0,0,0,99,102,1,0,0,0,100,98,1,0,0,0,100,
-        101,1,0,0,0,101,103,1,0,0,0,102,100,1,0,0,0,103,104,3,1,0,0,104,
-        105,1,0,0,0,105,106,6,2,0,0,106,6,1,0,0,0,107,111,5,39,0,0,108,110,
-        8,1,0,0,109,108,1,0,0,0,110,113,1,0,0,0,111,109,1,0,0,0,111,112,
-        1,0,0,0,112,114,1,0,0,0,113,111,1,0,0,0,114,115,6,3,0,0,115,8,1,
-        0,0,0,116,117,5,73,0,0,117,118,5,70,0,0,118,10,1,0,0,0,119,120,5,
-        84,0,0,120,121,5,72,0,0,121,122,5,69,0,0,122,123,5,78,0,0,123,12,
-        1,0,0,0,124,125,5,69,0,0,125,126,5,76,0,0,126,127,5,83,0,0,127,128,
-        5,69,0,0,128,14,1,0,0,0,129,130,5,80,0,0,130,131,5,82,0,0,131,132,
-        5,73,0,0,132,133,5,78,0,0,133,134,5,84,0,0,134,16,1,0,0,0,135,136,
-        5,76,0,0,136,137,5,69,0,0,137,138,5,84,0,0,138,18,1,0,0,0,139,140,
-        5,69,0,0,140,141,5,78,0,0,141,142,5,68,0,0,142,20,1,0,0,0,143,144,
-        5,71,0,0,144,145,5,79,0,0,145,146,5,84,0,0,146,147,5,79,0,0,147,
-        22,1,0,0,0,148,149,5,70,0,0,149,150,5,79,0,0,150,151,5,82,0,0,151,
-        24,1,0,0,0,152,153,5,84,0,0,153,154,5,79,0,0,154,26,1,0,0,0,155,
-        156,5,83,0,0,156,157,5,84,0,0,157,158,5,69,0,0,158,159,5,80,0,0,
-        159,28,1,0,0,0,160,161,5,78,0,0,161,162,5,69,0,0,162,163,5,88,0,
-        0,163,164,5,84,0,0,164,30,1,0,0,0,165,166,5,71,0,0,166,167,5,79,
-        0,0,167,168,5,83,0,0,168,169,5,85,0,0,169,170,5,66,0,0,170,32,1,
-        0,0,0,171,172,5,82,0,0,172,173,5,69,0,0,173,174,5,84,0,0,174,175,
-        5,85,0,0,175,176,5,82,0,0,176,177,5,78,0,0,177,34,1,0,0,0,178,179,
-        5,87,0,0,179,180,5,72,0,0,180,181,5,73,0,0,181,182,5,76,0,0,182,
-        183,5,69,0,0,183,36,1,0,0,0,184,185,5,87,0,0,185,186,5,69,0,0,186,
-        187,5,78,0,0,187,188,5,68,0,0,188,38,1,0,0,0,189,190,5,73,0,0,190,
-        191,5,78,0,0,191,192,5,80,0,0,192,193,5,85,0,0,193,194,5,84,0,0,
-        194,40,1,0,0,0,195,199,7,2,0,0,196,198,7,3,0,0,197,196,1,0,0,0,198,
-        201,1,0,0,0,199,197,1,0,0,0,199,200,1,0,0,0,200,42,1,0,0,0,201,199,
-        1,0,0,0,202,204,7,4,0,0,203,202,1,0,0,0,204,205,1,0,0,0,205,203,
-        1,0,0,0,205,206,1,0,0,0,206,213,1,0,0,0,207,209,5,46,0,0,208,210,
-        7,4,0,0,209,208,1,0,0,0,210,211,1,0,0,0,211,209,1,0,0,0,211,212,
-        1,0,0,0,212,214,1,0,0,0,213,207,1,0,0,0,213,214,1,0,0,0,214,44,1,
-        0,0,0,215,219,5,34,0,0,216,218,8,5,0,0,217,216,1,0,0,0,218,221,1,
-        0,0,0,219,220,1,0,0,0,219,217,1,0,0,0,220,222,1,0,0,0,221,219,1,
-        0,0,0,222,223,5,34,0,0,223,46,1,0,0,0,224,225,5,61,0,0,225,48,1,
-        0,0,0,226,227,5,61,0,0,227,50,1,0,0,0,228,229,5,60,0,0,229,52,1,
-        0,0,0,230,231,5,62,0,0,231,54,1,0,0,0,232,233,5,60,0,0,233,234,5,
-        61,0,0,234,56,1,0,0,0,235,236,5,62,0,0,236,237,5,61,0,0,237,58,1,
-        0,0,0,238,239,5,60,0,0,239,240,5,62,0,0,240,60,1,0,0,0,241,242,5,
-        43,0,0,242,62,1,0,0,0,243,244,5,45,0,0,244,64,1,0,0,0,245,246,5,
-        42,0,0,246,66,1,0,0,0,247,248,5,47,0,0,248,68,1,0,0,0,249,250,5,
-        40,0,0,250,70,1,0,0,0,251,252,5,41,0,0,252,72,1,0,0,0,253,254,5,
-        58,0,0,254,74,1,0,0,0,255,256,5,44,0,0,256,76,1,0,0,0,257,258,5,
-        59,0,0,258,78,1,0,0,0,259,260,7,6,0,0,260,80,1,0,0,0,10,0,82,89,
-        100,111,199,205,211,213,219,1,6,0,0
+        39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,
+        45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,
+        52,7,52,2,53,7,53,2,54,7,54,2,55,7,55,2,56,7,56,2,57,7,57,2,58,7,
+        58,2,59,7,59,2,60,7,60,2,61,7,61,2,62,7,62,2,63,7,63,1,0,3,0,131,
+        8,0,1,0,1,0,1,1,4,1,136,8,1,11,1,12,1,137,1,1,1,1,1,2,1,2,1,2,1,
+        2,1,2,5,2,147,8,2,10,2,12,2,150,9,2,1,2,1,2,1,2,1,2,1,3,1,3,5,3,
+        158,8,3,10,3,12,3,161,9,3,1,3,1,3,1,4,1,4,1,4,1,5,1,5,1,5,1,5,1,
+        5,1,6,1,6,1,6,1,6,1,6,1,7,1,7,1,7,1,7,1,7,1,7,1,8,1,8,1,8,1,8,1,
+        9,1,9,1,9,1,9,1,10,1,10,1,10,1,10,1,10,1,11,1,11,1,11,1,11,1,12,
+        1,12,1,12,1,13,1,13,1,13,1,13,1,13,1,14,1,14,1,14,1,14,1,14,1,15,
+        1,15,1,15,1,15,1,15,1,15,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,17,
+        1,17,1,17,1,17,1,17,1,17,1,18,1,18,1,18,1,18,1,18,1,19,1,19,1,19,
+        1,19,1,19,1,19,1,20,1,20,1,20,1,21,1,21,1,21,1,21,1,21,1,21,1,21,
+        1,22,1,22,1,22,1,22,1,22,1,23,1,23,1,23,1,24,1,24,1,24,1,24,1,25,
+        1,25,1,25,1,25,1,26,1,26,1,26,1,26,1,27,1,27,1,27,1,27,1,28,1,28,
+        1,28,1,28,1,28,1,29,1,29,1,29,1,29,1,29,1,30,1,30,1,30,1,30,1,31,
+        1,31,1,31,1,31,1,31,1,32,1,32,1,32,1,32,1,32,1,32,1,33,1,33,1,33,
+        1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,35,1,35,1,35,1,35,1,35,1,35,
+        1,35,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,37,1,37,1,37,1,37,1,38,
+        1,38,1,38,1,38,1,38,1,38,1,39,1,39,1,39,1,39,1,40,1,40,1,40,1,40,
+        1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,
+        1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,
+        1,41,1,41,1,41,1,41,1,41,1,41,1,41,3,41,378,8,41,1,42,1,42,1,42,
+        1,42,1,42,5,42,385,8,42,10,42,12,42,388,9,42,1,43,1,43,5,43,392,
+        8,43,10,43,12,43,395,9,43,1,44,4,44,398,8,44,11,44,12,44,399,1,44,
+        1,44,4,44,404,8,44,11,44,12,44,405,3,44,408,8,44,1,45,1,45,5,45,
+        412,8,45,10,45,12,45,415,9,45,1,45,1,45,1,46,1,46,1,47,1,47,1,48,
+        1,48,1,49,1,49,1,50,1,50,1,50,1,51,1,51,1,51,1,52,1,52,1,52,1,53,
+        1,53,1,54,1,54,1,55,1,55,1,56,1,56,1,57,1,57,1,58,1,58,1,59,1,59,
+        1,60,1,60,1,61,1,61,1,62,1,62,1,63,1,63,1,413,0,64,1,1,3,2,5,3,7,
+        4,9,5,11,6,13,7,15,8,17,9,19,10,21,11,23,12,25,13,27,14,29,15,31,
+        16,33,17,35,18,37,19,39,20,41,21,43,22,45,23,47,24,49,25,51,26,53,
+        27,55,28,57,29,59,30,61,31,63,32,65,33,67,34,69,35,71,36,73,37,75,
+        38,77,39,79,40,81,41,83,42,85,43,87,44,89,45,91,46,93,47,95,48,97,
+        49,99,50,101,51,103,52,105,53,107,54,109,55,111,56,113,57,115,58,
+        117,59,119,60,121,61,123,62,125,63,127,64,1,0,7,2,0,9,9,32,32,2,
+        0,10,10,13,13,3,0,65,90,95,95,97,122,4,0,48,57,65,90,95,95,97,122,
+        1,0,48,57,3,0,10,10,13,13,34,34,2,0,33,33,36,37,476,0,1,1,0,0,0,
+        0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,
+        1,0,0,0,0,15,1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,
+        1,0,0,0,0,25,1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,
+        1,0,0,0,0,35,1,0,0,0,0,37,1,0,0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,43,
+        1,0,0,0,0,45,1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,0,51,1,0,0,0,0,53,
+        1,0,0,0,0,55,1,0,0,0,0,57,1,0,0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,63,
+        1,0,0,0,0,65,1,0,0,0,0,67,1,0,0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,73,
+        1,0,0,0,0,75,1,0,0,0,0,77,1,0,0,0,0,79,1,0,0,0,0,81,1,0,0,0,0,83,
+        1,0,0,0,0,85,1,0,0,0,0,87,1,0,0,0,0,89,1,0,0,0,0,91,1,0,0,0,0,93,
+        1,0,0,0,0,95,1,0,0,0,0,97,1,0,0,0,0,99,1,0,0,0,0,101,1,0,0,0,0,103,
+        1,0,0,0,0,105,1,0,0,0,0,107,1,0,0,0,0,109,1,0,0,0,0,111,1,0,0,0,
+        0,113,1,0,0,0,0,115,1,0,0,0,0,117,1,0,0,0,0,119,1,0,0,0,0,121,1,
+        0,0,0,0,123,1,0,0,0,0,125,1,0,0,0,0,127,1,0,0,0,1,130,1,0,0,0,3,
+        135,1,0,0,0,5,141,1,0,0,0,7,155,1,0,0,0,9,164,1,0,0,0,11,167,1,0,
+        0,0,13,172,1,0,0,0,15,177,1,0,0,0,17,183,1,0,0,0,19,187,1,0,0,0,
+        21,191,1,0,0,0,23,196,1,0,0,0,25,200,1,0,0,0,27,203,1,0,0,0,29,208,
+        1,0,0,0,31,213,1,0,0,0,33,219,1,0,0,0,35,226,1,0,0,0,37,232,1,0,
+        0,0,39,237,1,0,0,0,41,243,1,0,0,0,43,246,1,0,0,0,45,253,1,0,0,0,
+        47,258,1,0,0,0,49,261,1,0,0,0,51,265,1,0,0,0,53,269,1,0,0,0,55,273,
+        1,0,0,0,57,277,1,0,0,0,59,282,1,0,0,0,61,287,1,0,0,0,63,291,1,0,
+        0,0,65,296,1,0,0,0,67,302,1,0,0,0,69,305,1,0,0,0,71,312,1,0,0,0,
+        73,319,1,0,0,0,75,326,1,0,0,0,77,330,1,0,0,0,79,336,1,0,0,0,81,340,
+        1,0,0,0,83,377,1,0,0,0,85,379,1,0,0,0,87,389,1,0,0,0,89,397,1,0,
+        0,0,91,409,1,0,0,0,93,418,1,0,0,0,95,420,1,0,0,0,97,422,1,0,0,0,
+        99,424,1,0,0,0,101,426,1,0,0,0,103,429,1,0,0,0,105,432,1,0,0,0,107,
+        435,1,0,0,0,109,437,1,0,0,0,111,439,1,0,0,0,113,441,1,0,0,0,115,
+        443,1,0,0,0,117,445,1,0,0,0,119,447,1,0,0,0,121,449,1,0,0,0,123,
+        451,1,0,0,0,125,453,1,0,0,0,127,455,1,0,0,0,129,131,5,13,0,0,130,
+        129,1,0,0,0,130,131,1,0,0,0,131,132,1,0,0,0,132,133,5,10,0,0,133,
+        2,1,0,0,0,134,136,7,0,0,0,135,134,1,0,0,0,136,137,1,0,0,0,137,135,
+        1,0,0,0,137,138,1,0,0,0,138,139,1,0,0,0,139,140,6,1,0,0,140,4,1,
+        0,0,0,141,142,5,82,0,0,142,143,5,69,0,0,143,144,5,77,0,0,144,148,
+        1,0,0,0,145,147,8,1,0,0,146,145,1,0,0,0,147,150,1,0,0,0,148,146,
+        1,0,0,0,148,149,1,0,0,0,149,151,1,0,0,0,150,148,1,0,0,0,151,152,
+        3,1,0,0,152,153,1,0,0,0,153,154,6,2,0,0,154,6,1,0,0,0,155,159,5,
+        39,0,0,156,158,8,1,0,0,157,156,1,0,0,0,158,161,1,0,0,0,159,157,1,
+        0,0,0,159,160,1,0,0,0,160,162,1,0,0,0,161,159,1,0,0,0,162,163,6,
+        3,0,0,163,8,1,0,0,0,164,165,5,73,0,0,165,166,5,70,0,0,166,10,1,0,
+        0,0,167,168,5,84,0,0,168,169,5,72,0,0,169,170,5,69,0,0,170,171,5,
+        78,0,0,171,12,1,0,0,0,172,173,5,69,0,0,173,174,5,76,0,0,174,175,
+        5,83,0,0,175,176,5,69,0,0,176,14,1,0,0,0,177,178,5,80,0,0,178,179,
+        5,82,0,0,179,180,5,73,0,0,180,181,5,78,0,0,181,182,5,84,0,0,182,
+        16,1,0,0,0,183,184,5,76,0,0,184,185,5,69,0,0,185,186,5,84,0,0,186,
+        18,1,0,0,0,187,188,5,69,0,0,188,189,5,78,0,0,189,190,5,68,0,0,190,
+        20,1,0,0,0,191,192,5,71,0,0,192,193,5,79,0,0,193,194,5,84,0,0,194,
+        195,5,79,0,0,195,22,1,0,0,0,196,197,5,70,0,0,197,198,5,79,0,0,198,
+        199,5,82,0,0,199,24,1,0,0,0,200,201,5,84,0,0,201,202,5,79,0,0,202,
+        26,1,0,0,0,203,204,5,83,0,0,204,205,5,84,0,0,205,206,5,69,0,0,206,
+        207,5,80,0,0,207,28,1,0,0,0,208,209,5,78,0,0,209,210,5,69,0,0,210,
+        211,5,88,0,0,211,212,5,84,0,0,212,30,1,0,0,0,213,214,5,71,0,0,214,
+        215,5,79,0,0,215,216,5,83,0,0,216,217,5,85,0,0,217,218,5,66,0,0,
+        218,32,1,0,0,0,219,220,5,82,0,0,220,221,5,69,0,0,221,222,5,84,0,
+        0,222,223,5,85,0,0,223,224,5,82,0,0,224,225,5,78,0,0,225,34,1,0,
+        0,0,226,227,5,87,0,0,227,228,5,72,0,0,228,229,5,73,0,0,229,230,5,
+        76,0,0,230,231,5,69,0,0,231,36,1,0,0,0,232,233,5,87,0,0,233,234,
+        5,69,0,0,234,235,5,78,0,0,235,236,5,68,0,0,236,38,1,0,0,0,237,238,
+        5,73,0,0,238,239,5,78,0,0,239,240,5,80,0,0,240,241,5,85,0,0,241,
+        242,5,84,0,0,242,40,1,0,0,0,243,244,5,79,0,0,244,245,5,78,0,0,245,
+        42,1,0,0,0,246,247,5,83,0,0,247,248,5,69,0,0,248,249,5,76,0,0,249,
+        250,5,69,0,0,250,251,5,67,0,0,251,252,5,84,0,0,252,44,1,0,0,0,253,
+        254,5,67,0,0,254,255,5,65,0,0,255,256,5,83,0,0,256,257,5,69,0,0,
+        257,46,1,0,0,0,258,259,5,73,0,0,259,260,5,83,0,0,260,48,1,0,0,0,
+        261,262,5,68,0,0,262,263,5,73,0,0,263,264,5,77,0,0,264,50,1,0,0,
+        0,265,266,5,77,0,0,266,267,5,65,0,0,267,268,5,84,0,0,268,52,1,0,
+        0,0,269,270,5,84,0,0,270,271,5,82,0,0,271,272,5,78,0,0,272,54,1,
+        0,0,0,273,274,5,73,0,0,274,275,5,78,0,0,275,276,5,86,0,0,276,56,
+        1,0,0,0,277,278,5,68,0,0,278,279,5,65,0,0,279,280,5,84,0,0,280,281,
+        5,65,0,0,281,58,1,0,0,0,282,283,5,82,0,0,283,284,5,69,0,0,284,285,
+        5,65,0,0,285,286,5,68,0,0,286,60,1,0,0,0,287,288,5,68,0,0,288,289,
+        5,69,0,0,289,290,5,70,0,0,290,62,1,0,0,0,291,292,5,79,0,0,292,293,
+        5,80,0,0,293,294,5,69,0,0,294,295,5,78,0,0,295,64,1,0,0,0,296,297,
+        5,67,0,0,297,298,5,76,0,0,298,299,5,79,0,0,299,300,5,83,0,0,300,
+        301,5,69,0,0,301,66,1,0,0,0,302,303,5,65,0,0,303,304,5,83,0,0,304,
+        68,1,0,0,0,305,306,5,79,0,0,306,307,5,85,0,0,307,308,5,84,0,0,308,
+        309,5,80,0,0,309,310,5,85,0,0,310,311,5,84,0,0,311,70,1,0,0,0,312,
+        313,5,65,0,0,313,314,5,80,0,0,314,315,5,80,0,0,315,316,5,69,0,0,
+        316,317,5,78,0,0,317,318,5,68,0,0,318,72,1,0,0,0,319,320,5,82,0,
+        0,320,321,5,65,0,0,321,322,5,78,0,0,322,323,5,68,0,0,323,324,5,79,
+        0,0,324,325,5,77,0,0,325,74,1,0,0,0,326,327,5,76,0,0,327,328,5,69,
+        0,0,328,329,5,78,0,0,329,76,1,0,0,0,330,331,5,70,0,0,331,332,5,73,
+        0,0,332,333,5,69,0,0,333,334,5,76,0,0,334,335,5,68,0,0,335,78,1,
+        0,0,0,336,337,5,71,0,0,337,338,5,69,0,0,338,339,5,84,0,0,339,80,
+        1,0,0,0,340,341,5,80,0,0,341,342,5,85,0,0,342,343,5,84,0,0,343,82,
+        1,0,0,0,344,345,5,83,0,0,345,346,5,81,0,0,346,378,5,82,0,0,347,348,
+        5,83,0,0,348,349,5,73,0,0,349,378,5,78,0,0,350,351,5,67,0,0,351,
+        352,5,79,0,0,352,378,5,83,0,0,353,354,5,65,0,0,354,355,5,84,0,0,
+        355,378,5,78,0,0,356,357,5,69,0,0,357,358,5,88,0,0,358,378,5,80,
+        0,0,359,360,5,76,0,0,360,361,5,79,0,0,361,378,5,71,0,0,362,363,5,
+        73,0,0,363,364,5,78,0,0,364,378,5,84,0,0,365,366,5,65,0,0,366,367,
+        5,66,0,0,367,378,5,83,0,0,368,369,5,83,0,0,369,370,5,71,0,0,370,
+        378,5,78,0,0,371,372,5,82,0,0,372,373,5,78,0,0,373,378,5,68,0,0,
+        374,375,5,69,0,0,375,376,5,79,0,0,376,378,5,70,0,0,377,344,1,0,0,
+        0,377,347,1,0,0,0,377,350,1,0,0,0,377,353,1,0,0,0,377,356,1,0,0,
+        0,377,359,1,0,0,0,377,362,1,0,0,0,377,365,1,0,0,0,377,368,1,0,0,
+        0,377,371,1,0,0,0,377,374,1,0,0,0,378,84,1,0,0,0,379,380,5,70,0,
+        0,380,381,5,78,0,0,381,382,1,0,0,0,382,386,7,2,0,0,383,385,7,3,0,
+        0,384,383,1,0,0,0,385,388,1,0,0,0,386,384,1,0,0,0,386,387,1,0,0,
+        0,387,86,1,0,0,0,388,386,1,0,0,0,389,393,7,2,0,0,390,392,7,3,0,0,
+        391,390,1,0,0,0,392,395,1,0,0,0,393,391,1,0,0,0,393,394,1,0,0,0,
+        394,88,1,0,0,0,395,393,1,0,0,0,396,398,7,4,0,0,397,396,1,0,0,0,398,
+        399,1,0,0,0,399,397,1,0,0,0,399,400,1,0,0,0,400,407,1,0,0,0,401,
+        403,5,46,0,0,402,404,7,4,0,0,403,402,1,0,0,0,404,405,1,0,0,0,405,
+        403,1,0,0,0,405,406,1,0,0,0,406,408,1,0,0,0,407,401,1,0,0,0,407,
+        408,1,0,0,0,408,90,1,0,0,0,409,413,5,34,0,0,410,412,8,5,0,0,411,
+        410,1,0,0,0,412,415,1,0,0,0,413,414,1,0,0,0,413,411,1,0,0,0,414,
+        416,1,0,0,0,415,413,1,0,0,0,416,417,5,34,0,0,417,92,1,0,0,0,418,
+        419,5,61,0,0,419,94,1,0,0,0,420,421,5,61,0,0,421,96,1,0,0,0,422,
+        423,5,60,0,0,423,98,1,0,0,0,424,425,5,62,0,0,425,100,1,0,0,0,426,
+        427,5,60,0,0,427,428,5,61,0,0,428,102,1,0,0,0,429,430,5,62,0,0,430,
+        431,5,61,0,0,431,104,1,0,0,0,432,433,5,60,0,0,433,434,5,62,0,0,434,
+        106,1,0,0,0,435,436,5,43,0,0,436,108,1,0,0,0,437,438,5,45,0,0,438,
+        110,1,0,0,0,439,440,5,42,0,0,440,112,1,0,0,0,441,442,5,47,0,0,442,
+        114,1,0,0,0,443,444,5,40,0,0,444,116,1,0,0,0,445,446,5,41,0,0,446,
+        118,1,0,0,0,447,448,5,58,0,0,448,120,1,0,0,0,449,450,5,44,0,0,450,
+        122,1,0,0,0,451,452,5,59,0,0,452,124,1,0,0,0,453,454,5,35,0,0,454,
+        126,1,0,0,0,455,456,7,6,0,0,456,128,1,0,0,0,12,0,130,137,148,159,
+        377,386,393,399,405,407,413,1,6,0,0
     ]
 
 class BasicLexer(Lexer):
@@ -129,26 +199,50 @@ class BasicLexer(Lexer):
     WHILE = 18
     WEND = 19
     INPUT = 20
-    ID = 21
-    NUMBER = 22
-    STRING = 23
-    ASSIGN = 24
-    EQ = 25
-    LT = 26
-    GT = 27
-    LTE = 28
-    GTE = 29
-    NEQ = 30
-    PLUS = 31
-    MINUS = 32
-    MUL = 33
-    DIV = 34
-    LPAREN = 35
-    RPAREN = 36
-    COLON = 37
-    COMMA = 38
-    SEMICOLON = 39
-    TYPE_SUFFIX = 40
+    ON = 21
+    SELECT = 22
+    CASE = 23
+    IS = 24
+    DIM = 25
+    MAT = 26
+    TRN = 27
+    INV = 28
+    DATA = 29
+    READ = 30
+    DEF = 31
+    OPEN = 32
+    CLOSE = 33
+    AS = 34
+    OUTPUT = 35
+    APPEND = 36
+    RANDOM = 37
+    LEN = 38
+    FIELD = 39
+    GET = 40
+    PUT = 41
+    BUILTIN = 42
+    FN_NAME = 43
+    ID = 44
+    NUMBER = 45
+    STRING = 46
+    ASSIGN = 47
+    EQ = 48
+    LT = 49
+    GT = 50
+    LTE = 51
+    GTE = 52
+    NEQ = 53
+    PLUS = 54
+    MINUS = 55
+    MUL = 56
+    DIV = 57
+    LPAREN = 58
+    RPAREN = 59
+    COLON = 60
+    COMMA = 61
+    SEMICOLON = 62
+    HASH = 63
+    TYPE_SUFFIX = 64
 
     channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
 
@@ -157,24 +251,34 @@ class BasicLexer(Lexer):
     literalNames = [ "<INVALID>",
             "'IF'", "'THEN'", "'ELSE'", "'PRINT'", "'LET'", "'END'", "'GOTO'", 
             "'FOR'", "'TO'", "'STEP'", "'NEXT'", "'GOSUB'", "'RETURN'", 
-            "'WHILE'", "'WEND'", "'INPUT'", "'<'", "'>'", "'<='", "'>='", 
-            "'<>'", "'+'", "'-'", "'*'", "'/'", "'('", "')'", "':'", "','", 
-            "';'" ]
+            "'WHILE'", "'WEND'", "'INPUT'", "'ON'", "'SELECT'", "'CASE'", 
+            "'IS'", "'DIM'", "'MAT'", "'TRN'", "'INV'", "'DATA'", "'READ'", 
+            "'DEF'", "'OPEN'", "'CLOSE'", "'AS'", "'OUTPUT'", "'APPEND'", 
+            "'RANDOM'", "'LEN'", "'FIELD'", "'GET'", "'PUT'", "'<'", "'>'", 
+            "'<='", "'>='", "'<>'", "'+'", "'-'", "'*'", "'/'", "'('", "')'", 
+            "':'", "','", "';'", "'#'" ]
 
     symbolicNames = [ "<INVALID>",
             "NEWLINE", "WS", "REM_COMMENT", "APOSTROPHE_COMMENT", "IF", 
             "THEN", "ELSE", "PRINT", "LET", "END", "GOTO", "FOR", "TO", 
             "STEP", "NEXT", "GOSUB", "RETURN", "WHILE", "WEND", "INPUT", 
-            "ID", "NUMBER", "STRING", "ASSIGN", "EQ", "LT", "GT", "LTE", 
-            "GTE", "NEQ", "PLUS", "MINUS", "MUL", "DIV", "LPAREN", "RPAREN", 
-            "COLON", "COMMA", "SEMICOLON", "TYPE_SUFFIX" ]
+            "ON", "SELECT", "CASE", "IS", "DIM", "MAT", "TRN", "INV", "DATA", 
+            "READ", "DEF", "OPEN", "CLOSE", "AS", "OUTPUT", "APPEND", "RANDOM", 
+            "LEN", "FIELD", "GET", "PUT", "BUILTIN", "FN_NAME", "ID", "NUMBER", 
+            "STRING", "ASSIGN", "EQ", "LT", "GT", "LTE", "GTE", "NEQ", "PLUS", 
+            "MINUS", "MUL", "DIV", "LPAREN", "RPAREN", "COLON", "COMMA", 
+            "SEMICOLON", "HASH", "TYPE_SUFFIX" ]
 
     ruleNames = [ "NEWLINE", "WS", "REM_COMMENT", "APOSTROPHE_COMMENT", 
                   "IF", "THEN", "ELSE", "PRINT", "LET", "END", "GOTO", "FOR", 
                   "TO", "STEP", "NEXT", "GOSUB", "RETURN", "WHILE", "WEND", 
-                  "INPUT", "ID", "NUMBER", "STRING", "ASSIGN", "EQ", "LT", 
+                  "INPUT", "ON", "SELECT", "CASE", "IS", "DIM", "MAT", "TRN", 
+                  "INV", "DATA", "READ", "DEF", "OPEN", "CLOSE", "AS", "OUTPUT", 
+                  "APPEND", "RANDOM", "LEN", "FIELD", "GET", "PUT", "BUILTIN", 
+                  "FN_NAME", "ID", "NUMBER", "STRING", "ASSIGN", "EQ", "LT", 
                   "GT", "LTE", "GTE", "NEQ", "PLUS", "MINUS", "MUL", "DIV", 
-                  "LPAREN", "RPAREN", "COLON", "COMMA", "SEMICOLON", "TYPE_SUFFIX" ]
+                  "LPAREN", "RPAREN", "COLON", "COMMA", "SEMICOLON", "HASH", 
+                  "TYPE_SUFFIX" ]
 
     grammarFileName = "Basic.g4"
 
@@ -143,6 +143,159 @@ class BasicListener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by BasicParser#onStmt.
+    def enterOnStmt(self, ctx:BasicParser.OnStmtContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#onStmt.
+    def exitOnStmt(self, ctx:BasicParser.OnStmtContext):
+        pass
+
+
+    # Enter a parse tree produced by BasicParser#selectStmt.
+    def enterSelectStmt(self, ctx:BasicParser.SelectStmtContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#selectStmt.
+    def exitSelectStmt(self, ctx:BasicParser.SelectStmtContext):
+        pass
+
+
+    # Enter a parse tree produced by BasicParser#caseClause.
+    def enterCaseClause(self, ctx:BasicParser.CaseClauseContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#caseClause.
+    def exitCaseClause(self, ctx:BasicParser.CaseClauseContext):
+        pass
+
+
+    # Enter a parse tree produced by BasicParser#caseTest.
+    def enterCaseTest(self, ctx:BasicParser.CaseTestContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#caseTest.
+    def exitCaseTest(self, ctx:BasicParser.CaseTestContext):
+        pass
+
+
+    # Enter a parse tree produced by BasicParser#dimStmt.
+    def enterDimStmt(self, ctx:BasicParser.DimStmtContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#dimStmt.
+    def exitDimStmt(self, ctx:BasicParser.DimStmtContext):
+        pass
+
+
+    # Enter a parse tree produced by BasicParser#matStmt.
+    def enterMatStmt(self, ctx:BasicParser.MatStmtContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#matStmt.
+    def exitMatStmt(self, ctx:BasicParser.MatStmtContext):
+        pass
+
+
+    # Enter a parse tree produced by BasicParser#matExpr.
+    def enterMatExpr(self, ctx:BasicParser.MatExprContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#matExpr.
+    def exitMatExpr(self, ctx:BasicParser.MatExprContext):
+        pass
+
+
+    # Enter a parse tree produced by BasicParser#dataStmt.
+    def enterDataStmt(self, ctx:BasicParser.DataStmtContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#dataStmt.
+    def exitDataStmt(self, ctx:BasicParser.DataStmtContext):
+        pass
+
+
+    # Enter a parse tree produced by BasicParser#dataItem.
+    def enterDataItem(self, ctx:BasicParser.DataItemContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#dataItem.
+    def exitDataItem(self, ctx:BasicParser.DataItemContext):
+        pass
+
+
+    # Enter a parse tree produced by BasicParser#readStmt.
+    def enterReadStmt(self, ctx:BasicParser.ReadStmtContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#readStmt.
+    def exitReadStmt(self, ctx:BasicParser.ReadStmtContext):
+        pass
+
+
+    # Enter a parse tree produced by BasicParser#defStmt.
+    def enterDefStmt(self, ctx:BasicParser.DefStmtContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#defStmt.
+    def exitDefStmt(self, ctx:BasicParser.DefStmtContext):
+        pass
+
+
+    # Enter a parse tree produced by BasicParser#openStmt.
+    def enterOpenStmt(self, ctx:BasicParser.OpenStmtContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#openStmt.
+    def exitOpenStmt(self, ctx:BasicParser.OpenStmtContext):
+        pass
+
+
+    # Enter a parse tree produced by BasicParser#closeStmt.
+    def enterCloseStmt(self, ctx:BasicParser.CloseStmtContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#closeStmt.
+    def exitCloseStmt(self, ctx:BasicParser.CloseStmtContext):
+        pass
+
+
+    # Enter a parse tree produced by BasicParser#fieldStmt.
+    def enterFieldStmt(self, ctx:BasicParser.FieldStmtContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#fieldStmt.
+    def exitFieldStmt(self, ctx:BasicParser.FieldStmtContext):
+        pass
+
+
+    # Enter a parse tree produced by BasicParser#fieldItem.
+    def enterFieldItem(self, ctx:BasicParser.FieldItemContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#fieldItem.
+    def exitFieldItem(self, ctx:BasicParser.FieldItemContext):
+        pass
+
+
+    # Enter a parse tree produced by BasicParser#getStmt.
+    def enterGetStmt(self, ctx:BasicParser.GetStmtContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#getStmt.
+    def exitGetStmt(self, ctx:BasicParser.GetStmtContext):
+        pass
+
+
+    # Enter a parse tree produced by BasicParser#putStmt.
+    def enterPutStmt(self, ctx:BasicParser.PutStmtContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#putStmt.
+    def exitPutStmt(self, ctx:BasicParser.PutStmtContext):
+        pass
+
+
     # Enter a parse tree produced by BasicParser#targetLabel.
     def enterTargetLabel(self, ctx:BasicParser.TargetLabelContext):
         pass
@@ -170,6 +323,42 @@ class BasicListener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by BasicParser#arrayElement.
+    def enterArrayElement(self, ctx:BasicParser.ArrayElementContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#arrayElement.
+    def exitArrayElement(self, ctx:BasicParser.ArrayElementContext):
+        pass
+
+
+    # Enter a parse tree produced by BasicParser#target.
+    def enterTarget(self, ctx:BasicParser.TargetContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#target.
+    def exitTarget(self, ctx:BasicParser.TargetContext):
+        pass
+
+
+    # Enter a parse tree produced by BasicParser#functionCall.
+    def enterFunctionCall(self, ctx:BasicParser.FunctionCallContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#functionCall.
+    def exitFunctionCall(self, ctx:BasicParser.FunctionCallContext):
+        pass
+
+
+    # Enter a parse tree produced by BasicParser#userFunctionCall.
+    def enterUserFunctionCall(self, ctx:BasicParser.UserFunctionCallContext):
+        pass
+
+    # Exit a parse tree produced by BasicParser#userFunctionCall.
+    def exitUserFunctionCall(self, ctx:BasicParser.UserFunctionCallContext):
+        pass
+
+
     # Enter a parse tree produced by BasicParser#condition.
     def enterCondition(self, ctx:BasicParser.ConditionContext):
         pass
@@ -10,85 +10,220 @@ else:
 
 def serializedATN():
     return [
-        4,1,40,227,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        4,1,64,570,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
         6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
         2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,20,
-        7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,1,0,3,0,52,8,0,1,0,
-        5,0,55,8,0,10,0,12,0,58,9,0,1,0,3,0,61,8,0,1,0,1,0,1,1,1,1,3,1,67,
-        8,1,1,1,3,1,70,8,1,3,1,72,8,1,1,2,1,2,1,2,1,3,1,3,1,3,1,3,1,3,1,
-        3,1,3,1,3,1,3,1,3,1,3,3,3,88,8,3,1,4,1,4,3,4,92,8,4,1,5,1,5,1,5,
-        5,5,97,8,5,10,5,12,5,100,9,5,1,6,1,6,1,6,1,6,1,6,1,7,1,7,3,7,109,
-        8,7,1,7,1,7,3,7,113,8,7,1,7,1,7,3,7,117,8,7,1,7,1,7,1,7,3,7,122,
-        8,7,1,7,3,7,125,8,7,1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,
-        3,9,138,8,9,1,10,1,10,1,10,1,10,5,10,144,8,10,10,10,12,10,147,9,
-        10,1,11,1,11,1,11,1,12,1,12,1,13,1,13,1,13,3,13,157,8,13,1,13,5,
-        13,160,8,13,10,13,12,13,163,9,13,1,13,1,13,1,14,1,14,1,14,3,14,170,
-        8,14,1,14,1,14,1,14,5,14,175,8,14,10,14,12,14,178,9,14,1,15,1,15,
-        1,16,1,16,1,17,1,17,3,17,186,8,17,1,18,1,18,1,19,1,19,1,20,1,20,
-        1,20,3,20,195,8,20,1,21,1,21,1,21,5,21,200,8,21,10,21,12,21,203,
-        9,21,1,22,1,22,1,22,5,22,208,8,22,10,22,12,22,211,9,22,1,23,1,23,
-        1,23,3,23,216,8,23,1,24,1,24,1,24,1,24,1,24,1,24,1,24,3,24,225,8,
-        24,1,24,0,0,25,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,
-        36,38,40,42,44,46,48,0,5,1,0,38,39,1,0,21,22,1,0,25,30,1,0,31,32,
-        1,0,33,34,238,0,56,1,0,0,0,2,71,1,0,0,0,4,73,1,0,0,0,6,87,1,0,0,
-        0,8,89,1,0,0,0,10,93,1,0,0,0,12,101,1,0,0,0,14,106,1,0,0,0,16,126,
-        1,0,0,0,18,129,1,0,0,0,20,139,1,0,0,0,22,148,1,0,0,0,24,151,1,0,
-        0,0,26,153,1,0,0,0,28,166,1,0,0,0,30,179,1,0,0,0,32,181,1,0,0,0,
-        34,183,1,0,0,0,36,187,1,0,0,0,38,189,1,0,0,0,40,191,1,0,0,0,42,196,
-        1,0,0,0,44,204,1,0,0,0,46,215,1,0,0,0,48,224,1,0,0,0,50,52,3,2,1,
-        0,51,50,1,0,0,0,51,52,1,0,0,0,52,53,1,0,0,0,53,55,5,1,0,0,54,51,
-        1,0,0,0,55,58,1,0,0,0,56,54,1,0,0,0,56,57,1,0,0,0,57,60,1,0,0,0,
-        58,56,1,0,0,0,59,61,3,2,1,0,60,59,1,0,0,0,60,61,1,0,0,0,61,62,1,
-        0,0,0,62,63,5,0,0,1,63,1,1,0,0,0,64,72,3,4,2,0,65,67,5,22,0,0,66,
-        65,1,0,0,0,66,67,1,0,0,0,67,69,1,0,0,0,68,70,3,6,3,0,69,68,1,0,0,
-        0,69,70,1,0,0,0,70,72,1,0,0,0,71,64,1,0,0,0,71,66,1,0,0,0,72,3,1,
-        0,0,0,73,74,5,21,0,0,74,75,5,37,0,0,75,5,1,0,0,0,76,88,3,8,4,0,77,
-        88,3,12,6,0,78,88,3,14,7,0,79,88,3,16,8,0,80,88,3,18,9,0,81,88,3,
-        20,10,0,82,88,3,22,11,0,83,88,3,24,12,0,84,88,3,26,13,0,85,88,3,
-        28,14,0,86,88,3,32,16,0,87,76,1,0,0,0,87,77,1,0,0,0,87,78,1,0,0,
-        0,87,79,1,0,0,0,87,80,1,0,0,0,87,81,1,0,0,0,87,82,1,0,0,0,87,83,
-        1,0,0,0,87,84,1,0,0,0,87,85,1,0,0,0,87,86,1,0,0,0,88,7,1,0,0,0,89,
-        91,5,8,0,0,90,92,3,10,5,0,91,90,1,0,0,0,91,92,1,0,0,0,92,9,1,0,0,
-        0,93,98,3,38,19,0,94,95,7,0,0,0,95,97,3,38,19,0,96,94,1,0,0,0,97,
-        100,1,0,0,0,98,96,1,0,0,0,98,99,1,0,0,0,99,11,1,0,0,0,100,98,1,0,
-        0,0,101,102,5,9,0,0,102,103,3,34,17,0,103,104,5,24,0,0,104,105,3,
-        38,19,0,105,13,1,0,0,0,106,108,5,5,0,0,107,109,5,2,0,0,108,107,1,
-        0,0,0,108,109,1,0,0,0,109,110,1,0,0,0,110,112,3,36,18,0,111,113,
-        5,2,0,0,112,111,1,0,0,0,112,113,1,0,0,0,113,114,1,0,0,0,114,116,
-        5,6,0,0,115,117,5,2,0,0,116,115,1,0,0,0,116,117,1,0,0,0,117,118,
-        1,0,0,0,118,124,3,6,3,0,119,121,5,7,0,0,120,122,5,2,0,0,121,120,
-        1,0,0,0,121,122,1,0,0,0,122,123,1,0,0,0,123,125,3,6,3,0,124,119,
-        1,0,0,0,124,125,1,0,0,0,125,15,1,0,0,0,126,127,5,11,0,0,127,128,
-        3,30,15,0,128,17,1,0,0,0,129,130,5,12,0,0,130,131,3,34,17,0,131,
-        132,5,24,0,0,132,133,3,38,19,0,133,134,5,13,0,0,134,137,3,38,19,
-        0,135,136,5,14,0,0,136,138,3,38,19,0,137,135,1,0,0,0,137,138,1,0,
-        0,0,138,19,1,0,0,0,139,140,5,15,0,0,140,145,3,34,17,0,141,142,5,
-        38,0,0,142,144,3,34,17,0,143,141,1,0,0,0,144,147,1,0,0,0,145,143,
-        1,0,0,0,145,146,1,0,0,0,146,21,1,0,0,0,147,145,1,0,0,0,148,149,5,
-        16,0,0,149,150,3,30,15,0,150,23,1,0,0,0,151,152,5,17,0,0,152,25,
-        1,0,0,0,153,154,5,18,0,0,154,161,3,36,18,0,155,157,3,2,1,0,156,155,
-        1,0,0,0,156,157,1,0,0,0,157,158,1,0,0,0,158,160,5,1,0,0,159,156,
-        1,0,0,0,160,163,1,0,0,0,161,159,1,0,0,0,161,162,1,0,0,0,162,164,
-        1,0,0,0,163,161,1,0,0,0,164,165,5,19,0,0,165,27,1,0,0,0,166,169,
-        5,20,0,0,167,168,5,23,0,0,168,170,5,38,0,0,169,167,1,0,0,0,169,170,
-        1,0,0,0,170,171,1,0,0,0,171,176,3,34,17,0,172,173,5,38,0,0,173,175,
-        3,34,17,0,174,172,1,0,0,0,175,178,1,0,0,0,176,174,1,0,0,0,176,177,
-        1,0,0,0,177,29,1,0,0,0,178,176,1,0,0,0,179,180,7,1,0,0,180,31,1,
-        0,0,0,181,182,5,10,0,0,182,33,1,0,0,0,183,185,5,21,0,0,184,186,5,
-        40,0,0,185,184,1,0,0,0,185,186,1,0,0,0,186,35,1,0,0,0,187,188,3,
-        38,19,0,188,37,1,0,0,0,189,190,3,40,20,0,190,39,1,0,0,0,191,194,
-        3,42,21,0,192,193,7,2,0,0,193,195,3,42,21,0,194,192,1,0,0,0,194,
-        195,1,0,0,0,195,41,1,0,0,0,196,201,3,44,22,0,197,198,7,3,0,0,198,
-        200,3,44,22,0,199,197,1,0,0,0,200,203,1,0,0,0,201,199,1,0,0,0,201,
-        202,1,0,0,0,202,43,1,0,0,0,203,201,1,0,0,0,204,209,3,46,23,0,205,
-        206,7,4,0,0,206,208,3,46,23,0,207,205,1,0,0,0,208,211,1,0,0,0,209,
-        207,1,0,0,0,209,210,1,0,0,0,210,45,1,0,0,0,211,209,1,0,0,0,212,213,
-        5,32,0,0,213,216,3,48,24,0,214,216,3,48,24,0,215,212,1,0,0,0,215,
-        214,1,0,0,0,216,47,1,0,0,0,217,225,5,22,0,0,218,225,5,23,0,0,219,
-        225,3,34,17,0,220,221,5,35,0,0,221,222,3,38,19,0,222,223,5,36,0,
-        0,223,225,1,0,0,0,224,217,1,0,0,0,224,218,1,0,0,0,224,219,1,0,0,
-        0,224,220,1,0,0,0,225,49,1,0,0,0,26,51,56,60,66,69,71,87,91,98,108,
-        112,116,121,124,137,145,156,161,169,176,185,194,201,209,215,224
+        7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,26,
+        2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,32,2,33,
+        7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,39,7,39,
+        2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,45,1,0,
+        3,0,94,8,0,1,0,5,0,97,8,0,10,0,12,0,100,9,0,1,0,3,0,103,8,0,1,0,
+        1,0,1,1,1,1,3,1,109,8,1,1,1,3,1,112,8,1,3,1,114,8,1,1,2,1,2,1,2,
+        1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,
+        1,3,1,3,1,3,1,3,1,3,1,3,1,3,3,3,142,8,3,1,4,1,4,1,4,1,4,1,4,3,4,
+        149,8,4,1,4,3,4,152,8,4,1,5,1,5,1,5,5,5,157,8,5,10,5,12,5,160,9,
+        5,1,6,1,6,1,6,1,6,1,6,1,7,1,7,3,7,169,8,7,1,7,1,7,3,7,173,8,7,1,
+        7,1,7,3,7,177,8,7,1,7,1,7,1,7,3,7,182,8,7,1,7,3,7,185,8,7,1,8,1,
+        8,1,8,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,3,9,198,8,9,1,10,1,10,1,10,
+        1,10,5,10,204,8,10,10,10,12,10,207,9,10,1,11,1,11,1,11,1,12,1,12,
+        1,13,1,13,1,13,3,13,217,8,13,1,13,5,13,220,8,13,10,13,12,13,223,
+        9,13,1,13,1,13,1,14,1,14,1,14,1,14,1,14,1,14,1,14,3,14,234,8,14,
+        1,14,1,14,1,14,5,14,239,8,14,10,14,12,14,242,9,14,1,15,1,15,1,15,
+        1,15,1,15,1,15,5,15,250,8,15,10,15,12,15,253,9,15,1,16,1,16,1,16,
+        1,16,4,16,259,8,16,11,16,12,16,260,1,16,5,16,264,8,16,10,16,12,16,
+        267,9,16,1,16,1,16,1,16,1,17,1,17,1,17,1,17,1,17,5,17,277,8,17,10,
+        17,12,17,280,9,17,3,17,282,8,17,1,17,3,17,285,8,17,1,17,5,17,288,
+        8,17,10,17,12,17,291,9,17,1,18,1,18,1,18,1,18,1,18,1,18,3,18,299,
+        8,18,3,18,301,8,18,1,19,1,19,1,19,1,19,5,19,307,8,19,10,19,12,19,
+        310,9,19,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,5,20,
+        322,8,20,10,20,12,20,325,9,20,1,20,1,20,1,20,1,20,1,20,5,20,332,
+        8,20,10,20,12,20,335,9,20,1,20,3,20,338,8,20,3,20,340,8,20,1,21,
+        1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,
+        1,21,1,21,1,21,1,21,1,21,3,21,361,8,21,3,21,363,8,21,1,22,1,22,1,
+        22,1,22,5,22,369,8,22,10,22,12,22,372,9,22,1,23,3,23,375,8,23,1,
+        23,1,23,3,23,379,8,23,1,24,1,24,1,24,1,24,5,24,385,8,24,10,24,12,
+        24,388,9,24,1,25,1,25,1,25,3,25,393,8,25,1,25,1,25,1,25,1,25,5,25,
+        399,8,25,10,25,12,25,402,9,25,1,25,1,25,3,25,406,8,25,1,25,1,25,
+        1,25,1,26,1,26,1,26,1,26,3,26,415,8,26,1,26,1,26,3,26,419,8,26,1,
+        26,1,26,1,26,1,26,3,26,425,8,26,1,27,1,27,3,27,429,8,27,1,27,1,27,
+        1,27,3,27,434,8,27,1,27,5,27,437,8,27,10,27,12,27,440,9,27,3,27,
+        442,8,27,1,28,1,28,3,28,446,8,28,1,28,1,28,1,28,1,28,1,28,5,28,453,
+        8,28,10,28,12,28,456,9,28,1,29,1,29,1,29,1,29,1,30,1,30,3,30,464,
+        8,30,1,30,1,30,1,30,3,30,469,8,30,1,31,1,31,3,31,473,8,31,1,31,1,
+        31,1,31,3,31,478,8,31,1,32,1,32,1,33,1,33,1,34,1,34,3,34,486,8,34,
+        1,35,1,35,1,35,1,35,1,35,5,35,493,8,35,10,35,12,35,496,9,35,1,35,
+        1,35,1,36,1,36,3,36,502,8,36,1,37,1,37,1,37,1,37,1,37,3,37,509,8,
+        37,1,38,1,38,3,38,513,8,38,1,38,1,38,1,38,1,38,5,38,519,8,38,10,
+        38,12,38,522,9,38,1,38,1,38,3,38,526,8,38,1,39,1,39,1,40,1,40,1,
+        41,1,41,1,41,3,41,535,8,41,1,42,1,42,1,42,5,42,540,8,42,10,42,12,
+        42,543,9,42,1,43,1,43,1,43,5,43,548,8,43,10,43,12,43,551,9,43,1,
+        44,1,44,1,44,3,44,556,8,44,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,
+        45,1,45,1,45,3,45,568,8,45,1,45,0,0,46,0,2,4,6,8,10,12,14,16,18,
+        20,22,24,26,28,30,32,34,36,38,40,42,44,46,48,50,52,54,56,58,60,62,
+        64,66,68,70,72,74,76,78,80,82,84,86,88,90,0,9,1,0,61,62,2,0,11,11,
+        16,16,2,0,47,47,49,53,1,0,54,56,2,0,20,20,35,37,1,0,44,45,1,0,48,
+        53,1,0,54,55,1,0,56,57,622,0,98,1,0,0,0,2,113,1,0,0,0,4,115,1,0,
+        0,0,6,141,1,0,0,0,8,143,1,0,0,0,10,153,1,0,0,0,12,161,1,0,0,0,14,
+        166,1,0,0,0,16,186,1,0,0,0,18,189,1,0,0,0,20,199,1,0,0,0,22,208,
+        1,0,0,0,24,211,1,0,0,0,26,213,1,0,0,0,28,226,1,0,0,0,30,243,1,0,
+        0,0,32,254,1,0,0,0,34,271,1,0,0,0,36,300,1,0,0,0,38,302,1,0,0,0,
+        40,339,1,0,0,0,42,362,1,0,0,0,44,364,1,0,0,0,46,378,1,0,0,0,48,380,
+        1,0,0,0,50,389,1,0,0,0,52,410,1,0,0,0,54,426,1,0,0,0,56,443,1,0,
+        0,0,58,457,1,0,0,0,60,461,1,0,0,0,62,470,1,0,0,0,64,479,1,0,0,0,
+        66,481,1,0,0,0,68,483,1,0,0,0,70,487,1,0,0,0,72,501,1,0,0,0,74,503,
+        1,0,0,0,76,510,1,0,0,0,78,527,1,0,0,0,80,529,1,0,0,0,82,531,1,0,
+        0,0,84,536,1,0,0,0,86,544,1,0,0,0,88,555,1,0,0,0,90,567,1,0,0,0,
+        92,94,3,2,1,0,93,92,1,0,0,0,93,94,1,0,0,0,94,95,1,0,0,0,95,97,5,
+        1,0,0,96,93,1,0,0,0,97,100,1,0,0,0,98,96,1,0,0,0,98,99,1,0,0,0,99,
+        102,1,0,0,0,100,98,1,0,0,0,101,103,3,2,1,0,102,101,1,0,0,0,102,103,
+        1,0,0,0,103,104,1,0,0,0,104,105,5,0,0,1,105,1,1,0,0,0,106,114,3,
+        4,2,0,107,109,5,45,0,0,108,107,1,0,0,0,108,109,1,0,0,0,109,111,1,
+        0,0,0,110,112,3,6,3,0,111,110,1,0,0,0,111,112,1,0,0,0,112,114,1,
+        0,0,0,113,106,1,0,0,0,113,108,1,0,0,0,114,3,1,0,0,0,115,116,5,44,
+        0,0,116,117,5,60,0,0,117,5,1,0,0,0,118,142,3,8,4,0,119,142,3,12,
+        6,0,120,142,3,14,7,0,121,142,3,16,8,0,122,142,3,18,9,0,123,142,3,
+        20,10,0,124,142,3,22,11,0,125,142,3,24,12,0,126,142,3,26,13,0,127,
+        142,3,28,14,0,128,142,3,30,15,0,129,142,3,32,16,0,130,142,3,38,19,
+        0,131,142,3,40,20,0,132,142,3,44,22,0,133,142,3,48,24,0,134,142,
+        3,50,25,0,135,142,3,52,26,0,136,142,3,54,27,0,137,142,3,56,28,0,
+        138,142,3,60,30,0,139,142,3,62,31,0,140,142,3,66,33,0,141,118,1,
+        0,0,0,141,119,1,0,0,0,141,120,1,0,0,0,141,121,1,0,0,0,141,122,1,
+        0,0,0,141,123,1,0,0,0,141,124,1,0,0,0,141,125,1,0,0,0,141,126,1,
+        0,0,0,141,127,1,0,0,0,141,128,1,0,0,0,141,129,1,0,0,0,141,130,1,
+        0,0,0,141,131,1,0,0,0,141,132,1,0,0,0,141,133,1,0,0,0,141,134,1,
+        0,0,0,141,135,1,0,0,0,141,136,1,0,0,0,141,137,1,0,0,0,141,138,1,
+        0,0,0,141,139,1,0,0,0,141,140,1,0,0,0,142,7,1,0,0,0,143,148,5,8,
+        0,0,144,145,5,63,0,0,145,146,3,80,40,0,146,147,5,61,0,0,147,149,
+        1,0,0,0,148,144,1,0,0,0,148,149,1,0,0,0,149,151,1,0,0,0,150,152,
+        3,10,5,0,151,150,1,0,0,0,151,152,1,0,0,0,152,9,1,0,0,0,153,158,3,
+        80,40,0,154,155,7,0,0,0,155,157,3,80,40,0,156,154,1,0,0,0,157,160,
+        1,0,0,0,158,156,1,0,0,0,158,159,1,0,0,0,159,11,1,0,0,0,160,158,1,
+        0,0,0,161,162,5,9,0,0,162,163,3,72,36,0,163,164,5,47,0,0,164,165,
+        3,80,40,0,165,13,1,0,0,0,166,168,5,5,0,0,167,169,5,2,0,0,168,167,
+        1,0,0,0,168,169,1,0,0,0,169,170,1,0,0,0,170,172,3,78,39,0,171,173,
+        5,2,0,0,172,171,1,0,0,0,172,173,1,0,0,0,173,174,1,0,0,0,174,176,
+        5,6,0,0,175,177,5,2,0,0,176,175,1,0,0,0,176,177,1,0,0,0,177,178,
+        1,0,0,0,178,184,3,6,3,0,179,181,5,7,0,0,180,182,5,2,0,0,181,180,
+        1,0,0,0,181,182,1,0,0,0,182,183,1,0,0,0,183,185,3,6,3,0,184,179,
+        1,0,0,0,184,185,1,0,0,0,185,15,1,0,0,0,186,187,5,11,0,0,187,188,
+        3,64,32,0,188,17,1,0,0,0,189,190,5,12,0,0,190,191,3,68,34,0,191,
+        192,5,47,0,0,192,193,3,80,40,0,193,194,5,13,0,0,194,197,3,80,40,
+        0,195,196,5,14,0,0,196,198,3,80,40,0,197,195,1,0,0,0,197,198,1,0,
+        0,0,198,19,1,0,0,0,199,200,5,15,0,0,200,205,3,68,34,0,201,202,5,
+        61,0,0,202,204,3,68,34,0,203,201,1,0,0,0,204,207,1,0,0,0,205,203,
+        1,0,0,0,205,206,1,0,0,0,206,21,1,0,0,0,207,205,1,0,0,0,208,209,5,
+        16,0,0,209,210,3,64,32,0,210,23,1,0,0,0,211,212,5,17,0,0,212,25,
+        1,0,0,0,213,214,5,18,0,0,214,221,3,78,39,0,215,217,3,2,1,0,216,215,
+        1,0,0,0,216,217,1,0,0,0,217,218,1,0,0,0,218,220,5,1,0,0,219,216,
+        1,0,0,0,220,223,1,0,0,0,221,219,1,0,0,0,221,222,1,0,0,0,222,224,
+        1,0,0,0,223,221,1,0,0,0,224,225,5,19,0,0,225,27,1,0,0,0,226,233,
+        5,20,0,0,227,228,5,63,0,0,228,229,3,80,40,0,229,230,5,61,0,0,230,
+        234,1,0,0,0,231,232,5,46,0,0,232,234,5,61,0,0,233,227,1,0,0,0,233,
+        231,1,0,0,0,233,234,1,0,0,0,234,235,1,0,0,0,235,240,3,72,36,0,236,
+        237,5,61,0,0,237,239,3,72,36,0,238,236,1,0,0,0,239,242,1,0,0,0,240,
+        238,1,0,0,0,240,241,1,0,0,0,241,29,1,0,0,0,242,240,1,0,0,0,243,244,
+        5,21,0,0,244,245,3,80,40,0,245,246,7,1,0,0,246,251,3,64,32,0,247,
+        248,5,61,0,0,248,250,3,64,32,0,249,247,1,0,0,0,250,253,1,0,0,0,251,
+        249,1,0,0,0,251,252,1,0,0,0,252,31,1,0,0,0,253,251,1,0,0,0,254,255,
+        5,22,0,0,255,256,5,23,0,0,256,258,3,80,40,0,257,259,5,1,0,0,258,
+        257,1,0,0,0,259,260,1,0,0,0,260,258,1,0,0,0,260,261,1,0,0,0,261,
+        265,1,0,0,0,262,264,3,34,17,0,263,262,1,0,0,0,264,267,1,0,0,0,265,
+        263,1,0,0,0,265,266,1,0,0,0,266,268,1,0,0,0,267,265,1,0,0,0,268,
+        269,5,10,0,0,269,270,5,22,0,0,270,33,1,0,0,0,271,281,5,23,0,0,272,
+        282,5,7,0,0,273,278,3,36,18,0,274,275,5,61,0,0,275,277,3,36,18,0,
+        276,274,1,0,0,0,277,280,1,0,0,0,278,276,1,0,0,0,278,279,1,0,0,0,
+        279,282,1,0,0,0,280,278,1,0,0,0,281,272,1,0,0,0,281,273,1,0,0,0,
+        282,289,1,0,0,0,283,285,3,2,1,0,284,283,1,0,0,0,284,285,1,0,0,0,
+        285,286,1,0,0,0,286,288,5,1,0,0,287,284,1,0,0,0,288,291,1,0,0,0,
+        289,287,1,0,0,0,289,290,1,0,0,0,290,35,1,0,0,0,291,289,1,0,0,0,292,
+        293,5,24,0,0,293,294,7,2,0,0,294,301,3,80,40,0,295,298,3,80,40,0,
+        296,297,5,13,0,0,297,299,3,80,40,0,298,296,1,0,0,0,298,299,1,0,0,
+        0,299,301,1,0,0,0,300,292,1,0,0,0,300,295,1,0,0,0,301,37,1,0,0,0,
+        302,303,5,25,0,0,303,308,3,70,35,0,304,305,5,61,0,0,305,307,3,70,
+        35,0,306,304,1,0,0,0,307,310,1,0,0,0,308,306,1,0,0,0,308,309,1,0,
+        0,0,309,39,1,0,0,0,310,308,1,0,0,0,311,312,5,26,0,0,312,313,3,68,
+        34,0,313,314,5,47,0,0,314,315,3,42,21,0,315,340,1,0,0,0,316,317,
+        5,26,0,0,317,318,5,30,0,0,318,323,3,68,34,0,319,320,5,61,0,0,320,
+        322,3,68,34,0,321,319,1,0,0,0,322,325,1,0,0,0,323,321,1,0,0,0,323,
+        324,1,0,0,0,324,340,1,0,0,0,325,323,1,0,0,0,326,327,5,26,0,0,327,
+        328,5,8,0,0,328,333,3,68,34,0,329,330,7,0,0,0,330,332,3,68,34,0,
+        331,329,1,0,0,0,332,335,1,0,0,0,333,331,1,0,0,0,333,334,1,0,0,0,
+        334,337,1,0,0,0,335,333,1,0,0,0,336,338,5,62,0,0,337,336,1,0,0,0,
+        337,338,1,0,0,0,338,340,1,0,0,0,339,311,1,0,0,0,339,316,1,0,0,0,
+        339,326,1,0,0,0,340,41,1,0,0,0,341,342,5,27,0,0,342,343,5,58,0,0,
+        343,344,3,68,34,0,344,345,5,59,0,0,345,363,1,0,0,0,346,347,5,28,
+        0,0,347,348,5,58,0,0,348,349,3,68,34,0,349,350,5,59,0,0,350,363,
+        1,0,0,0,351,352,5,58,0,0,352,353,3,80,40,0,353,354,5,59,0,0,354,
+        355,5,56,0,0,355,356,3,68,34,0,356,363,1,0,0,0,357,360,3,68,34,0,
+        358,359,7,3,0,0,359,361,3,68,34,0,360,358,1,0,0,0,360,361,1,0,0,
+        0,361,363,1,0,0,0,362,341,1,0,0,0,362,346,1,0,0,0,362,351,1,0,0,
+        0,362,357,1,0,0,0,363,43,1,0,0,0,364,365,5,29,0,0,365,370,3,46,23,
+        0,366,367,5,61,0,0,367,369,3,46,23,0,368,366,1,0,0,0,369,372,1,0,
+        0,0,370,368,1,0,0,0,370,371,1,0,0,0,371,45,1,0,0,0,372,370,1,0,0,
+        0,373,375,5,55,0,0,374,373,1,0,0,0,374,375,1,0,0,0,375,376,1,0,0,
+        0,376,379,5,45,0,0,377,379,5,46,0,0,378,374,1,0,0,0,378,377,1,0,
+        0,0,379,47,1,0,0,0,380,381,5,30,0,0,381,386,3,72,36,0,382,383,5,
+        61,0,0,383,385,3,72,36,0,384,382,1,0,0,0,385,388,1,0,0,0,386,384,
+        1,0,0,0,386,387,1,0,0,0,387,49,1,0,0,0,388,386,1,0,0,0,389,390,5,
+        31,0,0,390,392,5,43,0,0,391,393,5,64,0,0,392,391,1,0,0,0,392,393,
+        1,0,0,0,393,405,1,0,0,0,394,395,5,58,0,0,395,400,3,68,34,0,396,397,
+        5,61,0,0,397,399,3,68,34,0,398,396,1,0,0,0,399,402,1,0,0,0,400,398,
+        1,0,0,0,400,401,1,0,0,0,401,403,1,0,0,0,402,400,1,0,0,0,403,404,
+        5,59,0,0,404,406,1,0,0,0,405,394,1,0,0,0,405,406,1,0,0,0,406,407,
+        1,0,0,0,407,408,5,47,0,0,408,409,3,80,40,0,409,51,1,0,0,0,410,411,
+        5,32,0,0,411,414,3,80,40,0,412,413,5,12,0,0,413,415,7,4,0,0,414,
+        412,1,0,0,0,414,415,1,0,0,0,415,416,1,0,0,0,416,418,5,34,0,0,417,
+        419,5,63,0,0,418,417,1,0,0,0,418,419,1,0,0,0,419,420,1,0,0,0,420,
+        424,3,80,40,0,421,422,5,38,0,0,422,423,5,47,0,0,423,425,3,80,40,
+        0,424,421,1,0,0,0,424,425,1,0,0,0,425,53,1,0,0,0,426,441,5,33,0,
+        0,427,429,5,63,0,0,428,427,1,0,0,0,428,429,1,0,0,0,429,430,1,0,0,
+        0,430,438,3,80,40,0,431,433,5,61,0,0,432,434,5,63,0,0,433,432,1,
+        0,0,0,433,434,1,0,0,0,434,435,1,0,0,0,435,437,3,80,40,0,436,431,
+        1,0,0,0,437,440,1,0,0,0,438,436,1,0,0,0,438,439,1,0,0,0,439,442,
+        1,0,0,0,440,438,1,0,0,0,441,428,1,0,0,0,441,442,1,0,0,0,442,55,1,
+        0,0,0,443,445,5,39,0,0,444,446,5,63,0,0,445,444,1,0,0,0,445,446,
+        1,0,0,0,446,447,1,0,0,0,447,448,3,80,40,0,448,449,5,61,0,0,449,454,
+        3,58,29,0,450,451,5,61,0,0,451,453,3,58,29,0,452,450,1,0,0,0,453,
+        456,1,0,0,0,454,452,1,0,0,0,454,455,1,0,0,0,455,57,1,0,0,0,456,454,
+        1,0,0,0,457,458,5,45,0,0,458,459,5,34,0,0,459,460,3,68,34,0,460,
+        59,1,0,0,0,461,463,5,40,0,0,462,464,5,63,0,0,463,462,1,0,0,0,463,
+        464,1,0,0,0,464,465,1,0,0,0,465,468,3,80,40,0,466,467,5,61,0,0,467,
+        469,3,80,40,0,468,466,1,0,0,0,468,469,1,0,0,0,469,61,1,0,0,0,470,
+        472,5,41,0,0,471,473,5,63,0,0,472,471,1,0,0,0,472,473,1,0,0,0,473,
+        474,1,0,0,0,474,477,3,80,40,0,475,476,5,61,0,0,476,478,3,80,40,0,
+        477,475,1,0,0,0,477,478,1,0,0,0,478,63,1,0,0,0,479,480,7,5,0,0,480,
+        65,1,0,0,0,481,482,5,10,0,0,482,67,1,0,0,0,483,485,5,44,0,0,484,
+        486,5,64,0,0,485,484,1,0,0,0,485,486,1,0,0,0,486,69,1,0,0,0,487,
+        488,3,68,34,0,488,489,5,58,0,0,489,494,3,80,40,0,490,491,5,61,0,
+        0,491,493,3,80,40,0,492,490,1,0,0,0,493,496,1,0,0,0,494,492,1,0,
+        0,0,494,495,1,0,0,0,495,497,1,0,0,0,496,494,1,0,0,0,497,498,5,59,
+        0,0,498,71,1,0,0,0,499,502,3,70,35,0,500,502,3,68,34,0,501,499,1,
+        0,0,0,501,500,1,0,0,0,502,73,1,0,0,0,503,508,5,42,0,0,504,505,5,
+        58,0,0,505,506,3,80,40,0,506,507,5,59,0,0,507,509,1,0,0,0,508,504,
+        1,0,0,0,508,509,1,0,0,0,509,75,1,0,0,0,510,512,5,43,0,0,511,513,
+        5,64,0,0,512,511,1,0,0,0,512,513,1,0,0,0,513,525,1,0,0,0,514,515,
+        5,58,0,0,515,520,3,80,40,0,516,517,5,61,0,0,517,519,3,80,40,0,518,
+        516,1,0,0,0,519,522,1,0,0,0,520,518,1,0,0,0,520,521,1,0,0,0,521,
+        523,1,0,0,0,522,520,1,0,0,0,523,524,5,59,0,0,524,526,1,0,0,0,525,
+        514,1,0,0,0,525,526,1,0,0,0,526,77,1,0,0,0,527,528,3,80,40,0,528,
+        79,1,0,0,0,529,530,3,82,41,0,530,81,1,0,0,0,531,534,3,84,42,0,532,
+        533,7,6,0,0,533,535,3,84,42,0,534,532,1,0,0,0,534,535,1,0,0,0,535,
+        83,1,0,0,0,536,541,3,86,43,0,537,538,7,7,0,0,538,540,3,86,43,0,539,
+        537,1,0,0,0,540,543,1,0,0,0,541,539,1,0,0,0,541,542,1,0,0,0,542,
+        85,1,0,0,0,543,541,1,0,0,0,544,549,3,88,44,0,545,546,7,8,0,0,546,
+        548,3,88,44,0,547,545,1,0,0,0,548,551,1,0,0,0,549,547,1,0,0,0,549,
+        550,1,0,0,0,550,87,1,0,0,0,551,549,1,0,0,0,552,553,5,55,0,0,553,
+        556,3,90,45,0,554,556,3,90,45,0,555,552,1,0,0,0,555,554,1,0,0,0,
+        556,89,1,0,0,0,557,568,5,45,0,0,558,568,5,46,0,0,559,568,3,74,37,
+        0,560,568,3,76,38,0,561,568,3,70,35,0,562,568,3,68,34,0,563,564,
+        5,58,0,0,564,565,3,80,40,0,565,566,5,59,0,0,566,568,1,0,0,0,567,
+        557,1,0,0,0,567,558,1,0,0,0,567,559,1,0,0,0,567,560,1,0,0,0,567,
+        561,1,0,0,0,567,562,1,0,0,0,567,563,1,0,0,0,568,91,1,0,0,0,69,93,
+        98,102,108,111,113,141,148,151,158,168,172,176,181,184,197,205,216,
+        221,233,240,251,260,265,278,281,284,289,298,300,308,323,333,337,
+        339,360,362,370,374,378,386,392,400,405,414,418,424,428,433,438,
+        441,445,454,463,468,472,477,485,494,501,508,512,520,525,534,541,
+        549,555,567
     ]
 
 class BasicParser ( Parser ):
@@ -105,18 +240,25 @@ class BasicParser ( Parser ):
                      "<INVALID>", "'IF'", "'THEN'", "'ELSE'", "'PRINT'", 
                      "'LET'", "'END'", "'GOTO'", "'FOR'", "'TO'", "'STEP'", 
                      "'NEXT'", "'GOSUB'", "'RETURN'", "'WHILE'", "'WEND'", 
-                     "'INPUT'", "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
-                     "<INVALID>", "'<'", "'>'", "'<='", "'>='", "'<>'", 
-                     "'+'", "'-'", "'*'", "'/'", "'('", "')'", "':'", "','", 
-                     "';'" ]
+                     "'INPUT'", "'ON'", "'SELECT'", "'CASE'", "'IS'", "'DIM'", 
+                     "'MAT'", "'TRN'", "'INV'", "'DATA'", "'READ'", "'DEF'", 
+                     "'OPEN'", "'CLOSE'", "'AS'", "'OUTPUT'", "'APPEND'", 
+                     "'RANDOM'", "'LEN'", "'FIELD'", "'GET'", "'PUT'", "<INVALID>", 
+                     "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                     "<INVALID>", "<INVALID>", "'<'", "'>'", "'<='", "'>='", 
+                     "'<>'", "'+'", "'-'", "'*'", "'/'", "'('", "')'", "':'", 
+                     "','", "';'", "'#'" ]
 
     symbolicNames = [ "<INVALID>", "NEWLINE", "WS", "REM_COMMENT", "APOSTROPHE_COMMENT", 
                       "IF", "THEN", "ELSE", "PRINT", "LET", "END", "GOTO", 
                       "FOR", "TO", "STEP", "NEXT", "GOSUB", "RETURN", "WHILE", 
-                      "WEND", "INPUT", "ID", "NUMBER", "STRING", "ASSIGN", 
-                      "EQ", "LT", "GT", "LTE", "GTE", "NEQ", "PLUS", "MINUS", 
-                      "MUL", "DIV", "LPAREN", "RPAREN", "COLON", "COMMA", 
-                      "SEMICOLON", "TYPE_SUFFIX" ]
+                      "WEND", "INPUT", "ON", "SELECT", "CASE", "IS", "DIM", 
+                      "MAT", "TRN", "INV", "DATA", "READ", "DEF", "OPEN", 
+                      "CLOSE", "AS", "OUTPUT", "APPEND", "RANDOM", "LEN", 
+                      "FIELD", "GET", "PUT", "BUILTIN", "FN_NAME", "ID", 
+                      "NUMBER", "STRING", "ASSIGN", "EQ", "LT", "GT", "LTE", 
+                      "GTE", "NEQ", "PLUS", "MINUS", "MUL", "DIV", "LPAREN", 
+                      "RPAREN", "COLON", "COMMA", "SEMICOLON", "HASH", "TYPE_SUFFIX" ]
 
     RULE_program = 0
     RULE_lineContent = 1
@@ -133,23 +275,48 @@ class BasicParser ( Parser ):
     RULE_returnStmt = 12
     RULE_whileStmt = 13
     RULE_inputStmt = 14
-    RULE_targetLabel = 15
-    RULE_endStmt = 16
-    RULE_variable = 17
-    RULE_condition = 18
-    RULE_expression = 19
-    RULE_comparisonExpr = 20
-    RULE_additiveExpr = 21
-    RULE_multiplicativeExpr = 22
-    RULE_unaryExpr = 23
-    RULE_atom = 24
+    RULE_onStmt = 15
+    RULE_selectStmt = 16
+    RULE_caseClause = 17
+    RULE_caseTest = 18
+    RULE_dimStmt = 19
+    RULE_matStmt = 20
+    RULE_matExpr = 21
+    RULE_dataStmt = 22
+    RULE_dataItem = 23
+    RULE_readStmt = 24
+    RULE_defStmt = 25
+    RULE_openStmt = 26
+    RULE_closeStmt = 27
+    RULE_fieldStmt = 28
+    RULE_fieldItem = 29
+    RULE_getStmt = 30
+    RULE_putStmt = 31
+    RULE_targetLabel = 32
+    RULE_endStmt = 33
+    RULE_variable = 34
+    RULE_arrayElement = 35
+    RULE_target = 36
+    RULE_functionCall = 37
+    RULE_userFunctionCall = 38
+    RULE_condition = 39
+    RULE_expression = 40
+    RULE_comparisonExpr = 41
+    RULE_additiveExpr = 42
+    RULE_multiplicativeExpr = 43
+    RULE_unaryExpr = 44
+    RULE_atom = 45
 
     ruleNames =  [ "program", "lineContent", "labelDef", "statement", "printStmt", 
                    "expressionList", "letStmt", "ifStmt", "gotoStmt", "forStmt", 
                    "nextStmt", "gosubStmt", "returnStmt", "whileStmt", "inputStmt", 
-                   "targetLabel", "endStmt", "variable", "condition", "expression", 
-                   "comparisonExpr", "additiveExpr", "multiplicativeExpr", 
-                   "unaryExpr", "atom" ]
+                   "onStmt", "selectStmt", "caseClause", "caseTest", "dimStmt", 
+                   "matStmt", "matExpr", "dataStmt", "dataItem", "readStmt", 
+                   "defStmt", "openStmt", "closeStmt", "fieldStmt", "fieldItem", 
+                   "getStmt", "putStmt", "targetLabel", "endStmt", "variable", 
+                   "arrayElement", "target", "functionCall", "userFunctionCall", 
+                   "condition", "expression", "comparisonExpr", "additiveExpr", 
+                   "multiplicativeExpr", "unaryExpr", "atom" ]
 
     EOF = Token.EOF
     NEWLINE=1
@@ -172,26 +339,50 @@ class BasicParser ( Parser ):
     WHILE=18
     WEND=19
     INPUT=20
-    ID=21
-    NUMBER=22
-    STRING=23
-    ASSIGN=24
-    EQ=25
-    LT=26
-    GT=27
-    LTE=28
-    GTE=29
-    NEQ=30
-    PLUS=31
-    MINUS=32
-    MUL=33
-    DIV=34
-    LPAREN=35
-    RPAREN=36
-    COLON=37
-    COMMA=38
-    SEMICOLON=39
-    TYPE_SUFFIX=40
+    ON=21
+    SELECT=22
+    CASE=23
+    IS=24
+    DIM=25
+    MAT=26
+    TRN=27
+    INV=28
+    DATA=29
+    READ=30
+    DEF=31
+    OPEN=32
+    CLOSE=33
+    AS=34
+    OUTPUT=35
+    APPEND=36
+    RANDOM=37
+    LEN=38
+    FIELD=39
+    GET=40
+    PUT=41
+    BUILTIN=42
+    FN_NAME=43
+    ID=44
+    NUMBER=45
+    STRING=46
+    ASSIGN=47
+    EQ=48
+    LT=49
+    GT=50
+    LTE=51
+    GTE=52
+    NEQ=53
+    PLUS=54
+    MINUS=55
+    MUL=56
+    DIV=57
+    LPAREN=58
+    RPAREN=59
+    COLON=60
+    COMMA=61
+    SEMICOLON=62
+    HASH=63
+    TYPE_SUFFIX=64
 
     def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
         super().__init__(input, output)
@@ -251,34 +442,34 @@ class BasicParser ( Parser ):
         self.enterRule(localctx, 0, self.RULE_program)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 56
+            self.state = 98
             self._errHandler.sync(self)
             _alt = self._interp.adaptivePredict(self._input,1,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 51
+                    self.state = 93
                     self._errHandler.sync(self)
                     la_ = self._interp.adaptivePredict(self._input,0,self._ctx)
                     if la_ == 1:
-                        self.state = 50
+                        self.state = 92
                         self.lineContent()
 
 
-                    self.state = 53
+                    self.state = 95
                     self.match(BasicParser.NEWLINE) 
-                self.state = 58
+                self.state = 100
                 self._errHandler.sync(self)
                 _alt = self._interp.adaptivePredict(self._input,1,self._ctx)
 
-            self.state = 60
+            self.state = 102
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,2,self._ctx)
             if la_ == 1:
-                self.state = 59
+                self.state = 101
                 self.lineContent()
 
 
-            self.state = 62
+            self.state = 104
             self.match(BasicParser.EOF)
         except RecognitionException as re:
             localctx.exception = re
@@ -334,27 +525,27 @@ class BasicParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 71
+            self.state = 113
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [21]:
-                self.state = 64
+            if token in [44]:
+                self.state = 106
                 self.labelDef()
                 pass
-            elif token in [-1, 1, 5, 8, 9, 10, 11, 12, 15, 16, 17, 18, 20, 22]:
-                self.state = 66
+            elif token in [-1, 1, 5, 8, 9, 10, 11, 12, 15, 16, 17, 18, 20, 21, 22, 25, 26, 29, 30, 31, 32, 33, 39, 40, 41, 45]:
+                self.state = 108
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==22:
-                    self.state = 65
+                if _la==45:
+                    self.state = 107
                     self.match(BasicParser.NUMBER)
 
 
-                self.state = 69
+                self.state = 111
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 1548064) != 0):
-                    self.state = 68
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 3865042198304) != 0):
+                    self.state = 110
                     self.statement()
 
 
@@ -410,9 +601,9 @@ class BasicParser ( Parser ):
         self.enterRule(localctx, 4, self.RULE_labelDef)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 73
+            self.state = 115
             self.match(BasicParser.ID)
-            self.state = 74
+            self.state = 116
             self.match(BasicParser.COLON)
         except RecognitionException as re:
             localctx.exception = re
@@ -470,6 +661,54 @@ class BasicParser ( Parser ):
             return self.getTypedRuleContext(BasicParser.InputStmtContext,0)
 
 
+        def onStmt(self):
+            return self.getTypedRuleContext(BasicParser.OnStmtContext,0)
+
+
+        def selectStmt(self):
+            return self.getTypedRuleContext(BasicParser.SelectStmtContext,0)
+
+
+        def dimStmt(self):
+            return self.getTypedRuleContext(BasicParser.DimStmtContext,0)
+
+
+        def matStmt(self):
+            return self.getTypedRuleContext(BasicParser.MatStmtContext,0)
+
+
+        def dataStmt(self):
+            return self.getTypedRuleContext(BasicParser.DataStmtContext,0)
+
+
+        def readStmt(self):
+            return self.getTypedRuleContext(BasicParser.ReadStmtContext,0)
+
+
+        def defStmt(self):
+            return self.getTypedRuleContext(BasicParser.DefStmtContext,0)
+
+
+        def openStmt(self):
+            return self.getTypedRuleContext(BasicParser.OpenStmtContext,0)
+
+
+        def closeStmt(self):
+            return self.getTypedRuleContext(BasicParser.CloseStmtContext,0)
+
+
+        def fieldStmt(self):
+            return self.getTypedRuleContext(BasicParser.FieldStmtContext,0)
+
+
+        def getStmt(self):
+            return self.getTypedRuleContext(BasicParser.GetStmtContext,0)
+
+
+        def putStmt(self):
+            return self.getTypedRuleContext(BasicParser.PutStmtContext,0)
+
+
         def endStmt(self):
             return self.getTypedRuleContext(BasicParser.EndStmtContext,0)
 
@@ -499,62 +738,122 @@ class BasicParser ( Parser ):
         localctx = BasicParser.StatementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 6, self.RULE_statement)
         try:
-            self.state = 87
+            self.state = 141
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [8]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 76
+                self.state = 118
                 self.printStmt()
                 pass
             elif token in [9]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 77
+                self.state = 119
                 self.letStmt()
                 pass
             elif token in [5]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 78
+                self.state = 120
                 self.ifStmt()
                 pass
             elif token in [11]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 79
+                self.state = 121
                 self.gotoStmt()
                 pass
             elif token in [12]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 80
+                self.state = 122
                 self.forStmt()
                 pass
             elif token in [15]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 81
+                self.state = 123
                 self.nextStmt()
                 pass
             elif token in [16]:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 82
+                self.state = 124
                 self.gosubStmt()
                 pass
             elif token in [17]:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 83
+                self.state = 125
                 self.returnStmt()
                 pass
             elif token in [18]:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 84
+                self.state = 126
                 self.whileStmt()
                 pass
             elif token in [20]:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 85
+                self.state = 127
                 self.inputStmt()
                 pass
-            elif token in [10]:
+            elif token in [21]:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 86
+                self.state = 128
+                self.onStmt()
+                pass
+            elif token in [22]:
+                self.enterOuterAlt(localctx, 12)
+                self.state = 129
+                self.selectStmt()
+                pass
+            elif token in [25]:
+                self.enterOuterAlt(localctx, 13)
+                self.state = 130
+                self.dimStmt()
+                pass
+            elif token in [26]:
+                self.enterOuterAlt(localctx, 14)
+                self.state = 131
+                self.matStmt()
+                pass
+            elif token in [29]:
+                self.enterOuterAlt(localctx, 15)
+                self.state = 132
+                self.dataStmt()
+                pass
+            elif token in [30]:
+                self.enterOuterAlt(localctx, 16)
+                self.state = 133
+                self.readStmt()
+                pass
+            elif token in [31]:
+                self.enterOuterAlt(localctx, 17)
+                self.state = 134
+                self.defStmt()
+                pass
+            elif token in [32]:
+                self.enterOuterAlt(localctx, 18)
+                self.state = 135
+                self.openStmt()
+                pass
+            elif token in [33]:
+                self.enterOuterAlt(localctx, 19)
+                self.state = 136
+                self.closeStmt()
+                pass
+            elif token in [39]:
+                self.enterOuterAlt(localctx, 20)
+                self.state = 137
+                self.fieldStmt()
+                pass
+            elif token in [40]:
+                self.enterOuterAlt(localctx, 21)
+                self.state = 138
+                self.getStmt()
+                pass
+            elif token in [41]:
+                self.enterOuterAlt(localctx, 22)
+                self.state = 139
+                self.putStmt()
+                pass
+            elif token in [10]:
+                self.enterOuterAlt(localctx, 23)
+                self.state = 140
                 self.endStmt()
                 pass
             else:
@@ -579,6 +878,16 @@ class BasicParser ( Parser ):
         def PRINT(self):
             return self.getToken(BasicParser.PRINT, 0)
 
+        def HASH(self):
+            return self.getToken(BasicParser.HASH, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(BasicParser.ExpressionContext,0)
+
+
+        def COMMA(self):
+            return self.getToken(BasicParser.COMMA, 0)
+
         def expressionList(self):
             return self.getTypedRuleContext(BasicParser.ExpressionListContext,0)
 
@@ -610,13 +919,25 @@ class BasicParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 89
+            self.state = 143
             self.match(BasicParser.PRINT)
-            self.state = 91
+            self.state = 148
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==63:
+                self.state = 144
+                self.match(BasicParser.HASH)
+                self.state = 145
+                self.expression()
+                self.state = 146
+                self.match(BasicParser.COMMA)
+
+
+            self.state = 151
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 38669385728) != 0):
-                self.state = 90
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 324395512612519936) != 0):
+                self.state = 150
                 self.expressionList()
 
 
@@ -682,22 +1003,22 @@ class BasicParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 93
+            self.state = 153
             self.expression()
-            self.state = 98
+            self.state = 158
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==38 or _la==39:
-                self.state = 94
+            while _la==61 or _la==62:
+                self.state = 154
                 _la = self._input.LA(1)
-                if not(_la==38 or _la==39):
+                if not(_la==61 or _la==62):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 95
+                self.state = 155
                 self.expression()
-                self.state = 100
+                self.state = 160
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -720,8 +1041,8 @@ class BasicParser ( Parser ):
         def LET(self):
             return self.getToken(BasicParser.LET, 0)
 
-        def variable(self):
-            return self.getTypedRuleContext(BasicParser.VariableContext,0)
+        def target(self):
+            return self.getTypedRuleContext(BasicParser.TargetContext,0)
 
 
         def ASSIGN(self):
@@ -757,13 +1078,13 @@ class BasicParser ( Parser ):
         self.enterRule(localctx, 12, self.RULE_letStmt)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 101
+            self.state = 161
             self.match(BasicParser.LET)
-            self.state = 102
-            self.variable()
-            self.state = 103
+            self.state = 162
+            self.target()
+            self.state = 163
             self.match(BasicParser.ASSIGN)
-            self.state = 104
+            self.state = 164
             self.expression()
         except RecognitionException as re:
             localctx.exception = re
@@ -834,53 +1155,53 @@ class BasicParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 106
+            self.state = 166
             self.match(BasicParser.IF)
-            self.state = 108
+            self.state = 168
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==2:
-                self.state = 107
+                self.state = 167
                 self.match(BasicParser.WS)
 
 
-            self.state = 110
+            self.state = 170
             self.condition()
-            self.state = 112
+            self.state = 172
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==2:
-                self.state = 111
+                self.state = 171
                 self.match(BasicParser.WS)
 
 
-            self.state = 114
+            self.state = 174
             self.match(BasicParser.THEN)
-            self.state = 116
+            self.state = 176
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==2:
-                self.state = 115
+                self.state = 175
                 self.match(BasicParser.WS)
 
 
-            self.state = 118
+            self.state = 178
             self.statement()
-            self.state = 124
+            self.state = 184
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,13,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,14,self._ctx)
             if la_ == 1:
-                self.state = 119
+                self.state = 179
                 self.match(BasicParser.ELSE)
-                self.state = 121
+                self.state = 181
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==2:
-                    self.state = 120
+                    self.state = 180
                     self.match(BasicParser.WS)
 
 
-                self.state = 123
+                self.state = 183
                 self.statement()
 
 
@@ -933,9 +1254,9 @@ class BasicParser ( Parser ):
         self.enterRule(localctx, 16, self.RULE_gotoStmt)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 126
+            self.state = 186
             self.match(BasicParser.GOTO)
-            self.state = 127
+            self.state = 187
             self.targetLabel()
         except RecognitionException as re:
             localctx.exception = re
@@ -1003,25 +1324,25 @@ class BasicParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 129
+            self.state = 189
             self.match(BasicParser.FOR)
-            self.state = 130
+            self.state = 190
             self.variable()
-            self.state = 131
+            self.state = 191
             self.match(BasicParser.ASSIGN)
-            self.state = 132
+            self.state = 192
             self.expression()
-            self.state = 133
+            self.state = 193
             self.match(BasicParser.TO)
-            self.state = 134
+            self.state = 194
             self.expression()
-            self.state = 137
+            self.state = 197
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==14:
-                self.state = 135
+                self.state = 195
                 self.match(BasicParser.STEP)
-                self.state = 136
+                self.state = 196
                 self.expression()
 
 
@@ -1084,19 +1405,19 @@ class BasicParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 139
+            self.state = 199
             self.match(BasicParser.NEXT)
-            self.state = 140
+            self.state = 200
             self.variable()
-            self.state = 145
+            self.state = 205
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==38:
-                self.state = 141
+            while _la==61:
+                self.state = 201
                 self.match(BasicParser.COMMA)
-                self.state = 142
+                self.state = 202
                 self.variable()
-                self.state = 147
+                self.state = 207
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -1149,9 +1470,9 @@ class BasicParser ( Parser ):
         self.enterRule(localctx, 22, self.RULE_gosubStmt)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 148
+            self.state = 208
             self.match(BasicParser.GOSUB)
-            self.state = 149
+            self.state = 209
             self.targetLabel()
         except RecognitionException as re:
             localctx.exception = re
@@ -1198,7 +1519,7 @@ class BasicParser ( Parser ):
         self.enterRule(localctx, 24, self.RULE_returnStmt)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 151
+            self.state = 211
             self.match(BasicParser.RETURN)
         except RecognitionException as re:
             localctx.exception = re
@@ -1266,29 +1587,29 @@ class BasicParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 153
+            self.state = 213
             self.match(BasicParser.WHILE)
-            self.state = 154
+            self.state = 214
             self.condition()
-            self.state = 161
+            self.state = 221
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 7839522) != 0):
-                self.state = 156
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 56641600331554) != 0):
+                self.state = 216
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,16,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,17,self._ctx)
                 if la_ == 1:
-                    self.state = 155
+                    self.state = 215
                     self.lineContent()
 
 
-                self.state = 158
+                self.state = 218
                 self.match(BasicParser.NEWLINE)
-                self.state = 163
+                self.state = 223
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 164
+            self.state = 224
             self.match(BasicParser.WEND)
         except RecognitionException as re:
             localctx.exception = re
@@ -1309,15 +1630,19 @@ class BasicParser ( Parser ):
         def INPUT(self):
             return self.getToken(BasicParser.INPUT, 0)
 
-        def variable(self, i:int=None):
+        def target(self, i:int=None):
             if i is None:
-                return self.getTypedRuleContexts(BasicParser.VariableContext)
+                return self.getTypedRuleContexts(BasicParser.TargetContext)
             else:
-                return self.getTypedRuleContext(BasicParser.VariableContext,i)
+                return self.getTypedRuleContext(BasicParser.TargetContext,i)
 
 
-        def STRING(self):
-            return self.getToken(BasicParser.STRING, 0)
+        def HASH(self):
+            return self.getToken(BasicParser.HASH, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(BasicParser.ExpressionContext,0)
+
 
         def COMMA(self, i:int=None):
             if i is None:
@@ -1325,6 +1650,9 @@ class BasicParser ( Parser ):
             else:
                 return self.getToken(BasicParser.COMMA, i)
 
+        def STRING(self):
+            return self.getToken(BasicParser.STRING, 0)
+
         def getRuleIndex(self):
             return BasicParser.RULE_inputStmt
 
@@ -1352,29 +1680,40 @@ class BasicParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 166
+            self.state = 226
             self.match(BasicParser.INPUT)
-            self.state = 169
+            self.state = 233
             self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            if _la==23:
-                self.state = 167
+            token = self._input.LA(1)
+            if token in [63]:
+                self.state = 227
+                self.match(BasicParser.HASH)
+                self.state = 228
+                self.expression()
+                self.state = 229
+                self.match(BasicParser.COMMA)
+                pass
+            elif token in [46]:
+                self.state = 231
                 self.match(BasicParser.STRING)
-                self.state = 168
+                self.state = 232
                 self.match(BasicParser.COMMA)
-
-
-            self.state = 171
-            self.variable()
-            self.state = 176
+                pass
+            elif token in [44]:
+                pass
+            else:
+                pass
+            self.state = 235
+            self.target()
+            self.state = 240
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==38:
-                self.state = 172
+            while _la==61:
+                self.state = 236
                 self.match(BasicParser.COMMA)
-                self.state = 173
-                self.variable()
-                self.state = 178
+                self.state = 237
+                self.target()
+                self.state = 242
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -1387,53 +1726,91 @@ class BasicParser ( Parser ):
         return localctx
 
 
-    class TargetLabelContext(ParserRuleContext):
+    class OnStmtContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def ID(self):
-            return self.getToken(BasicParser.ID, 0)
+        def ON(self):
+            return self.getToken(BasicParser.ON, 0)
 
-        def NUMBER(self):
-            return self.getToken(BasicParser.NUMBER, 0)
+        def expression(self):
+            return self.getTypedRuleContext(BasicParser.ExpressionContext,0)
+
+
+        def targetLabel(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(BasicParser.TargetLabelContext)
+            else:
+                return self.getTypedRuleContext(BasicParser.TargetLabelContext,i)
+
+
+        def GOTO(self):
+            return self.getToken(BasicParser.GOTO, 0)
+
+        def GOSUB(self):
+            return self.getToken(BasicParser.GOSUB, 0)
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(BasicParser.COMMA)
+            else:
+                return self.getToken(BasicParser.COMMA, i)
 
         def getRuleIndex(self):
-            return BasicParser.RULE_targetLabel
+            return BasicParser.RULE_onStmt
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterTargetLabel" ):
-                listener.enterTargetLabel(self)
+            if hasattr( listener, "enterOnStmt" ):
+                listener.enterOnStmt(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitTargetLabel" ):
-                listener.exitTargetLabel(self)
+            if hasattr( listener, "exitOnStmt" ):
+                listener.exitOnStmt(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitTargetLabel" ):
-                return visitor.visitTargetLabel(self)
+            if hasattr( visitor, "visitOnStmt" ):
+                return visitor.visitOnStmt(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def targetLabel(self):
+    def onStmt(self):
 
-        localctx = BasicParser.TargetLabelContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 30, self.RULE_targetLabel)
+        localctx = BasicParser.OnStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 30, self.RULE_onStmt)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 179
+            self.state = 243
+            self.match(BasicParser.ON)
+            self.state = 244
+            self.expression()
+            self.state = 245
             _la = self._input.LA(1)
-            if not(_la==21 or _la==22):
+            if not(_la==11 or _la==16):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
+            self.state = 246
+            self.targetLabel()
+            self.state = 251
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==61:
+                self.state = 247
+                self.match(BasicParser.COMMA)
+                self.state = 248
+                self.targetLabel()
+                self.state = 253
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1443,44 +1820,101 @@ class BasicParser ( Parser ):
         return localctx
 
 
-    class EndStmtContext(ParserRuleContext):
+    class SelectStmtContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
+        def SELECT(self, i:int=None):
+            if i is None:
+                return self.getTokens(BasicParser.SELECT)
+            else:
+                return self.getToken(BasicParser.SELECT, i)
+
+        def CASE(self):
+            return self.getToken(BasicParser.CASE, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(BasicParser.ExpressionContext,0)
+
+
         def END(self):
             return self.getToken(BasicParser.END, 0)
 
+        def NEWLINE(self, i:int=None):
+            if i is None:
+                return self.getTokens(BasicParser.NEWLINE)
+            else:
+                return self.getToken(BasicParser.NEWLINE, i)
+
+        def caseClause(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(BasicParser.CaseClauseContext)
+            else:
+                return self.getTypedRuleContext(BasicParser.CaseClauseContext,i)
+
+
         def getRuleIndex(self):
-            return BasicParser.RULE_endStmt
+            return BasicParser.RULE_selectStmt
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterEndStmt" ):
-                listener.enterEndStmt(self)
+            if hasattr( listener, "enterSelectStmt" ):
+                listener.enterSelectStmt(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitEndStmt" ):
-                listener.exitEndStmt(self)
+            if hasattr( listener, "exitSelectStmt" ):
+                listener.exitSelectStmt(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitEndStmt" ):
-                return visitor.visitEndStmt(self)
+            if hasattr( visitor, "visitSelectStmt" ):
+                return visitor.visitSelectStmt(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def endStmt(self):
+    def selectStmt(self):
 
-        localctx = BasicParser.EndStmtContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 32, self.RULE_endStmt)
+        localctx = BasicParser.SelectStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 32, self.RULE_selectStmt)
+        self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 181
+            self.state = 254
+            self.match(BasicParser.SELECT)
+            self.state = 255
+            self.match(BasicParser.CASE)
+            self.state = 256
+            self.expression()
+            self.state = 258 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 257
+                self.match(BasicParser.NEWLINE)
+                self.state = 260 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not (_la==1):
+                    break
+
+            self.state = 265
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==23:
+                self.state = 262
+                self.caseClause()
+                self.state = 267
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 268
             self.match(BasicParser.END)
+            self.state = 269
+            self.match(BasicParser.SELECT)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1490,57 +1924,1963 @@ class BasicParser ( Parser ):
         return localctx
 
 
-    class VariableContext(ParserRuleContext):
+    class CaseClauseContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def ID(self):
-            return self.getToken(BasicParser.ID, 0)
+        def CASE(self):
+            return self.getToken(BasicParser.CASE, 0)
+
+        def ELSE(self):
+            return self.getToken(BasicParser.ELSE, 0)
+
+        def caseTest(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(BasicParser.CaseTestContext)
+            else:
+                return self.getTypedRuleContext(BasicParser.CaseTestContext,i)
+
+
+        def NEWLINE(self, i:int=None):
+            if i is None:
+                return self.getTokens(BasicParser.NEWLINE)
+            else:
+                return self.getToken(BasicParser.NEWLINE, i)
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(BasicParser.COMMA)
+            else:
+                return self.getToken(BasicParser.COMMA, i)
+
+        def lineContent(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(BasicParser.LineContentContext)
+            else:
+                return self.getTypedRuleContext(BasicParser.LineContentContext,i)
 
-        def TYPE_SUFFIX(self):
-            return self.getToken(BasicParser.TYPE_SUFFIX, 0)
 
         def getRuleIndex(self):
-            return BasicParser.RULE_variable
+            return BasicParser.RULE_caseClause
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterVariable" ):
-                listener.enterVariable(self)
+            if hasattr( listener, "enterCaseClause" ):
+                listener.enterCaseClause(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitVariable" ):
-                listener.exitVariable(self)
+            if hasattr( listener, "exitCaseClause" ):
+                listener.exitCaseClause(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitVariable" ):
-                return visitor.visitVariable(self)
+            if hasattr( visitor, "visitCaseClause" ):
+                return visitor.visitCaseClause(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def variable(self):
+    def caseClause(self):
 
-        localctx = BasicParser.VariableContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 34, self.RULE_variable)
+        localctx = BasicParser.CaseClauseContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 34, self.RULE_caseClause)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 183
-            self.match(BasicParser.ID)
-            self.state = 185
+            self.state = 271
+            self.match(BasicParser.CASE)
+            self.state = 281
             self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            if _la==40:
-                self.state = 184
-                self.match(BasicParser.TYPE_SUFFIX)
-
+            token = self._input.LA(1)
+            if token in [7]:
+                self.state = 272
+                self.match(BasicParser.ELSE)
+                pass
+            elif token in [24, 42, 43, 44, 45, 46, 55, 58]:
+                self.state = 273
+                self.caseTest()
+                self.state = 278
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==61:
+                    self.state = 274
+                    self.match(BasicParser.COMMA)
+                    self.state = 275
+                    self.caseTest()
+                    self.state = 280
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
 
-        except RecognitionException as re:
+                pass
+            else:
+                raise NoViableAltException(self)
+
+            self.state = 289
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,27,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    self.state = 284
+                    self._errHandler.sync(self)
+                    la_ = self._interp.adaptivePredict(self._input,26,self._ctx)
+                    if la_ == 1:
+                        self.state = 283
+                        self.lineContent()
+
+
+                    self.state = 286
+                    self.match(BasicParser.NEWLINE) 
+                self.state = 291
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,27,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class CaseTestContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.op = None # Token
+
+        def IS(self):
+            return self.getToken(BasicParser.IS, 0)
+
+        def expression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(BasicParser.ExpressionContext)
+            else:
+                return self.getTypedRuleContext(BasicParser.ExpressionContext,i)
+
+
+        def ASSIGN(self):
+            return self.getToken(BasicParser.ASSIGN, 0)
+
+        def LT(self):
+            return self.getToken(BasicParser.LT, 0)
+
+        def GT(self):
+            return self.getToken(BasicParser.GT, 0)
+
+        def LTE(self):
+            return self.getToken(BasicParser.LTE, 0)
+
+        def GTE(self):
+            return self.getToken(BasicParser.GTE, 0)
+
+        def NEQ(self):
+            return self.getToken(BasicParser.NEQ, 0)
+
+        def TO(self):
+            return self.getToken(BasicParser.TO, 0)
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_caseTest
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterCaseTest" ):
+                listener.enterCaseTest(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitCaseTest" ):
+                listener.exitCaseTest(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCaseTest" ):
+                return visitor.visitCaseTest(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def caseTest(self):
+
+        localctx = BasicParser.CaseTestContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 36, self.RULE_caseTest)
+        self._la = 0 # Token type
+        try:
+            self.state = 300
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [24]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 292
+                self.match(BasicParser.IS)
+                self.state = 293
+                localctx.op = self._input.LT(1)
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 17592186044416000) != 0)):
+                    localctx.op = self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 294
+                self.expression()
+                pass
+            elif token in [42, 43, 44, 45, 46, 55, 58]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 295
+                self.expression()
+                self.state = 298
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==13:
+                    self.state = 296
+                    self.match(BasicParser.TO)
+                    self.state = 297
+                    self.expression()
+
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DimStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def DIM(self):
+            return self.getToken(BasicParser.DIM, 0)
+
+        def arrayElement(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(BasicParser.ArrayElementContext)
+            else:
+                return self.getTypedRuleContext(BasicParser.ArrayElementContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(BasicParser.COMMA)
+            else:
+                return self.getToken(BasicParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_dimStmt
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterDimStmt" ):
+                listener.enterDimStmt(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitDimStmt" ):
+                listener.exitDimStmt(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDimStmt" ):
+                return visitor.visitDimStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def dimStmt(self):
+
+        localctx = BasicParser.DimStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 38, self.RULE_dimStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 302
+            self.match(BasicParser.DIM)
+            self.state = 303
+            self.arrayElement()
+            self.state = 308
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==61:
+                self.state = 304
+                self.match(BasicParser.COMMA)
+                self.state = 305
+                self.arrayElement()
+                self.state = 310
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class MatStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def MAT(self):
+            return self.getToken(BasicParser.MAT, 0)
+
+        def variable(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(BasicParser.VariableContext)
+            else:
+                return self.getTypedRuleContext(BasicParser.VariableContext,i)
+
+
+        def ASSIGN(self):
+            return self.getToken(BasicParser.ASSIGN, 0)
+
+        def matExpr(self):
+            return self.getTypedRuleContext(BasicParser.MatExprContext,0)
+
+
+        def READ(self):
+            return self.getToken(BasicParser.READ, 0)
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(BasicParser.COMMA)
+            else:
+                return self.getToken(BasicParser.COMMA, i)
+
+        def PRINT(self):
+            return self.getToken(BasicParser.PRINT, 0)
+
+        def SEMICOLON(self, i:int=None):
+            if i is None:
+                return self.getTokens(BasicParser.SEMICOLON)
+            else:
+                return self.getToken(BasicParser.SEMICOLON, i)
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_matStmt
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterMatStmt" ):
+                listener.enterMatStmt(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitMatStmt" ):
+                listener.exitMatStmt(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMatStmt" ):
+                return visitor.visitMatStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def matStmt(self):
+
+        localctx = BasicParser.MatStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 40, self.RULE_matStmt)
+        self._la = 0 # Token type
+        try:
+            self.state = 339
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,34,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 311
+                self.match(BasicParser.MAT)
+                self.state = 312
+                self.variable()
+                self.state = 313
+                self.match(BasicParser.ASSIGN)
+                self.state = 314
+                self.matExpr()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 316
+                self.match(BasicParser.MAT)
+                self.state = 317
+                self.match(BasicParser.READ)
+                self.state = 318
+                self.variable()
+                self.state = 323
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==61:
+                    self.state = 319
+                    self.match(BasicParser.COMMA)
+                    self.state = 320
+                    self.variable()
+                    self.state = 325
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 326
+                self.match(BasicParser.MAT)
+                self.state = 327
+                self.match(BasicParser.PRINT)
+                self.state = 328
+                self.variable()
+                self.state = 333
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,32,self._ctx)
+                while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                    if _alt==1:
+                        self.state = 329
+                        _la = self._input.LA(1)
+                        if not(_la==61 or _la==62):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 330
+                        self.variable() 
+                    self.state = 335
+                    self._errHandler.sync(self)
+                    _alt = self._interp.adaptivePredict(self._input,32,self._ctx)
+
+                self.state = 337
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==62:
+                    self.state = 336
+                    self.match(BasicParser.SEMICOLON)
+
+
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class MatExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.op = None # Token
+
+        def TRN(self):
+            return self.getToken(BasicParser.TRN, 0)
+
+        def LPAREN(self):
+            return self.getToken(BasicParser.LPAREN, 0)
+
+        def variable(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(BasicParser.VariableContext)
+            else:
+                return self.getTypedRuleContext(BasicParser.VariableContext,i)
+
+
+        def RPAREN(self):
+            return self.getToken(BasicParser.RPAREN, 0)
+
+        def INV(self):
+            return self.getToken(BasicParser.INV, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(BasicParser.ExpressionContext,0)
+
+
+        def MUL(self):
+            return self.getToken(BasicParser.MUL, 0)
+
+        def PLUS(self):
+            return self.getToken(BasicParser.PLUS, 0)
+
+        def MINUS(self):
+            return self.getToken(BasicParser.MINUS, 0)
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_matExpr
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterMatExpr" ):
+                listener.enterMatExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitMatExpr" ):
+                listener.exitMatExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMatExpr" ):
+                return visitor.visitMatExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def matExpr(self):
+
+        localctx = BasicParser.MatExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 42, self.RULE_matExpr)
+        self._la = 0 # Token type
+        try:
+            self.state = 362
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [27]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 341
+                self.match(BasicParser.TRN)
+                self.state = 342
+                self.match(BasicParser.LPAREN)
+                self.state = 343
+                self.variable()
+                self.state = 344
+                self.match(BasicParser.RPAREN)
+                pass
+            elif token in [28]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 346
+                self.match(BasicParser.INV)
+                self.state = 347
+                self.match(BasicParser.LPAREN)
+                self.state = 348
+                self.variable()
+                self.state = 349
+                self.match(BasicParser.RPAREN)
+                pass
+            elif token in [58]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 351
+                self.match(BasicParser.LPAREN)
+                self.state = 352
+                self.expression()
+                self.state = 353
+                self.match(BasicParser.RPAREN)
+                self.state = 354
+                self.match(BasicParser.MUL)
+                self.state = 355
+                self.variable()
+                pass
+            elif token in [44]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 357
+                self.variable()
+                self.state = 360
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 126100789566373888) != 0):
+                    self.state = 358
+                    localctx.op = self._input.LT(1)
+                    _la = self._input.LA(1)
+                    if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 126100789566373888) != 0)):
+                        localctx.op = self._errHandler.recoverInline(self)
+                    else:
+                        self._errHandler.reportMatch(self)
+                        self.consume()
+                    self.state = 359
+                    self.variable()
+
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DataStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def DATA(self):
+            return self.getToken(BasicParser.DATA, 0)
+
+        def dataItem(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(BasicParser.DataItemContext)
+            else:
+                return self.getTypedRuleContext(BasicParser.DataItemContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(BasicParser.COMMA)
+            else:
+                return self.getToken(BasicParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_dataStmt
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterDataStmt" ):
+                listener.enterDataStmt(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitDataStmt" ):
+                listener.exitDataStmt(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDataStmt" ):
+                return visitor.visitDataStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def dataStmt(self):
+
+        localctx = BasicParser.DataStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 44, self.RULE_dataStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 364
+            self.match(BasicParser.DATA)
+            self.state = 365
+            self.dataItem()
+            self.state = 370
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==61:
+                self.state = 366
+                self.match(BasicParser.COMMA)
+                self.state = 367
+                self.dataItem()
+                self.state = 372
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DataItemContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def NUMBER(self):
+            return self.getToken(BasicParser.NUMBER, 0)
+
+        def MINUS(self):
+            return self.getToken(BasicParser.MINUS, 0)
+
+        def STRING(self):
+            return self.getToken(BasicParser.STRING, 0)
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_dataItem
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterDataItem" ):
+                listener.enterDataItem(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitDataItem" ):
+                listener.exitDataItem(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDataItem" ):
+                return visitor.visitDataItem(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def dataItem(self):
+
+        localctx = BasicParser.DataItemContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 46, self.RULE_dataItem)
+        self._la = 0 # Token type
+        try:
+            self.state = 378
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [45, 55]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 374
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==55:
+                    self.state = 373
+                    self.match(BasicParser.MINUS)
+
+
+                self.state = 376
+                self.match(BasicParser.NUMBER)
+                pass
+            elif token in [46]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 377
+                self.match(BasicParser.STRING)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReadStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def READ(self):
+            return self.getToken(BasicParser.READ, 0)
+
+        def target(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(BasicParser.TargetContext)
+            else:
+                return self.getTypedRuleContext(BasicParser.TargetContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(BasicParser.COMMA)
+            else:
+                return self.getToken(BasicParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_readStmt
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterReadStmt" ):
+                listener.enterReadStmt(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitReadStmt" ):
+                listener.exitReadStmt(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReadStmt" ):
+                return visitor.visitReadStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def readStmt(self):
+
+        localctx = BasicParser.ReadStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 48, self.RULE_readStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 380
+            self.match(BasicParser.READ)
+            self.state = 381
+            self.target()
+            self.state = 386
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==61:
+                self.state = 382
+                self.match(BasicParser.COMMA)
+                self.state = 383
+                self.target()
+                self.state = 388
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DefStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def DEF(self):
+            return self.getToken(BasicParser.DEF, 0)
+
+        def FN_NAME(self):
+            return self.getToken(BasicParser.FN_NAME, 0)
+
+        def ASSIGN(self):
+            return self.getToken(BasicParser.ASSIGN, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(BasicParser.ExpressionContext,0)
+
+
+        def TYPE_SUFFIX(self):
+            return self.getToken(BasicParser.TYPE_SUFFIX, 0)
+
+        def LPAREN(self):
+            return self.getToken(BasicParser.LPAREN, 0)
+
+        def variable(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(BasicParser.VariableContext)
+            else:
+                return self.getTypedRuleContext(BasicParser.VariableContext,i)
+
+
+        def RPAREN(self):
+            return self.getToken(BasicParser.RPAREN, 0)
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(BasicParser.COMMA)
+            else:
+                return self.getToken(BasicParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_defStmt
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterDefStmt" ):
+                listener.enterDefStmt(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitDefStmt" ):
+                listener.exitDefStmt(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDefStmt" ):
+                return visitor.visitDefStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def defStmt(self):
+
+        localctx = BasicParser.DefStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 50, self.RULE_defStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 389
+            self.match(BasicParser.DEF)
+            self.state = 390
+            self.match(BasicParser.FN_NAME)
+            self.state = 392
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==64:
+                self.state = 391
+                self.match(BasicParser.TYPE_SUFFIX)
+
+
+            self.state = 405
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==58:
+                self.state = 394
+                self.match(BasicParser.LPAREN)
+                self.state = 395
+                self.variable()
+                self.state = 400
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==61:
+                    self.state = 396
+                    self.match(BasicParser.COMMA)
+                    self.state = 397
+                    self.variable()
+                    self.state = 402
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                self.state = 403
+                self.match(BasicParser.RPAREN)
+
+
+            self.state = 407
+            self.match(BasicParser.ASSIGN)
+            self.state = 408
+            self.expression()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class OpenStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.fileMode = None # Token
+
+        def OPEN(self):
+            return self.getToken(BasicParser.OPEN, 0)
+
+        def expression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(BasicParser.ExpressionContext)
+            else:
+                return self.getTypedRuleContext(BasicParser.ExpressionContext,i)
+
+
+        def AS(self):
+            return self.getToken(BasicParser.AS, 0)
+
+        def FOR(self):
+            return self.getToken(BasicParser.FOR, 0)
+
+        def HASH(self):
+            return self.getToken(BasicParser.HASH, 0)
+
+        def LEN(self):
+            return self.getToken(BasicParser.LEN, 0)
+
+        def ASSIGN(self):
+            return self.getToken(BasicParser.ASSIGN, 0)
+
+        def INPUT(self):
+            return self.getToken(BasicParser.INPUT, 0)
+
+        def OUTPUT(self):
+            return self.getToken(BasicParser.OUTPUT, 0)
+
+        def APPEND(self):
+            return self.getToken(BasicParser.APPEND, 0)
+
+        def RANDOM(self):
+            return self.getToken(BasicParser.RANDOM, 0)
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_openStmt
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterOpenStmt" ):
+                listener.enterOpenStmt(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitOpenStmt" ):
+                listener.exitOpenStmt(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitOpenStmt" ):
+                return visitor.visitOpenStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def openStmt(self):
+
+        localctx = BasicParser.OpenStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 52, self.RULE_openStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 410
+            self.match(BasicParser.OPEN)
+            self.state = 411
+            self.expression()
+            self.state = 414
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==12:
+                self.state = 412
+                self.match(BasicParser.FOR)
+                self.state = 413
+                localctx.fileMode = self._input.LT(1)
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 240519217152) != 0)):
+                    localctx.fileMode = self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+
+
+            self.state = 416
+            self.match(BasicParser.AS)
+            self.state = 418
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==63:
+                self.state = 417
+                self.match(BasicParser.HASH)
+
+
+            self.state = 420
+            self.expression()
+            self.state = 424
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==38:
+                self.state = 421
+                self.match(BasicParser.LEN)
+                self.state = 422
+                self.match(BasicParser.ASSIGN)
+                self.state = 423
+                self.expression()
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class CloseStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def CLOSE(self):
+            return self.getToken(BasicParser.CLOSE, 0)
+
+        def expression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(BasicParser.ExpressionContext)
+            else:
+                return self.getTypedRuleContext(BasicParser.ExpressionContext,i)
+
+
+        def HASH(self, i:int=None):
+            if i is None:
+                return self.getTokens(BasicParser.HASH)
+            else:
+                return self.getToken(BasicParser.HASH, i)
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(BasicParser.COMMA)
+            else:
+                return self.getToken(BasicParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_closeStmt
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterCloseStmt" ):
+                listener.enterCloseStmt(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitCloseStmt" ):
+                listener.exitCloseStmt(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCloseStmt" ):
+                return visitor.visitCloseStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def closeStmt(self):
+
+        localctx = BasicParser.CloseStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 54, self.RULE_closeStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 426
+            self.match(BasicParser.CLOSE)
+            self.state = 441
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & -8898976524242255872) != 0):
+                self.state = 428
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==63:
+                    self.state = 427
+                    self.match(BasicParser.HASH)
+
+
+                self.state = 430
+                self.expression()
+                self.state = 438
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==61:
+                    self.state = 431
+                    self.match(BasicParser.COMMA)
+                    self.state = 433
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if _la==63:
+                        self.state = 432
+                        self.match(BasicParser.HASH)
+
+
+                    self.state = 435
+                    self.expression()
+                    self.state = 440
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class FieldStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def FIELD(self):
+            return self.getToken(BasicParser.FIELD, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(BasicParser.ExpressionContext,0)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(BasicParser.COMMA)
+            else:
+                return self.getToken(BasicParser.COMMA, i)
+
+        def fieldItem(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(BasicParser.FieldItemContext)
+            else:
+                return self.getTypedRuleContext(BasicParser.FieldItemContext,i)
+
+
+        def HASH(self):
+            return self.getToken(BasicParser.HASH, 0)
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_fieldStmt
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterFieldStmt" ):
+                listener.enterFieldStmt(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitFieldStmt" ):
+                listener.exitFieldStmt(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFieldStmt" ):
+                return visitor.visitFieldStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def fieldStmt(self):
+
+        localctx = BasicParser.FieldStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 56, self.RULE_fieldStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 443
+            self.match(BasicParser.FIELD)
+            self.state = 445
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==63:
+                self.state = 444
+                self.match(BasicParser.HASH)
+
+
+            self.state = 447
+            self.expression()
+            self.state = 448
+            self.match(BasicParser.COMMA)
+            self.state = 449
+            self.fieldItem()
+            self.state = 454
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==61:
+                self.state = 450
+                self.match(BasicParser.COMMA)
+                self.state = 451
+                self.fieldItem()
+                self.state = 456
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class FieldItemContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def NUMBER(self):
+            return self.getToken(BasicParser.NUMBER, 0)
+
+        def AS(self):
+            return self.getToken(BasicParser.AS, 0)
+
+        def variable(self):
+            return self.getTypedRuleContext(BasicParser.VariableContext,0)
+
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_fieldItem
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterFieldItem" ):
+                listener.enterFieldItem(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitFieldItem" ):
+                listener.exitFieldItem(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFieldItem" ):
+                return visitor.visitFieldItem(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def fieldItem(self):
+
+        localctx = BasicParser.FieldItemContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 58, self.RULE_fieldItem)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 457
+            self.match(BasicParser.NUMBER)
+            self.state = 458
+            self.match(BasicParser.AS)
+            self.state = 459
+            self.variable()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class GetStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def GET(self):
+            return self.getToken(BasicParser.GET, 0)
+
+        def expression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(BasicParser.ExpressionContext)
+            else:
+                return self.getTypedRuleContext(BasicParser.ExpressionContext,i)
+
+
+        def HASH(self):
+            return self.getToken(BasicParser.HASH, 0)
+
+        def COMMA(self):
+            return self.getToken(BasicParser.COMMA, 0)
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_getStmt
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterGetStmt" ):
+                listener.enterGetStmt(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitGetStmt" ):
+                listener.exitGetStmt(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitGetStmt" ):
+                return visitor.visitGetStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def getStmt(self):
+
+        localctx = BasicParser.GetStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 60, self.RULE_getStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 461
+            self.match(BasicParser.GET)
+            self.state = 463
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==63:
+                self.state = 462
+                self.match(BasicParser.HASH)
+
+
+            self.state = 465
+            self.expression()
+            self.state = 468
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==61:
+                self.state = 466
+                self.match(BasicParser.COMMA)
+                self.state = 467
+                self.expression()
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PutStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def PUT(self):
+            return self.getToken(BasicParser.PUT, 0)
+
+        def expression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(BasicParser.ExpressionContext)
+            else:
+                return self.getTypedRuleContext(BasicParser.ExpressionContext,i)
+
+
+        def HASH(self):
+            return self.getToken(BasicParser.HASH, 0)
+
+        def COMMA(self):
+            return self.getToken(BasicParser.COMMA, 0)
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_putStmt
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterPutStmt" ):
+                listener.enterPutStmt(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitPutStmt" ):
+                listener.exitPutStmt(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPutStmt" ):
+                return visitor.visitPutStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def putStmt(self):
+
+        localctx = BasicParser.PutStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 62, self.RULE_putStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 470
+            self.match(BasicParser.PUT)
+            self.state = 472
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==63:
+                self.state = 471
+                self.match(BasicParser.HASH)
+
+
+            self.state = 474
+            self.expression()
+            self.state = 477
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==61:
+                self.state = 475
+                self.match(BasicParser.COMMA)
+                self.state = 476
+                self.expression()
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class TargetLabelContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(BasicParser.ID, 0)
+
+        def NUMBER(self):
+            return self.getToken(BasicParser.NUMBER, 0)
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_targetLabel
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterTargetLabel" ):
+                listener.enterTargetLabel(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitTargetLabel" ):
+                listener.exitTargetLabel(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitTargetLabel" ):
+                return visitor.visitTargetLabel(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def targetLabel(self):
+
+        localctx = BasicParser.TargetLabelContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 64, self.RULE_targetLabel)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 479
+            _la = self._input.LA(1)
+            if not(_la==44 or _la==45):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class EndStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def END(self):
+            return self.getToken(BasicParser.END, 0)
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_endStmt
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterEndStmt" ):
+                listener.enterEndStmt(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitEndStmt" ):
+                listener.exitEndStmt(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEndStmt" ):
+                return visitor.visitEndStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def endStmt(self):
+
+        localctx = BasicParser.EndStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 66, self.RULE_endStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 481
+            self.match(BasicParser.END)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VariableContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(BasicParser.ID, 0)
+
+        def TYPE_SUFFIX(self):
+            return self.getToken(BasicParser.TYPE_SUFFIX, 0)
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_variable
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterVariable" ):
+                listener.enterVariable(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitVariable" ):
+                listener.exitVariable(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVariable" ):
+                return visitor.visitVariable(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def variable(self):
+
+        localctx = BasicParser.VariableContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 68, self.RULE_variable)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 483
+            self.match(BasicParser.ID)
+            self.state = 485
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==64:
+                self.state = 484
+                self.match(BasicParser.TYPE_SUFFIX)
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ArrayElementContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def variable(self):
+            return self.getTypedRuleContext(BasicParser.VariableContext,0)
+
+
+        def LPAREN(self):
+            return self.getToken(BasicParser.LPAREN, 0)
+
+        def expression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(BasicParser.ExpressionContext)
+            else:
+                return self.getTypedRuleContext(BasicParser.ExpressionContext,i)
+
+
+        def RPAREN(self):
+            return self.getToken(BasicParser.RPAREN, 0)
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(BasicParser.COMMA)
+            else:
+                return self.getToken(BasicParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_arrayElement
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterArrayElement" ):
+                listener.enterArrayElement(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitArrayElement" ):
+                listener.exitArrayElement(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArrayElement" ):
+                return visitor.visitArrayElement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def arrayElement(self):
+
+        localctx = BasicParser.ArrayElementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 70, self.RULE_arrayElement)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 487
+            self.variable()
+            self.state = 488
+            self.match(BasicParser.LPAREN)
+            self.state = 489
+            self.expression()
+            self.state = 494
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==61:
+                self.state = 490
+                self.match(BasicParser.COMMA)
+                self.state = 491
+                self.expression()
+                self.state = 496
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 497
+            self.match(BasicParser.RPAREN)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class TargetContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def arrayElement(self):
+            return self.getTypedRuleContext(BasicParser.ArrayElementContext,0)
+
+
+        def variable(self):
+            return self.getTypedRuleContext(BasicParser.VariableContext,0)
+
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_target
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterTarget" ):
+                listener.enterTarget(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitTarget" ):
+                listener.exitTarget(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitTarget" ):
+                return visitor.visitTarget(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def target(self):
+
+        localctx = BasicParser.TargetContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 72, self.RULE_target)
+        try:
+            self.state = 501
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,59,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 499
+                self.arrayElement()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 500
+                self.variable()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class FunctionCallContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def BUILTIN(self):
+            return self.getToken(BasicParser.BUILTIN, 0)
+
+        def LPAREN(self):
+            return self.getToken(BasicParser.LPAREN, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(BasicParser.ExpressionContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(BasicParser.RPAREN, 0)
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_functionCall
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterFunctionCall" ):
+                listener.enterFunctionCall(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitFunctionCall" ):
+                listener.exitFunctionCall(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFunctionCall" ):
+                return visitor.visitFunctionCall(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def functionCall(self):
+
+        localctx = BasicParser.FunctionCallContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 74, self.RULE_functionCall)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 503
+            self.match(BasicParser.BUILTIN)
+            self.state = 508
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==58:
+                self.state = 504
+                self.match(BasicParser.LPAREN)
+                self.state = 505
+                self.expression()
+                self.state = 506
+                self.match(BasicParser.RPAREN)
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class UserFunctionCallContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def FN_NAME(self):
+            return self.getToken(BasicParser.FN_NAME, 0)
+
+        def TYPE_SUFFIX(self):
+            return self.getToken(BasicParser.TYPE_SUFFIX, 0)
+
+        def LPAREN(self):
+            return self.getToken(BasicParser.LPAREN, 0)
+
+        def expression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(BasicParser.ExpressionContext)
+            else:
+                return self.getTypedRuleContext(BasicParser.ExpressionContext,i)
+
+
+        def RPAREN(self):
+            return self.getToken(BasicParser.RPAREN, 0)
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(BasicParser.COMMA)
+            else:
+                return self.getToken(BasicParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return BasicParser.RULE_userFunctionCall
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterUserFunctionCall" ):
+                listener.enterUserFunctionCall(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitUserFunctionCall" ):
+                listener.exitUserFunctionCall(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitUserFunctionCall" ):
+                return visitor.visitUserFunctionCall(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def userFunctionCall(self):
+
+        localctx = BasicParser.UserFunctionCallContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 76, self.RULE_userFunctionCall)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 510
+            self.match(BasicParser.FN_NAME)
+            self.state = 512
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==64:
+                self.state = 511
+                self.match(BasicParser.TYPE_SUFFIX)
+
+
+            self.state = 525
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==58:
+                self.state = 514
+                self.match(BasicParser.LPAREN)
+                self.state = 515
+                self.expression()
+                self.state = 520
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==61:
+                    self.state = 516
+                    self.match(BasicParser.COMMA)
+                    self.state = 517
+                    self.expression()
+                    self.state = 522
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                self.state = 523
+                self.match(BasicParser.RPAREN)
+
+
+        except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
             self._errHandler.recover(self, re)
@@ -1583,10 +3923,10 @@ class BasicParser ( Parser ):
     def condition(self):
 
         localctx = BasicParser.ConditionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 36, self.RULE_condition)
+        self.enterRule(localctx, 78, self.RULE_condition)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 187
+            self.state = 527
             self.expression()
         except RecognitionException as re:
             localctx.exception = re
@@ -1631,10 +3971,10 @@ class BasicParser ( Parser ):
     def expression(self):
 
         localctx = BasicParser.ExpressionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 38, self.RULE_expression)
+        self.enterRule(localctx, 80, self.RULE_expression)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 189
+            self.state = 529
             self.comparisonExpr()
         except RecognitionException as re:
             localctx.exception = re
@@ -1703,25 +4043,25 @@ class BasicParser ( Parser ):
     def comparisonExpr(self):
 
         localctx = BasicParser.ComparisonExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 40, self.RULE_comparisonExpr)
+        self.enterRule(localctx, 82, self.RULE_comparisonExpr)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 191
+            self.state = 531
             localctx.left = self.additiveExpr()
-            self.state = 194
+            self.state = 534
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 2113929216) != 0):
-                self.state = 192
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 17732923532771328) != 0):
+                self.state = 532
                 localctx.op = self._input.LT(1)
                 _la = self._input.LA(1)
-                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 2113929216) != 0)):
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 17732923532771328) != 0)):
                     localctx.op = self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 193
+                self.state = 533
                 localctx.right = self.additiveExpr()
 
 
@@ -1786,27 +4126,27 @@ class BasicParser ( Parser ):
     def additiveExpr(self):
 
         localctx = BasicParser.AdditiveExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 42, self.RULE_additiveExpr)
+        self.enterRule(localctx, 84, self.RULE_additiveExpr)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 196
+            self.state = 536
             localctx.left = self.multiplicativeExpr()
-            self.state = 201
+            self.state = 541
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==31 or _la==32:
-                self.state = 197
+            while _la==54 or _la==55:
+                self.state = 537
                 localctx.op = self._input.LT(1)
                 _la = self._input.LA(1)
-                if not(_la==31 or _la==32):
+                if not(_la==54 or _la==55):
                     localctx.op = self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 198
+                self.state = 538
                 localctx.right = self.multiplicativeExpr()
-                self.state = 203
+                self.state = 543
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -1871,27 +4211,27 @@ class BasicParser ( Parser ):
     def multiplicativeExpr(self):
 
         localctx = BasicParser.MultiplicativeExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 44, self.RULE_multiplicativeExpr)
+        self.enterRule(localctx, 86, self.RULE_multiplicativeExpr)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 204
+            self.state = 544
             localctx.left = self.unaryExpr()
-            self.state = 209
+            self.state = 549
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==33 or _la==34:
-                self.state = 205
+            while _la==56 or _la==57:
+                self.state = 545
                 localctx.op = self._input.LT(1)
                 _la = self._input.LA(1)
-                if not(_la==33 or _la==34):
+                if not(_la==56 or _la==57):
                     localctx.op = self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 206
+                self.state = 546
                 localctx.right = self.unaryExpr()
-                self.state = 211
+                self.state = 551
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -1941,21 +4281,21 @@ class BasicParser ( Parser ):
     def unaryExpr(self):
 
         localctx = BasicParser.UnaryExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 46, self.RULE_unaryExpr)
+        self.enterRule(localctx, 88, self.RULE_unaryExpr)
         try:
-            self.state = 215
+            self.state = 555
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [32]:
+            if token in [55]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 212
+                self.state = 552
                 self.match(BasicParser.MINUS)
-                self.state = 213
+                self.state = 553
                 self.atom()
                 pass
-            elif token in [21, 22, 23, 35]:
+            elif token in [42, 43, 44, 45, 46, 58]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 214
+                self.state = 554
                 self.atom()
                 pass
             else:
@@ -1983,6 +4323,18 @@ class BasicParser ( Parser ):
         def STRING(self):
             return self.getToken(BasicParser.STRING, 0)
 
+        def functionCall(self):
+            return self.getTypedRuleContext(BasicParser.FunctionCallContext,0)
+
+
+        def userFunctionCall(self):
+            return self.getTypedRuleContext(BasicParser.UserFunctionCallContext,0)
+
+
+        def arrayElement(self):
+            return self.getTypedRuleContext(BasicParser.ArrayElementContext,0)
+
+
         def variable(self):
             return self.getTypedRuleContext(BasicParser.VariableContext,0)
 
@@ -2020,37 +4372,57 @@ class BasicParser ( Parser ):
     def atom(self):
 
         localctx = BasicParser.AtomContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 48, self.RULE_atom)
+        self.enterRule(localctx, 90, self.RULE_atom)
         try:
-            self.state = 224
+            self.state = 567
             self._errHandler.sync(self)
-            token = self._input.LA(1)
-            if token in [22]:
+            la_ = self._interp.adaptivePredict(self._input,68,self._ctx)
+            if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 217
+                self.state = 557
                 self.match(BasicParser.NUMBER)
                 pass
-            elif token in [23]:
+
+            elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 218
+                self.state = 558
                 self.match(BasicParser.STRING)
                 pass
-            elif token in [21]:
+
+            elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 219
-                self.variable()
+                self.state = 559
+                self.functionCall()
                 pass
-            elif token in [35]:
+
+            elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 220
+                self.state = 560
+                self.userFunctionCall()
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 561
+                self.arrayElement()
+                pass
+
+            elif la_ == 6:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 562
+                self.variable()
+                pass
+
+            elif la_ == 7:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 563
                 self.match(BasicParser.LPAREN)
-                self.state = 221
+                self.state = 564
                 self.expression()
-                self.state = 222
+                self.state = 565
                 self.match(BasicParser.RPAREN)
                 pass
-            else:
-                raise NoViableAltException(self)
+
 
         except RecognitionException as re:
             localctx.exception = re
@@ -84,6 +84,91 @@ class BasicVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by BasicParser#onStmt.
+    def visitOnStmt(self, ctx:BasicParser.OnStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by BasicParser#selectStmt.
+    def visitSelectStmt(self, ctx:BasicParser.SelectStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by BasicParser#caseClause.
+    def visitCaseClause(self, ctx:BasicParser.CaseClauseContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by BasicParser#caseTest.
+    def visitCaseTest(self, ctx:BasicParser.CaseTestContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by BasicParser#dimStmt.
+    def visitDimStmt(self, ctx:BasicParser.DimStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by BasicParser#matStmt.
+    def visitMatStmt(self, ctx:BasicParser.MatStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by BasicParser#matExpr.
+    def visitMatExpr(self, ctx:BasicParser.MatExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by BasicParser#dataStmt.
+    def visitDataStmt(self, ctx:BasicParser.DataStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by BasicParser#dataItem.
+    def visitDataItem(self, ctx:BasicParser.DataItemContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by BasicParser#readStmt.
+    def visitReadStmt(self, ctx:BasicParser.ReadStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by BasicParser#defStmt.
+    def visitDefStmt(self, ctx:BasicParser.DefStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by BasicParser#openStmt.
+    def visitOpenStmt(self, ctx:BasicParser.OpenStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by BasicParser#closeStmt.
+    def visitCloseStmt(self, ctx:BasicParser.CloseStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by BasicParser#fieldStmt.
+    def visitFieldStmt(self, ctx:BasicParser.FieldStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by BasicParser#fieldItem.
+    def visitFieldItem(self, ctx:BasicParser.FieldItemContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by BasicParser#getStmt.
+    def visitGetStmt(self, ctx:BasicParser.GetStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by BasicParser#putStmt.
+    def visitPutStmt(self, ctx:BasicParser.PutStmtContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by BasicParser#targetLabel.
     def visitTargetLabel(self, ctx:BasicParser.TargetLabelContext):
         return self.visitChildren(ctx)
@@ -99,6 +184,26 @@ class BasicVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by BasicParser#arrayElement.
+    def visitArrayElement(self, ctx:BasicParser.ArrayElementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by BasicParser#target.
+    def visitTarget(self, ctx:BasicParser.TargetContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by BasicParser#functionCall.
+    def visitFunctionCall(self, ctx:BasicParser.FunctionCallContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by BasicParser#userFunctionCall.
+    def visitUserFunctionCall(self, ctx:BasicParser.UserFunctionCallContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by BasicParser#condition.
     def visitCondition(self, ctx:BasicParser.ConditionContext):
         return self.visitChildren(ctx)
@@ -1,9 +1,24 @@
+import math
+
 from ast_nodes import (
     ProgramNode, PrintNode, LetNode, EndNode, IfNode, GotoNode, LabelReferenceNode,
     ForNode, NextNode, GosubNode, ReturnNode, WhileNode, InputNode,
-    NumberNode, StringNode, VariableNode, BinaryOpNode, UnaryOpNode, LabelNode
+    NumberNode, StringNode, VariableNode, BinaryOpNode, UnaryOpNode, LabelNode,
+    OnJumpNode, SelectCaseNode, CaseNode, CaseRangeNode, CaseIsNode, DimNode, ArrayElementNode,
+    MatLetNode, ReadNode, FunctionCallNode, DefFnNode, FnCallNode, OpenNode, CloseNode,
+    GetNode, PutNode
 )
 
+# Чистые встроенные функции: вызов с константным аргументом вычисляется при компиляции так же,
+# как его вычислит сгенерированный код. RND при каждом вызове дает новое значение
+FOLDABLE_FUNCTIONS = {
+    'SQR': math.sqrt, 'SIN': math.sin, 'COS': math.cos, 'ATN': math.atan, 'EXP': math.exp, 'LOG': math.log,
+    'ABS': abs, 'INT': lambda value: value // 1, 'SGN': lambda value: (value > 0) - (value < 0),
+}
+# Наибольшее по модулю значение, которое float хранит точно: дальше свертка операции над
+# целыми аргументами дала бы другое число, чем целая арифметика Python при выполнении
+MAX_EXACT_FLOAT = 2 ** 53
+
 class Optimizer:
     def optimize(self, ast_root):
         raise NotImplementedError("Метод optimize должен быть реализован в наследниках")
@@ -13,26 +28,23 @@ class ConstantFoldingOptimizer(Optimizer):
         if not isinstance(ast_root, ProgramNode):
             raise ValueError("Ожидается корень AST дерева типа ProgramNode")
 
-        optimized_statements = []
-
-        for stmt in ast_root.statements:
-            optimized_stmt = self._optimize_statement(stmt)
-            optimized_statements.append(optimized_stmt)
-
-        ast_root.statements = optimized_statements
+        # IF с ложным константным условием сворачивается в None и удаляется
+        ast_root.statements = self._optimize_body(ast_root.statements)
         return ast_root
     
     def _optimize_statement(self, stmt):
         if isinstance(stmt, LetNode):
             value = self._optimize_expression(stmt.value)
-            return LetNode(stmt.variable, value)
+            # Индексы элемента массива в левой части сворачиваются так же, как выражения
+            return LetNode(self._optimize_expression(stmt.variable), value)
         
         elif isinstance(stmt, PrintNode):
             optimized_items = []
             for item in stmt.expressions_with_separators:
                 expr = self._optimize_expression(item['expression'])
                 optimized_items.append({'expression': expr, 'separator': item['separator']})
-            optimized_node = PrintNode(optimized_items)
+            channel = self._optimize_expression(stmt.channel) if stmt.channel else None
+            optimized_node = PrintNode(optimized_items, channel)
             return optimized_node
         
         elif isinstance(stmt, IfNode):
@@ -65,21 +77,70 @@ class ConstantFoldingOptimizer(Optimizer):
             if isinstance(condition, NumberNode) and condition.value == 0:
                 return None
 
-            optimized_body = []
-            for body_stmt in stmt.body:
-                optimized_body_stmt = self._optimize_statement(body_stmt)
-                if optimized_body_stmt:
-                    optimized_body.append(optimized_body_stmt)
-            
-            return WhileNode(condition, optimized_body)
+            return WhileNode(condition, self._optimize_body(stmt.body))
+
+        elif isinstance(stmt, OnJumpNode):
+            return OnJumpNode(self._optimize_expression(stmt.index), stmt.target_label_refs, stmt.is_gosub)
+
+        elif isinstance(stmt, SelectCaseNode):
+            cases = [
+                CaseNode([self._optimize_case_test(test) for test in case.tests], self._optimize_body(case.body))
+                for case in stmt.cases
+            ]
+            else_body = self._optimize_body(stmt.else_body) if stmt.else_body is not None else None
+            return SelectCaseNode(self._optimize_expression(stmt.selector), cases, else_body)
         
         elif isinstance(stmt, InputNode):
+            variables = [self._optimize_expression(var) for var in stmt.variables]
+            channel = self._optimize_expression(stmt.channel) if stmt.channel else None
             if stmt.prompt:
                 prompt = self._optimize_expression(stmt.prompt)
-                return InputNode(stmt.variables, prompt)
+                return InputNode(variables, prompt, channel)
+            return InputNode(variables, channel_node=channel)
+
+        elif isinstance(stmt, ReadNode):
+            return ReadNode([self._optimize_expression(var) for var in stmt.variables])
+
+        elif isinstance(stmt, MatLetNode) and stmt.factor is not None:
+            return MatLetNode(stmt.target, stmt.operation, stmt.operands, self._optimize_expression(stmt.factor))
+
+        elif isinstance(stmt, DimNode):
+            return DimNode([self._optimize_expression(array) for array in stmt.arrays])
+
+        elif isinstance(stmt, OpenNode):
+            record_length = self._optimize_expression(stmt.record_length) if stmt.record_length else None
+            return OpenNode(
+                self._optimize_expression(stmt.path), stmt.mode, self._optimize_expression(stmt.channel), record_length
+            )
+
+        elif isinstance(stmt, CloseNode):
+            return CloseNode([self._optimize_expression(channel) for channel in stmt.channels])
+
+        elif isinstance(stmt, (GetNode, PutNode)):
+            record = self._optimize_expression(stmt.record) if stmt.record else None
+            return type(stmt)(stmt.channel, record, stmt.variables)
+
+        elif isinstance(stmt, DefFnNode):
+            # Определение хранится и в таблице символов, поэтому тело заменяется в том же узле
+            stmt.body = self._optimize_expression(stmt.body)
             return stmt
         return stmt
     
+    def _optimize_body(self, statements):
+        optimized_body = []
+        for body_stmt in statements:
+            optimized_body_stmt = self._optimize_statement(body_stmt)
+            if optimized_body_stmt:
+                optimized_body.append(optimized_body_stmt)
+        return optimized_body
+
+    def _optimize_case_test(self, test):
+        if isinstance(test, CaseRangeNode):
+            return CaseRangeNode(self._optimize_expression(test.low), self._optimize_expression(test.high))
+        if isinstance(test, CaseIsNode):
+            return CaseIsNode(test.op, self._optimize_expression(test.value))
+        return self._optimize_expression(test)
+
     def _optimize_expression(self, expr):
         if isinstance(expr, NumberNode) or isinstance(expr, StringNode):
             return expr
@@ -87,6 +148,10 @@ class ConstantFoldingOptimizer(Optimizer):
         elif isinstance(expr, VariableNode):
             return expr
 
+        elif isinstance(expr, ArrayElementNode):
+            indices = [self._optimize_expression(index) for index in expr.indices]
+            return ArrayElementNode(expr.name, expr.type_suffix, indices)
+
         elif isinstance(expr, BinaryOpNode):
             left = self._optimize_expression(expr.left)
             right = self._optimize_expression(expr.right)
@@ -120,8 +185,63 @@ class ConstantFoldingOptimizer(Optimizer):
 
             return UnaryOpNode(expr.op, operand)
 
+        elif isinstance(expr, FunctionCallNode):
+            arguments = [self._optimize_expression(argument) for argument in expr.arguments]
+            if arguments and all(isinstance(argument, NumberNode) for argument in arguments):
+                result = self._evaluate_function(expr.name, arguments[0].value)
+                if result is not None:
+                    return NumberNode(result)
+            return FunctionCallNode(expr.name, arguments)
+
+        elif isinstance(expr, FnCallNode):
+            arguments = [self._optimize_expression(argument) for argument in expr.arguments]
+            return FnCallNode(expr.name, expr.type_suffix, arguments)
+
         return expr
     
+    def fold_constants(self, expr):
+        """
+        Сворачивает только операции, все операнды которых — числа. Генератор кода применяет ее
+        к телу функции DEF FN после подстановки аргументов: тождества вида X + 0 здесь не
+        упрощаются, потому что подставленный аргумент может быть целым, а результат — float
+        """
+        if isinstance(expr, BinaryOpNode):
+            left = self.fold_constants(expr.left)
+            right = self.fold_constants(expr.right)
+            if isinstance(left, NumberNode) and isinstance(right, NumberNode):
+                folded = self._folded(self._evaluate_binary_op(left.value, expr.op, right.value))
+                if folded is not None:
+                    return folded
+            return BinaryOpNode(left, expr.op, right)
+
+        elif isinstance(expr, UnaryOpNode):
+            operand = self.fold_constants(expr.operand)
+            if isinstance(operand, NumberNode) and expr.op == '-':
+                return NumberNode(-operand.value)
+            return UnaryOpNode(expr.op, operand)
+
+        elif isinstance(expr, FunctionCallNode):
+            arguments = [self.fold_constants(argument) for argument in expr.arguments]
+            if arguments and all(isinstance(argument, NumberNode) for argument in arguments):
+                folded = self._folded(self._evaluate_function(expr.name, arguments[0].value))
+                if folded is not None:
+                    return folded
+            return FunctionCallNode(expr.name, arguments)
+
+        elif isinstance(expr, ArrayElementNode):
+            return ArrayElementNode(expr.name, expr.type_suffix, [self.fold_constants(index) for index in expr.indices])
+
+        elif isinstance(expr, FnCallNode):
+            return FnCallNode(expr.name, expr.type_suffix, [self.fold_constants(argument) for argument in expr.arguments])
+
+        return expr
+
+    def _folded(self, result):
+        """Узел числа результата свертки или None, если свертка не удалась или неточна"""
+        if result is None or abs(result) >= MAX_EXACT_FLOAT:
+            return None
+        return NumberNode(result)
+
     def _evaluate_binary_op(self, left, op, right):
         try:
             if op == '+':
@@ -149,6 +269,15 @@ class ConstantFoldingOptimizer(Optimizer):
         except:
             return None  # Если возникли ошибки, не оптимизируем
 
+    def _evaluate_function(self, name, value):
+        if name not in FOLDABLE_FUNCTIONS:
+            return None
+        try:
+            return FOLDABLE_FUNCTIONS[name](value)
+        except (ValueError, OverflowError):
+            # SQR(-1), LOG(0), EXP(1000): ошибку должна дать программа при выполнении
+            return None
+
 class DeadCodeEliminationOptimizer(Optimizer):
     def optimize(self, ast_root):
         if not isinstance(ast_root, ProgramNode):
@@ -186,19 +315,50 @@ class UnusedLabelEliminationOptimizer(Optimizer):
         for stmt in ast_root.statements:
             if isinstance(stmt, LabelNode):
                 labels[stmt.name] = stmt
-            elif isinstance(stmt, GotoNode) or isinstance(stmt, GosubNode):
-                used_labels.add(stmt.target_label_ref.name_or_number)
+            else:
+                self._collect_used_labels(stmt, used_labels)
 
+        ast_root.statements = self._remove_unused_labels(ast_root.statements, used_labels)
+        return ast_root
+
+    def _remove_unused_labels(self, statements, used_labels):
+        # В программе с нумерованными строками метка стоит перед каждой строкой, в том числе
+        # в теле WHILE: лишние метки мешают собрать цикл в структурированную форму
         optimized_statements = []
 
-        for stmt in ast_root.statements:
+        for stmt in statements:
             if isinstance(stmt, LabelNode) and stmt.name not in used_labels:
                 continue
+            if isinstance(stmt, WhileNode):
+                stmt.body = self._remove_unused_labels(stmt.body, used_labels)
+            elif isinstance(stmt, SelectCaseNode):
+                for case in stmt.cases:
+                    case.body = self._remove_unused_labels(case.body, used_labels)
+                if stmt.else_body is not None:
+                    stmt.else_body = self._remove_unused_labels(stmt.else_body, used_labels)
 
             optimized_statements.append(stmt)
 
-        ast_root.statements = optimized_statements
-        return ast_root
+        return optimized_statements
+
+    def _collect_used_labels(self, stmt, used_labels):
+        # Переходы встречаются и внутри IF ... THEN GOTO, и в теле WHILE и ветвях CASE
+        if isinstance(stmt, GotoNode) or isinstance(stmt, GosubNode):
+            used_labels.add(stmt.target_label_ref.name_or_number)
+        elif isinstance(stmt, OnJumpNode):
+            used_labels.update(target_ref.name_or_number for target_ref in stmt.target_label_refs)
+        elif isinstance(stmt, IfNode):
+            for branch in (stmt.then_branch, stmt.else_branch):
+                if branch:
+                    self._collect_used_labels(branch, used_labels)
+        elif isinstance(stmt, WhileNode):
+            for body_stmt in stmt.body:
+                self._collect_used_labels(body_stmt, used_labels)
+        elif isinstance(stmt, SelectCaseNode):
+            bodies = [case.body for case in stmt.cases] + [stmt.else_body or []]
+            for body in bodies:
+                for body_stmt in body:
+                    self._collect_used_labels(body_stmt, used_labels)
 
 class OptimizationPipeline:
     def __init__(self, optimizers=None):
@@ -0,0 +1,1029 @@
+import ast
+import copy
+import inspect
+
+from ast_nodes import (
+    ProgramNode, PrintNode, LetNode, EndNode, IfNode, ForNode, WhileNode, InputNode,
+    NumberNode, StringNode, VariableNode, BinaryOpNode, UnaryOpNode,
+    BreakNode, ContinueNode, LoopNode, IfBlockNode, DispatchNode, JumpNode, ReturnJumpNode,
+    SubroutineNode, CallSubroutineNode, SubroutineReturnNode, ChunkNode, ChunkedDispatchNode, SwitchNode,
+    DispatchStateNode, DimNode, ArrayElementNode, MatLetNode, MatReadNode, MatPrintNode, DataNode, ReadNode,
+    FunctionCallNode, DefFnNode, FnCallNode, OpenNode, CloseNode, FieldNode, GetNode, PutNode
+)
+from chunked_layout import EXIT_STATE
+from code_generator import CodeGenerator, MAT_OPERATIONS
+from semantic_analyzer import SymbolTable, TypeInference
+from vectorizer import LoopVectorizer
+import basic_runtime
+
+BINARY_OPERATORS = {'+': ast.Add, '-': ast.Sub, '*': ast.Mult, '/': ast.Div}
+COMPARISON_OPERATORS = {'=': ast.Eq, '<>': ast.NotEq, '<': ast.Lt, '<=': ast.LtE, '>': ast.Gt, '>=': ast.GtE}
+UNARY_OPERATORS = {'-': ast.USub, '+': ast.UAdd}
+# Контексты без полей, как и парсер CPython, делят один экземпляр
+LOAD = ast.Load()
+STORE = ast.Store()
+
+# Определения среды выполнения верхнего уровня, разобранные из исходного кода basic_runtime
+_runtime_definitions = {}
+
+
+def runtime_definitions():
+    """Узлы ast определений basic_runtime по именам; модуль разбирается один раз"""
+    if not _runtime_definitions:
+        for node in ast.parse(inspect.getsource(basic_runtime)).body:
+            if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+                _runtime_definitions[node.name] = node
+            elif isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name):
+                _runtime_definitions[node.targets[0].id] = node
+    return _runtime_definitions
+
+
+def set_locations(tree):
+    """
+    Ставит всем узлам позицию 1:0. Делает то же, что ast.fix_missing_locations для дерева без
+    позиций, но без рекурсии и генераторов: для больших программ это заметная часть времени.
+    """
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if node._attributes:
+            node.lineno = node.end_lineno = 1
+            node.col_offset = node.end_col_offset = 0
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if isinstance(value, list):
+                stack.extend(item for item in value if isinstance(item, ast.AST))
+            elif isinstance(value, ast.AST):
+                stack.append(value)
+
+
+class PythonAstGenerator(CodeGenerator):
+    """
+    Генератор, который строит ast.Module прямо из AST программы BASIC. Модуль передается
+    в compile() без повторного разбора текста, а текст программы получается из него через
+    ast.unparse. Поддерживаются режимы structured, state_machine и chunked: вложенные функции
+    режима nested генерирует только текстовый CodeGenerator.
+    """
+
+    def __init__(self, symbol_table=None, inline_runtime=False, batch_input=False):
+        super().__init__(symbol_table, inline_runtime, batch_input)
+        # Таблицы переходов SwitchNode: пары (константа, значение) -> имя словаря уровня модуля
+        self.switch_tables = {}
+        # Функции ядер циклов, выполняемых над срезами NumPy: определения уровня модуля
+        self.vector_kernels = []
+        self.vectorizer = LoopVectorizer(self._is_int_valued)
+        self.variable_references = {}
+        self.loop_counter = 0
+        # Номера состояний части автомата, которая генерируется сейчас (раскладка chunked)
+        self.chunk_states = None
+
+    def generate(self, ast_root):
+        return ast.unparse(self.generate_module(ast_root))
+
+    def generate_module(self, ast_root):
+        if not isinstance(ast_root, ProgramNode):
+            raise ValueError("Ожидается корень AST дерева типа ProgramNode")
+
+        self._assign_storage(ast_root)
+        self._collect_arrays(ast_root)
+        self._count_variable_references(ast_root)
+        self.type_inference.infer(ast_root)
+
+        subroutines = [stmt for stmt in ast_root.statements if isinstance(stmt, SubroutineNode)]
+        main_statements = [stmt for stmt in ast_root.statements if not isinstance(stmt, SubroutineNode)]
+        body = [self._build_subroutine(subroutine) for subroutine in subroutines]
+        main = self._function('main', self._build_defaults(main_statements) + self._build_block(main_statements))
+        self._bind_parameters(main, self._function_parameters(main_statements))
+        body.append(main)
+        return self._build_module(body)
+
+    def _build_module(self, body):
+        """Модуль из функций программы: заголовок и запуск main() устроены как текст CodeGenerator.generate"""
+        run_main = [ast.Expr(self._call('main'))]
+        if self._writes_output() or self._opens_files():
+            finalbody = []
+            if self._opens_files():
+                finalbody.append(ast.Expr(self._call(self._runtime('basic_close'))))
+            if self._writes_output():
+                finalbody.append(ast.Expr(self._call(self._runtime('flush_output'))))
+            run_main = [ast.Try(body=run_main, handlers=[], orelse=[], finalbody=finalbody)]
+        if 'basic_rnd' in self.runtime_names:
+            run_main.insert(0, ast.Expr(self._call(self._runtime('configure_random'))))
+        if self._reads_batch_input():
+            configure = self._call(self._runtime('configure_input'))
+            configure.keywords = [ast.keyword(arg='batch', value=ast.Constant(True))]
+            run_main.insert(-1, ast.Expr(configure))
+        body.append(ast.If(
+            test=ast.Compare(left=self._load('__name__'), ops=[ast.Eq()], comparators=[ast.Constant('__main__')]),
+            body=run_main, orelse=[]
+        ))
+
+        user_functions = self._build_user_functions()
+        # Пустая строка ячеек _slots попадает в пул строк раньше, чем он выписывается
+        slots = self._build_slots()
+        header = (self._build_runtime_imports() + self._build_string_constants() + self._build_data()
+                  + self._build_switch_tables() + self.vector_kernels + user_functions + slots)
+        module = ast.Module(body=header + body, type_ignores=[])
+        set_locations(module)
+        return module
+
+    def _build_runtime_imports(self):
+        names = [name for name in basic_runtime.RUNTIME_NAMES if name in self.runtime_names]
+        array_import = [ast.ImportFrom(module='array', names=[ast.alias('array')], level=0)] if self.uses_array else []
+        if self.math_functions:
+            array_import.append(ast.ImportFrom(
+                module='math', names=[ast.alias(name) for name in sorted(self.math_functions)], level=0
+            ))
+        if not self.inline_runtime:
+            header = [ast.Import(names=[ast.alias('sys')])] if self.uses_sys else []
+            header.extend(array_import)
+            if names:
+                header.append(ast.ImportFrom(
+                    module='basic_runtime', names=[ast.alias(name) for name in names], level=0
+                ))
+            return header
+
+        required = self._required_runtime_names(names)
+        header = []
+        if self.uses_sys or required:
+            header.append(ast.Import(names=[ast.alias('sys')]))
+        if required:
+            header.append(ast.Import(names=[ast.alias('os')]))
+        if '_random' in required:
+            header.append(ast.Import(names=[ast.alias('random')]))
+        if 'RecordFile' in required:
+            header.append(ast.Import(names=[ast.alias('mmap')]))
+            header.append(ast.Import(names=[ast.alias('struct')]))
+        header.extend(array_import)
+        definitions = runtime_definitions()
+        for name in basic_runtime.RUNTIME_NAMES:
+            if name in required:
+                header.append(copy.deepcopy(definitions[name]))
+        return header
+
+    def _build_string_constants(self):
+        return [
+            ast.Assign(targets=[self._store(name)], value=self._call('BasicString', ast.Constant(value)))
+            for value, name in self.string_constants.items()
+        ]
+
+    def _build_data(self):
+        if 'DataReader' not in self.runtime_names:
+            return []
+        values = self._call('DataReader', ast.Constant(tuple(self.symbol_table.data)))
+        return [ast.Assign(targets=[self._store('_data')], value=values)]
+
+    def _build_switch_tables(self):
+        return [
+            ast.Assign(targets=[self._store(name)], value=ast.Dict(
+                keys=[ast.Constant(key) for key, _ in entries], values=[ast.Constant(value) for _, value in entries]
+            ))
+            for entries, name in self.switch_tables.items()
+        ]
+
+    def _build_slots(self):
+        if not self.slot_references:
+            return []
+        slots = ast.List(elts=[self._build_default(symbol) for symbol in self.symbol_table.slots.values()], ctx=LOAD)
+        return [ast.Assign(targets=[ast.Name(id='_slots', ctx=STORE)], value=slots)]
+
+    def _build_defaults(self, statements):
+        """Присваивания значений по умолчанию локальным переменным в начале функции"""
+        return [
+            ast.Assign(targets=[self._store(name)], value=self._build_default(variable))
+            for name, variable in self._local_variables(statements).items()
+        ]
+
+    def _build_default(self, variable):
+        value = self._default_value(variable)
+        return self._load(self._string_constant(value)) if isinstance(value, str) else ast.Constant(value)
+
+    def _build_subroutine(self, subroutine_node):
+        function = self._function(subroutine_node.name, self._build_block(subroutine_node.body))
+        parameters = self._function_parameters(subroutine_node.body)
+        if self._uses_slots(subroutine_node.body):
+            parameters.insert(0, ('_slots', '_slots'))
+        self._bind_parameters(function, parameters)
+        return function
+
+    def _uses_slots(self, statements):
+        return any(
+            self._format_variable_name(node) in self.slot_references
+            for stmt in statements for node in self._walk_with_functions(stmt)
+            if isinstance(node, (VariableNode, ArrayElementNode))
+        )
+
+    def _bind_parameters(self, function, parameters):
+        """Параметры со значениями по умолчанию из _function_parameters"""
+        for name, value in parameters:
+            function.args.args.append(ast.arg(arg=name))
+            function.args.defaults.append(self._load(value))
+
+    def _build_statements(self, statements):
+        result = []
+        for stmt in statements:
+            if isinstance(stmt, LetNode):
+                result.extend(self._build_let(stmt))
+            elif isinstance(stmt, PrintNode):
+                result.extend(self._build_print(stmt))
+            elif isinstance(stmt, IfNode):
+                result.extend(self._build_if(stmt))
+            elif isinstance(stmt, ForNode) and stmt.body is not None:
+                result.extend(self._build_for(stmt))
+            elif isinstance(stmt, WhileNode):
+                result.extend(self._build_while(stmt))
+            elif isinstance(stmt, InputNode):
+                result.extend(self._build_input(stmt))
+            elif isinstance(stmt, DimNode):
+                result.extend(self._build_dim(stmt))
+            elif isinstance(stmt, MatLetNode):
+                result.extend(self._build_mat_let(stmt))
+            elif isinstance(stmt, MatReadNode):
+                result.extend(self._build_mat_read(stmt))
+            elif isinstance(stmt, MatPrintNode):
+                result.extend(self._build_mat_print(stmt))
+            elif isinstance(stmt, ReadNode):
+                result.extend(self._build_read(stmt))
+            elif isinstance(stmt, OpenNode):
+                result.extend(self._build_open(stmt))
+            elif isinstance(stmt, CloseNode):
+                channels = [self._build_integer_expression(channel) for channel in stmt.channels]
+                result.append(ast.Expr(self._call(self._runtime('basic_close'), *channels)))
+            elif isinstance(stmt, FieldNode):
+                channel = self._build_integer_expression(stmt.channel)
+                fields = self._call(self._runtime('basic_field'), channel, ast.Constant(self._field_layout(stmt)))
+                result.append(self._build_unpack(stmt.variables, fields))
+            elif isinstance(stmt, GetNode):
+                result.append(self._build_unpack(stmt.variables, self._build_get(stmt)))
+            elif isinstance(stmt, PutNode):
+                result.extend(self._build_put(stmt))
+            elif isinstance(stmt, (DataNode, DefFnNode)):
+                pass
+            elif isinstance(stmt, EndNode):
+                self.uses_sys = True
+                exit_call = ast.Call(
+                    func=ast.Attribute(value=self._load('sys'), attr='exit', ctx=LOAD),
+                    args=[ast.Constant(0)], keywords=[]
+                )
+                result.append(ast.Expr(exit_call))
+            elif isinstance(stmt, BreakNode):
+                result.append(ast.Break())
+            elif isinstance(stmt, ContinueNode):
+                result.append(ast.Continue())
+            elif isinstance(stmt, LoopNode):
+                result.extend(self._build_loop(stmt))
+            elif isinstance(stmt, IfBlockNode):
+                result.extend(self._build_if_block(stmt))
+            elif isinstance(stmt, SwitchNode):
+                result.extend(self._build_switch(stmt))
+            elif isinstance(stmt, DispatchNode):
+                result.extend(self._build_dispatch(stmt))
+            elif isinstance(stmt, ChunkNode):
+                result.extend(self._build_chunk(stmt))
+            elif isinstance(stmt, ChunkedDispatchNode):
+                result.extend(self._build_chunked_dispatch(stmt))
+            elif isinstance(stmt, JumpNode):
+                result.extend(self._build_jump(stmt))
+            elif isinstance(stmt, ReturnJumpNode):
+                result.extend(self._build_return_jump(stmt))
+            elif isinstance(stmt, CallSubroutineNode):
+                result.append(ast.Expr(self._call(stmt.name)))
+            elif isinstance(stmt, SubroutineReturnNode):
+                result.append(ast.Return(value=None))
+            else:
+                raise ValueError(
+                    f"Узел {type(stmt).__name__} не поддерживается генератором ast: "
+                    f"используйте режим structured, state_machine или chunked"
+                )
+        return result
+
+    def _build_block(self, statements):
+        return self._build_statements(statements) or [ast.Pass()]
+
+    def _build_let(self, let_node):
+        var_name = self._format_variable_name(let_node.variable)
+        target = self._build_target(let_node.variable)
+
+        if let_node.variable.type_suffix == '$':
+            appended = self._appended_parts(let_node)
+            if appended:
+                parts = [self._build_operand(part) for part in appended]
+                value = self._call(self._runtime('basic_append'), self._load(var_name), *parts)
+                return [ast.Assign(targets=[target], value=value)]
+        value = self._build_assigned_value(let_node.variable.type_suffix, let_node.value)
+        return [ast.Assign(targets=[target], value=value)]
+
+    def _build_assigned_value(self, type_suffix, value_node, exact=True):
+        """Значение для переменной с суффиксом type_suffix, как в _generate_assigned_value"""
+        if type_suffix == '$':
+            value = self._build_expression(value_node)
+            if self._expression_type(value_node) != TypeInference.STRING:
+                value = self._call(self._runtime('BasicString'), value)
+            return value
+        if type_suffix == '%':
+            value = self._build_expression(value_node, exact=False)
+            if not self._is_int_valued(value_node):
+                value = self._call('int', value)
+            return value
+        return self._build_expression(value_node, exact)
+
+    def _build_print(self, print_node):
+        prefix = None
+        groups = self._print_groups(print_node)
+        for group in groups[:-1]:
+            prefix = self._call(self._runtime('basic_zone'), self._build_print_string(prefix, group))
+        line = self._build_print_string(prefix, groups[-1] + [(True, '\n')])
+        if print_node.channel is not None:
+            channel = self._build_integer_expression(print_node.channel)
+            return [ast.Expr(self._call(self._runtime('file_write'), channel, line))]
+        return [ast.Expr(self._call(self._runtime('basic_write'), line))]
+
+    def _build_print_string(self, prefix, segments):
+        """Строка из prefix и сегментов PRINT: константа или f-строка"""
+        merged = [(False, prefix)] if prefix is not None else []
+        for is_text, value in segments:
+            if is_text and merged and merged[-1][0]:
+                merged[-1] = (True, merged[-1][1] + value)
+            else:
+                merged.append((is_text, value if is_text else self._build_expression(value)))
+
+        if len(merged) == 1 and merged[0][0]:
+            return ast.Constant(merged[0][1])
+        return ast.JoinedStr(values=[
+            ast.Constant(value) if is_text else ast.FormattedValue(value=value, conversion=-1, format_spec=None)
+            for is_text, value in merged
+        ])
+
+    def _build_if(self, if_node):
+        condition = self._build_expression(if_node.condition, exact=False)
+        then_body = self._build_block([if_node.then_branch] if if_node.then_branch else [])
+        else_body = self._build_statements([if_node.else_branch]) if if_node.else_branch else []
+        return [ast.If(test=condition, body=then_body, orelse=else_body)]
+
+    def _build_if_block(self, if_node):
+        condition = self._build_expression(if_node.condition, exact=False)
+        if not if_node.then_body and if_node.else_body:
+            negated = ast.UnaryOp(op=ast.Not(), operand=condition)
+            return [ast.If(test=negated, body=self._build_block(if_node.else_body), orelse=[])]
+        return [ast.If(
+            test=condition,
+            body=self._build_block(if_node.then_body),
+            orelse=self._build_statements(if_node.else_body)
+        )]
+
+    def _build_loop(self, loop_node):
+        if loop_node.condition is None:
+            condition = ast.Constant(True)
+        else:
+            condition = self._build_expression(loop_node.condition, exact=False)
+        return [ast.While(test=condition, body=self._build_block(loop_node.body), orelse=[])]
+
+    def _build_while(self, while_node):
+        constant = self._constant_value(while_node.condition)
+        if constant is not None and constant != 0:
+            condition = ast.Constant(True)
+        else:
+            condition = self._build_expression(while_node.condition, exact=False)
+        return [ast.While(test=condition, body=self._build_block(while_node.body), orelse=[])]
+
+    def _build_dispatch(self, dispatch_node):
+        result = []
+        uses_gosub = any(
+            isinstance(stmt, JumpNode) and stmt.return_state is not None
+            for state in dispatch_node.states for stmt in state.statements
+        )
+        if uses_gosub:
+            result.append(ast.Assign(targets=[self._store('_gosub_stack')], value=ast.List(elts=[], ctx=LOAD)))
+
+        result.append(ast.Assign(targets=[self._store('_pc')], value=ast.Constant(dispatch_node.entry_state)))
+        states = dispatch_node.states
+        result.append(ast.While(
+            test=ast.Constant(True), body=self._build_dispatch_tree(states, 0, len(states)), orelse=[]
+        ))
+
+        if len(dispatch_node.exits) == 1:
+            result.extend(self._build_statements(dispatch_node.exits[0].statements))
+        else:
+            for exit_state in dispatch_node.exits:
+                result.append(ast.If(
+                    test=self._compare_pc(ast.Eq, exit_state.state_id),
+                    body=self._build_block(exit_state.statements), orelse=[]
+                ))
+        return result
+
+    def _build_dispatch_tree(self, states, low, high, counter='_pc'):
+        # Бинарное дерево сравнений номера состояния, как в текстовом генераторе
+        if high - low == 1:
+            return self._build_block(states[low].statements)
+
+        middle = (low + high) // 2
+        return [ast.If(
+            test=self._compare_pc(ast.Lt, states[middle].state_id, counter),
+            body=self._build_dispatch_tree(states, low, middle, counter),
+            orelse=self._build_dispatch_tree(states, middle, high, counter)
+        )]
+
+    def _compare_pc(self, op, state_id, counter='_pc'):
+        return ast.Compare(left=self._load(counter), ops=[op()], comparators=[ast.Constant(state_id)])
+
+    def _build_switch(self, switch_node):
+        selector = self._build_switch_selector(switch_node)
+        key_groups = [case.tests for case in switch_node.cases]
+        states = self._switch_states(switch_node)
+        if states is not None:
+            # Все ветви — переходы автомата: номер следующего состояния берется прямо из таблицы
+            lookup = self._switch_lookup(self._switch_table(key_groups, states[:-1]), selector, states[-1])
+            result = [ast.Assign(targets=[self._store('_pc')], value=lookup)]
+            if any(self._leaves_chunk(state) for state in states):
+                result.append(self._build_return_outside_chunk())
+            return result
+
+        arms = self._switch_arms(switch_node)
+        table = self._switch_table(key_groups, range(len(switch_node.cases)))
+        lookup = self._switch_lookup(table, selector, len(switch_node.cases))
+        return [ast.Assign(targets=[self._store('_case')], value=lookup)] + self._build_dispatch_tree(
+            arms, 0, len(arms), '_case'
+        )
+
+    def _build_switch_selector(self, switch_node):
+        if switch_node.rounded and not self._is_int_valued(switch_node.selector):
+            shifted = ast.BinOp(
+                left=self._build_expression(switch_node.selector, exact=False), op=ast.Add(), right=ast.Constant(0.5)
+            )
+            return self._call('int', shifted)
+        return self._build_operand(switch_node.selector, exact=False)
+
+    def _switch_lookup(self, table, selector, default):
+        get = ast.Attribute(value=self._load(table), attr='get', ctx=LOAD)
+        return ast.Call(func=get, args=[selector, ast.Constant(default)], keywords=[])
+
+    def _switch_states(self, switch_node):
+        """Номера состояний ветвей и ветви по умолчанию, если каждая ветвь — только переход JumpNode"""
+        bodies = [case.body for case in switch_node.cases] + [switch_node.default_body]
+        if all(len(body) == 1 and isinstance(body[0], JumpNode) and body[0].return_state is None for body in bodies):
+            return [body[0].target_state for body in bodies]
+        return None
+
+    def _switch_arms(self, switch_node):
+        """Ветви SwitchNode как состояния с номерами 0..n, последняя — ветвь по умолчанию"""
+        bodies = [case.body for case in switch_node.cases] + [switch_node.default_body]
+        return [DispatchStateNode(index, body) for index, body in enumerate(bodies)]
+
+    def _switch_table(self, key_groups, values):
+        """Имя словаря уровня модуля: каждая константа группы i -> values[i]; одинаковые таблицы общие"""
+        entries = tuple(
+            (self._switch_key(key), value) for keys, value in zip(key_groups, values) for key in keys
+        )
+        if entries not in self.switch_tables:
+            self.switch_tables[entries] = f"_switch{len(self.switch_tables) + 1}"
+        return self.switch_tables[entries]
+
+    def _switch_key(self, key_node):
+        if isinstance(key_node, StringNode):
+            return key_node.value
+        # 2 и 2.0 — один ключ словаря, целые константы записываются как int
+        return int(key_node.value) if self._is_integer_literal(key_node.value) else key_node.value
+
+    def _build_chunk(self, chunk_node):
+        states = chunk_node.states
+        self.chunk_states = (states[0].state_id, states[-1].state_id + 1)
+        result = [
+            ast.Global(names=['_pc']),
+            ast.While(test=ast.Constant(True), body=self._build_dispatch_tree(states, 0, len(states)), orelse=[]),
+        ]
+        self.chunk_states = None
+        return result
+
+    def _build_chunked_dispatch(self, dispatch_node):
+        result = [ast.Global(names=['_pc', '_gosub_stack'] if dispatch_node.uses_gosub else ['_pc'])]
+        # Таблица: номер состояния -> функция части, в которой оно выполняется
+        chunk_counts = ast.Tuple(elts=[
+            ast.Tuple(elts=[self._load(name), ast.Constant(size)], ctx=LOAD)
+            for name, size in zip(dispatch_node.chunk_names, dispatch_node.chunk_sizes)
+        ], ctx=LOAD)
+        extend = ast.Call(
+            func=ast.Attribute(value=self._load('_chunks'), attr='extend', ctx=LOAD),
+            args=[ast.BinOp(
+                left=ast.List(elts=[self._load('_chunk')], ctx=LOAD), op=ast.Mult(), right=self._load('_count')
+            )], keywords=[]
+        )
+        result.append(ast.Assign(targets=[self._store('_chunks')], value=ast.List(elts=[], ctx=LOAD)))
+        result.append(ast.For(
+            target=ast.Tuple(elts=[self._store('_chunk'), self._store('_count')], ctx=STORE),
+            iter=chunk_counts, body=[ast.Expr(extend)], orelse=[]
+        ))
+        if dispatch_node.uses_gosub:
+            result.append(ast.Assign(targets=[self._store('_gosub_stack')], value=ast.List(elts=[], ctx=LOAD)))
+        result.append(ast.Assign(targets=[self._store('_pc')], value=ast.Constant(dispatch_node.entry_state)))
+        call_chunk = ast.Call(
+            func=ast.Subscript(value=self._load('_chunks'), slice=self._load('_pc'), ctx=LOAD), args=[], keywords=[]
+        )
+        result.append(ast.While(
+            test=self._compare_pc(ast.GtE, 0), body=[ast.Expr(call_chunk)], orelse=[]
+        ))
+        return result
+
+    def _leaves_chunk(self, state_id):
+        """Переход к состоянию из другой части автомата: управление возвращается в цикл main()"""
+        return self.chunk_states is not None and not self.chunk_states[0] <= state_id < self.chunk_states[1]
+
+    def _build_jump(self, jump_node):
+        result = []
+        if jump_node.return_state is not None:
+            push = ast.Call(
+                func=ast.Attribute(value=self._load('_gosub_stack'), attr='append', ctx=LOAD),
+                args=[ast.Constant(jump_node.return_state)], keywords=[]
+            )
+            result.append(ast.Expr(push))
+        result.append(ast.Assign(targets=[self._store('_pc')], value=ast.Constant(jump_node.target_state)))
+        if self._leaves_chunk(jump_node.target_state):
+            result.append(ast.Return(value=None))
+        return result
+
+    def _build_return_jump(self, return_node):
+        pop = ast.Call(
+            func=ast.Attribute(value=self._load('_gosub_stack'), attr='pop', ctx=LOAD),
+            args=[], keywords=[]
+        )
+        empty_stack = ast.UnaryOp(op=ast.Not(), operand=self._load('_gosub_stack'))
+        if self.chunk_states is None:
+            return [
+                ast.If(test=empty_stack, body=[ast.Break()], orelse=[]),
+                ast.Assign(targets=[self._store('_pc')], value=pop),
+            ]
+
+        return [
+            ast.If(test=empty_stack, body=[
+                ast.Assign(targets=[self._store('_pc')], value=ast.Constant(EXIT_STATE)),
+                ast.Return(value=None),
+            ], orelse=[]),
+            ast.Assign(targets=[self._store('_pc')], value=pop),
+            self._build_return_outside_chunk(),
+        ]
+
+    def _build_return_outside_chunk(self):
+        """Возврат в цикл main(), если номер состояния вышел за пределы текущей части автомата"""
+        low, high = self.chunk_states
+        in_chunk = ast.Compare(
+            left=ast.Constant(low), ops=[ast.LtE(), ast.Lt()], comparators=[self._load('_pc'), ast.Constant(high)]
+        )
+        return ast.If(test=ast.UnaryOp(op=ast.Not(), operand=in_chunk), body=[ast.Return(value=None)], orelse=[])
+
+    def _build_for(self, for_node):
+        """FOR с телом: for ... in range() при доказуемо целых границах, иначе while"""
+        self.loop_counter += 1
+        step = self._constant_value(for_node.step_value) if for_node.step_value else 1
+        bounds = [for_node.start_value, for_node.end_value] + ([for_node.step_value] if for_node.step_value else [])
+
+        if (step is not None and step != 0 and for_node.loop_variable.type_suffix != '$'
+                and all(self._is_int_valued(expr) for expr in bounds)):
+            return self._build_for_range(for_node, int(step))
+        return self._build_for_while(for_node, step)
+
+    def _build_for_range(self, for_node, step):
+        loop_var = self._format_variable_name(for_node.loop_variable)
+        start = self._build_integer_expression(for_node.start_value)
+
+        # range не включает конец, поэтому граница сдвигается на единицу в сторону шага
+        end_value = self._constant_value(for_node.end_value)
+        if end_value is not None:
+            stop = ast.Constant(int(end_value) + (1 if step > 0 else -1))
+        else:
+            stop = ast.BinOp(
+                left=self._build_integer_expression(for_node.end_value),
+                op=ast.Add() if step > 0 else ast.Sub(), right=ast.Constant(1)
+            )
+
+        range_call = self._call('range', start, stop, *([ast.Constant(step)] if step != 1 else []))
+        is_float = for_node.loop_variable.type_suffix != '%'
+        read_outside = self._is_read_outside(for_node)
+        plan = self.vectorizer.plan(for_node)
+
+        result = []
+        if read_outside or plan is not None:
+            range_var = f"_for{self.loop_counter}_range"
+            result.append(ast.Assign(targets=[self._store(range_var)], value=range_call))
+            range_call = self._load(range_var)
+        iterable = self._call('map', self._load('float'), range_call) if is_float else range_call
+        body = self._in_loop_range(for_node, self._build_block)
+        loop = ast.For(target=self._store(loop_var), iter=iterable, body=body, orelse=[])
+        if plan is not None:
+            # Обычный цикл выполняется, если среда выполнения не смогла выполнить его над срезами
+            vectorized = self._build_vector_loop_call(plan, self._load(range_var))
+            loop = ast.If(test=ast.UnaryOp(op=ast.Not(), operand=vectorized), body=[loop], orelse=[])
+        result.append(loop)
+
+        if read_outside:
+            # После NEXT переменная цикла в BASIC равна первому значению за границей
+            final_value = ast.BinOp(
+                left=self._range_attribute(range_var, 'start'), op=ast.Add(),
+                right=ast.BinOp(
+                    left=self._call('len', self._load(range_var)), op=ast.Mult(),
+                    right=self._range_attribute(range_var, 'step')
+                )
+            )
+            result.append(ast.Assign(
+                targets=[self._store(loop_var)],
+                value=self._call('float', final_value) if is_float else final_value
+            ))
+        return result
+
+    def _in_loop_range(self, for_node, build):
+        """
+        Тело цикла range(), построенное функцией build. Переменная цикла в теле не присваивается,
+        поэтому при константных границах ее значения известны при компиляции
+        """
+        key = self._storage_key(for_node.loop_variable)
+        saved = self.loop_ranges.get(key)
+        start = self._constant_value(for_node.start_value)
+        end = self._constant_value(for_node.end_value)
+        if start is not None and end is not None:
+            self.loop_ranges[key] = min(int(start), int(end)), max(int(start), int(end))
+        body = build(for_node.body)
+        if saved is None:
+            self.loop_ranges.pop(key, None)
+        else:
+            self.loop_ranges[key] = saved
+        return body
+
+    def _build_vector_loop_call(self, plan, loop_range):
+        """Вызов vector_loop для цикла, который можно выполнить над срезами массивов"""
+        accesses = [
+            self._tuple([
+                self._load(self._format_variable_name(access.base)), self._build_array_index(access.base, checked=False),
+                ast.Constant(self._array_stride(access)), self._tuple(self._build_access_bounds(access)),
+            ])
+            for access in plan.accesses
+        ]
+        arguments = [
+            self._load(self._build_vector_kernel(plan)), loop_range, self._tuple(accesses),
+            ast.Constant(tuple(plan.written)),
+            self._tuple([self._build_expression(scalar) for scalar in plan.scalars]),
+        ]
+        if plan.index is not None:
+            arguments.append(ast.Constant(self._array_typecode(plan.index)[0]))
+        return self._call(self._runtime('vector_loop'), *arguments)
+
+    def _build_access_bounds(self, access):
+        return [
+            self._tuple([
+                self._build_integer_expression(access.base.indices[dimension]),
+                self._build_array_bound(access.base, dimension),
+            ])
+            for dimension in self._access_dimensions(access)
+        ]
+
+    def _access_dimensions(self, access):
+        """Измерения обращения в порядке границ vector_loop: первым — измерение переменной цикла"""
+        return [access.dimension] + [
+            dimension for dimension in range(len(access.base.indices)) if dimension != access.dimension
+        ]
+
+    def _build_vector_kernel(self, plan):
+        """Функция ядра уровня модуля; тело строится с пустой таблицей символов, без ячеек _slots"""
+        name = f"_vector{len(self.vector_kernels) + 1}"
+        parameters = plan.parameters + plan.scalars + ([plan.index] if plan.index is not None else [])
+        saved = self.symbol_table
+        self.symbol_table = SymbolTable()
+        body = self._build_statements(plan.kernel)
+        self.symbol_table = saved
+        results = [self._load(self._variable_identifier(plan.parameters[number])) for number in plan.written]
+        body.append(ast.Return(value=self._tuple(results)))
+        function = self._function(name, body)
+        function.args.args = [ast.arg(arg=self._variable_identifier(node)) for node in parameters]
+        self.vector_kernels.append(function)
+        return name
+
+    def _build_user_functions(self):
+        """Функции уровня модуля для вызовов DEF FN, которые не подставляются"""
+        functions = []
+        index = 0
+        while index < len(self.called_functions):
+            definition = self.symbol_table.functions.get(self.called_functions[index])
+            index += 1
+            if definition is None:
+                continue
+            saved = self.symbol_table
+            self.symbol_table = self._function_scope()
+            value = self._build_assigned_value(definition.type_suffix, definition.body)
+            self.symbol_table = saved
+            function = self._function(self._variable_identifier(definition), [ast.Return(value=value)])
+            function.args.args = [
+                ast.arg(arg=self._variable_identifier(node))
+                for node in definition.parameters + self._function_globals(definition)
+            ]
+            self._bind_parameters(function, self._function_parameters([definition.body]))
+            functions.append(function)
+        return functions
+
+    def _tuple(self, items):
+        return ast.Tuple(elts=items, ctx=LOAD)
+
+    def _range_attribute(self, range_var, attr):
+        return ast.Attribute(value=self._load(range_var), attr=attr, ctx=LOAD)
+
+    def _build_for_while(self, for_node, step):
+        loop_var = self._format_variable_name(for_node.loop_variable)
+        result = self._build_let(LetNode(for_node.loop_variable, for_node.start_value))
+
+        if self._constant_value(for_node.end_value) is not None:
+            end = self._build_expression(for_node.end_value, exact=False)
+        else:
+            end_var = f"_for{self.loop_counter}_end"
+            end_value = self._build_expression(for_node.end_value, exact=False)
+            result.append(ast.Assign(targets=[self._store(end_var)], value=end_value))
+            end = self._load(end_var)
+
+        if step is not None:
+            step_node = for_node.step_value or NumberNode(1)
+            condition = ast.Compare(
+                left=self._load(loop_var), ops=[ast.GtE() if step < 0 else ast.LtE()], comparators=[end]
+            )
+        else:
+            step_node = VariableNode(f"_for{self.loop_counter}_step")
+            step_var = self._format_variable_name(step_node)
+            step_value = self._build_expression(for_node.step_value)
+            result.append(ast.Assign(targets=[self._store(step_var)], value=step_value))
+            # Одно сравнение для шага любого знака
+            difference = ast.BinOp(left=self._load(loop_var), op=ast.Sub(), right=end)
+            condition = ast.Compare(
+                left=ast.BinOp(left=difference, op=ast.Mult(), right=self._load(step_var)),
+                ops=[ast.LtE()], comparators=[ast.Constant(0)]
+            )
+
+        body = self._build_statements(for_node.body or [])
+        body.extend(self._build_let(LetNode(for_node.loop_variable, BinaryOpNode(for_node.loop_variable, '+', step_node))))
+        result.append(ast.While(test=condition, body=body, orelse=[]))
+        return result
+
+    def _count_variable_references(self, ast_root):
+        for node in self._walk_with_functions(ast_root):
+            if isinstance(node, VariableNode):
+                key = self._format_variable_name(node)
+                self.variable_references[key] = self.variable_references.get(key, 0) + 1
+
+    def _is_read_outside(self, for_node):
+        """Используется ли переменная цикла где-либо вне самого цикла"""
+        key = self._format_variable_name(for_node.loop_variable)
+        inside = sum(
+            1 for node in self._walk_with_functions(for_node)
+            if isinstance(node, VariableNode) and self._format_variable_name(node) == key
+        )
+        return self.variable_references.get(key, 0) > inside
+
+    def _build_input(self, input_node):
+        prompt = [self._build_operand(input_node.prompt)] if input_node.prompt else []
+        suffixes = ast.Tuple(elts=[ast.Constant(var.type_suffix) for var in input_node.variables], ctx=LOAD)
+
+        if input_node.channel is not None:
+            channel = self._build_integer_expression(input_node.channel)
+            fields = self._call(self._runtime('file_input_fields'), channel, suffixes)
+            return self._build_input_assignments(fields, input_node.variables)
+        if len(input_node.variables) > 1:
+            fields = self._call(self._runtime('basic_input_fields'), *(prompt or [ast.Constant(None)]), suffixes)
+            return self._build_input_assignments(fields, input_node.variables)
+
+        var = input_node.variables[0]
+        if var.type_suffix == '$':
+            reader = 'basic_input_string'
+        elif var.type_suffix == '%':
+            reader = 'basic_input_integer'
+        else:
+            reader = 'basic_input_number'
+        value = self._call(self._runtime(reader), *prompt)
+        return [ast.Assign(targets=[self._build_target(var)], value=value)]
+
+    def _build_input_assignments(self, fields, variables):
+        """input_values = fields и присваивание переменным INPUT тех полей, которые есть в записи"""
+        result = [ast.Assign(targets=[self._store('input_values')], value=fields)]
+        for i, var in enumerate(variables):
+            has_field = ast.Compare(
+                left=self._call('len', self._load('input_values')), ops=[ast.Gt()], comparators=[ast.Constant(i)]
+            )
+            field = ast.Subscript(value=self._load('input_values'), slice=ast.Constant(i), ctx=LOAD)
+            assign = ast.Assign(targets=[self._build_target(var)], value=field)
+            result.append(ast.If(test=has_field, body=[assign], orelse=[]))
+        return result
+
+    def _build_open(self, open_node):
+        path = self._build_expression(open_node.path)
+        channel = self._build_integer_expression(open_node.channel)
+        if open_node.mode == 'RANDOM':
+            arguments = [path, channel]
+            if open_node.record_length is not None:
+                arguments.append(self._build_integer_expression(open_node.record_length))
+            return [ast.Expr(self._call(self._runtime('basic_open_random'), *arguments))]
+        return [ast.Expr(self._call(self._runtime('basic_open'), path, ast.Constant(open_node.mode), channel))]
+
+    def _build_unpack(self, variables, value):
+        """Присваивание списка полей записи переменным FIELD"""
+        targets = ast.Tuple(elts=[self._build_target(var) for var in variables], ctx=STORE)
+        return ast.Assign(targets=[targets], value=value)
+
+    def _build_get(self, get_node):
+        arguments = [self._build_integer_expression(get_node.channel)]
+        if get_node.record is not None:
+            arguments.append(self._build_integer_expression(get_node.record))
+        return self._call(self._runtime('file_get'), *arguments)
+
+    def _build_put(self, put_node):
+        channel = self._build_integer_expression(put_node.channel)
+        record = self._build_integer_expression(put_node.record) if put_node.record is not None else ast.Constant(None)
+        values = [self._build_expression(var) for var in put_node.variables]
+        return [ast.Expr(self._call(self._runtime('file_put'), channel, record, *values))]
+
+    def _build_target(self, var_node):
+        if isinstance(var_node, ArrayElementNode):
+            return self._build_array_element(var_node, STORE)
+        return self._store(self._format_variable_name(var_node))
+
+    def _build_dim(self, dim_node):
+        result = []
+        for array in dim_node.arrays:
+            size = self._array_size(array)
+            if isinstance(size, int):
+                size = ast.Constant(size)
+            else:
+                first, rest = size
+                size = ast.BinOp(left=self._build_integer_expression(first), op=ast.Add(), right=ast.Constant(1))
+                if rest != 1:
+                    size = ast.BinOp(left=size, op=ast.Mult(), right=ast.Constant(rest))
+            if array.type_suffix == '$':
+                items = ast.List(elts=[self._load(self._string_constant(''))], ctx=LOAD)
+            else:
+                self.uses_array = True
+                typecode, zero = self._array_typecode(array)
+                items = self._call('array', ast.Constant(typecode), ast.List(elts=[ast.Constant(zero)], ctx=LOAD))
+            storage = ast.BinOp(left=items, op=ast.Mult(), right=size)
+            result.append(ast.Assign(targets=[self._store(self._format_variable_name(array))], value=storage))
+        return result
+
+    def _build_mat_let(self, mat_node):
+        operands = [
+            self._call(self._runtime('mat_view'), *self._build_matrix_arguments(matrix)) for matrix in mat_node.operands
+        ]
+        if mat_node.operation == 'COPY':
+            value = operands[0]
+        elif mat_node.operation == 'SCALE':
+            value = self._call(self._runtime('mat_scale'), self._build_expression(mat_node.factor), operands[0])
+        else:
+            value = self._call(self._runtime(MAT_OPERATIONS[mat_node.operation]), *operands)
+        arguments = self._build_matrix_arguments(mat_node.target) + [value]
+        return [ast.Expr(self._call(self._runtime('mat_assign'), *arguments))]
+
+    def _build_mat_read(self, mat_node):
+        return [
+            ast.Expr(self._call(
+                self._runtime('mat_read'), *self._build_matrix_arguments(matrix), self._load(self._data_reader())
+            ))
+            for matrix in mat_node.matrices
+        ]
+
+    def _build_mat_print(self, mat_node):
+        result = []
+        for matrix, separator in zip(mat_node.matrices, mat_node.separators):
+            arguments = self._build_matrix_arguments(matrix) + ([ast.Constant(True)] if separator == ';' else [])
+            result.append(ast.Expr(self._call(self._runtime('mat_print'), *arguments)))
+        return result
+
+    def _build_matrix_arguments(self, matrix_node):
+        return [self._load(self._format_variable_name(matrix_node)), ast.Constant(self._matrix_columns(matrix_node))]
+
+    def _build_read(self, read_node):
+        result = []
+        for var in read_node.variables:
+            method = ast.Attribute(value=self._load(self._data_reader()), attr=self._data_read_method(var), ctx=LOAD)
+            value = ast.Call(func=method, args=[], keywords=[])
+            result.append(ast.Assign(targets=[self._build_target(var)], value=value))
+        return result
+
+    def _build_array_element(self, element_node, ctx):
+        return ast.Subscript(
+            value=self._load(self._format_variable_name(element_node)),
+            slice=self._build_array_index(element_node), ctx=ctx
+        )
+
+    def _build_array_index(self, element_node, checked=True):
+        terms, offset = self._array_index_terms(element_node, checked)
+        index = None
+        for index_node, stride, dimension in terms:
+            term = self._build_subscript(element_node, index_node, dimension)
+            if stride != 1:
+                term = ast.BinOp(left=term, op=ast.Mult(), right=ast.Constant(stride))
+            index = term if index is None else ast.BinOp(left=index, op=ast.Add(), right=term)
+        if index is None:
+            return ast.Constant(offset)
+        if offset:
+            index = ast.BinOp(left=index, op=ast.Add(), right=ast.Constant(offset))
+        return index
+
+    def _build_subscript(self, element_node, index_node, dimension):
+        if dimension is None:
+            return self._build_integer_expression(index_node)
+        return self._call(
+            self._runtime('basic_index'), self._build_expression(index_node, exact=False),
+            self._build_array_bound(element_node, dimension)
+        )
+
+    def _build_array_bound(self, element_node, dimension):
+        bound = self._array_bound(element_node, dimension)
+        if bound is not None:
+            return ast.Constant(bound)
+        stride = self._dimension_stride(element_node, dimension)
+        length = self._call('len', self._load(self._format_variable_name(element_node)))
+        if stride != 1:
+            length = ast.BinOp(left=length, op=ast.FloorDiv(), right=ast.Constant(stride))
+        return ast.BinOp(left=length, op=ast.Sub(), right=ast.Constant(1))
+
+    def _build_expression(self, expr_node, exact=True):
+        """Узел выражения Python; exact имеет тот же смысл, что и в _generate_expression"""
+        if isinstance(expr_node, NumberNode):
+            if not exact and self._is_integer_literal(expr_node.value):
+                return ast.Constant(int(expr_node.value))
+            return ast.Constant(expr_node.value)
+
+        elif isinstance(expr_node, StringNode):
+            return self._load(self._string_constant(expr_node.value))
+
+        elif isinstance(expr_node, VariableNode):
+            return self._load(self._format_variable_name(expr_node))
+
+        elif isinstance(expr_node, ArrayElementNode):
+            return self._build_array_element(expr_node, LOAD)
+
+        elif isinstance(expr_node, BinaryOpNode):
+            if expr_node.op in COMPARISON_OPERATORS:
+                return ast.Compare(
+                    left=self._build_operand(expr_node.left, exact=False),
+                    ops=[COMPARISON_OPERATORS[expr_node.op]()],
+                    comparators=[self._build_operand(expr_node.right, exact=False)]
+                )
+            left_exact, right_exact = self._operands_exactness(expr_node, exact)
+            return ast.BinOp(
+                left=self._build_expression(expr_node.left, left_exact),
+                op=BINARY_OPERATORS[expr_node.op](),
+                right=self._build_expression(expr_node.right, right_exact)
+            )
+
+        elif isinstance(expr_node, UnaryOpNode):
+            operand = self._build_expression(expr_node.operand, exact)
+            return ast.UnaryOp(op=UNARY_OPERATORS[expr_node.op](), operand=operand)
+
+        elif isinstance(expr_node, FunctionCallNode):
+            if expr_node.name == 'INT':
+                argument = self._build_expression(expr_node.arguments[0], exact)
+                return ast.BinOp(left=argument, op=ast.FloorDiv(), right=ast.Constant(1))
+            arguments = [] if expr_node.name == 'RND' else [
+                self._build_expression(argument, self._argument_exactness(expr_node, exact))
+                for argument in expr_node.arguments
+            ]
+            return self._call(f"_{self._builtin_function(expr_node.name)}", *arguments)
+
+        elif isinstance(expr_node, FnCallNode):
+            inlined = self._inlined_call(expr_node)
+            if inlined is not None:
+                return self._build_assigned_value(expr_node.type_suffix, inlined, exact)
+            definition = self._function_definition(expr_node)
+            arguments = [
+                self._build_assigned_value(parameter.type_suffix, argument)
+                for parameter, argument in zip(definition.parameters if definition else [], expr_node.arguments)
+            ] + [self._load(self._format_variable_name(node)) for node in self._function_globals(expr_node)]
+            return self._call(self._user_function(expr_node), *arguments)
+
+        else:
+            raise ValueError(f"Неизвестный тип узла выражения: {type(expr_node)}")
+
+    def _build_operand(self, expr_node, exact=True):
+        if isinstance(expr_node, StringNode):
+            return ast.Constant(expr_node.value)
+        return self._build_expression(expr_node, exact)
+
+    def _build_integer_expression(self, expr_node):
+        value = self._constant_value(expr_node)
+        if value is not None:
+            return ast.Constant(int(value))
+        expr = self._build_expression(expr_node, exact=False)
+        return expr if self._is_int_valued(expr_node) else self._call('int', expr)
+
+    def _function(self, name, body):
+        arguments = ast.arguments(posonlyargs=[], args=[], kwonlyargs=[], kw_defaults=[], defaults=[])
+        return ast.FunctionDef(name=name, args=arguments, body=body, decorator_list=[])
+
+    def _call(self, function_name, *args):
+        return ast.Call(func=self._load(function_name), args=list(args), keywords=[])
+
+    def _load(self, name):
+        if name in self.slot_references:
+            return self._slot(name, LOAD)
+        return ast.Name(id=name, ctx=LOAD)
+
+    def _store(self, name):
+        if name in self.slot_references:
+            return self._slot(name, STORE)
+        return ast.Name(id=name, ctx=STORE)
+
+    def _slot(self, reference, ctx):
+        """_slots[N] для переменной, хранящейся в ячейке списка"""
+        return ast.Subscript(
+            value=ast.Name(id='_slots', ctx=LOAD), slice=ast.Constant(self.slot_references[reference]), ctx=ctx
+        )
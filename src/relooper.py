@@ -0,0 +1,564 @@
+from ast_nodes import (
+    ProgramNode, EndNode, LetNode, NumberNode, VariableNode, BinaryOpNode, BreakNode, ContinueNode, LoopNode, IfBlockNode,
+    DispatchStateNode, DispatchNode, JumpNode, SubroutineNode, SubroutineReturnNode, CaseNode, SwitchNode
+)
+from control_flow import ControlFlowBuilder, StateMachineLowering, Jump, Branch, Switch, Call, Return, Halt
+from optimizers import Optimizer
+from chunked_layout import MAX_INDENT_DEPTH
+
+# Наибольшая вложенность структурируемых участков. Каждый уровень — несколько кадров стека
+# рекурсивного обхода; программа с более глубокой вложенностью все равно превысила бы предел
+# отступов раскладки chunked, поэтому ее сразу раскладывает ChunkedLowering
+MAX_STRUCTURE_DEPTH = MAX_INDENT_DEPTH
+
+
+class StructureError(Exception):
+    """Участок графа нельзя выразить через while/if/break/continue"""
+    pass
+
+
+class NestingLimitError(Exception):
+    """Вложенность участков превышает MAX_STRUCTURE_DEPTH"""
+    pass
+
+
+class Loop:
+    """Естественный цикл: заголовок, множество блоков тела и блок, к которому ведёт выход"""
+
+    def __init__(self, header, body, exit_block, parent=None):
+        self.header = header
+        self.body = body
+        self.exit = exit_block
+        self.parent = parent
+        # Переходы к заголовку или выходу внешних циклов, выполняемые через флаг _loop_exit
+        self.escapes = []
+
+
+_INVERTED_COMPARISONS = {'<': '>=', '>=': '<', '>': '<=', '<=': '>', '=': '<>', '<>': '='}
+
+
+def compute_immediate_dominators(order, predecessors):
+    """
+    Итеративный алгоритм Купера-Харви-Кеннеди.
+    order — узлы в обратном порядке обхода (order[0] — корень), predecessors(узел) — его предшественники.
+    """
+    index = {node: i for i, node in enumerate(order)}
+    idom = {order[0]: order[0]}
+
+    def intersect(a, b):
+        while a is not b:
+            while index[a] > index[b]:
+                a = idom[a]
+            while index[b] > index[a]:
+                b = idom[b]
+        return a
+
+    changed = True
+    while changed:
+        changed = False
+        for node in order[1:]:
+            new_idom = None
+            for pred in predecessors(node):
+                if pred in idom and pred in index:
+                    new_idom = pred if new_idom is None else intersect(pred, new_idom)
+            if new_idom is not None and idom.get(node) is not new_idom:
+                idom[node] = new_idom
+                changed = True
+    return idom
+
+
+class Relooper(Optimizer):
+    """
+    Восстанавливает структурный поток управления из графа переходов программы.
+
+    Естественные циклы становятся while, ветвления — if/else, а переходы по таблице (ON,
+    SELECT CASE) — выбором ветви по словарю; точка слияния ветвей — постдоминатор.
+    Переходы к заголовку и выходу цикла — continue и break. Участки, которые так выразить
+    нельзя (несводимые циклы, GOSUB/RETURN, переходы через несколько уровней циклов),
+    компилируются в локальный цикл диспетчеризации только в пределах этого участка.
+    """
+
+    def optimize(self, ast_root):
+        cfg = ControlFlowBuilder().build(ast_root)
+        subroutines = [
+            SubroutineNode(name, self.structure_graph(graph, in_subroutine=True))
+            for name, graph in cfg.extract_subroutines()
+        ]
+        return ProgramNode(subroutines + self.structure_graph(cfg))
+
+    def structure_graph(self, cfg, in_subroutine=False):
+        self.cfg = cfg
+        # Выход за конец графа подпрограммы — это RETURN, а не завершение программы
+        self.exit_statement = SubroutineReturnNode if in_subroutine else EndNode
+        self.preds = cfg.predecessors()
+        self.idom = compute_immediate_dominators(cfg.blocks, lambda block: self.preds[block])
+        self._number_dominator_tree()
+        self.loops = self._find_loops()
+        self.postdominators = {}
+        self.emitted = set()
+        self.emit_log = []
+        self.active_loops = set()
+        self.depth = 0
+
+        try:
+            statements = self._structure(cfg.entry, None, None)
+        except StructureError:
+            return [StateMachineLowering().lower_graph(cfg)]
+        return self._tidy(statements)
+
+    # --- Анализ графа ---
+
+    def _number_dominator_tree(self):
+        children = {block: [] for block in self.cfg.blocks}
+        for block, parent in self.idom.items():
+            if block is not parent:
+                children[parent].append(block)
+
+        self.dom_enter = {}
+        self.dom_leave = {}
+        counter = 0
+        stack = [(self.cfg.entry, False)]
+        while stack:
+            block, leaving = stack.pop()
+            counter += 1
+            if leaving:
+                self.dom_leave[block] = counter
+                continue
+            self.dom_enter[block] = counter
+            stack.append((block, True))
+            stack.extend((child, False) for child in children[block])
+
+    def _dominates(self, a, b):
+        return self.dom_enter[a] <= self.dom_enter[b] and self.dom_leave[b] <= self.dom_leave[a]
+
+    def _find_loops(self):
+        """Находит естественные циклы по обратным рёбрам (переход к доминатору)"""
+        loops = {}
+        for block in self.cfg.blocks:
+            for succ in block.successors():
+                if not self._dominates(succ, block):
+                    continue
+                body = loops.setdefault(succ, {succ})
+                stack = [block]
+                while stack:
+                    node = stack.pop()
+                    if node not in body:
+                        body.add(node)
+                        stack.extend(self.preds[node])
+        return loops
+
+    def _loop_exit(self, header, body):
+        exits = sorted(
+            {succ for block in body for succ in block.successors() if succ not in body},
+            key=lambda block: block.id
+        )
+        if not exits:
+            return None
+        for succ in header.successors():
+            if succ in exits:
+                return succ
+        return exits[-1]
+
+    def _region_successors(self, block, loop):
+        terminator = block.terminator
+        if isinstance(terminator, Call):
+            targets = [terminator.return_target]
+        elif isinstance(terminator, (Return, Halt)):
+            targets = [None]
+        else:
+            targets = terminator.successors() or [None]
+
+        result = []
+        for target in targets:
+            inside = target is not None and (loop is None or (target in loop.body and target is not loop.header))
+            result.append(target if inside else None)
+        return result
+
+    def _immediate_postdominator(self, block, loop):
+        """Точка слияния ветвей: ближайший постдоминатор в пределах текущего цикла (или всей программы)"""
+        key = loop.header if loop else None
+        if key not in self.postdominators:
+            self.postdominators[key] = self._compute_postdominators(loop)
+        ipdom, exit_node = self.postdominators[key]
+        result = ipdom.get(block)
+        return result if result is not exit_node else None
+
+    def _compute_postdominators(self, loop):
+        nodes = loop.body if loop else self.cfg.blocks
+        exit_node = object()
+
+        successors = {block: [s if s is not None else exit_node for s in self._region_successors(block, loop)]
+                      for block in nodes}
+        reverse_successors = {exit_node: []}
+        for block in nodes:
+            reverse_successors.setdefault(block, [])
+        for block, targets in successors.items():
+            for target in targets:
+                reverse_successors[target].append(block)
+
+        visited = {exit_node}
+        postorder = []
+        stack = [(exit_node, iter(reverse_successors[exit_node]))]
+        while stack:
+            node, it = stack[-1]
+            for pred in it:
+                if pred not in visited:
+                    visited.add(pred)
+                    stack.append((pred, iter(reverse_successors[pred])))
+                    break
+            else:
+                stack.pop()
+                postorder.append(node)
+        postorder.reverse()
+
+        return compute_immediate_dominators(postorder, lambda node: successors.get(node, [])), exit_node
+
+    # --- Структурирование ---
+
+    def _structure(self, block, follow, loop):
+        """Строит инструкции участка, начиная с block, до блока follow (не включая его)"""
+        if self.depth >= MAX_STRUCTURE_DEPTH:
+            raise NestingLimitError(f"Вложенность участков больше {MAX_STRUCTURE_DEPTH}")
+        self.depth += 1
+        try:
+            return self._structure_sequence(block, follow, loop)
+        finally:
+            self.depth -= 1
+
+    def _structure_sequence(self, block, follow, loop):
+        statements = []
+        # Начало каждого шага: (блок, позиция в журнале размещения, длина statements,
+        # шаг - участок диспетчеризации)
+        steps = []
+        while block is not None and block is not follow:
+            steps.append((block, len(self.emit_log), len(statements), False))
+            try:
+                step, block = self._structure_step(block, follow, loop)
+            except StructureError:
+                step, block = self._dispatch_steps(steps, statements, follow, loop)
+            statements.extend(step)
+        return statements
+
+    def _dispatch_steps(self, steps, statements, follow, loop):
+        """
+        Участок диспетчеризации с начала последнего шага. Если в участок попадают блоки,
+        размещённые предыдущими шагами (второй вход в цикл уже выведен как ветвь), эти шаги
+        отменяются и участок начинается раньше. Повторно отменённый участок диспетчеризации
+        занимает все достижимые блоки, иначе продолжение после него снова не структурировалось бы
+        """
+        while steps:
+            start, saved, length, dispatched = steps.pop()
+            self._rollback(saved)
+            del statements[length:]
+            try:
+                dispatch = self._dispatch_region(start, follow, loop, bounded=not dispatched)
+            except StructureError:
+                continue
+            steps.append((start, saved, length, True))
+            return dispatch
+        raise StructureError("Участок пересекается с блоками, размещёнными снаружи")
+
+    def _structure_step(self, block, follow, loop):
+        if block in self.loops and block not in self.active_loops:
+            return self._structure_loop(block, follow, loop)
+
+        self._mark_emitted(block)
+
+        statements = list(block.statements)
+        terminator = block.terminator
+
+        if isinstance(terminator, Jump):
+            edge, next_block = self._edge(terminator.target, follow, loop)
+            return statements + edge, next_block
+
+        if isinstance(terminator, Branch):
+            join = self._immediate_postdominator(block, loop)
+            arm_follow = join if join is not None else follow
+            then_body = self._arm(terminator.true_target, arm_follow, loop)
+            else_body = self._arm(terminator.false_target, arm_follow, loop)
+            statements.append(IfBlockNode(terminator.condition, then_body, else_body))
+            return statements, arm_follow
+
+        if isinstance(terminator, Switch):
+            # Ветви таблицы сходятся в постдоминаторе так же, как ветви if/else
+            join = self._immediate_postdominator(block, loop)
+            arm_follow = join if join is not None else follow
+            cases = [CaseNode(keys, self._arm(target, arm_follow, loop)) for target, keys in terminator.arms()]
+            default_body = self._arm(terminator.default, arm_follow, loop)
+            statements.append(SwitchNode(terminator.selector, cases, default_body, terminator.rounded))
+            return statements, arm_follow
+
+        if isinstance(terminator, Halt):
+            return statements, None
+
+        raise StructureError("GOSUB/RETURN выражаются только через диспетчеризацию")
+
+    def _mark_emitted(self, block):
+        if block in self.emitted:
+            raise StructureError(f"Блок {block.id} уже размещён")
+        self.emitted.add(block)
+        self.emit_log.append(block)
+
+    def _rollback(self, saved):
+        """Отменяет размещение блоков после неудачной попытки структурирования"""
+        for block in self.emit_log[saved:]:
+            self.emitted.discard(block)
+        del self.emit_log[saved:]
+
+    def _structure_loop(self, header, follow, outer_loop):
+        body = self.loops[header]
+        loop = Loop(header, body, self._loop_exit(header, body), outer_loop)
+
+        self.active_loops.add(header)
+        try:
+            body_statements = self._structure(header, None, loop)
+        finally:
+            self.active_loops.discard(header)
+
+        statements = [LoopNode(body_statements)]
+        if loop.escapes:
+            exit_flag = VariableNode('_loop_exit')
+            statements.insert(0, LetNode(exit_flag, NumberNode(-1)))
+            for target in loop.escapes:
+                edge, _ = self._edge(target, follow, outer_loop)
+                statements.append(IfBlockNode(BinaryOpNode(exit_flag, '=', NumberNode(target.id)), edge))
+
+        if loop.exit is None:
+            return statements, None
+        # Выход внутреннего цикла может вести к заголовку или выходу внешнего
+        edge, next_block = self._edge(loop.exit, follow, outer_loop)
+        return statements + edge, next_block
+
+    def _arm(self, target, follow, loop):
+        edge, next_block = self._edge(target, follow, loop)
+        if next_block is None or next_block is follow:
+            return edge
+        return edge + self._structure(next_block, follow, loop)
+
+    def _edge(self, target, follow, loop):
+        """Возвращает инструкции перехода к target и блок, с которого продолжается обход"""
+        if target is None:
+            # Выход за конец программы: на верхнем уровне достаточно дойти до конца main()
+            if loop is None and follow is None:
+                return [], None
+            return [self.exit_statement()], None
+        if loop is not None and target is loop.header:
+            return [ContinueNode()], None
+        if loop is not None and target is loop.exit:
+            return [BreakNode()], None
+        if loop is not None and self._is_outer_loop_target(target, loop.parent):
+            # break сразу из нескольких циклов: флаг проверяется после каждого из них
+            if target not in loop.escapes:
+                loop.escapes.append(target)
+            return [LetNode(VariableNode('_loop_exit'), NumberNode(target.id)), BreakNode()], None
+        if target is follow:
+            return [], follow
+        if target in self.emitted:
+            raise StructureError(f"Повторный вход в блок {target.id}")
+        return [], target
+
+    def _is_outer_loop_target(self, target, loop):
+        while loop is not None:
+            if target is loop.header or target is loop.exit:
+                return True
+            loop = loop.parent
+        return False
+
+    def _dispatch_region(self, start, follow, loop, bounded=True):
+        """
+        Компилирует в локальный цикл диспетчеризации участок, который не удалось структурировать.
+        Возвращает инструкции и блок, с которого продолжается структурный обход. Участок - блоки
+        циклов, в которые ведет start, и ветви между ними до общего постдоминатора их выходов;
+        если в участке есть GOSUB/RETURN или выходы не сходятся в одном блоке, в него попадает
+        все, что достижимо из start. С bounded=False участок всегда занимает все достижимое
+        """
+        stops = {follow, None}
+        if loop is not None:
+            stops.add(loop.exit)
+            if start is not loop.header:
+                stops.add(loop.header)
+
+        reachable = self._reachable([start], stops)
+        region = self._bounded_region(start, reachable, stops, follow, loop) if bounded else None
+        region, next_block = region if region is not None else (reachable, None)
+        if any(block in self.emitted for block in region):
+            raise StructureError("Блок участка уже размещён")
+
+        region = sorted(region, key=lambda block: block.id)
+        state_ids = {block: index for index, block in enumerate(region)}
+        for block in region:
+            if isinstance(block.terminator, Call) and not all(
+                    target in state_ids for target in block.terminator.successors()):
+                raise StructureError("GOSUB с возвратом за пределы участка")
+
+        exits = []
+        exit_ids = {}
+
+        def jump_to(target):
+            if target in state_ids:
+                return [JumpNode(state_ids[target])]
+            if target not in exit_ids:
+                exit_ids[target] = len(region) + len(exit_ids)
+                edge, _ = self._edge(target, follow, loop)
+                exits.append(DispatchStateNode(exit_ids[target], edge))
+            return [JumpNode(exit_ids[target]), BreakNode()]
+
+        lowering = StateMachineLowering()
+        states = [
+            DispatchStateNode(state_ids[block], lowering.lower_block(block, jump_to, lambda target: state_ids[target]))
+            for block in region
+        ]
+        for block in region:
+            self._mark_emitted(block)
+        return [DispatchNode(states, state_ids[start], exits)], next_block
+
+    def _reachable(self, blocks, stops):
+        """Блоки, достижимые из blocks, не проходя через stops"""
+        seen = {block for block in blocks if block not in stops}
+        stack = list(seen)
+        while stack:
+            for succ in stack.pop().successors():
+                if succ not in seen and succ not in stops:
+                    seen.add(succ)
+                    stack.append(succ)
+        return seen
+
+    def _bounded_region(self, start, reachable, stops, follow, loop):
+        """
+        Участок для _dispatch_region с одним блоком продолжения: (блоки, блок продолжения) или
+        None. Участок замкнут: в него входят все достижимые блоки, из которых можно вернуться в
+        участок, поэтому продолжение структурируется без повторного входа в размещённые блоки
+        """
+        region = {start}
+        while True:
+            region = self._closure(region, reachable)
+            if any(isinstance(block.terminator, (Call, Return)) for block in region):
+                # RETURN с пустым стеком возвратов выходит из цикла диспетчеризации, и вместо
+                # завершения программы выполнилось бы продолжение после участка
+                return None
+
+            exits = {
+                target for block in region for target in self._exit_targets(block)
+                if target not in region and not self._leaves_sequence(target, follow, loop)
+            }
+            if len(exits) <= 1:
+                return region, next(iter(exits), None)
+
+            # Выходы сходятся в постдоминаторе: ветви между ними и ним тоже входят в участок
+            join = self._common_postdominator(exits, loop)
+            if join is None or any(target in stops and target is not join for target in exits):
+                return None
+            region |= self._reachable(exits, stops | {join})
+
+    def _closure(self, region, reachable):
+        """Участок вместе с достижимыми блоками, из которых в него можно вернуться"""
+        closed = set(region)
+        stack = list(region)
+        while stack:
+            for pred in self.preds[stack.pop()]:
+                if pred in reachable and pred not in closed:
+                    closed.add(pred)
+                    stack.append(pred)
+        return closed
+
+    def _exit_targets(self, block):
+        """Переходы блока; None - выход за конец программы"""
+        if isinstance(block.terminator, Jump):
+            return [block.terminator.target]
+        return block.terminator.successors()
+
+    def _leaves_sequence(self, target, follow, loop):
+        """Переход к target - break, continue или выход из программы, а не продолжение участка"""
+        if target is None:
+            return loop is not None or follow is not None
+        return loop is not None and (
+            target is loop.header or target is loop.exit or self._is_outer_loop_target(target, loop.parent)
+        )
+
+    def _common_postdominator(self, blocks, loop):
+        """Ближайший общий постдоминатор блоков в пределах цикла или None"""
+        chains = []
+        for block in blocks:
+            chain = []
+            while block is not None:
+                chain.append(block)
+                block = self._immediate_postdominator(block, loop)
+            chains.append(chain)
+        common = set(chains[0]).intersection(*chains[1:])
+        return next((block for block in chains[0] if block in common), None)
+
+    # --- Приведение к читаемому виду ---
+
+    def _tidy(self, statements):
+        result = []
+        for stmt in statements:
+            if isinstance(stmt, IfBlockNode):
+                stmt.then_body = self._tidy(stmt.then_body)
+                stmt.else_body = self._tidy(stmt.else_body)
+                if stmt.else_body and self._ends_with_jump(stmt.then_body):
+                    # if c: ...; break else: X  ->  if c: ...; break  X
+                    result.append(IfBlockNode(stmt.condition, stmt.then_body))
+                    result.extend(stmt.else_body)
+                    continue
+            elif isinstance(stmt, SwitchNode):
+                for case in stmt.cases:
+                    case.body = self._tidy(case.body)
+                stmt.default_body = self._tidy(stmt.default_body)
+            elif isinstance(stmt, LoopNode):
+                stmt = self._tidy_loop(stmt)
+            elif isinstance(stmt, DispatchNode):
+                for exit_state in stmt.exits:
+                    exit_state.statements = self._tidy(exit_state.statements)
+            result.append(stmt)
+            if self._ends_with_jump([stmt]):
+                break
+        return result
+
+    def _tidy_loop(self, loop_node):
+        body = loop_node.body
+        if loop_node.condition is None and len(body) == 1 and isinstance(body[0], IfBlockNode):
+            branch = body[0]
+            if self._is_break(branch.else_body):
+                # while True: if c: тело else: break  ->  while c: тело
+                loop_node = LoopNode(branch.then_body, branch.condition)
+            elif self._is_break(branch.then_body) and self._invert(branch.condition) is not None:
+                loop_node = LoopNode(branch.else_body, self._invert(branch.condition))
+
+        loop_node.body = self._strip_trailing_continue(self._tidy(loop_node.body))
+        return loop_node
+
+    def _strip_trailing_continue(self, statements):
+        if statements and isinstance(statements[-1], ContinueNode):
+            return statements[:-1]
+        if statements and isinstance(statements[-1], IfBlockNode):
+            last = statements[-1]
+            last.then_body = self._strip_trailing_continue(last.then_body)
+            last.else_body = self._strip_trailing_continue(last.else_body)
+            if not last.then_body and not last.else_body:
+                return statements[:-1]
+        if statements and isinstance(statements[-1], SwitchNode):
+            last = statements[-1]
+            for case in last.cases:
+                case.body = self._strip_trailing_continue(case.body)
+            last.default_body = self._strip_trailing_continue(last.default_body)
+        return statements
+
+    def _ends_with_jump(self, statements):
+        if not statements:
+            return False
+        last = statements[-1]
+        if isinstance(last, (BreakNode, ContinueNode, EndNode, SubroutineReturnNode)):
+            return True
+        if isinstance(last, IfBlockNode):
+            return self._ends_with_jump(last.then_body) and self._ends_with_jump(last.else_body)
+        if isinstance(last, SwitchNode):
+            return all(self._ends_with_jump(body) for body in [case.body for case in last.cases] + [last.default_body])
+        return False
+
+    def _is_break(self, statements):
+        return len(statements) == 1 and isinstance(statements[0], BreakNode)
+
+    def _invert(self, condition):
+        if isinstance(condition, BinaryOpNode) and condition.op in _INVERTED_COMPARISONS:
+            return BinaryOpNode(condition.left, _INVERTED_COMPARISONS[condition.op], condition.right)
+        return None
@@ -1,13 +1,22 @@
 from ast_nodes import (
     ProgramNode, PrintNode, LetNode, EndNode, IfNode, GotoNode, LabelReferenceNode,
     ForNode, NextNode, GosubNode, ReturnNode, WhileNode, InputNode,
-    NumberNode, StringNode, VariableNode, BinaryOpNode, UnaryOpNode, LabelNode
+    NumberNode, StringNode, VariableNode, BinaryOpNode, UnaryOpNode, LabelNode,
+    OnJumpNode, SelectCaseNode, CaseRangeNode, CaseIsNode, DimNode, ArrayElementNode,
+    MatLetNode, MatReadNode, MatPrintNode, DataNode, ReadNode, FunctionCallNode,
+    DefFnNode, FnCallNode, OpenNode, CloseNode, FieldNode, GetNode, PutNode
 )
+from control_flow import ControlFlowBuilder, Return
+from basic_runtime import DEFAULT_RECORD_LENGTH
 
 class SemanticError(Exception):
     """Исключение для семантических ошибок"""
     pass
 
+# Классы хранения переменных в сгенерированном коде
+STORAGE_LOCAL = 'local'  # быстрая локальная переменная функции (LOAD_FAST/STORE_FAST)
+STORAGE_SLOT = 'slot'    # ячейка общего списка _slots с постоянным индексом
+
 class Symbol:
     """Класс для представления символа в таблице символов"""
     def __init__(self, name, type_suffix=None, value=None, initialized=False, line_number=None):
@@ -16,6 +25,13 @@ class Symbol:
         self.value = value
         self.initialized = initialized
         self.line_number = line_number  # Номер строки, где символ был объявлен
+        # Число измерений массива; None — простая переменная
+        self.dimensions = None
+        # Наибольшие индексы измерений массива из DIM; None — индекс не константа
+        self.bounds = None
+        # Номер ячейки и класс хранения назначаются перед генерацией кода
+        self.slot = None
+        self.storage = STORAGE_LOCAL
     
     def __repr__(self):
         return f"Symbol({self.name}, type={self.type_suffix}, initialized={self.initialized})"
@@ -25,6 +41,17 @@ class SymbolTable:
     def __init__(self):
         self.symbols = {}
         self.labels = {}
+        # Массивы по (имени, суффиксу): A(), A%() и простая переменная A — разные объекты
+        self.arrays = {}
+        # Переменные сгенерированного кода по (имени, суффиксу), включая служебные переменные
+        # циклов, в порядке номеров ячеек
+        self.slots = {}
+        # Значения всех DATA программы в порядке записи: их по очереди читают READ и MAT READ
+        self.data = []
+        # Функции пользователя DEF FN по (имени, суффиксу)
+        self.functions = {}
+        # Описания FIELD по номерам файлов: их переменные читает GET и записывает PUT
+        self.fields = {}
     
     def add_variable(self, name, type_suffix=None, initialized=False, line_number=None):
         """Добавляет или обновляет переменную в таблице символов"""
@@ -36,6 +63,18 @@ class SymbolTable:
         self.symbols[name] = symbol
         return symbol
     
+    def add_array(self, name, type_suffix, dimensions, bounds=None):
+        """Добавляет массив с заданным числом измерений в таблицу символов"""
+        symbol = Symbol(name, type_suffix, initialized=True)
+        symbol.dimensions = dimensions
+        symbol.bounds = bounds or [None] * dimensions
+        self.arrays[(name, type_suffix)] = symbol
+        return symbol
+
+    def get_array(self, name, type_suffix=None):
+        """Возвращает массив из таблицы символов или None, если он не объявлен в DIM"""
+        return self.arrays.get((name, type_suffix))
+
     def add_label(self, label_node):
         """Добавляет метку в таблицу символов"""
         self.labels[label_node.name] = label_node
@@ -47,9 +86,28 @@ class SymbolTable:
     def get_label(self, name_or_number):
         """Возвращает метку из таблицы символов или None, если не найдена"""
         return self.labels.get(name_or_number)
+
+    def assign_slot(self, name, type_suffix=None, storage=STORAGE_LOCAL):
+        """
+        Закрепляет за переменной номер ячейки и класс хранения. Номер выдается при первом
+        обращении и дальше не меняется; класс хранения STORAGE_SLOT не понижается до локального.
+        """
+        key = (name, type_suffix)
+        symbol = self.slots.get(key)
+        if symbol is None:
+            symbol = Symbol(name, type_suffix)
+            symbol.slot = len(self.slots)
+            self.slots[key] = symbol
+        if storage == STORAGE_SLOT:
+            symbol.storage = STORAGE_SLOT
+        return symbol
+
+    def get_slot(self, name, type_suffix=None):
+        """Ячейка переменной сгенерированного кода или None, если она не назначена"""
+        return self.slots.get((name, type_suffix))
     
     def __repr__(self):
-        return f"SymbolTable(variables={list(self.symbols.keys())}, labels={list(self.labels.keys())})"
+        return f"SymbolTable(variables={list(self.symbols.keys())}, labels={list(self.labels.keys())}, slots={len(self.slots)})"
 
 class TypeAnalyzer:
     """Анализатор типов выражений"""
@@ -72,6 +130,21 @@ class TypeAnalyzer:
             if not variable:
                 raise SemanticError(f"Использование необъявленной переменной: {node.name}")
             return variable.type_suffix
+
+        elif isinstance(node, ArrayElementNode):
+            array = symbol_table.get_array(node.name, node.type_suffix)
+            array_name = node.name + (node.type_suffix or '')
+            if not array:
+                raise SemanticError(f"Использование необъявленного массива: {array_name}")
+            if len(node.indices) != array.dimensions:
+                raise SemanticError(
+                    f"Неверное число индексов массива {array_name}: ожидалось {array.dimensions}, "
+                    f"получено {len(node.indices)}"
+                )
+            for index in node.indices:
+                if TypeAnalyzer.get_expression_type(index, symbol_table) == TypeAnalyzer.STRING_TYPE:
+                    raise SemanticError(f"Индекс массива {array_name} должен быть числом")
+            return node.type_suffix
         
         elif isinstance(node, BinaryOpNode):
             left_type = TypeAnalyzer.get_expression_type(node.left, symbol_table)
@@ -97,10 +170,220 @@ class TypeAnalyzer:
             if operand_type == TypeAnalyzer.STRING_TYPE and node.op == '-':
                 raise SemanticError("Унарный минус не может быть применен к строке")
             return operand_type
+
+        elif isinstance(node, FunctionCallNode):
+            argument_types = [TypeAnalyzer.get_expression_type(argument, symbol_table) for argument in node.arguments]
+            if TypeAnalyzer.STRING_TYPE in argument_types:
+                raise SemanticError(f"Аргумент функции {node.name} должен быть числом")
+            if node.name in TypeInference.TYPE_PRESERVING_FUNCTIONS:
+                return argument_types[0]
+            return TypeAnalyzer.DEFAULT_TYPE
+
+        elif isinstance(node, FnCallNode):
+            function_name = node.name + (node.type_suffix or '')
+            definition = symbol_table.functions.get((node.name, node.type_suffix))
+            if definition is None:
+                raise SemanticError(f"Функция {function_name} не определена")
+            if len(node.arguments) != len(definition.parameters):
+                raise SemanticError(
+                    f"Неверное число аргументов функции {function_name}: ожидалось {len(definition.parameters)}, "
+                    f"получено {len(node.arguments)}"
+                )
+            for number, (parameter, argument) in enumerate(zip(definition.parameters, node.arguments), 1):
+                is_string = TypeAnalyzer.get_expression_type(argument, symbol_table) == TypeAnalyzer.STRING_TYPE
+                if is_string != (parameter.type_suffix == TypeAnalyzer.STRING_TYPE):
+                    expected = "строкой" if parameter.type_suffix == TypeAnalyzer.STRING_TYPE else "числом"
+                    raise SemanticError(f"Аргумент {number} функции {function_name} должен быть {expected}")
+            return node.type_suffix
         
         else:
             raise SemanticError(f"Неизвестный тип узла для анализа типа: {type(node)}")
 
+class TypeInference:
+    """
+    Вывод типов для всей программы. Каждому выражению сопоставляется тип значения, которое
+    оно имеет во время выполнения сгенерированного кода, а каждой переменной — объединение
+    типов всех присваиваемых ей значений. Результат записывается в атрибут inferred_type узлов.
+    """
+    INT = 'int'
+    FLOAT = 'float'
+    STRING = 'str'
+    BOOL = 'bool'         # результат сравнения
+    UNKNOWN = 'unknown'   # тип не доказан
+
+    NUMERIC_TYPES = (INT, FLOAT, BOOL)
+    COMPARISON_OPS = ('=', '<>', '<', '>', '<=', '>=')
+    # Встроенные функции, значение которых того же типа, что и аргумент; остальные возвращают float
+    TYPE_PRESERVING_FUNCTIONS = ('INT', 'ABS', 'SGN')
+
+    def __init__(self, functions=None):
+        self.variable_types = {}
+        # Определения DEF FN по (имени, суффиксу): вызов присваивает аргументы параметрам
+        self.functions = functions or {}
+        # Функции, тип тела которых вычисляется сейчас: рекурсивное определение не зацикливает вывод
+        self.evaluating = set()
+
+    def infer(self, ast_root):
+        """Вычисляет типы переменных до неподвижной точки и размечает выражения программы"""
+        assignments = []
+        # Тела функций могут не попасть в дерево после понижения, поэтому обходятся отдельно
+        roots = [ast_root] + [definition.body for definition in self.functions.values()]
+        for node in (node for root in roots for node in root.walk()):
+            # Тип элементов массива задан типом хранилища и от присваиваний не зависит
+            if isinstance(node, LetNode) and isinstance(node.variable, VariableNode):
+                assignments.append((node.variable, [node.value]))
+            elif isinstance(node, (InputNode, ReadNode, FieldNode, GetNode)):
+                for var in node.variables:
+                    if isinstance(var, VariableNode):
+                        assignments.append((var, [NumberNode(0.0)]))
+            elif isinstance(node, ForNode):
+                # Переменная цикла получает начальное значение и значения после шага;
+                # при обходе range() она приводится к float
+                step = BinaryOpNode(node.loop_variable, '+', node.step_value or NumberNode(1.0))
+                assignments.append((node.loop_variable, [NumberNode(0.0), node.start_value, step]))
+            elif isinstance(node, FnCallNode) and self._definition(node) is not None:
+                # Параметр функции получает значения аргументов всех вызовов, как переменная при LET
+                for parameter, argument in zip(self._definition(node).parameters, node.arguments):
+                    assignments.append((parameter, [argument]))
+
+        # Когда тип переменной меняется, пересчитываются только присваивания, которые её читают.
+        # Тип каждой переменной меняется не больше двух раз, поэтому вывод линеен по размеру программы
+        dependents = {}
+        for index, (variable, values) in enumerate(assignments):
+            for value in values:
+                for node in self._value_nodes(value):
+                    if isinstance(node, VariableNode):
+                        dependents.setdefault(self._variable_key(node), []).append(index)
+
+        pending = list(range(len(assignments)))
+        queued = set(pending)
+        while pending:
+            index = pending.pop()
+            queued.discard(index)
+            variable, values = assignments[index]
+            key = self._variable_key(variable)
+            current = self.variable_types.get(key)
+            new_type = current
+            for value in values:
+                new_type = self.join(new_type, self.expression_type(value))
+            if new_type != current:
+                self.variable_types[key] = new_type
+                for dependent in dependents.get(key, []):
+                    if dependent not in queued:
+                        queued.add(dependent)
+                        pending.append(dependent)
+
+        for node in (node for root in roots for node in root.walk()):
+            if isinstance(node, (NumberNode, StringNode, VariableNode, ArrayElementNode, BinaryOpNode, UnaryOpNode,
+                                 FunctionCallNode, FnCallNode)):
+                node.inferred_type = self.expression_type(node) or self.UNKNOWN
+        return self.variable_types
+
+    def _definition(self, call_node):
+        return self.functions.get((call_node.name, call_node.type_suffix))
+
+    def _value_nodes(self, value):
+        """
+        Узлы выражения вместе с телами вызываемых в нем функций: тип вызова зависит от типов
+        параметров и переменных программы, которые читает тело
+        """
+        stack = [value]
+        visited = set()
+        while stack:
+            for node in stack.pop().walk():
+                yield node
+                if isinstance(node, FnCallNode) and self._definition(node) is not None:
+                    key = node.name, node.type_suffix
+                    if key not in visited:
+                        visited.add(key)
+                        stack.append(self._definition(node).body)
+
+    def variable_type(self, var_node):
+        if var_node.type_suffix == TypeAnalyzer.INTEGER_TYPE:
+            return self.INT
+        if var_node.type_suffix == TypeAnalyzer.STRING_TYPE:
+            return self.STRING
+        return self.variable_types.get(self._variable_key(var_node))
+
+    def expression_type(self, node):
+        """Тип выражения; None — переменной ещё не присвоено ни одного значения"""
+        if isinstance(node, NumberNode):
+            return self.INT if isinstance(node.value, int) else self.FLOAT
+
+        elif isinstance(node, StringNode):
+            return self.STRING
+
+        elif isinstance(node, VariableNode):
+            return self.variable_type(node)
+
+        elif isinstance(node, ArrayElementNode):
+            # Целые массивы — array('q'), вещественные — array('d'): элемент всегда int или float
+            if node.type_suffix == TypeAnalyzer.INTEGER_TYPE:
+                return self.INT
+            if node.type_suffix == TypeAnalyzer.STRING_TYPE:
+                return self.STRING
+            return self.FLOAT
+
+        elif isinstance(node, BinaryOpNode):
+            if node.op in self.COMPARISON_OPS:
+                return self.BOOL
+
+            left_type = self.expression_type(node.left)
+            right_type = self.expression_type(node.right)
+            if left_type is None or right_type is None:
+                return None
+
+            if node.op == '+' and self.STRING in (left_type, right_type):
+                return self.STRING
+            if left_type not in self.NUMERIC_TYPES or right_type not in self.NUMERIC_TYPES:
+                return self.UNKNOWN
+            if node.op == '/':
+                return self.FLOAT
+            if self.FLOAT in (left_type, right_type):
+                return self.FLOAT
+            return self.INT
+
+        elif isinstance(node, UnaryOpNode):
+            operand_type = self.expression_type(node.operand)
+            if operand_type in (self.INT, self.BOOL):
+                return self.INT
+            return operand_type if operand_type in (self.FLOAT, None) else self.UNKNOWN
+
+        elif isinstance(node, FunctionCallNode):
+            if node.name not in self.TYPE_PRESERVING_FUNCTIONS:
+                return self.FLOAT
+            argument_type = self.expression_type(node.arguments[0])
+            if argument_type in (self.INT, self.BOOL):
+                return self.INT
+            return argument_type if argument_type in (self.FLOAT, None) else self.UNKNOWN
+
+        elif isinstance(node, FnCallNode):
+            # Результат функции FNA% приводится к int, как при присваивании целой переменной
+            if node.type_suffix == TypeAnalyzer.INTEGER_TYPE:
+                return self.INT
+            if node.type_suffix == TypeAnalyzer.STRING_TYPE:
+                return self.STRING
+            key = node.name, node.type_suffix
+            if self._definition(node) is None or key in self.evaluating:
+                return self.UNKNOWN
+            self.evaluating.add(key)
+            body_type = self.expression_type(self._definition(node).body)
+            self.evaluating.discard(key)
+            return body_type
+
+        return self.UNKNOWN
+
+    def join(self, first, second):
+        if first is None or first == second:
+            return second
+        if second is None:
+            return first
+        return self.UNKNOWN
+
+    def _variable_key(self, var_node):
+        return var_node.name, var_node.type_suffix
+
+
 class SemanticAnalyzer:
     """Класс для семантического анализа AST дерева"""
     
@@ -108,32 +391,175 @@ class SemanticAnalyzer:
         self.symbol_table = SymbolTable()
         self.errors = []
         self.for_loops_stack = []
-        self.gosub_stack = []
-        self.in_subroutine = False
+        self.reads_data = False
+        # Длины записей OPEN ... LEN по номерам файлов (None — не константа). Если номер файла
+        # записей в каком-нибудь OPEN не константа, GET и PUT по OPEN не проверяются
+        self.record_lengths = {}
+        self.record_channels_known = True
     
     def analyze(self, ast_root):
         """Основной метод для семантического анализа AST дерева"""
         if not isinstance(ast_root, ProgramNode):
             raise SemanticError("Ожидается корень AST дерева типа ProgramNode")
         
-        # Первый проход: сбор всех меток
+        # Первый проход: сбор всех меток и массивов
         self._collect_labels(ast_root)
+        self._collect_arrays(ast_root)
+        self._collect_functions(ast_root)
+        self._collect_fields(ast_root)
+        self._collect_record_files(ast_root)
         
         # Второй проход: проверка правильности ссылок и типов
         self._analyze_statements(ast_root.statements)
+
+        # Тело функции читает переменные программы в момент вызова, поэтому проверяется,
+        # когда известны все переменные
+        self._analyze_functions()
+
+        self._check_returns(ast_root)
+
+        # DATA может стоять и после READ, поэтому значения проверяются после всего прохода
+        if self.reads_data and not self.symbol_table.data:
+            self.errors.append("READ без DATA: в программе нет значений для чтения")
         
         # Возвращаем список ошибок
         return self.errors
     
     def _collect_labels(self, program_node):
-        """Собирает все метки в программе"""
-        for stmt in program_node.statements:
+        """Собирает все метки в программе, включая метки и номера строк в теле WHILE"""
+        for stmt in program_node.walk():
             if isinstance(stmt, LabelNode):
+                # Обход доходит до метки и через ссылку перехода на неё (LabelReferenceNode.target)
+                if self.symbol_table.labels.get(stmt.name) is stmt:
+                    continue
                 if stmt.name in self.symbol_table.labels:
                     self.errors.append(f"Дублирование метки: {stmt.name}")
                 else:
                     self.symbol_table.add_label(stmt)
     
+    def _collect_arrays(self, program_node):
+        """
+        Собирает массивы всех DIM программы: массив может использоваться в тексте раньше
+        своего DIM, например в подпрограмме, которая вызывается после него
+        """
+        for stmt in program_node.walk():
+            if not isinstance(stmt, DimNode):
+                continue
+            for array in stmt.arrays:
+                array_name = array.name + (array.type_suffix or '')
+                if self.symbol_table.get_array(array.name, array.type_suffix):
+                    self.errors.append(f"Повторное объявление массива: {array_name}")
+                    continue
+                # Шаги индексов вычисляются при компиляции по всем размерам, кроме первого
+                if not all(isinstance(bound, NumberNode) and bound.value.is_integer() for bound in array.indices[1:]):
+                    self.errors.append(f"Размеры массива, кроме первого, должны быть целыми константами: {array_name}")
+                bounds = [
+                    int(bound.value) if isinstance(bound, NumberNode) and bound.value.is_integer() else None
+                    for bound in array.indices
+                ]
+                self.symbol_table.add_array(array.name, array.type_suffix, len(array.indices), bounds)
+
+    def _collect_functions(self, program_node):
+        """Собирает определения DEF FN: функцию можно вызвать и в тексте выше ее DEF"""
+        for stmt in program_node.walk():
+            if not isinstance(stmt, DefFnNode):
+                continue
+            key = stmt.name, stmt.type_suffix
+            if key in self.symbol_table.functions:
+                self.errors.append(f"Повторное определение функции: {stmt.name}{stmt.type_suffix or ''}")
+                continue
+            self.symbol_table.functions[key] = stmt
+            for parameter in stmt.parameters:
+                self.symbol_table.add_variable(parameter.name, parameter.type_suffix, initialized=True)
+
+    def _collect_fields(self, program_node):
+        """
+        Собирает описания FIELD. GET и PUT присваивают и записывают переменные FIELD своего файла,
+        поэтому номер файла в них — константа, поля каждого файла описаны один раз, а список
+        переменных узлы GET и PUT получают здесь же: FIELD может стоять и ниже по тексту
+        """
+        for stmt in program_node.walk():
+            if not isinstance(stmt, FieldNode):
+                continue
+            channel = self._constant_channel(stmt.channel, 'FIELD')
+            if channel is None:
+                continue
+            if channel in self.symbol_table.fields:
+                self.errors.append(f"Повторное описание полей файла #{channel}")
+                continue
+            self.symbol_table.fields[channel] = stmt
+            for var in stmt.variables:
+                self.symbol_table.add_variable(var.name, var.type_suffix, initialized=True)
+
+        for stmt in program_node.walk():
+            if not isinstance(stmt, (GetNode, PutNode)):
+                continue
+            channel = self._constant_channel(stmt.channel, 'GET' if isinstance(stmt, GetNode) else 'PUT')
+            if channel is None:
+                continue
+            if channel not in self.symbol_table.fields:
+                self.errors.append(f"Для файла #{channel} нет описания полей FIELD")
+                continue
+            field = self.symbol_table.fields[channel]
+            stmt.variables = [VariableNode(var.name, var.type_suffix) for var in field.variables]
+
+    def _collect_record_files(self, program_node):
+        """Собирает OPEN файлов записей: GET и PUT могут стоять выше OPEN по тексту"""
+        for stmt in program_node.walk():
+            if not isinstance(stmt, OpenNode) or stmt.mode != 'RANDOM':
+                continue
+            channel = self._channel_number(stmt.channel)
+            if channel is None:
+                self.record_channels_known = False
+                continue
+            if stmt.record_length is None:
+                length = DEFAULT_RECORD_LENGTH
+            elif isinstance(stmt.record_length, NumberNode):
+                length = int(stmt.record_length.value)
+            else:
+                length = None
+            self.record_lengths.setdefault(channel, []).append(length)
+
+    def _channel_number(self, channel_node):
+        """Номер файла, если он задан целой константой, иначе None"""
+        if isinstance(channel_node, NumberNode) and float(channel_node.value).is_integer():
+            return int(channel_node.value)
+        return None
+
+    def _constant_channel(self, channel_node, statement):
+        """Номер файла FIELD, GET или PUT: целая константа, иначе ошибка и None"""
+        channel = self._channel_number(channel_node)
+        if channel is not None:
+            return channel
+        self.errors.append(f"Номер файла в {statement} должен быть целой константой")
+        return None
+
+    def _analyze_functions(self):
+        """Проверяет тип тела каждой функции и отсутствие рекурсии"""
+        for key, definition in self.symbol_table.functions.items():
+            function_name = definition.name + (definition.type_suffix or '')
+            try:
+                body_type = TypeAnalyzer.get_expression_type(definition.body, self.symbol_table)
+                if (body_type == TypeAnalyzer.STRING_TYPE) != (definition.type_suffix == TypeAnalyzer.STRING_TYPE):
+                    expected = "строкой" if definition.type_suffix == TypeAnalyzer.STRING_TYPE else "числом"
+                    self.errors.append(f"Значение функции {function_name} должно быть {expected}")
+            except SemanticError as e:
+                self.errors.append(str(e))
+            if key in self._called_functions(definition.body):
+                self.errors.append(f"Функция {function_name} вызывает сама себя")
+
+    def _called_functions(self, expression):
+        """Функции, которые вызывает выражение, в том числе через тела других функций"""
+        called = set()
+        stack = [expression]
+        while stack:
+            for node in stack.pop().walk():
+                if isinstance(node, FnCallNode) and (node.name, node.type_suffix) not in called:
+                    called.add((node.name, node.type_suffix))
+                    if (node.name, node.type_suffix) in self.symbol_table.functions:
+                        stack.append(self.symbol_table.functions[(node.name, node.type_suffix)].body)
+        return called
+
     def _analyze_statements(self, statements):
         """Анализирует последовательность инструкций"""
         for stmt in statements:
@@ -152,13 +578,42 @@ class SemanticAnalyzer:
                     self._analyze_next(stmt)
                 elif isinstance(stmt, GosubNode):
                     self._analyze_gosub(stmt)
-                elif isinstance(stmt, ReturnNode):
-                    self._analyze_return(stmt)
                 elif isinstance(stmt, WhileNode):
                     self._analyze_while(stmt)
                 elif isinstance(stmt, InputNode):
                     self._analyze_input(stmt)
-                elif isinstance(stmt, EndNode):
+                elif isinstance(stmt, OnJumpNode):
+                    self._analyze_on_jump(stmt)
+                elif isinstance(stmt, SelectCaseNode):
+                    self._analyze_select_case(stmt)
+                elif isinstance(stmt, DimNode):
+                    self._analyze_dim(stmt)
+                elif isinstance(stmt, MatLetNode):
+                    self._analyze_mat_let(stmt)
+                elif isinstance(stmt, MatReadNode):
+                    self.reads_data = True
+                    for matrix in stmt.matrices:
+                        self._matrix_shape(matrix)
+                elif isinstance(stmt, MatPrintNode):
+                    for matrix in stmt.matrices:
+                        self._matrix_shape(matrix)
+                elif isinstance(stmt, DataNode):
+                    self.symbol_table.data.extend(value.value for value in stmt.values)
+                elif isinstance(stmt, ReadNode):
+                    self._analyze_read(stmt)
+                elif isinstance(stmt, OpenNode):
+                    self._analyze_open(stmt)
+                elif isinstance(stmt, CloseNode):
+                    for channel in stmt.channels:
+                        self._analyze_channel(channel)
+                elif isinstance(stmt, FieldNode):
+                    self._analyze_field(stmt)
+                elif isinstance(stmt, (GetNode, PutNode)):
+                    self._analyze_record(stmt)
+                elif isinstance(stmt, DefFnNode):
+                    pass
+                elif isinstance(stmt, (EndNode, ReturnNode)):
+                    # RETURN проверяется по графу переходов после прохода, в _check_returns
                     pass
                 elif isinstance(stmt, LabelNode):
                     pass
@@ -172,7 +627,10 @@ class SemanticAnalyzer:
         variable = let_node.variable
         value = let_node.value
 
-        self.symbol_table.add_variable(variable.name, variable.type_suffix, initialized=True)
+        if isinstance(variable, ArrayElementNode):
+            self._analyze_array_element(variable)
+        else:
+            self.symbol_table.add_variable(variable.name, variable.type_suffix, initialized=True)
 
         try:
             expr_type = TypeAnalyzer.get_expression_type(value, self.symbol_table)
@@ -188,6 +646,8 @@ class SemanticAnalyzer:
     
     def _analyze_print(self, print_node):
         """Анализирует инструкцию PRINT"""
+        if print_node.channel is not None:
+            self._analyze_channel(print_node.channel)
         for item in print_node.expressions_with_separators:
             expr = item['expression']
             try:
@@ -255,18 +715,22 @@ class SemanticAnalyzer:
         target_ref = gosub_node.target_label_ref
         if not self.symbol_table.get_label(target_ref.name_or_number):
             self.errors.append(f"Вызов несуществующей подпрограммы: {target_ref.name_or_number}")
-
-        self.gosub_stack.append(target_ref.name_or_number)
-        self.in_subroutine = True
     
-    def _analyze_return(self, return_node):
-        """Анализирует инструкцию RETURN"""
-        if not self.gosub_stack:
-            self.errors.append("RETURN без соответствующего GOSUB")
-        else:
-            self.gosub_stack.pop()
-            if not self.gosub_stack:
-                self.in_subroutine = False
+    def _check_returns(self, program_node):
+        """
+        RETURN без GOSUB — RETURN, до которого нельзя дойти ни из одной подпрограммы. Входы
+        подпрограмм берутся из графа переходов, а не из порядка записи: ON ... GOSUB вызывает
+        каждую свою метку, а подпрограмма может закончиться несколькими RETURN
+        """
+        try:
+            cfg = ControlFlowBuilder().build(program_node)
+        except ValueError:
+            # Переход на несуществующую или повторную метку уже найден при сборе меток
+            return
+        subroutine_blocks = cfg.subroutine_blocks()
+        for block in cfg.blocks:
+            if isinstance(block.terminator, Return) and block not in subroutine_blocks:
+                self.errors.append("RETURN без соответствующего GOSUB")
     
     def _analyze_while(self, while_node):
         """Анализирует инструкцию WHILE"""
@@ -279,8 +743,43 @@ class SemanticAnalyzer:
         except SemanticError as e:
             self.errors.append(str(e))
     
+    def _analyze_on_jump(self, on_node):
+        """Анализирует инструкцию ON ... GOTO/GOSUB"""
+        if TypeAnalyzer.get_expression_type(on_node.index, self.symbol_table) == TypeAnalyzer.STRING_TYPE:
+            self.errors.append("Номер перехода ON должен быть числом")
+
+        for target_ref in on_node.target_label_refs:
+            if not self.symbol_table.get_label(target_ref.name_or_number):
+                self.errors.append(f"Переход на несуществующую метку: {target_ref.name_or_number}")
+
+    def _analyze_select_case(self, select_node):
+        """Анализирует блок SELECT CASE: проверки должны быть того же вида, что и селектор"""
+        selector_is_string = (
+            TypeAnalyzer.get_expression_type(select_node.selector, self.symbol_table) == TypeAnalyzer.STRING_TYPE
+        )
+        for case in select_node.cases:
+            for test in case.tests:
+                if isinstance(test, CaseRangeNode):
+                    values = [test.low, test.high]
+                elif isinstance(test, CaseIsNode):
+                    values = [test.value]
+                else:
+                    values = [test]
+                for value in values:
+                    value_is_string = (
+                        TypeAnalyzer.get_expression_type(value, self.symbol_table) == TypeAnalyzer.STRING_TYPE
+                    )
+                    if value_is_string != selector_is_string:
+                        self.errors.append("Несоответствие типов: проверка CASE и селектор SELECT CASE")
+            self._analyze_statements(case.body)
+
+        if select_node.else_body is not None:
+            self._analyze_statements(select_node.else_body)
+
     def _analyze_input(self, input_node):
         """Анализирует инструкцию INPUT"""
+        if input_node.channel is not None:
+            self._analyze_channel(input_node.channel)
         if input_node.prompt:
             try:
                 prompt_type = TypeAnalyzer.get_expression_type(input_node.prompt, self.symbol_table)
@@ -290,4 +789,164 @@ class SemanticAnalyzer:
                 self.errors.append(str(e))
 
         for var in input_node.variables:
-            self.symbol_table.add_variable(var.name, var.type_suffix, initialized=True) 
\ No newline at end of file
+            if isinstance(var, ArrayElementNode):
+                self._analyze_array_element(var)
+            else:
+                self.symbol_table.add_variable(var.name, var.type_suffix, initialized=True)
+
+    def _analyze_open(self, open_node):
+        """Анализирует инструкцию OPEN: имя файла — строка, номер файла — число"""
+        try:
+            if TypeAnalyzer.get_expression_type(open_node.path, self.symbol_table) != TypeAnalyzer.STRING_TYPE:
+                self.errors.append("Имя файла в OPEN должно быть строкой")
+        except SemanticError as e:
+            self.errors.append(str(e))
+        self._analyze_channel(open_node.channel)
+        if open_node.record_length is not None:
+            try:
+                length_type = TypeAnalyzer.get_expression_type(open_node.record_length, self.symbol_table)
+                if length_type == TypeAnalyzer.STRING_TYPE:
+                    self.errors.append("Длина записи в OPEN должна быть числом")
+            except SemanticError as e:
+                self.errors.append(str(e))
+
+    def _analyze_field(self, field_node):
+        """
+        Анализирует FIELD: ширина поля подходит к типу переменной, а все поля помещаются в
+        запись файла, если его OPEN задает длину константой
+        """
+        for width, var in zip(field_node.widths, field_node.variables):
+            var_name = var.name + (var.type_suffix or '')
+            if var.type_suffix == TypeAnalyzer.STRING_TYPE:
+                if width == 0:
+                    self.errors.append(f"Поле {var_name} в FIELD не может быть пустым")
+            elif var.type_suffix == TypeAnalyzer.INTEGER_TYPE:
+                if width not in (2, 4, 8):
+                    self.errors.append(f"Поле {var_name} в FIELD занимает 2, 4 или 8 байт")
+            elif width not in (4, 8):
+                self.errors.append(f"Поле {var_name} в FIELD занимает 4 или 8 байт")
+
+        channel = self._channel_number(field_node.channel)
+        size = sum(field_node.widths)
+        for length in self.record_lengths.get(channel, []):
+            if length is not None and size > length:
+                self.errors.append(f"Поля FIELD #{channel} занимают {size} байт, больше длины записи LEN = {length}")
+
+    def _analyze_record(self, node):
+        """
+        Анализирует GET и PUT: номер записи — число, а файл с этим номером открывается в
+        программе как файл записей (OPEN ... LEN =)
+        """
+        channel = self._channel_number(node.channel)
+        if channel is not None and self.record_channels_known and channel not in self.record_lengths:
+            statement = 'GET' if isinstance(node, GetNode) else 'PUT'
+            self.errors.append(f"{statement} #{channel}: файл не открывается как файл записей (OPEN ... LEN =)")
+        if node.record is None:
+            return
+        try:
+            if TypeAnalyzer.get_expression_type(node.record, self.symbol_table) == TypeAnalyzer.STRING_TYPE:
+                self.errors.append("Номер записи в GET и PUT должен быть числом")
+        except SemanticError as e:
+            self.errors.append(str(e))
+
+    def _analyze_channel(self, channel_node):
+        """Номер файла в OPEN, CLOSE, PRINT # и INPUT # должен быть числом"""
+        try:
+            if TypeAnalyzer.get_expression_type(channel_node, self.symbol_table) == TypeAnalyzer.STRING_TYPE:
+                self.errors.append("Номер файла должен быть числом")
+        except SemanticError as e:
+            self.errors.append(str(e))
+
+    def _analyze_dim(self, dim_node):
+        """Анализирует инструкцию DIM: размеры массивов должны быть числами"""
+        for array in dim_node.arrays:
+            for bound in array.indices:
+                try:
+                    if TypeAnalyzer.get_expression_type(bound, self.symbol_table) == TypeAnalyzer.STRING_TYPE:
+                        self.errors.append(f"Размер массива {array.name} должен быть числом")
+                except SemanticError as e:
+                    self.errors.append(str(e))
+
+    def _analyze_read(self, read_node):
+        """Анализирует инструкцию READ: переменные получают значения, как при INPUT"""
+        self.reads_data = True
+        for var in read_node.variables:
+            if isinstance(var, ArrayElementNode):
+                self._analyze_array_element(var)
+            else:
+                self.symbol_table.add_variable(var.name, var.type_suffix, initialized=True)
+
+    def _analyze_mat_let(self, mat_node):
+        """
+        Анализирует MAT массив = выражение. Если наибольшие индексы массивов в DIM — константы,
+        согласованность размеров проверяется уже при компиляции, иначе при выполнении
+        """
+        if mat_node.factor is not None:
+            if TypeAnalyzer.get_expression_type(mat_node.factor, self.symbol_table) == TypeAnalyzer.STRING_TYPE:
+                self.errors.append("Множитель в MAT должен быть числом")
+
+        target_shape = self._matrix_shape(mat_node.target)
+        shapes = [self._matrix_shape(matrix) for matrix in mat_node.operands]
+        if target_shape is None or None in shapes:
+            return
+        result_shape = self._mat_result_shape(mat_node.operation, shapes)
+        if not self._shapes_match(result_shape, target_shape):
+            raise SemanticError(
+                f"MAT: размер результата не совпадает с размером массива {mat_node.target.name}"
+            )
+
+    def _mat_result_shape(self, operation, shapes):
+        """Размер результата операции MAT по размерам операндов; None в размере — не константа"""
+        first = shapes[0]
+        if operation in ('COPY', 'SCALE'):
+            return first
+        if operation in ('+', '-'):
+            if not self._shapes_match(first, shapes[1]):
+                raise SemanticError(f"MAT {operation}: размеры массивов не совпадают")
+            return first
+        if operation == 'TRN':
+            if len(first) != 2:
+                raise SemanticError("MAT TRN: транспонировать можно только матрицу")
+            return first[::-1]
+        if operation == 'INV':
+            if len(first) != 2 or not self._shapes_match(first[:1], first[1:]):
+                raise SemanticError("MAT INV: обратная матрица есть только у квадратной матрицы")
+            return first
+
+        # Матричное произведение: вектор слева — строка, справа — столбец
+        second = shapes[1]
+        if len(first) == 1 and len(second) == 1:
+            raise SemanticError("MAT *: произведение двух векторов — число, а не массив")
+        if not self._shapes_match(first[-1:], second[:1]):
+            raise SemanticError("MAT *: число столбцов первого множителя не равно числу строк второго")
+        return first[:-1] + second[1:]
+
+    def _shapes_match(self, first, second):
+        return len(first) == len(second) and all(
+            a is None or b is None or a == b for a, b in zip(first, second)
+        )
+
+    def _matrix_shape(self, matrix_node):
+        """
+        Размер массива в MAT: наибольшие индексы измерений из DIM, строка и столбец 0 в
+        операциях не участвуют. None, если массив нельзя использовать в MAT
+        """
+        array = self.symbol_table.get_array(matrix_node.name, matrix_node.type_suffix)
+        array_name = matrix_node.name + (matrix_node.type_suffix or '')
+        if not array:
+            self.errors.append(f"Использование необъявленного массива: {array_name}")
+            return None
+        if matrix_node.type_suffix == TypeAnalyzer.STRING_TYPE:
+            self.errors.append(f"MAT работает только с числовыми массивами: {array_name}")
+            return None
+        if array.dimensions > 2:
+            self.errors.append(f"MAT работает только с векторами и матрицами: {array_name}")
+            return None
+        return tuple(array.bounds)
+
+    def _analyze_array_element(self, element_node):
+        """Проверяет, что массив объявлен, и число и типы индексов элемента"""
+        try:
+            TypeAnalyzer.get_expression_type(element_node, self.symbol_table)
+        except SemanticError as e:
+            self.errors.append(str(e))
@@ -0,0 +1,220 @@
+from ast_nodes import (
+    LetNode, NumberNode, VariableNode, BinaryOpNode, UnaryOpNode, ArrayElementNode, FunctionCallNode, FnCallNode,
+    IMPURE_FUNCTIONS
+)
+
+# Операции, которые NumPy выполняет над срезами поэлементно с тем же результатом, что и Python
+VECTOR_OPERATORS = ('+', '-', '*', '/')
+
+
+def expression_key(expr):
+    """Структурный ключ выражения: равные ключи — одно и то же выражение"""
+    if isinstance(expr, NumberNode):
+        return 'number', expr.value
+    if isinstance(expr, VariableNode):
+        return 'variable', expr.name, expr.type_suffix
+    if isinstance(expr, ArrayElementNode):
+        return ('element', expr.name, expr.type_suffix) + tuple(expression_key(index) for index in expr.indices)
+    if isinstance(expr, BinaryOpNode):
+        return 'binary', expr.op, expression_key(expr.left), expression_key(expr.right)
+    if isinstance(expr, UnaryOpNode):
+        return 'unary', expr.op, expression_key(expr.operand)
+    return 'other', id(expr)
+
+
+class ArrayAccess:
+    """
+    Обращение к элементу массива в цикле: на итерации с переменной цикла I индекс элемента
+    в хранилище равен индексу base плюс stride * I
+    """
+
+    def __init__(self, element, dimension, base):
+        self.element = element
+        # Измерение, индекс которого содержит переменную цикла
+        self.dimension = dimension
+        # Тот же элемент с индексом этого измерения без переменной цикла
+        self.base = base
+
+
+class VectorPlan:
+    """
+    Цикл FOR, выполняемый одним вызовом ядра над срезами массивов. Ядро — тело цикла, в котором
+    элементы массивов заменены переменными parameters: каждая получает срез своего обращения.
+    Простые переменные и переменная цикла остаются под своими именами
+    """
+
+    def __init__(self, accesses, parameters, kernel, written, scalars, index):
+        self.accesses = accesses
+        self.parameters = parameters
+        self.kernel = kernel
+        # Номера обращений, которые цикл изменяет, в порядке результатов ядра
+        self.written = written
+        # Переменные, не меняющиеся в цикле: их значения передаются ядру
+        self.scalars = scalars
+        # Переменная цикла, если ядро ее читает: тогда ему передаются все ее значения
+        self.index = index
+
+
+class LoopVectorizer:
+    """
+    Находит циклы FOR, тело которых только поэлементно вычисляет числовые элементы массивов
+    по индексу переменной цикла: C(I) = A(I) * B(I) + K. Элемент должен зависеть от I как
+    I + смещение ровно в одном измерении. Массив, который цикл изменяет, читается и пишется
+    только по одному и тому же индексу: тогда ни одна итерация не видит результат другой, и
+    инструкции тела можно выполнить по очереди над целыми срезами. PRINT, переходы, вложенные
+    блоки и присваивания простым переменным оставляют цикл обычным.
+    """
+
+    def __init__(self, is_int_valued):
+        # Проверка генератора: вычисляется ли выражение в целых числах Python
+        self.is_int_valued = is_int_valued
+
+    def plan(self, for_node):
+        """VectorPlan для FOR с телом или None, если цикл нельзя выполнить над срезами"""
+        self.loop_variable = for_node.loop_variable
+        self.accesses = []
+        self.parameters = []
+        self.access_numbers = {}
+        self.scalars = {}
+        self.index = None
+
+        kernel = []
+        written = []
+        for stmt in for_node.body or []:
+            if (not isinstance(stmt, LetNode) or not isinstance(stmt.variable, ArrayElementNode)
+                    or stmt.variable.type_suffix == '$'):
+                return None
+            value = self._vector_expression(stmt.value)
+            number = self._access(stmt.variable)
+            if value is None or number is None:
+                return None
+            target = self.parameters[number]
+            # int() не применяется к срезам: целый массив принимает только целое выражение
+            if target.type_suffix == '%' and not self.is_int_valued(value):
+                return None
+            kernel.append(LetNode(target, value))
+            if number not in written:
+                written.append(number)
+        if not kernel:
+            return None
+
+        # Изменяемый массив не может читаться по другому индексу: срезы перекрылись бы
+        written_arrays = {self._array_key(self.accesses[number].element) for number in written}
+        for array in written_arrays:
+            if sum(1 for access in self.accesses if self._array_key(access.element) == array) > 1:
+                return None
+
+        return VectorPlan(
+            self.accesses, self.parameters, kernel, written, list(self.scalars.values()), self.index
+        )
+
+    def _array_key(self, element):
+        return element.name, element.type_suffix
+
+    def _vector_expression(self, expr):
+        """Выражение ядра для выражения тела цикла или None, если его нельзя вычислить над срезами"""
+        if isinstance(expr, NumberNode):
+            return expr
+
+        elif isinstance(expr, VariableNode):
+            if expr.type_suffix == '$':
+                return None
+            if self._is_loop_variable(expr):
+                self.index = expr
+            else:
+                self.scalars.setdefault(expression_key(expr), expr)
+            return expr
+
+        elif isinstance(expr, ArrayElementNode):
+            if expr.type_suffix == '$':
+                return None
+            number = self._access(expr)
+            return self.parameters[number] if number is not None else None
+
+        elif isinstance(expr, BinaryOpNode):
+            if expr.op not in VECTOR_OPERATORS:
+                return None
+            left = self._vector_expression(expr.left)
+            right = self._vector_expression(expr.right)
+            if left is None or right is None:
+                return None
+            return self._typed(BinaryOpNode(left, expr.op, right), expr)
+
+        elif isinstance(expr, UnaryOpNode):
+            operand = self._vector_expression(expr.operand)
+            if expr.op != '-' or operand is None:
+                return None
+            return self._typed(UnaryOpNode(expr.op, operand), expr)
+
+        return None
+
+    def _typed(self, node, original):
+        """
+        Узел ядра получает выведенный тип заменяемого узла тела: генератор выбирает по типам
+        операндов запись констант, и ядро должно вычислять ровно то же, что обычный цикл
+        """
+        if hasattr(original, 'inferred_type'):
+            node.inferred_type = original.inferred_type
+        return node
+
+    def _access(self, element):
+        """Номер обращения к элементу или None, если индекс не имеет вида I + смещение"""
+        key = expression_key(element)
+        if key in self.access_numbers:
+            return self.access_numbers[key]
+
+        dimension = None
+        base_indices = []
+        for position, index in enumerate(element.indices):
+            offset = self._index_offset(index)
+            if offset is not None:
+                if dimension is not None:
+                    return None
+                dimension = position
+                base_indices.append(offset)
+            elif self._is_invariant(index):
+                base_indices.append(index)
+            else:
+                return None
+        if dimension is None:
+            return None
+
+        number = len(self.accesses)
+        self.accesses.append(
+            ArrayAccess(element, dimension, ArrayElementNode(element.name, element.type_suffix, base_indices))
+        )
+        self.parameters.append(self._typed(VariableNode(f"_v{number + 1}", element.type_suffix), element))
+        self.access_numbers[key] = number
+        return number
+
+    def _index_offset(self, index):
+        """Смещение индекса I, I + E, E + I или I - E от переменной цикла; None для другого индекса"""
+        if self._is_loop_variable(index):
+            return NumberNode(0)
+        if not isinstance(index, BinaryOpNode) or index.op not in ('+', '-'):
+            return None
+        if self._is_loop_variable(index.left):
+            offset = index.right
+        elif index.op == '+' and self._is_loop_variable(index.right):
+            offset = index.left
+        else:
+            return None
+        # Дробное смещение изменило бы отбрасывание дробной части при int(I + E)
+        if not self._is_invariant(offset) or not self.is_int_valued(offset):
+            return None
+        return offset if index.op == '+' else UnaryOpNode('-', offset)
+
+    def _is_invariant(self, expr):
+        """
+        Выражение не меняется в цикле: в нем нет переменной цикла, элементов массивов, RND, EOF
+        и функций пользователя, тело которых может читать массивы
+        """
+        return not any(
+            isinstance(node, (ArrayElementNode, FnCallNode)) or self._is_loop_variable(node)
+            or (isinstance(node, FunctionCallNode) and node.name in IMPURE_FUNCTIONS)
+            for node in expr.walk()
+        )
+
+    def _is_loop_variable(self, expr):
+        return (isinstance(expr, VariableNode) and expr.name == self.loop_variable.name
+                and expr.type_suffix == self.loop_variable.type_suffix)
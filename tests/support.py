@@ -0,0 +1,57 @@
+"""
+Запуск программы BASIC во всех режимах генерации кода. Тесты проверяют, что вывод программы
+одинаков в каждом режиме и совпадает с ожидаемым.
+"""
+import contextlib
+import io
+import sys
+
+import basic_runtime
+from compiler import compile_basic_to_python, compile_basic_to_code
+
+# Режимы, которые генерируют текст программы и модуль ast
+TEXT_MODES = ('structured', 'state_machine', 'chunked')
+
+
+def compile_variants(source):
+    """Объекты кода программы для каждого режима, генератора и варианта среды выполнения"""
+    variants = {}
+    for mode in TEXT_MODES:
+        python_code, errors = compile_basic_to_python(source, codegen_mode=mode)
+        assert not errors, errors
+        variants[mode] = compile(python_code, f'<{mode}>', 'exec')
+        variants[f'{mode}-ast'] = compile_basic_to_code(source, codegen_mode=mode)[0]
+    variants['bytecode'] = compile_basic_to_code(source, backend='bytecode')[0]
+    variants['noopt'] = compile(compile_basic_to_python(source, enable_optimizations=False)[0], '<noopt>', 'exec')
+    variants['inline'] = compile(compile_basic_to_python(source, inline_runtime=True)[0], '<inline>', 'exec')
+    variants['inline-ast'] = compile_basic_to_code(source, inline_runtime=True)[0]
+    return variants
+
+
+def run_code(code, stdin=''):
+    """Выполняет программу как __main__ и возвращает ее вывод. Ошибка выполнения дописывается к выводу"""
+    output = io.StringIO()
+    saved_stdin = sys.stdin
+    sys.stdin = io.StringIO(stdin)
+    basic_runtime.configure_input()
+    try:
+        with contextlib.redirect_stdout(output):
+            try:
+                exec(code, {'__name__': '__main__'})
+            except SystemExit:
+                pass
+            except Exception as error:
+                print(f"{type(error).__name__}: {error}")
+    finally:
+        sys.stdin = saved_stdin
+        basic_runtime.configure_input()
+    return output.getvalue()
+
+
+def run_basic(source, stdin=''):
+    """Вывод программы, одинаковый во всех вариантах компиляции"""
+    outputs = {name: run_code(code, stdin) for name, code in compile_variants(source).items()}
+    expected = outputs['structured']
+    different = {name: output for name, output in outputs.items() if output != expected}
+    assert not different, f"structured: {expected!r}, остальные: {different!r}"
+    return expected
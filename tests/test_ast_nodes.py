@@ -0,0 +1,29 @@
+"""Отладочная печать дерева AST"""
+import contextlib
+import io
+
+from compiler import compile_and_print_ast, compile_basic_to_python
+
+PROGRAM = """
+5 LET A = 0
+10 PRINT "A="; A, "B"
+20 LET A = A + 1
+30 IF A < 3 THEN GOTO 10
+"""
+
+
+def test_display_prints_print_items_and_line_numbers():
+    stream = io.StringIO()
+    program = compile_and_print_ast(PROGRAM, "Display")
+    program.display(stream=stream)
+    text = stream.getvalue()
+    assert "PrintNode(" in text and "separator=';'" in text
+    assert "line_number=20" in text
+
+
+def test_debug_compilation_prints_optimized_ast():
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        python_code, errors = compile_basic_to_python(PROGRAM, debug=True)
+    assert python_code and not errors
+    assert "Оптимизированное AST:" in output.getvalue()
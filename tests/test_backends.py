@@ -0,0 +1,47 @@
+"""Генераторы модуля ast и байт-кода дают ту же программу, что и текст"""
+import ast
+import contextlib
+import io
+
+import pytest
+
+from bytecode_generator import bytecode_supported
+from compiler import compile_and_run, compile_basic_to_module, compile_basic_to_code
+from support import run_basic, run_code
+
+PROGRAM = """
+LET S = 0
+FOR I% = 1 TO 10
+GOSUB ADD
+NEXT I%
+LET N = 0
+TOP:
+LET N = N + 1
+IF N < 3 THEN GOTO TOP
+PRINT S; N; "x"
+END
+ADD:
+LET S = S + I%
+RETURN
+"""
+
+
+def test_ast_module_backend():
+    module, errors = compile_basic_to_module(PROGRAM)
+    assert not errors and isinstance(module, ast.Module)
+    assert run_code(compile(module, '<basic>', 'exec')) == "55.03.0x\n"
+
+
+@pytest.mark.skipif(not bytecode_supported(), reason="байт-код собирается только для CPython 3.11")
+def test_bytecode_backend():
+    code, errors = compile_basic_to_code(PROGRAM, backend='bytecode')
+    assert not errors
+    assert run_code(code) == run_basic(PROGRAM) == "55.03.0x\n"
+
+
+def test_compile_and_run_in_process_returns_source():
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        python_code, errors = compile_and_run(PROGRAM, run=True)
+    assert not errors and output.getvalue() == "55.03.0x\n"
+    assert 'def main(' in python_code and run_code(compile(python_code, '<unparsed>', 'exec')) == "55.03.0x\n"
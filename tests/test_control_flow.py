@@ -0,0 +1,281 @@
+"""Переходы, циклы и подпрограммы во всех режимах генерации кода"""
+from compiler import compile_basic_to_python
+from support import run_basic
+
+
+def test_goto_and_gosub_in_state_machine():
+    source = """
+LET I = 0
+TOP:
+LET I = I + 1
+GOSUB SHOW
+IF I < 3 THEN GOTO TOP
+PRINT "done"
+END
+SHOW:
+PRINT "I="; I
+RETURN
+"""
+    assert run_basic(source) == "I=1.0\nI=2.0\nI=3.0\ndone\n"
+    python_code, _ = compile_basic_to_python(source, codegen_mode='state_machine')
+    assert '_pc' in python_code
+
+
+def test_long_goto_loop_does_not_grow_stack():
+    source = """
+LET I = 0
+TOP:
+LET I = I + 1
+IF I < 20000 THEN GOTO TOP
+PRINT I
+"""
+    assert run_basic(source) == "20000.0\n"
+
+
+def test_goto_loops_are_structured():
+    source = """
+LET I = 0
+OUTER:
+LET I = I + 1
+LET J = 0
+INNER:
+LET J = J + 1
+IF J > 3 THEN GOTO NEXTI
+IF I * J > 6 THEN GOTO DONE
+PRINT I; ","; J
+GOTO INNER
+NEXTI:
+IF I < 5 THEN GOTO OUTER
+DONE:
+PRINT "done"; I; J
+"""
+    assert run_basic(source) == (
+        "1.0,1.0\n1.0,2.0\n1.0,3.0\n2.0,1.0\n2.0,2.0\n2.0,3.0\n3.0,1.0\n3.0,2.0\ndone3.03.0\n"
+    )
+    python_code, _ = compile_basic_to_python(source)
+    assert 'while True' in python_code and '_pc' not in python_code
+
+
+def test_loop_with_two_entries():
+    source = """
+LET K = 0
+LET N = 0
+IF K > 0 THEN GOTO SECOND
+FIRST:
+LET N = N + 1
+PRINT "first"; N
+IF N > 4 THEN GOTO DONE
+SECOND:
+LET N = N + 1
+PRINT "second"; N
+GOTO FIRST
+DONE:
+PRINT "end"
+FOR I = 1 TO 2
+PRINT I
+NEXT I
+"""
+    assert run_basic(source) == "first1.0\nsecond2.0\nfirst3.0\nsecond4.0\nfirst5.0\nend\n1.0\n2.0\n"
+    # Цикл диспетчеризации занимает только несводимый цикл, код после него остается в main()
+    python_code, _ = compile_basic_to_python(source)
+    assert '\n    _pc = 0\n    while True:\n' in python_code
+    assert '\n    for I in map(float, range(1, 3)):\n' in python_code
+
+
+def test_for_next_loops():
+    source = """
+FOR I% = 3 TO 1 STEP -1
+FOR J = 1 TO 2
+PRINT I%; " "; J
+NEXT J
+NEXT I%
+LET S = 2
+FOR K = 10 TO 1 STEP -S
+PRINT K
+NEXT K
+PRINT I%; K
+"""
+    assert run_basic(source) == (
+        "3 1.0\n3 2.0\n2 1.0\n2 2.0\n1 1.0\n1 2.0\n10.0\n8.0\n6.0\n4.0\n2.0\n00.0\n"
+    )
+    python_code, _ = compile_basic_to_python(source)
+    assert 'for I_I in _for1_range:' in python_code
+
+
+def test_while_wend_loops():
+    source = """
+LET J = 0
+WHILE J < 3
+PRINT "J ="; J
+LET J = J + 1
+WEND
+LET S = 1
+WHILE S < 100
+LET S = S * 3
+WEND
+PRINT S
+"""
+    assert run_basic(source) == "J =0.0\nJ =1.0\nJ =2.0\n243.0\n"
+    python_code, _ = compile_basic_to_python(source)
+    assert 'while J < 3:' in python_code
+
+
+def test_gosub_subroutines_become_functions():
+    source = """
+LET A = 0
+LET T = 0
+FOR I = 1 TO 5
+GOSUB ADD
+NEXT I
+PRINT "T="; T; " A="; A
+END
+ADD:
+LET T = T + I
+GOSUB BUMP
+RETURN
+BUMP:
+LET A = A + 2
+RETURN
+"""
+    assert run_basic(source) == "T=15.0 A=10.0\n"
+    python_code, _ = compile_basic_to_python(source)
+    assert 'def sub_ADD(' in python_code and 'def sub_BUMP(' in python_code
+    # Переменные, общие для main() и подпрограмм, хранятся в ячейках _slots
+    assert '_slots[' in python_code
+
+
+def test_inferred_types_keep_results():
+    source = """
+LET N = 10
+LET S = 0
+FOR I = 1 TO N
+LET S = S + I
+NEXT I
+LET H = S / 4
+LET B% = 7 / 2
+PRINT S; H; B%; N * 2
+"""
+    assert run_basic(source) == "55.013.75320.0\n"
+
+
+def test_deeply_nested_loops_fall_back_to_chunks():
+    depth = 25
+    lines = ["LET C = 0"]
+    lines += [f"FOR I{n} = 1 TO 1" for n in range(depth)]
+    lines.append("LET C = C + 1")
+    lines += [f"NEXT I{n}" for n in reversed(range(depth))]
+    lines.append("PRINT C")
+    source = "\n".join(lines) + "\n"
+    assert run_basic(source) == "1.0\n"
+    python_code, _ = compile_basic_to_python(source)
+    assert '_chunk' in python_code
+
+
+def test_deeply_nested_branches_fall_back_to_chunks():
+    lines = ["LET X = 0"]
+    for k in range(600):
+        lines += [f"IF X > {k} THEN GOTO DONE", "LET X = X + 2"]
+    lines += ["DONE:", "PRINT X"]
+    source = "\n".join(lines) + "\n"
+    assert run_basic(source) == "2.0\n"
+    python_code, _ = compile_basic_to_python(source)
+    assert '_chunk' in python_code
+
+
+def test_numbered_lines_run_in_number_order():
+    source = """
+40 PRINT "forty"; N
+10 LET N = 3
+20 GOSUB 100
+30 GOTO 40
+50 END
+100 PRINT "sub"
+110 LET N = N + 1
+120 RETURN
+"""
+    assert run_basic(source) == "sub\nforty4.0\n"
+
+
+def test_on_goto_and_select_case():
+    source = """
+FOR K = 0 TO 4
+ON K GOTO L1, L2, L3
+PRINT K; "none"
+GOTO NX
+L1:
+PRINT "one"
+GOTO NX
+L2:
+PRINT "two"
+GOTO NX
+L3:
+PRINT "three"
+NX:
+NEXT K
+FOR V = 0 TO 12 STEP 3
+SELECT CASE V
+CASE 0
+PRINT "zero"
+CASE 3, 6
+PRINT "small"; V
+CASE 7 TO 9
+PRINT "range"; V
+CASE IS > 10
+PRINT "big"; V
+CASE ELSE
+PRINT "else"; V
+END SELECT
+NEXT V
+LET S$ = "b"
+SELECT CASE S$
+CASE "a"
+PRINT "is a"
+CASE "b", "c"
+PRINT "is b or c"
+END SELECT
+"""
+    assert run_basic(source) == (
+        "0.0none\none\ntwo\nthree\n4.0none\nzero\nsmall3.0\nsmall6.0\nrange9.0\nbig12.0\nis b or c\n"
+    )
+
+
+def test_on_gosub_calls_each_subroutine():
+    source = """
+FOR K = 1 TO 3
+ON K GOSUB S1, S2, S3
+NEXT K
+LET T = 150
+GOSUB CHECK
+END
+S1:
+PRINT "s1"
+RETURN
+S2:
+PRINT "s2"
+RETURN
+S3:
+PRINT "s3"
+RETURN
+CHECK:
+IF T > 100 THEN RETURN
+PRINT "small"
+RETURN
+"""
+    assert run_basic(source) == "s1\ns2\ns3\n"
+
+
+def test_return_outside_subroutine_is_reported():
+    _, errors = compile_basic_to_python('GOSUB S\nPRINT 2\nRETURN\nS:\nRETURN\n')
+    assert errors == ["RETURN без соответствующего GOSUB"]
+
+
+def test_undefined_jump_targets_are_reported():
+    for mode in ('structured', 'state_machine', 'chunked', 'nested'):
+        python_code, errors = compile_basic_to_python('PRINT 1\nGOTO NOWHERE\n', codegen_mode=mode)
+        assert python_code is None and errors == ["Переход на несуществующую метку: NOWHERE"]
+    _, errors = compile_basic_to_python('GOSUB 100\nON 1 GOTO NOPE\nL:\nL:\nEND\n')
+    assert errors == [
+        "Дублирование метки: L",
+        "Вызов несуществующей подпрограммы: 100",
+        "Переход на несуществующую метку: NOPE",
+    ]
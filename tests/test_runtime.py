@@ -0,0 +1,283 @@
+"""Среда выполнения: вывод, ввод, строки и файлы во всех режимах генерации кода"""
+import contextlib
+import io
+import os
+import subprocess
+import sys
+
+import basic_runtime
+from compiler import compile_basic_to_python, compile_basic_to_code
+from support import run_basic, run_code, compile_variants
+
+
+def test_runtime_is_imported_or_inlined():
+    source = 'LET A$ = "x"\nPRINT A$; 1\n'
+    imported, _ = compile_basic_to_python(source)
+    inlined, _ = compile_basic_to_python(source, inline_runtime=True)
+    assert 'from basic_runtime import' in imported
+    assert 'basic_runtime' not in inlined and 'class OutputBuffer' in inlined
+    assert run_basic(source) == "x1.0\n"
+
+
+def test_output_is_flushed_before_runtime_error():
+    source = """
+LET Z = 0
+PRINT "before"
+PRINT LOG(Z)
+PRINT "after"
+"""
+    assert run_basic(source) == "before\nValueError: math domain error\n"
+
+
+def test_output_to_file_descriptor():
+    code = compile_variants('FOR I = 1 TO 3\nPRINT "line"; I\nNEXT I\n')['structured']
+    read_fd, write_fd = os.pipe()
+    basic_runtime.configure_output(fd=write_fd, buffer_size=0)
+    try:
+        assert run_code(code) == ""
+    finally:
+        basic_runtime.configure_output()
+        os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        assert pipe.read() == "line1.0\nline2.0\nline3.0\n"
+
+
+def test_imported_program_is_flushed_at_exit(tmp_path):
+    (tmp_path / 'prog.py').write_text(compile_basic_to_python('PRINT "imported"\n')[0])
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(tmp_path), os.path.dirname(basic_runtime.__file__)]))
+    # main() вызывается без блока finally сгенерированной программы: вывод сбрасывает atexit
+    result = subprocess.run([sys.executable, '-c', 'import prog; prog.main()'], env=env, capture_output=True, text=True)
+    assert result.stdout == "imported\n"
+
+
+def test_print_formatting():
+    source = """
+LET A = 1.5
+LET B% = 7
+LET S$ = "ab"
+PRINT "x"; A; "y"; B%
+PRINT A, B%, S$
+PRINT
+PRINT "q{}\\"; 5; -2
+PRINT "s" + B%; A
+PRINT "abcdefghijklmnopq", 1
+"""
+    assert run_basic(source) == (
+        "x1.5y7\n1.5           7             ab\n\nq{}\\5.0-2.0\ns71.5\nabcdefghijklmnopq           1.0\n"
+    )
+
+
+def test_input_reads_records_and_fields():
+    source = """
+INPUT "Name? ", N$
+INPUT A, B%
+PRINT "Hello, "; N$; A + B%
+INPUT C$, D
+PRINT C$; D
+"""
+    assert run_basic(source, "Bob\n3.5, 4\nxy, 7\n") == "Name? Hello, Bob7.5\nxy7.0\n"
+
+
+class Keyboard(io.StringIO):
+    """Ввод с клавиатуры: запоминает, какой вывод был виден к каждому чтению"""
+
+    def __init__(self, text, output):
+        super().__init__(text)
+        self.output = output
+        self.seen = []
+
+    def readline(self, *args):
+        self.seen.append(self.output.getvalue())
+        return super().readline(*args)
+
+    def read(self, *args):
+        self.seen.append(self.output.getvalue())
+        return super().read(*args)
+
+
+def test_input_reads_lines_after_flushing_prompt():
+    code = compile_variants('PRINT "start"\nINPUT "N? ", N\nPRINT N * 2\nINPUT M\nPRINT M\n')['structured']
+    for batch, seen in ((False, ["start\nN? ", "start\nN? 6.0\n"]), (True, [""])):
+        output = io.StringIO()
+        keyboard = Keyboard("3\n4\n", output)
+        basic_runtime.configure_input(keyboard, batch=batch)
+        try:
+            with contextlib.redirect_stdout(output):
+                exec(code, {'__name__': '__main__'})
+        finally:
+            basic_runtime.configure_input()
+        assert output.getvalue() == "start\nN? 6.0\n4.0\n"
+        assert keyboard.seen[:len(seen)] == seen
+
+
+def test_batch_input_prompt_is_flushed_on_exit():
+    code = compile_variants('INPUT "N? ", N\n')['structured']
+    output = io.StringIO()
+    basic_runtime.configure_input(io.StringIO("3\n"), batch=True)
+    try:
+        with contextlib.redirect_stdout(output):
+            exec(code, {'__name__': '__main__'})
+    finally:
+        basic_runtime.configure_input()
+    assert output.getvalue() == "N? "
+
+
+def test_batch_input_is_switched_on_by_program_or_environment(monkeypatch):
+    source = 'PRINT "start"\nINPUT A, B%\nINPUT C$\nPRINT A + B%; C$\n'
+    text = compile_basic_to_python(source, batch_input=True)[0]
+    assert "configure_input(batch=True)" in text
+    codes = [compile(text, '<text>', 'exec'), compile_basic_to_code(source, batch_input=True)[0],
+             compile_basic_to_code(source, backend='bytecode', batch_input=True)[0]]
+    for code in codes:
+        output = io.StringIO()
+        keyboard = Keyboard("1.5, 2\nx, y\n", output)
+        saved_stdin, sys.stdin = sys.stdin, keyboard
+        try:
+            with contextlib.redirect_stdout(output):
+                exec(code, {'__name__': '__main__'})
+        finally:
+            sys.stdin = saved_stdin
+            basic_runtime.configure_input()
+        assert output.getvalue() == "start\n3.5x, y\n"
+        # Весь ввод прочитан одним блоком до первого сброса вывода
+        assert keyboard.seen[:1] == [""]
+    assert "configure_input" not in compile_basic_to_python(source)[0]
+
+    monkeypatch.setenv('BASIC_BATCH_INPUT', '1')
+    basic_runtime.configure_input()
+    assert basic_runtime._input.batch
+    monkeypatch.setenv('BASIC_BATCH_INPUT', '0')
+    basic_runtime.configure_input()
+    assert not basic_runtime._input.batch
+
+
+def test_batch_input_splits_fields_once_per_block():
+    reader = basic_runtime.InputReader(io.StringIO("1,2\na,b,c\n"), batch=True)
+    assert reader.read_fields() == ['1', '2']
+    assert reader.fields == [['1', '2'], ['a', 'b', 'c']]
+    assert reader.read_record() == "a,b,c"
+
+
+def test_string_append_keeps_values_immutable():
+    source = """
+LET A$ = "x"
+FOR I% = 1 TO 3
+LET A$ = A$ + "ab" + I%
+NEXT I%
+LET B$ = A$
+LET A$ = A$ + "!"
+PRINT A$; " "; B$; " "; A$ + B$
+"""
+    assert run_basic(source) == "xab1ab2ab3! xab1ab2ab3 xab1ab2ab3!xab1ab2ab3\n"
+    python_code, _ = compile_basic_to_python(source)
+    assert 'basic_append(' in python_code
+
+
+def test_string_literals_are_pooled():
+    source = """
+LET S$ = "hi"
+FOR I = 1 TO 2
+LET T$ = "hi" + S$
+PRINT T$; "hi"
+NEXT I
+"""
+    assert run_basic(source) == "hihihi\nhihihi\n"
+    python_code, _ = compile_basic_to_python(source)
+    assert python_code.count("BasicString('hi')") == 1
+
+
+def test_string_literals_keep_backslashes_and_quotes():
+    source = 'LET S$ = "\\"\nLET T$ = S$ + "a\\b" + "\'"\nPRINT S$; T$; "\\"\n'
+    expected = "\\\\a\\b'\\\n"
+    assert run_basic(source) == expected
+    # Текст режима nested выводит строковые литералы через repr
+    nested = compile_basic_to_python(source, codegen_mode='nested')[0]
+    assert run_code(compile(nested, '<nested>', 'exec')) == expected
+
+
+def test_sequential_files(tmp_path):
+    path = tmp_path / 'items.txt'
+    source = f"""
+OPEN "{path}" FOR OUTPUT AS #1
+FOR I = 1 TO 3
+PRINT #1, "ITEM"; I; ","; I * 2.5
+NEXT I
+CLOSE #1
+OPEN "{path}" FOR APPEND AS 2
+PRINT #2, "LAST, 7"
+CLOSE
+OPEN "{path}" FOR INPUT AS #1
+LET N = 0
+WHILE EOF(1) > -1
+INPUT #1, A$, B
+LET N = N + 1
+PRINT N; A$; "|"; B
+WEND
+CLOSE #1
+"""
+    assert run_basic(source) == "1.0ITEM1.0|2.5\n2.0ITEM2.0|5.0\n3.0ITEM3.0|7.5\n4.0LAST|7.0\n"
+    assert path.read_text() == "ITEM1.0,2.5\nITEM2.0,5.0\nITEM3.0,7.5\nLAST, 7\n"
+
+
+def test_random_access_records(tmp_path):
+    path = tmp_path / 'stock.dat'
+    source = f"""
+OPEN "{path}" FOR OUTPUT AS #9
+CLOSE #9
+OPEN "{path}" AS #1 LEN = 32
+FIELD #1, 20 AS N$, 4 AS Q%, 8 AS P
+FOR I% = 1 TO 3
+LET N$ = "ITEM" + I%
+LET Q% = I% * 100
+LET P = I% / 4
+PUT #1, I%
+NEXT I%
+GET #1, 2
+PRINT N$; Q%; P
+LET Q% = Q% + 1
+PUT #1, 2
+CLOSE #1
+OPEN "{path}" FOR RANDOM AS 2 LEN = 32
+FIELD #2, 20 AS M$, 4 AS K%, 8 AS V
+WHILE EOF(2) > -1
+GET #2
+PRINT M$; "|"; K%; "|"; V
+WEND
+GET #2, 100
+PRINT M$; "|"; K%
+CLOSE
+"""
+    assert run_basic(source) == (
+        "ITEM22000.5\nITEM1|100|0.25\nITEM2|201|0.5\nITEM3|300|0.75\n|0\n"
+    )
+    assert path.stat().st_size == 3 * 32
+
+
+def test_record_statements_are_checked_against_open():
+    source = """
+OPEN "stock.dat" AS #1 LEN = 16
+FIELD #1, 10 AS N$, 8 AS P
+GET #1, 1
+FIELD #2, 4 AS Q%
+PUT #2
+"""
+    _, errors = compile_basic_to_python(source)
+    assert errors == [
+        "Поля FIELD #1 занимают 18 байт, больше длины записи LEN = 16",
+        "PUT #2: файл не открывается как файл записей (OPEN ... LEN =)",
+    ]
+
+
+def test_unassigned_variables_have_basic_defaults():
+    source = """
+GOTO 50
+100 IF 1 > 2 THEN LET Z = 1
+IF 1 > 2 THEN LET A% = 2
+IF 1 > 2 THEN LET B$ = "x"
+RETURN
+50 GOSUB 100
+PRINT Z; A%; B$; "|"
+"""
+    assert run_basic(source) == "0.00|\n"
+    # Переменные без полей в строке INPUT сохраняют значения по умолчанию
+    assert run_basic('INPUT A, B%, C$\nPRINT A; B%; C$; "|"\nLET D = B%\nPRINT D\n', "2.5\n") == "2.50|\n0\n"
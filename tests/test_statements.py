@@ -0,0 +1,185 @@
+"""Массивы, MAT, встроенные функции и DEF FN во всех режимах генерации кода"""
+from compiler import compile_basic_to_python
+from support import run_basic
+
+
+def test_dim_arrays():
+    source = """
+DIM A(5), B%(2, 3), S$(2)
+FOR I = 0 TO 5
+LET A(I) = I * 1.5
+NEXT I
+FOR I = 0 TO 2
+FOR J = 0 TO 3
+LET B%(I, J) = I * 10 + J
+NEXT J
+NEXT I
+LET S$(1) = "one"
+PRINT A(5); B%(2, 3); B%(1, 0); S$(1); "|"; S$(0); "|"
+LET B%(1, 1) = 2.7
+PRINT B%(1, 1) + A(2.9)
+"""
+    assert run_basic(source) == "7.52310one||\n5.0\n"
+    python_code, _ = compile_basic_to_python(source)
+    assert "array('q'" in python_code and "array('d'" in python_code
+
+
+def test_subscripts_are_checked_per_dimension():
+    prefix = "DIM A(5), M(2, 3)\nLET N = 4\nDIM C(N, 2)\nLET K = -1\n"
+    assert run_basic(prefix + "PRINT A(K + 1)\nPRINT A(K)\n") == (
+        "0.0\nIndexError: Индекс -1 вне границ измерения массива 0..5\n"
+    )
+    assert run_basic(prefix + "LET M(0, 5) = 1\n") == "IndexError: Индекс 5 вне границ измерения массива 0..3\n"
+    assert run_basic(prefix + "PRINT C(N + 1, 0)\n") == "IndexError: Индекс 5 вне границ измерения массива 0..4\n"
+    # Векторизованный цикл не пишет за границу измерения: ошибку дает обычный цикл
+    source = prefix + "DIM B(2, 99)\nFOR I = 0 TO 99\nLET B(K + 4, I) = I\nNEXT I\n"
+    assert run_basic(source) == "IndexError: Индекс 3 вне границ измерения массива 0..2\n"
+
+
+def test_subscript_rank_must_match_dim():
+    for statement in ("PRINT A(1, 2)", "LET A(1, 1, 1) = 2"):
+        python_code, errors = compile_basic_to_python(f"DIM A(3)\n{statement}\n")
+        assert python_code is None and errors[0].startswith("Неверное число индексов массива A")
+
+
+def test_loop_subscripts_within_dim_are_not_checked():
+    source = """
+DIM A%(99), M%(9, 9)
+FOR I% = 0 TO 99
+LET A%(I%) = I%
+NEXT I%
+FOR I% = 1 TO 9
+FOR J% = 0 TO 8
+LET M%(I% - 1, J% + 1) = M%(I%, J%) + A%(I% + 90)
+NEXT J%
+LET M%(I%, 9) = A%(I% * 10)
+NEXT I%
+PRINT M%(0, 9); M%(8, 9); M%(9, 9)
+"""
+    assert run_basic(source) == "919990\n"
+    python_code, _ = compile_basic_to_python(source)
+    assert 'A_I_array[I_I]' in python_code and 'M_I_array[(I_I - 1) * 10 + (J_I + 1)]' in python_code
+    # Границы I% * 10 при компиляции не выводятся: этот индекс проверяется при выполнении
+    assert python_code.count('basic_index(') == 1
+
+
+def test_elementwise_loops_are_vectorized():
+    source = """
+DIM A(99), B(99), C(99), D%(99)
+FOR I = 0 TO 99
+LET A(I) = I * 0.5
+LET B(I) = 100 - I
+LET D%(I) = I * 3
+NEXT I
+LET K = 2.5
+FOR I = 0 TO 99
+LET C(I) = A(I) * B(I) + K
+NEXT I
+FOR J = 1 TO 98
+LET C(J) = C(J) + A(J - 1) + A(J + 1) + D%(J)
+NEXT J
+PRINT C(0); C(50); C(98); C(99); I; J
+"""
+    assert run_basic(source) == "2.51452.5492.552.0100.099.0\n"
+    python_code, _ = compile_basic_to_python(source)
+    assert 'vector_loop(' in python_code
+
+
+def test_vectorized_integer_overflow_matches_scalar_loop():
+    source = """
+DIM A%(99), B%(99), C(99)
+FOR I% = 0 TO 99
+LET A%(I%) = 3037000500 + I%
+NEXT I%
+FOR I% = 0 TO 99
+LET C(I%) = A%(I%) * A%(I%) / 2
+NEXT I%
+PRINT C(5)
+FOR I% = 0 TO 99
+LET B%(I%) = A%(I%) * A%(I%)
+NEXT I%
+"""
+    assert run_basic(source) == f"{3037000505 ** 2 / 2}\nOverflowError: int too big to convert\n"
+    python_code, _ = compile_basic_to_python(source)
+    assert python_code.count('vector_loop(') == 3
+
+
+def test_mat_statements():
+    source = """
+DIM A(2, 3), B(3, 2), C(2, 2), T(3, 2), V(3), W(2)
+MAT READ A, B
+MAT C = A * B
+MAT PRINT C
+MAT T = TRN(A)
+MAT PRINT T;
+MAT C = C + C
+MAT C = (0.5) * C
+MAT PRINT C
+READ X, Y$, Z%
+PRINT X; Y$; Z%
+MAT READ V
+MAT W = A * V
+MAT PRINT W
+DATA 1, 2, 3, 4, 5, 6
+DATA 1, 0, 0, 1, 1, 1
+DATA -2.5, "HI", 7.9
+DATA 1, 1, 1
+"""
+    assert run_basic(source) == (
+        "4.0           5.0\n10.0          11.0\n\n"
+        "1.04.0\n2.05.0\n3.06.0\n\n"
+        "4.0           5.0\n10.0          11.0\n\n"
+        "-2.5HI7\n"
+        "6.0\n15.0\n\n"
+    )
+
+
+def test_builtin_functions():
+    source = """
+LET X = 2
+PRINT SQR(X); " "; SQR(16)
+PRINT INT(3.7); " "; INT(-3.7)
+LET N% = 7
+PRINT INT(N%); " "; ABS(-N%); " "; SGN(-N%); " "; SGN(X)
+PRINT SIN(0); COS(0); ATN(1) * 4
+PRINT EXP(1); " "; LOG(X)
+PRINT RND(1); " "; RND
+"""
+    assert run_basic(source) == (
+        "1.4142135623730951 4.0\n3.0 -4.0\n7 7 -1 1.0\n0.01.03.141592653589793\n"
+        "2.718281828459045 0.6931471805599453\n0.8444218515250481 0.7579544029403025\n"
+    )
+
+
+def test_def_fn_functions():
+    source = """
+DEF FNSQ(X) = X * X
+DEF FNHYP(A, B) = SQR(FNSQ(A) + FNSQ(B))
+DEF FNK(X) = X * K + 1
+DEF FNI%(N%) = N% * 2 + 1
+DEF FNG$(S$) = S$ + "!" + T$
+LET K = 3
+LET T$ = "?"
+PRINT FNHYP(3, 4)
+PRINT FNK(2); " "; FNI%(3); " "; FNI%(2.7)
+PRINT FNG$("hi")
+PRINT FNSQ(FNSQ(2) + 1)
+GOSUB SHOW
+END
+SHOW:
+PRINT FNK(10) + FNSQ(K)
+RETURN
+"""
+    assert run_basic(source) == "5.0\n7.0 7 5\nhi!?\n25.0\n40.0\n"
+
+
+def test_inlined_functions_with_constant_arguments_are_folded():
+    source = """
+DEF FNA(X, Y) = X * X + Y
+DATA 5
+READ D
+PRINT FNA(3, 2); FNA(D, 1)
+"""
+    assert run_basic(source) == "11.026.0\n"
+    python_code, _ = compile_basic_to_python(source)
+    assert "{11.0}" in python_code and "pass" not in python_code